@@ -1,16 +1,27 @@
 """Build audit workbooks and operator actions for approval drift.
 
-The history command is read-only. The acceptance command is an explicit
+The history command changes nothing in ChMeetings or WordPress; besides its
+audit workbook it writes the ``.approval_drift_index.json`` offset index into
+the logs directory (see below). The acceptance command is an explicit
 operator action for final-week cases where a church confirms sport/event
 changes were legitimate and the prior approval should be restored.
+
+Both commands parse the season's ``sportsfest_*.log`` files.  Logs are
+streamed in large blocks, and only lines containing one of the drift markers
+are cut out, decoded and matched against the regexes.  A small offset index beside
+the logs (``DRIFT_INDEX_NAME``) records, per log file, how many bytes were
+already parsed and the events found in them, so a repeated run only parses
+the bytes appended since the previous one.
 """
 
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
+import json
 import re
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
@@ -18,6 +29,8 @@ import openpyxl
 from openpyxl.styles import Font, PatternFill
 from openpyxl.utils import get_column_letter
 
+from file_utils import atomic_write_json
+
 
 STATUS_WORKBOOK_GLOB = "Church_Team_Status_ALL_*.xlsx"
 LOG_GLOB = "sportsfest_*.log"
@@ -30,6 +43,12 @@ REAPPROVAL_REASON_ISSUE_TYPES = (
 )
 OPEN_STATUS = "open"
 RESOLVED_STATUS = "resolved"
+DRIFT_INDEX_NAME = ".approval_drift_index.json"
+DRIFT_INDEX_VERSION = 1
+_INDEX_HEAD_BYTES = 1024
+_SCAN_BLOCK_BYTES = 8 * 1024 * 1024
+_HARD_DRIFT_MARKER = b"APPROVAL IDENTITY DRIFT for chm_id="
+_SOFT_BIRTHDATE_MARKER = b"Birthdate correction for chm_id="
 
 _HARD_DRIFT_RE = re.compile(
     r"^(?P<detected_at>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})"
@@ -192,49 +211,179 @@ def _split_hard_drift_summary(summary: str) -> list[tuple[str, str, str]]:
     return deltas
 
 
-def parse_drift_events(log_paths: Iterable[Path]) -> list[DriftEvent]:
-    """Parse approval drift and soft birthdate correction entries from logs."""
+def _line_events(line: str, source_log: str) -> list[DriftEvent]:
+    """Return the drift events logged on one log line."""
+    hard = _HARD_DRIFT_RE.search(line)
+    if hard:
+        summary = hard.group("summary")
+        return [
+            DriftEvent(
+                detected_at=hard.group("detected_at"),
+                chmeetings_id=hard.group("chm_id"),
+                wp_participant_id=hard.group("wp_participant_id"),
+                source_log=source_log,
+                event_type="approval_identity_drift",
+                prior_status=hard.group("prior_status"),
+                raw_summary=summary,
+                field=field,
+                old_value=old_value,
+                new_value=new_value,
+            )
+            for field, old_value, new_value in _split_hard_drift_summary(summary)
+        ]
+
+    soft = _SOFT_BIRTHDATE_RE.search(line)
+    if soft:
+        return [
+            DriftEvent(
+                detected_at=soft.group("detected_at"),
+                chmeetings_id=soft.group("chm_id"),
+                wp_participant_id="",
+                source_log=source_log,
+                event_type="approval_birthdate_correction",
+                prior_status="approval_preserved",
+                raw_summary="Birthdate correction with age unchanged",
+                field="Birthdate (age unchanged)",
+                old_value=soft.group("old_value"),
+                new_value=soft.group("new_value"),
+            )
+        ]
+    return []
+
+
+def _marked_lines(block: bytes) -> list[bytes]:
+    """Return the lines of ``block`` that contain a drift marker, in order.
+
+    The markers are located with ``bytes.find`` over the whole block, so the
+    bulk of a log (lines without a marker) is never split or decoded.
+    """
+    starts: set[int] = set()
+    for marker in (_HARD_DRIFT_MARKER, _SOFT_BIRTHDATE_MARKER):
+        position = block.find(marker)
+        while position != -1:
+            starts.add(block.rfind(b"\n", 0, position) + 1)
+            position = block.find(marker, position + len(marker))
+    lines = []
+    for line_start in sorted(starts):
+        line_end = block.find(b"\n", line_start)
+        lines.append(block[line_start:] if line_end == -1 else block[line_start:line_end])
+    return lines
+
+
+def _scan_log(log_path: Path, offset: int) -> tuple[list[DriftEvent], int, list[DriftEvent]]:
+    """Stream ``log_path`` from byte ``offset`` in large blocks.
+
+    Returns ``(events, end_offset, tail_events)``: events from complete lines
+    up to ``end_offset`` (just past the last newline), and events from a final
+    line that has no newline yet.  The tail is reported but not indexed, since
+    the logger may still be appending to it.
+    """
+    events: list[DriftEvent] = []
+    end_offset = offset
+    pending = b""
+    with log_path.open("rb") as handle:
+        handle.seek(offset)
+        while True:
+            chunk = handle.read(_SCAN_BLOCK_BYTES)
+            if not chunk:
+                break
+            block = pending + chunk
+            cut = block.rfind(b"\n") + 1
+            pending = block[cut:]
+            end_offset += cut
+            for raw_line in _marked_lines(block[:cut]):
+                events.extend(_decoded_line_events(raw_line, log_path.name))
+    tail_events: list[DriftEvent] = []
+    for raw_line in _marked_lines(pending):
+        tail_events.extend(_decoded_line_events(raw_line, log_path.name))
+    return events, end_offset, tail_events
+
+
+def _decoded_line_events(raw_line: bytes, source_log: str) -> list[DriftEvent]:
+    # splitlines() keeps the old read_text().splitlines() line semantics for
+    # the rare line that also contains \r or other separators.
+    events: list[DriftEvent] = []
+    for line in raw_line.decode("utf-8", errors="replace").splitlines():
+        events.extend(_line_events(line, source_log))
+    return events
+
+
+def _head_digest(log_path: Path, length: int) -> str:
+    with log_path.open("rb") as handle:
+        return hashlib.sha256(handle.read(length)).hexdigest()
+
+
+def _load_drift_index(index_path: Optional[Path]) -> dict[str, dict[str, Any]]:
+    if index_path is None:
+        return {}
+    try:
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if payload.get("version") != DRIFT_INDEX_VERSION:
+        return {}
+    return dict(payload.get("logs") or {})
+
+
+def _save_drift_index(index_path: Path, logs: dict[str, dict[str, Any]]) -> None:
+    try:
+        atomic_write_json(index_path, {"version": DRIFT_INDEX_VERSION, "logs": logs})
+    except OSError:
+        # The index only saves time; a read-only logs folder just means a full parse next run.
+        pass
+
+
+def parse_drift_events(
+    log_paths: Iterable[Path],
+    index_path: Optional[Path] = None,
+) -> list[DriftEvent]:
+    """Parse approval drift and soft birthdate correction entries from logs.
+
+    With ``index_path`` the per-log byte offsets and extracted events are
+    cached there, so logs that only grew are parsed from where the previous
+    call stopped.  A log that shrank or whose first bytes changed (rotation,
+    truncation) is parsed again from the start.
+    """
+    index = _load_drift_index(index_path)
+    index_changed = False
     events: list[DriftEvent] = []
     for log_path in sorted(log_paths):
         if not log_path.exists() or not log_path.is_file():
             continue
-        for line in log_path.read_text(encoding="utf-8", errors="replace").splitlines():
-            hard = _HARD_DRIFT_RE.search(line)
-            if hard:
-                summary = hard.group("summary")
-                for field, old_value, new_value in _split_hard_drift_summary(summary):
-                    events.append(
-                        DriftEvent(
-                            detected_at=hard.group("detected_at"),
-                            chmeetings_id=hard.group("chm_id"),
-                            wp_participant_id=hard.group("wp_participant_id"),
-                            source_log=log_path.name,
-                            event_type="approval_identity_drift",
-                            prior_status=hard.group("prior_status"),
-                            raw_summary=summary,
-                            field=field,
-                            old_value=old_value,
-                            new_value=new_value,
-                        )
-                    )
-                continue
-
-            soft = _SOFT_BIRTHDATE_RE.search(line)
-            if soft:
-                events.append(
-                    DriftEvent(
-                        detected_at=soft.group("detected_at"),
-                        chmeetings_id=soft.group("chm_id"),
-                        wp_participant_id="",
-                        source_log=log_path.name,
-                        event_type="approval_birthdate_correction",
-                        prior_status="approval_preserved",
-                        raw_summary="Birthdate correction with age unchanged",
-                        field="Birthdate (age unchanged)",
-                        old_value=soft.group("old_value"),
-                        new_value=soft.group("new_value"),
-                    )
-                )
+        key = str(log_path.resolve())
+        entry = index.get(key)
+        size = log_path.stat().st_size
+        offset = 0
+        cached: list[DriftEvent] = []
+        if (
+            entry
+            and 0 < int(entry.get("offset") or 0) <= size
+            and entry.get("head") == _head_digest(log_path, min(int(entry["offset"]), _INDEX_HEAD_BYTES))
+        ):
+            offset = int(entry["offset"])
+            cached = [DriftEvent(**event) for event in entry.get("events") or []]
+
+        if offset == size:
+            events.extend(cached)
+            continue
+
+        new_events, end_offset, tail_events = _scan_log(log_path, offset)
+        indexed = cached + new_events
+        events.extend(indexed)
+        events.extend(tail_events)
+        if index_path is not None and end_offset != offset:
+            index[key] = {
+                "offset": end_offset,
+                "head": _head_digest(log_path, min(end_offset, _INDEX_HEAD_BYTES)),
+                "events": [asdict(event) for event in indexed],
+            }
+            index_changed = True
+
+    if index_path is not None and index_changed:
+        _save_drift_index(
+            index_path,
+            {key: entry for key, entry in index.items() if Path(key).exists()},
+        )
     return events
 
 
@@ -503,7 +652,7 @@ def _load_prior_statuses(logs_dir: Optional[Path]) -> dict[str, list[str]]:
     if not logs_dir or not logs_dir.exists():
         return {}
     statuses: dict[str, list[str]] = {}
-    for event in parse_drift_events(sorted(logs_dir.glob(LOG_GLOB))):
+    for event in parse_drift_events(sorted(logs_dir.glob(LOG_GLOB)), logs_dir / DRIFT_INDEX_NAME):
         prior = event.prior_status.strip()
         if not prior or prior == "approval_preserved":
             continue
@@ -890,7 +1039,7 @@ def run(
             for path in log_paths
             if _log_date_from_name(path.name) is None or _log_date_from_name(path.name) >= since
         ]
-    events = parse_drift_events(log_paths)
+    events = parse_drift_events(log_paths, logs_dir / DRIFT_INDEX_NAME)
     rows = build_history_rows(current, events)
     written = write_history_workbook(rows, output_path)
     with_history = {
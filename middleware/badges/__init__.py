@@ -2,11 +2,12 @@
 
 from badges.generator import BadgeGenerator
 from badges.runner import BadgeRunner
-from badges.uploader import BadgeUploadResult, WordPressBadgeUploader
+from badges.uploader import BadgeUploadManifest, BadgeUploadResult, WordPressBadgeUploader
 
 __all__ = [
     "BadgeGenerator",
     "BadgeRunner",
+    "BadgeUploadManifest",
     "BadgeUploadResult",
     "WordPressBadgeUploader",
 ]
@@ -19,9 +19,12 @@ import hmac
 import io
 import json
 import os
+import time
 import unicodedata
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import qrcode
 from loguru import logger
@@ -143,6 +146,37 @@ def _resolve_font_path(role: str) -> Optional[Path]:
     return None
 
 
+# Render stages reported by BadgeGenerator.timing_breakdown(), in draw order.
+_RENDER_STAGES = ("background", "photo", "qr", "church_code", "cards", "encode")
+
+
+@lru_cache(maxsize=2048)
+def _qr_image(payload: str) -> Image.Image:
+    """Return the scaled RGBA QR code for ``payload`` (shared; paste-only)."""
+    qr = qrcode.QRCode(
+        border=4,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+    )
+    qr.add_data(payload)
+    qr.make(fit=True)
+    qr_image = qr.make_image(
+        fill_color="black",
+        back_color="white",
+    ).convert("RGBA")
+    return qr_image.resize((QR_SIZE, QR_SIZE), Image.NEAREST)
+
+
+@lru_cache(maxsize=8)
+def _circle_mask(diameter: int) -> Image.Image:
+    """Return the ``L`` mask that clips a square photo to a circle."""
+    mask = Image.new("L", (diameter, diameter), 0)
+    ImageDraw.Draw(mask).ellipse(
+        (0, 0, diameter - 1, diameter - 1),
+        fill=255,
+    )
+    return mask
+
+
 def _ascii_initials(first: str, last: str) -> str:
     """Return up to two accent-stripped initials for the photo placeholder."""
 
@@ -193,7 +227,11 @@ class BadgeGenerator:
         self.filename_salt = salt.strip()
         self._font_cache: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
         self._resource_fingerprint_cache: Optional[bytes] = None
+        self._static_layer: Optional[Tuple[bytes, Image.Image]] = None
         self.last_write_skipped = False
+        # Cumulative seconds per render stage; see timing_breakdown().
+        self.stage_timings: Dict[str, float] = dict.fromkeys(_RENDER_STAGES, 0.0)
+        self.rendered_count = 0
 
     def filename_for(self, participant: Dict[str, Any]) -> str:
         """Return deterministic ``{church}_{chmid}_{8hex}.png`` filename."""
@@ -220,13 +258,18 @@ class BadgeGenerator:
         participant: Dict[str, Any],
         photo_bytes: Optional[bytes] = None,
     ) -> Image.Image:
-        """Render a 1080x1920 RGBA badge."""
-        canvas = self._load_template()
+        """Render a 1080x1920 RGBA badge.
+
+        Only the participant-specific layers are drawn here; the template and
+        fixed chrome come from a copy of the cached static layer.
+        """
+        with self._stage("background"):
+            canvas = self._static_background().copy()
         draw = ImageDraw.Draw(canvas)
-        self._draw_tagline(draw)
-        self._draw_theme(draw)
         self._draw_identity(canvas, draw, participant, photo_bytes)
-        self._draw_cards(draw, participant)
+        with self._stage("cards"):
+            self._draw_cards(draw, participant)
+        self.rendered_count += 1
         return canvas
 
     def render_to_file(
@@ -254,11 +297,67 @@ class BadgeGenerator:
             return out_path
 
         image = self.render(participant, photo_bytes)
-        image.save(out_path, format="PNG", optimize=True)
+        with self._stage("encode"):
+            image.save(out_path, format="PNG", optimize=True)
         fingerprint_path.write_text(f"{fingerprint}\n", encoding="ascii")
         logger.debug(f"Rendered badge: {out_path.name}")
         return out_path
 
+    def timing_breakdown(self) -> str:
+        """Return average milliseconds per rendered badge for each stage."""
+        count = max(self.rendered_count, 1)
+        stages = ", ".join(
+            f"{stage}={self.stage_timings[stage] * 1000 / count:.1f}"
+            for stage in _RENDER_STAGES
+        )
+        total = sum(self.stage_timings.values()) * 1000 / count
+        return (
+            f"Badge render timing over {self.rendered_count} badge(s), "
+            f"ms/badge: {stages}, total={total:.1f}"
+        )
+
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[name] += time.perf_counter() - start
+
+    def _static_background(self) -> Image.Image:
+        """Return the template plus participant-independent chrome.
+
+        Built once per resource fingerprint; callers must copy before drawing.
+        """
+        fingerprint = self._resource_fingerprint()
+        if self._static_layer is None or self._static_layer[0] != fingerprint:
+            canvas = self._load_template()
+            draw = ImageDraw.Draw(canvas)
+            self._draw_tagline(draw)
+            self._draw_theme(draw)
+            self._draw_static_chrome(draw)
+            self._static_layer = (fingerprint, canvas)
+        return self._static_layer[1]
+
+    def _draw_static_chrome(self, draw: ImageDraw.ImageDraw) -> None:
+        # Photo ring and QR card sit under every badge's photo and QR code.
+        draw.ellipse(
+            (
+                PHOTO_LEFT - 5,
+                PHOTO_TOP - 5,
+                PHOTO_LEFT + PHOTO_DIAM + 5,
+                PHOTO_TOP + PHOTO_DIAM + 5,
+            ),
+            fill=COL_PHOTO_RING,
+        )
+        draw.rounded_rectangle(
+            QR_CARD,
+            radius=12,
+            fill=COL_WHITE,
+            outline=COL_BORDER,
+            width=2,
+        )
+
     def _draw_tagline(self, draw: ImageDraw.ImageDraw) -> None:
         # The production template owns the upper title/branding area.
         return None
@@ -280,35 +379,38 @@ class BadgeGenerator:
             or ""
         ).strip()
         last = str(participant.get("last_name") or "").strip()
-        self._draw_photo(
-            canvas,
-            photo_bytes,
-            (
-                PHOTO_LEFT,
-                PHOTO_TOP,
-                PHOTO_LEFT + PHOTO_DIAM,
-                PHOTO_TOP + PHOTO_DIAM,
-            ),
-            first,
-            last,
-        )
-        self._draw_qr_block(
-            canvas,
-            draw,
-            self._required_chm_id(participant),
-            participant,
-        )
+        with self._stage("photo"):
+            self._draw_photo(
+                canvas,
+                photo_bytes,
+                (
+                    PHOTO_LEFT,
+                    PHOTO_TOP,
+                    PHOTO_LEFT + PHOTO_DIAM,
+                    PHOTO_TOP + PHOTO_DIAM,
+                ),
+                first,
+                last,
+            )
+        with self._stage("qr"):
+            self._draw_qr_block(
+                canvas,
+                draw,
+                self._required_chm_id(participant),
+                participant,
+            )
 
-        church_code = str(
-            participant.get("church_code") or "?"
-        ).strip().upper()
-        draw.text(
-            (CHURCH_CODE_CX, CHURCH_CODE_CY),
-            church_code,
-            font=self._font("bold", 76),
-            fill=COL_LABEL,
-            anchor="mm",
-        )
+        with self._stage("church_code"):
+            church_code = str(
+                participant.get("church_code") or "?"
+            ).strip().upper()
+            draw.text(
+                (CHURCH_CODE_CX, CHURCH_CODE_CY),
+                church_code,
+                font=self._font("bold", 76),
+                fill=COL_LABEL,
+                anchor="mm",
+            )
 
     def _draw_cards(
         self,
@@ -579,12 +681,9 @@ class BadgeGenerator:
         first: str,
         last: str,
     ) -> None:
+        # The ring around ``rect`` is part of the static background layer.
         left, top, right, bottom = rect
         diameter = right - left
-        ImageDraw.Draw(canvas).ellipse(
-            (left - 5, top - 5, right + 5, bottom + 5),
-            fill=COL_PHOTO_RING,
-        )
 
         image = None
         if photo_bytes:
@@ -611,12 +710,7 @@ class BadgeGenerator:
                 (diameter, diameter),
                 Image.LANCZOS,
             ).convert("RGBA")
-            mask = Image.new("L", (diameter, diameter), 0)
-            ImageDraw.Draw(mask).ellipse(
-                (0, 0, diameter - 1, diameter - 1),
-                fill=255,
-            )
-            canvas.paste(image, (left, top), mask)
+            canvas.paste(image, (left, top), _circle_mask(diameter))
             return
 
         initials = _ascii_initials(first, last)
@@ -644,24 +738,8 @@ class BadgeGenerator:
         payload: str,
         participant: Dict[str, Any],
     ) -> None:
-        draw.rounded_rectangle(
-            QR_CARD,
-            radius=12,
-            fill=COL_WHITE,
-            outline=COL_BORDER,
-            width=2,
-        )
-        qr = qrcode.QRCode(
-            border=4,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-        )
-        qr.add_data(str(payload))
-        qr.make(fit=True)
-        qr_image = qr.make_image(
-            fill_color="black",
-            back_color="white",
-        ).convert("RGBA")
-        qr_image = qr_image.resize((QR_SIZE, QR_SIZE), Image.NEAREST)
+        # The QR card itself is part of the static background layer.
+        qr_image = _qr_image(str(payload))
         canvas.paste(qr_image, (QR_LEFT, QR_TOP), qr_image)
         self._draw_qr_tags(draw, participant)
 
@@ -9,17 +9,21 @@ Pipeline per participant:
      falling back to the WordPress ``photo_url``; if neither is usable the
      generator draws an initials placeholder.
   3. Render the PNG locally via BadgeGenerator.
-  4. Optionally upload the PNG to WordPress uploads for public hosting.
+  4. Optionally upload the PNG to WordPress uploads for public hosting.  Uploads
+     run on a small thread pool after rendering, and badges whose bytes were
+     already hosted are skipped (see ``BadgeUploadManifest``).
   5. Optionally write the hosted badge URL plus ChMeetings inline IMG tag
-     back to a dedicated ChMeetings one-line text custom field.
+     back to a dedicated ChMeetings one-line text custom field.  Profiles whose
+     stored value already matches (per the step 2 read) are skipped.
 """
 
 from __future__ import annotations
 
 import io
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from loguru import logger
@@ -27,15 +31,17 @@ from PIL import Image
 from tqdm import tqdm
 
 from badges.generator import BadgeGenerator
-from badges.uploader import WordPressBadgeUploader
-from chmeetings.backend_connector import CHM_MIN_REQUEST_INTERVAL_SECONDS
+from badges.uploader import WordPressBadgeUploader, default_badge_upload_manifest
 from config import CHECK_BOXES, CHM_FIELDS, SF_CHECKLIST_OPTIONS, SF_FIELD_IDS, Config
+from photo_store import PhotoStore, default_photo_store
 
 # Approval statuses that count as "approved" for badge eligibility.
 APPROVED_STATUSES = {"approved"}
 
 _PAGE_LIMIT = 50          # safety cap on pagination loops
 _PER_PAGE = 100
+# Badge URL write-back workers; pacing comes from the connector's rate limiter.
+BADGE_URL_WRITE_WORKERS = 4
 
 
 class BadgeRunner:
@@ -47,13 +53,17 @@ class BadgeRunner:
         wp_connector,
         generator: Optional[BadgeGenerator] = None,
         badge_uploader: Optional[WordPressBadgeUploader] = None,
+        photo_store: Optional[PhotoStore] = None,
     ) -> None:
         self.chm = chm_connector
         self.wp = wp_connector
         self.generator = generator or BadgeGenerator()
         self.badge_uploader = badge_uploader
+        # Shared with score sheets; None (e.g. under pytest) downloads directly.
+        self.photo_store = photo_store if photo_store is not None else default_photo_store()
         self._church_names: Optional[Dict[str, str]] = None
         self._badge_url_field: Optional[Tuple[int, str]] = None
+        self._people: Dict[str, Dict[str, Any]] = {}
 
     # ── Public entry point ─────────────────────────────────────────────────────
 
@@ -107,9 +117,12 @@ class BadgeRunner:
                     f"(output: {self.generator.output_dir})")
 
         uploader = None if dry_run or not upload else (
-            self.badge_uploader or WordPressBadgeUploader(self.wp)
+            self.badge_uploader
+            or WordPressBadgeUploader(self.wp, manifest=default_badge_upload_manifest())
         )
-        rendered = skipped = uploaded = chm_updated = errors = 0
+        rendered = skipped = uploaded = upload_unchanged = errors = 0
+        chm_updated = chm_unchanged = 0
+        ready: List[Tuple[Dict[str, Any], str, Path]] = []
         for p in tqdm(participants, desc="Rendering badges", unit="badge"):
             name = f"{p.get('first_name', '')} {p.get('last_name', '')}".strip() or p.get("chmeetings_id")
             if not str(p.get("chmeetings_id") or "").strip():
@@ -139,22 +152,50 @@ class BadgeRunner:
                     skipped += 1
                 else:
                     rendered += 1
-                if uploader is not None:
-                    upload_result = uploader.upload_badge(out_path)
-                    uploaded += 1
-                    if write_chmeetings_badge_url:
-                        self._write_badge_url_to_chmeetings(p, upload_result.url)
-                        chm_updated += 1
+                ready.append((p, name, out_path))
                 logger.debug(f"Badge ready for {name}: {out_path.name}")
             except Exception as e:  # noqa: BLE001 - one bad record shouldn't abort the batch
                 errors += 1
                 logger.error(f"Failed to process badge for {name} "
                              f"(chm_id={p.get('chmeetings_id')}): {e}")
 
+        if uploader is not None and ready:
+            # Uploads run concurrently; ChMeetings write-back follows as one batch.
+            upload_results = uploader.upload_badges([out_path for _, _, out_path in ready])
+            hosted: List[Tuple[Dict[str, Any], str, str]] = []
+            for (p, name, _), (_, upload_result) in zip(ready, upload_results):
+                if isinstance(upload_result, Exception):
+                    errors += 1
+                    logger.error(f"Failed to process badge for {name} "
+                                 f"(chm_id={p.get('chmeetings_id')}): {upload_result}")
+                    continue
+                if upload_result.reused:
+                    upload_unchanged += 1
+                else:
+                    uploaded += 1
+                hosted.append((p, name, upload_result.url))
+            if write_chmeetings_badge_url:
+                outcomes = self._write_badge_urls_to_chmeetings([(p, url) for p, _, url in hosted])
+                for (p, name, _), outcome in zip(hosted, outcomes):
+                    if isinstance(outcome, Exception):
+                        errors += 1
+                        logger.error(f"Failed to process badge for {name} "
+                                     f"(chm_id={p.get('chmeetings_id')}): {outcome}")
+                    elif outcome:
+                        chm_updated += 1
+                    else:
+                        chm_unchanged += 1
+
+        if self.photo_store is not None:
+            self.photo_store.save()
         logger.info(f"{mode}Badge generation complete — rendered={rendered}, "
-                    f"skipped={skipped}, uploaded={uploaded}, errors={errors}")
+                    f"skipped={skipped}, uploaded={uploaded}, "
+                    f"upload_unchanged={upload_unchanged}, errors={errors}")
+        if not dry_run and self.generator.rendered_count:
+            logger.info(self.generator.timing_breakdown())
         if write_chmeetings_badge_url:
-            logger.info(f"{mode}ChMeetings badge URL profiles updated={chm_updated}")
+            logger.info(f"{mode}ChMeetings badge URL profiles updated={chm_updated}, "
+                        f"unchanged={chm_unchanged}")
         return errors == 0
 
     # ── Data fetching ──────────────────────────────────────────────────────────
@@ -195,8 +236,53 @@ class BadgeRunner:
             "or set SF_FIELD_IDS['BADGE_URL'] after running the ChMeetings field inspector."
         )
 
-    def _write_badge_url_to_chmeetings(self, participant: Dict[str, Any], badge_url: str) -> None:
-        """Write the hosted badge URL preview value to the person's ChMeetings profile."""
+    def _write_badge_urls_to_chmeetings(
+        self,
+        writes: List[Tuple[Dict[str, Any], str]],
+    ) -> List[Union[bool, Exception]]:
+        """Write hosted badge URLs back to ChMeetings; one outcome per ``(participant, url)``.
+
+        The profile read during photo enrichment answers "already current?"
+        without a request, so unchanged badges cost nothing.  The remaining
+        writes run on a small worker pool that shares the connector's rate
+        limiter.  Outcomes are True (written), False (already current) or the
+        exception that failed that write.
+        """
+        outcomes: Dict[int, Union[bool, Exception]] = {}
+        pending: List[int] = []
+        field_id = self._badge_url_field_definition()[0] if writes else 0
+        for index, (participant, badge_url) in enumerate(writes):
+            chm_id = str(participant.get("chmeetings_id") or "").strip()
+            person = self._people.get(chm_id)
+            if person is not None and self._current_badge_url_value(person, field_id) == (
+                self._badge_url_profile_value(badge_url)
+            ):
+                outcomes[index] = False
+            else:
+                pending.append(index)
+        if len(writes) > len(pending):
+            logger.info(
+                f"ChMeetings badge URL already current for {len(writes) - len(pending)} "
+                f"profile(s); {len(pending)} to write"
+            )
+
+        def write(index: int) -> Union[bool, Exception]:
+            try:
+                return self._write_badge_url_to_chmeetings(*writes[index])
+            except Exception as exc:  # noqa: BLE001 - reported per badge by the caller
+                return exc
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(BADGE_URL_WRITE_WORKERS, len(pending))) as executor:
+                outcomes.update(zip(pending, executor.map(write, pending)))
+        return [outcomes[index] for index in range(len(writes))]
+
+    def _write_badge_url_to_chmeetings(self, participant: Dict[str, Any], badge_url: str) -> bool:
+        """Write the hosted badge URL preview value to the person's ChMeetings profile.
+
+        Re-reads the person first because ``update_person`` is a full-replace
+        PUT; returns False without writing when the stored value is current.
+        """
         chm_id = str(participant.get("chmeetings_id") or "").strip()
         badge_url = str(badge_url or "").strip()
         if not chm_id:
@@ -206,11 +292,13 @@ class BadgeRunner:
         badge_profile_value = self._badge_url_profile_value(badge_url)
 
         person = self.chm.get_person(chm_id)
-        time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
         if not person:
             raise ValueError(f"ChMeetings person {chm_id} was not found.")
 
         field_id, field_type = self._badge_url_field_definition()
+        if self._current_badge_url_value(person, field_id) == badge_profile_value:
+            logger.debug(f"Badge URL already current in ChMeetings chm_id={chm_id}")
+            return False
         additional_fields = self._merged_badge_url_fields(
             person.get("additional_fields") or [],
             field_id=field_id,
@@ -229,10 +317,26 @@ class BadgeRunner:
             additional_fields,
             extra_person_data=person,
         )
-        time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
         if not ok:
             raise ValueError(f"ChMeetings badge URL update failed for person {chm_id}.")
         logger.info(f"Badge URL written to ChMeetings chm_id={chm_id}")
+        return True
+
+    @staticmethod
+    def _current_badge_url_value(person: Dict[str, Any], field_id: int) -> str:
+        """Return the stored Badge URL field value of a ChMeetings person record."""
+        fields = person.get("additional_fields") or []
+        if isinstance(fields, dict):
+            return str(fields.get(CHM_FIELDS["BADGE_URL"]) or "").strip()
+        for field in fields:
+            if not isinstance(field, dict):
+                continue
+            if (
+                int(field.get("field_id") or field.get("id") or 0) == field_id
+                or field.get("field_name") == CHM_FIELDS["BADGE_URL"]
+            ):
+                return str(field.get("value") or "").strip()
+        return ""
 
     @staticmethod
     def _badge_url_profile_value(badge_url: str) -> str:
@@ -316,8 +420,9 @@ class BadgeRunner:
 
         if chm_id:
             person = self.chm.get_person(chm_id)
-            time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
             if person:
+                # Reused by the badge URL write-back to skip unchanged profiles.
+                self._people[chm_id] = person
                 chm_photo = person.get("photo")
                 if chm_photo and str(chm_photo).startswith(("http://", "https://")):
                     candidates.append(("chm_photo", str(chm_photo)))
@@ -343,13 +448,17 @@ class BadgeRunner:
 
         for source, photo_url in candidates:
             try:
-                response = requests.get(photo_url, timeout=(5, 20))
-                response.raise_for_status()
-                photo_bytes = response.content
-                with Image.open(io.BytesIO(photo_bytes)) as image:
-                    image.verify()
+                if self.photo_store is not None:
+                    photo_bytes, status = self.photo_store.fetch(photo_url)
+                else:
+                    response = requests.get(photo_url, timeout=(5, 20))
+                    response.raise_for_status()
+                    photo_bytes = response.content
+                    with Image.open(io.BytesIO(photo_bytes)) as image:
+                        image.verify()
+                    status = "downloaded"
                 logger.info(
-                    f"Photo source={source} status=downloaded chm_id={chm_id}"
+                    f"Photo source={source} status={status} chm_id={chm_id}"
                 )
                 return photo_bytes
             except (requests.RequestException, OSError, ValueError) as exc:
@@ -1,23 +1,37 @@
-"""Upload generated athlete badge PNGs to the WordPress plugin."""
+"""Upload generated athlete badge PNGs to the WordPress plugin.
+
+``BadgeUploadManifest`` remembers which badge bytes (by SHA-256) were already
+hosted under which filename and URL, so a rerun skips identical uploads.  It
+also remembers whether the host firewall forced the re-encoded retry, in which
+case later uploads send the re-encoded PNG first instead of paying the 403
+round trip again.  The manifest is scoped to one WordPress API URL.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import requests
 from loguru import logger
 from PIL import Image
 
-from config import Config
+from config import BADGE_UPLOAD_MANIFEST_FILE, BADGE_UPLOAD_WORKERS, Config
+from file_utils import LazyDefault, atomic_write_json
 
 BADGE_WIDTH = 1080
 BADGE_HEIGHT = 1920
 MAX_BADGE_BYTES = 5 * 1024 * 1024
 _SAFE_BADGE_FILENAME_RE = re.compile(r"^[A-Za-z0-9_.-]+\.png$")
+UPLOAD_MANIFEST_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -28,17 +42,113 @@ class BadgeUploadResult:
     url: str
     byte_size: int
     sha256_hash: str
+    reused: bool = False
+
+
+def _default_api_url(wp_connector: Optional[Any] = None) -> str:
+    return (
+        getattr(wp_connector, "custom_api_url", None)
+        or f"{str(Config.WP_URL).rstrip('/')}/wp-json/vaysf/v1"
+    ).rstrip("/")
+
+
+class BadgeUploadManifest:
+    """JSON-backed ``sha256 -> hosted badge`` map plus the firewall re-encode flag."""
+
+    def __init__(self, path: Path, scope: Optional[str] = None) -> None:
+        self.path = Path(path)
+        self.scope = _default_api_url() if scope is None else scope
+        self._lock = threading.Lock()
+        self._badges: Dict[str, Dict[str, Any]] = {}
+        self.firewall_reencode = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable badge upload manifest {self.path}: {exc}")
+            return
+        if payload.get("version") != UPLOAD_MANIFEST_VERSION or payload.get("scope") != self.scope:
+            return
+        self._badges = dict(payload.get("badges") or {})
+        self.firewall_reencode = bool(payload.get("firewall_reencode"))
+
+    def lookup(self, sha256: str, filename: str) -> Optional[BadgeUploadResult]:
+        """Return the hosted badge for these exact bytes under ``filename``, if any."""
+        with self._lock:
+            entry = self._badges.get(sha256)
+        if not entry or entry.get("filename") != filename or not entry.get("url"):
+            return None
+        return BadgeUploadResult(
+            filename=filename,
+            url=str(entry["url"]),
+            byte_size=int(entry.get("byte_size") or 0),
+            sha256_hash=str(entry.get("remote_sha256") or ""),
+            reused=True,
+        )
+
+    def record(self, sha256: str, filename: str, result: BadgeUploadResult, *, reencoded: bool) -> None:
+        """Remember an upload and whether it needed the firewall-friendly encoding."""
+        with self._lock:
+            for stale_sha, entry in list(self._badges.items()):
+                if entry.get("filename") == filename:
+                    del self._badges[stale_sha]
+            self._badges[sha256] = {
+                "filename": filename,
+                "url": result.url,
+                "byte_size": result.byte_size,
+                "remote_sha256": result.sha256_hash,
+                "uploaded_at": time.time(),
+            }
+            self.firewall_reencode = reencoded
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        try:
+            atomic_write_json(
+                self.path,
+                {
+                    "version": UPLOAD_MANIFEST_VERSION,
+                    "scope": self.scope,
+                    "firewall_reencode": self.firewall_reencode,
+                    "badges": self._badges,
+                },
+                sort_keys=True,
+            )
+        except OSError as exc:
+            logger.warning(f"Could not write badge upload manifest {self.path}: {exc}")
+
+
+_DEFAULT_MANIFEST: LazyDefault[BadgeUploadManifest] = LazyDefault(
+    BadgeUploadManifest, BADGE_UPLOAD_MANIFEST_FILE
+)
+
+
+def default_badge_upload_manifest() -> Optional[BadgeUploadManifest]:
+    """Return the process-wide manifest at BADGE_UPLOAD_MANIFEST_FILE, or None when disabled."""
+    return _DEFAULT_MANIFEST.get()
 
 
 class WordPressBadgeUploader:
     """Small client for the ``/wp-json/vaysf/v1/badges`` upload endpoint."""
 
-    def __init__(self, wp_connector: Optional[Any] = None, session: Optional[requests.Session] = None) -> None:
-        self.base_url = (
-            getattr(wp_connector, "custom_api_url", None)
-            or f"{str(Config.WP_URL).rstrip('/')}/wp-json/vaysf/v1"
-        ).rstrip("/")
+    def __init__(
+        self,
+        wp_connector: Optional[Any] = None,
+        session: Optional[requests.Session] = None,
+        manifest: Optional[BadgeUploadManifest] = None,
+        workers: int = BADGE_UPLOAD_WORKERS,
+    ) -> None:
+        self.base_url = _default_api_url(wp_connector)
         self.session = session or requests.Session()
+        self.manifest = manifest
+        self.workers = workers
+        # Once the firewall has rejected original bytes (this run or, via the
+        # manifest, the last one), send the re-encoded PNG first.
+        self._prefer_reencoded = bool(manifest and manifest.firewall_reencode)
 
         if wp_connector is not None and getattr(wp_connector, "session", None) is not None:
             self.session.cookies.update(wp_connector.session.cookies)
@@ -52,22 +162,72 @@ class WordPressBadgeUploader:
         # need requests to compute their own Content-Type boundary.
         self.session.headers.pop("Content-Type", None)
 
+    def upload_badges(
+        self,
+        badge_paths: Iterable[Path],
+    ) -> List[Tuple[Path, Union[BadgeUploadResult, Exception]]]:
+        """Upload badges on a bounded thread pool.
+
+        Returns ``(path, result)`` pairs in input order; ``result`` is the
+        exception instead when that upload failed, so one bad badge does not
+        stop the batch.
+        """
+        paths = [Path(path) for path in badge_paths]
+        if not paths:
+            return []
+
+        def upload(path: Path) -> Union[BadgeUploadResult, Exception]:
+            try:
+                return self.upload_badge(path)
+            except Exception as exc:  # noqa: BLE001 - reported per badge by the caller
+                return exc
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(paths)))) as executor:
+            results = list(executor.map(upload, paths))
+        reused = sum(1 for result in results if isinstance(result, BadgeUploadResult) and result.reused)
+        failed = sum(1 for result in results if isinstance(result, Exception))
+        logger.info(
+            f"Badge uploads: {len(paths)} badge(s), {len(paths) - reused - failed} uploaded, "
+            f"{reused} unchanged since the last upload, {failed} failed"
+        )
+        return list(zip(paths, results))
+
     def upload_badge(self, badge_path: Path, *, filename: Optional[str] = None) -> BadgeUploadResult:
         """Upload one generated 1080x1920 PNG badge and return its hosted URL."""
         badge_path = Path(badge_path)
         upload_name = filename or badge_path.name
         self._validate_local_badge(badge_path, upload_name)
 
-        response = self._post_badge(badge_path, upload_name)
+        sha256 = hashlib.sha256(badge_path.read_bytes()).hexdigest()
+        if self.manifest is not None:
+            hosted = self.manifest.lookup(sha256, upload_name)
+            if hosted is not None:
+                logger.debug(f"Badge unchanged since last upload, skipping: {upload_name}")
+                return hosted
+
         retry_path: Optional[Path] = None
-        if response.status_code == 403:
-            logger.warning(
-                f"Badge upload was forbidden for {upload_name}; retrying with "
-                "a re-encoded PNG payload in case the host firewall matched "
-                "the original compressed bytes."
-            )
+        reencoded = self._prefer_reencoded
+        if reencoded:
             retry_path = self._reencode_for_firewall_retry(badge_path)
             response = self._post_badge(retry_path, upload_name)
+            if response.status_code == 403:
+                logger.warning(
+                    f"Re-encoded badge upload was forbidden for {upload_name}; "
+                    "retrying with the original PNG payload."
+                )
+                reencoded = False
+                response = self._post_badge(badge_path, upload_name)
+        else:
+            response = self._post_badge(badge_path, upload_name)
+            if response.status_code == 403:
+                logger.warning(
+                    f"Badge upload was forbidden for {upload_name}; retrying with "
+                    "a re-encoded PNG payload in case the host firewall matched "
+                    "the original compressed bytes."
+                )
+                reencoded = True
+                retry_path = self._reencode_for_firewall_retry(badge_path)
+                response = self._post_badge(retry_path, upload_name)
 
         try:
             response.raise_for_status()
@@ -92,6 +252,9 @@ class WordPressBadgeUploader:
             byte_size=int(payload.get("size") or badge_path.stat().st_size),
             sha256_hash=str(payload.get("sha256") or ""),
         )
+        self._prefer_reencoded = reencoded
+        if self.manifest is not None:
+            self.manifest.record(sha256, upload_name, result, reencoded=reencoded)
         logger.debug(f"Badge uploaded filename={result.filename} bytes={result.byte_size}")
         return result
 
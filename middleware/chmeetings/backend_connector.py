@@ -9,6 +9,7 @@ from typing import BinaryIO, Dict, List, Optional, Union, Any
 from urllib.parse import urljoin
 from loguru import logger
 
+from chmeetings.rate_limiter import AdaptiveRateLimiter, parse_retry_after
 from config import Config
 
 class ChMeetingsAPIError(Exception):
@@ -93,18 +94,21 @@ PERSON_PUT_DATE_FIELDS = frozenset({
 # ChMeetings reconciles their docs, update this constant (and this note) to
 # match the primary source.
 #
-# Every bulk ChMeetings-call loop should pace its inter-call sleep from this
-# one constant rather than a scattered hardcoded literal (issue #296).
+# Pacing is enforced in one place: _api_request() takes a token from the
+# connector's AdaptiveRateLimiter, whose sustained rate comes from this
+# constant (issue #296).  Call sites must not add their own sleeps.
 CHM_MIN_REQUEST_INTERVAL_SECONDS = 0.2  # 1 / 5 req/s
+CHM_RATE_LIMIT_BURST = 5
 
 # Bounded exponential backoff for HTTP 429 in _api_request(): 2s -> 60s cap,
-# 6 retries max, per the same conservative guidance.
+# 6 retries max, per the same conservative guidance.  A Retry-After header
+# overrides the schedule entry (capped at the schedule's last value).
 CHM_429_RETRY_WAITS_SECONDS = [2, 4, 8, 16, 32, 60]
 
 class ChMeetingsConnector:
     """Connector for ChMeetings API."""
 
-    def __init__(self, use_api: bool = True):
+    def __init__(self, use_api: bool = True, rate_limiter: Optional[AdaptiveRateLimiter] = None):
         self.api_url = Config.CHM_API_URL
         self.api_key = Config.CHM_API_KEY
         self.use_api = use_api
@@ -114,6 +118,12 @@ class ChMeetingsConnector:
         self.last_get_groups_status: Optional[str] = None
         self.last_get_group_people_status: Optional[str] = None
         self.session = requests.Session()
+        # One bucket per connector; worker threads share the connector, and
+        # therefore the ChMeetings request budget.
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter(
+            rate=1 / CHM_MIN_REQUEST_INTERVAL_SECONDS,
+            burst=CHM_RATE_LIMIT_BURST,
+        )
         # Set headers with API key (new API uses lowercase "apikey")
         self.session.headers.update({
             "accept": "application/json",
@@ -144,10 +154,13 @@ class ChMeetingsConnector:
         return None
 
     def _api_request(self, method: str, url_suffix: str, **kwargs) -> requests.Response:
-        """Execute an HTTP request with automatic 429 retry.
+        """Execute a paced HTTP request with automatic 429 retry.
 
-        Backoff schedule is CHM_429_RETRY_WAITS_SECONDS (2s -> 60s cap, 6
-        retries max) — see the module-level comment for why.
+        Each request first takes a token from ``self.rate_limiter``.  Backoff
+        schedule is CHM_429_RETRY_WAITS_SECONDS (2s -> 60s cap, 6 retries
+        max) — see the module-level comment for why — unless the response
+        carries Retry-After.  A 429 also tightens the limiter for every
+        other caller sharing this connector.
 
         Raises requests.RequestException on network errors or after exhausting
         retries on HTTP 429.  Callers are responsible for checking other
@@ -158,10 +171,17 @@ class ChMeetingsConnector:
         url = urljoin(self.api_url, url_suffix)
         http_fn = getattr(self.session, method.lower())
         for attempt in range(len(retry_waits) + 1):
+            if attempt == 0:
+                # Retries are already paced by the backoff sleep below.
+                self.rate_limiter.acquire()
             response = http_fn(url, **kwargs)
             if response.status_code == 429:
                 if attempt < len(retry_waits):
                     wait = retry_waits[attempt]
+                    retry_after = parse_retry_after(getattr(response, "headers", None))
+                    if retry_after is not None:
+                        wait = min(retry_after, retry_waits[-1])
+                    self.rate_limiter.on_throttle(wait)
                     logger.warning(
                         f"[VAY SM] Rate limited (429) on {method.upper()} {url_suffix}. "
                         f"Waiting {wait}s (retry {attempt + 1}/{len(retry_waits)})..."
@@ -173,6 +193,7 @@ class ChMeetingsConnector:
                     f"exhausted all {len(retry_waits)} retries."
                 )
                 response.raise_for_status()
+            self.rate_limiter.on_success()
             return response
         return response  # unreachable but satisfies linters
 
@@ -270,6 +291,35 @@ class ChMeetingsConnector:
         self.last_get_people_status = "ok"
         return all_people
 
+    def count_people(self) -> Optional[int]:
+        """Return the organization's people count from one single-row page.
+
+        Reads ``paging.total_count``; returns None when the API does not
+        report it or the request fails, so callers can fall back to a default.
+        """
+        if not self.use_api:
+            logger.error("API usage is disabled")
+            return None
+        try:
+            response = self._api_request(
+                "GET", "api/v1/people",
+                params={"page": 1, "page_size": 1,
+                        "include_additional_fields": False,
+                        "include_family_members": False,
+                        "include_organizations": False}
+            )
+            response.raise_for_status()
+            paging = self._get_paging(response.json())
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Failed to count people: {str(e)}")
+            return None
+        if not paging or "total_count" not in paging:
+            return None
+        try:
+            return int(paging["total_count"])
+        except (TypeError, ValueError):
+            return None
+
     def get_person(self, person_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific person record from ChMeetings.
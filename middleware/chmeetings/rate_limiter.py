@@ -0,0 +1,119 @@
+# chmeetings/rate_limiter.py
+"""Adaptive token-bucket pacing for ChMeetings API calls.
+
+Every ChMeetings request goes through ``ChMeetingsConnector._api_request``,
+which takes one token from the connector's ``AdaptiveRateLimiter`` before
+sending.  Pacing therefore lives in one place instead of a fixed
+``time.sleep`` after each call site's request: a request that itself took
+400 ms costs no extra wait, and worker threads sharing one connector queue
+behind the same bucket instead of each sleeping on its own schedule.
+
+The bucket refills at ``rate`` tokens per second up to ``burst``.  When
+ChMeetings answers 429 the limiter halves its rate (never below
+``min_rate``), empties the bucket and blocks every caller until the backoff
+or ``Retry-After`` has elapsed.  After ``recover_after`` consecutive
+successes the rate steps back up towards ``max_rate``.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, Optional
+
+
+def parse_retry_after(headers: Any, now: Optional[datetime] = None) -> Optional[float]:
+    """Return the ``Retry-After`` delay in seconds, or None when absent/invalid.
+
+    Accepts both forms allowed by RFC 9110: delay-seconds and an HTTP-date.
+    """
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get("Retry-After")
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe token bucket that tightens on 429 and relaxes on success."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 5,
+        min_rate: float = 0.5,
+        recover_after: int = 20,
+        recover_step: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.recover_after = recover_after
+        self.recover_step = recover_step
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        self._successes = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before sending.
+
+        Tokens may go negative: each caller reserves its place in line, so
+        concurrent callers are spaced ``1 / rate`` apart instead of waking
+        together.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return the time slept."""
+        wait = self.reserve()
+        if wait > 0:
+            (self._sleep or time.sleep)(wait)
+        return wait
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.recover_after and self.rate < self.max_rate:
+                self._refill(self._clock())
+                self.rate = min(self.max_rate, self.rate + self.recover_step)
+                self._successes = 0
+
+    def on_throttle(self, wait: float) -> None:
+        """Record a 429: halve the rate and hold every caller for ``wait`` seconds."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + wait)
+            self._successes = 0
@@ -58,11 +58,12 @@ from config import (
     POD_FIT_COLOR_RED,
     POD_FIT_YELLOW_MAX,
 )
-from validation.name_matcher import normalized_name as _norm_name
+from validation.name_matcher import TokenPrefixIndex, normalized_name as _norm_name
 from chmeetings.backend_connector import ChMeetingsConnector
 from wordpress.frontend_connector import WordPressConnector
 from tenacity import RetryError
 from time_utils import current_business_date, parse_wordpress_created_at_to_business_date
+from frame_utils import frame_records
 from schedule_workbook import ScheduleWorkbookBuilder
 from validation.models import RulesManager
 from math import ceil
@@ -254,6 +255,24 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
             for query_token in query_tokens
         )
 
+    @staticmethod
+    def _likely_name_match_candidates(
+        query_name_key: str,
+        token_index: TokenPrefixIndex,
+    ) -> List[int]:
+        """Positions that can pass ``_is_likely_name_match`` for ``query_name_key``.
+
+        Every query token must equal, or from two characters start, some
+        candidate token, so the longest query token alone narrows the pool.
+        """
+        query_tokens = str(query_name_key or "").split()
+        if not query_tokens:
+            return []
+        anchor = max(query_tokens, key=len)
+        if len(anchor) >= 2:
+            return sorted(token_index.with_prefix(anchor))
+        return sorted(token_index.with_token(anchor))
+
     @classmethod
     def _reverse_partner_suggestion_key(
         cls,
@@ -310,6 +329,9 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
 
         suggestions_by_key: Dict[Tuple[str, str, str, str], set[str]] = {}
         for (_, sport_type_key, sport_gender_key, sport_format_key), event_rows in grouped_rows.items():
+            token_index = TokenPrefixIndex(
+                candidate["participant_name_key"].split() for candidate in event_rows
+            )
             for claimant in event_rows:
                 partner_name = claimant["partner_name"]
                 if not partner_name:
@@ -318,7 +340,12 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
                 partner_name_key = self._normalized_name(partner_name)
                 matching_targets = [
                     candidate
-                    for candidate in event_rows
+                    for candidate in (
+                        event_rows[position]
+                        for position in self._likely_name_match_candidates(
+                            partner_name_key, token_index
+                        )
+                    )
                     if candidate["participant_id"] != claimant["participant_id"]
                     and self._is_likely_name_match(
                         partner_name_key,
@@ -414,6 +441,7 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
                 "participant_name_key": self._normalized_name(participant_name),
             })
 
+        token_indexes: Dict[Tuple[str, str, str], TokenPrefixIndex] = {}
         suggestions_by_key: Dict[Tuple[str, str, str, str], set[str]] = {}
         for issue in issues:
             if issue.get("issue_type") != "doubles_partner_unmatched":
@@ -442,10 +470,17 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
                 continue
 
             partner_name_key = self._normalized_name(parsed_partner_name)
+            token_index = token_indexes.get(event_key)
+            if token_index is None:
+                token_index = token_indexes[event_key] = TokenPrefixIndex(
+                    target["participant_name_key"].split() for target in event_targets
+                )
             matching_targets = [
-                target
-                for target in event_targets
-                if self._is_likely_name_match(partner_name_key, target["participant_name_key"])
+                event_targets[position]
+                for position in self._likely_name_match_candidates(partner_name_key, token_index)
+                if self._is_likely_name_match(
+                    partner_name_key, event_targets[position]["participant_name_key"]
+                )
             ]
             unique_targets = {
                 target["participant_id"]: target
@@ -1738,7 +1773,7 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
         rows: List[Dict[str, Any]] = []
         resource_counts: Dict[str, int] = {}
 
-        for _, row in df.iterrows():
+        for row in frame_records(df):
             resource_type = ChurchTeamsExporter._clean_excel_text(row.get("Resource Type"))
             if not resource_type:
                 continue
@@ -1810,7 +1845,7 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
             return []
 
         slots: List[Dict[str, Any]] = []
-        for _, row in df.iterrows():
+        for row in frame_records(df):
             game_id = ChurchTeamsExporter._clean_excel_text(row.get("game_id"))
             if not game_id:
                 continue
@@ -1883,7 +1918,7 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
             return {}
 
         gym_modes: Dict[str, Dict[str, int]] = {}
-        for _, row in df.iterrows():
+        for row in frame_records(df):
             gym_name = ChurchTeamsExporter._clean_excel_text(row.get("Gym Name"))
             if not gym_name:
                 continue
@@ -2564,7 +2599,7 @@ class ChurchTeamsExporter: # MODIFIED CLASS NAME
             return {}
 
         totals: Dict[str, int] = {}
-        for _, row in df.iterrows():
+        for row in frame_records(df):
             resource_type = ChurchTeamsExporter._clean_excel_text(row.get("Resource Type"))
             if not resource_type:
                 continue
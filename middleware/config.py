@@ -3,13 +3,13 @@
 import os
 import platform
 from dotenv import load_dotenv
-from cryptography.fernet import Fernet
 from loguru import logger
 import json
 import datetime
 from urllib.parse import urlparse
 from pathlib import Path
 import sys
+from typing import Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Load environment variables
@@ -46,6 +46,60 @@ elif _running_under_pytest():
     EXPORT_DIR = DEFAULT_TEST_EXPORT_DIR
 else:
     EXPORT_DIR = Path(DEFAULT_EXPORT_PATH_STR)
+
+# Local caches, ledgers and manifests below are optional files, each with a
+# default under TEMP_DIR.  Setting the variable to an empty string disables
+# that cache; under pytest they default to off so tests never reuse state left
+# by an earlier run and opt in with an explicit path instead.
+def _optional_cache_path(env_name: str, default_path: Path) -> Optional[Path]:
+    """Resolve an optional cache file/dir from the environment."""
+    value = os.getenv(env_name)
+    if value is not None:
+        return Path(value) if value.strip() else None
+    if _running_under_pytest():
+        return None
+    return default_path
+
+
+# Persistent roster/badge photo store shared by scoresheets and badges.
+PHOTO_CACHE_DIR = _optional_cache_path("PHOTO_CACHE_DIR", TEMP_DIR / "photo_cache")
+PHOTO_CACHE_MAX_BYTES = int(os.getenv("PHOTO_CACHE_MAX_MB", 512)) * 1024 * 1024
+PHOTO_CACHE_REVALIDATE_HOURS = int(os.getenv("PHOTO_CACHE_REVALIDATE_HOURS", 168))  # conditional GET after this long; 0 = every run
+
+# Local ledger of the validation-issue sets last synced to WordPress, so
+# unchanged participants/churches skip the WordPress round trips.
+VALIDATION_ISSUE_LEDGER_FILE = _optional_cache_path(
+    "VALIDATION_ISSUE_LEDGER_FILE", TEMP_DIR / "validation_issue_ledger.json"
+)
+VALIDATION_ISSUE_LEDGER_MAX_AGE_HOURS = int(os.getenv("VALIDATION_ISSUE_LEDGER_MAX_AGE_HOURS", 24))  # full reconcile at least this often
+
+# Cached Team-group membership snapshot, so assign-groups reruns plan from it
+# instead of re-reading every Team group.
+TEAM_MEMBERSHIP_CACHE_FILE = _optional_cache_path(
+    "TEAM_MEMBERSHIP_CACHE_FILE", TEMP_DIR / "team_membership_snapshot.json"
+)
+TEAM_MEMBERSHIP_CACHE_TTL_MINUTES = int(os.getenv("TEAM_MEMBERSHIP_CACHE_TTL_MINUTES", 15))  # re-read a group after this long
+
+# On-disk jar for the WordPress host's bot-protection cookie, so a challenge
+# answered once is reused by later CLI runs.
+WP_COOKIE_JAR_FILE = _optional_cache_path("WP_COOKIE_JAR_FILE", TEMP_DIR / "wp_session_cookies.json")
+WP_COOKIE_JAR_TTL_HOURS = int(os.getenv("WP_COOKIE_JAR_TTL_HOURS", 12))  # re-answer the challenge at least this often
+
+PUBLISH_SCHEDULE_CHUNK_SIZE = int(os.getenv("PUBLISH_SCHEDULE_CHUNK_SIZE", 200))  # games per publish-schedule upsert request
+
+# Cached sf_schedules manifest (game_key/game_status/source_hash per row), so
+# publish-schedule dry runs fetch only rows updated since the last read.
+SCHEDULE_MANIFEST_CACHE_FILE = _optional_cache_path(
+    "SCHEDULE_MANIFEST_CACHE_FILE", TEMP_DIR / "schedule_manifest.json"
+)
+SCHEDULE_MANIFEST_FULL_REFRESH_MINUTES = int(os.getenv("SCHEDULE_MANIFEST_FULL_REFRESH_MINUTES", 60))  # full manifest re-read at least this often
+
+# Local manifest of badge PNGs already uploaded to WordPress (sha256 -> hosted
+# URL), so generate-badges --upload reruns skip identical uploads.
+BADGE_UPLOAD_MANIFEST_FILE = _optional_cache_path(
+    "BADGE_UPLOAD_MANIFEST_FILE", TEMP_DIR / "badge_upload_manifest.json"
+)
+BADGE_UPLOAD_WORKERS = int(os.getenv("BADGE_UPLOAD_WORKERS", 4))  # concurrent badge uploads to WordPress
 DEFAULT_APPROVED_GROUP_NAME = "2026 Sports Fest"
 DEFAULT_SPORTS_FEST_DATE = "2026-07-18"
 DEFAULT_BUSINESS_TIMEZONE = "America/Los_Angeles"
@@ -76,6 +130,8 @@ logger.add(_make_console_stream_safe(sys.stdout), level="DEBUG", format="{time:H
 # Encryption setup
 def get_or_create_key() -> bytes:
     """Generate or load encryption key from .key file."""
+    from cryptography.fernet import Fernet
+
     key_file = BASE_DIR / ".key"
     try:
         if key_file.exists():
@@ -90,8 +146,18 @@ def get_or_create_key() -> bytes:
         logger.error(f"Failed to manage encryption key: {e}")
         raise
 
-FERNET_KEY = get_or_create_key()
-fernet = Fernet(FERNET_KEY)
+def __getattr__(name: str):
+    """Build ``FERNET_KEY`` / ``fernet`` on first use rather than at import."""
+    if name == "FERNET_KEY":
+        value = get_or_create_key()
+    elif name == "fernet":
+        from cryptography.fernet import Fernet
+
+        value = Fernet(__getattr__("FERNET_KEY"))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 # Sport Type Constants: These should match the actual data entry form!!!
 SPORT_TYPE = {
@@ -505,6 +571,12 @@ COURT_ESTIMATE_BC_RR_GAMES_PER_TEAM      = 3
 COURT_ESTIMATE_BC_PLAYOFF_GAMES           = 4   # 3 semis + 1 final
 COURT_ESTIMATE_BC_MIN_TEAMS_FOR_PLAYOFF   = 9
 
+# Wall-clock limit for the CP-SAT search that draws the no-repeat BC pool
+# triplets.  Feasible draws and impossible ones (too few teams, too many
+# seeds) both resolve well inside this for up to 40 teams; hitting the limit
+# omits BC pool games with a warning rather than stalling the workbook build.
+BC_TRIPLET_SOLVER_TIMEOUT = float(os.getenv("BC_TRIPLET_SOLVER_TIMEOUT", 30))
+
 COURT_ESTIMATE_DEFAULT_MINUTES_PER_GAME = 60
 COURT_ESTIMATE_INCLUDE_THIRD_PLACE_GAME = True
 
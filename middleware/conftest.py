@@ -19,6 +19,16 @@ os.environ.setdefault("TMP", str(TEST_TEMP_DIR))
 os.environ.setdefault("TEMP", str(TEST_TEMP_DIR))
 os.environ.setdefault("TMPDIR", str(TEST_TEMP_DIR))
 os.environ.setdefault("EXPORT_DIR", str(TEST_EXPORT_DIR))
+# Optional on-disk caches start disabled; tests opt in with an explicit path.
+for _cache_env in (
+    "PHOTO_CACHE_DIR",
+    "VALIDATION_ISSUE_LEDGER_FILE",
+    "TEAM_MEMBERSHIP_CACHE_FILE",
+    "WP_COOKIE_JAR_FILE",
+    "SCHEDULE_MANIFEST_CACHE_FILE",
+    "BADGE_UPLOAD_MANIFEST_FILE",
+):
+    os.environ.setdefault(_cache_env, "")
 
 # Add middleware root to sys.path so tests can import project modules
 sys.path.insert(0, str(MIDDLEWARE_DIR))
@@ -0,0 +1,58 @@
+"""file_utils — atomic writes and process-wide defaults for local state files.
+
+The photo store, validation-issue ledger, Team-membership cache, WordPress
+cookie jar, schedule manifest cache, badge upload manifest, publish journal
+and drift-log index all keep a small file next to the middleware.  Each write
+goes to a temp file beside the target and is moved into place with
+``os.replace``, so a reader never sees a half-written file.  The temp name
+carries the process and thread id, so two writers in one process (e.g. two
+connectors sharing a jar path) never write through the same temp file.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a per-thread temp file and ``os.replace``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(path: Path, payload: Any, **dumps_kwargs: Any) -> None:
+    """Serialize ``payload`` with ``json.dumps(**dumps_kwargs)`` and write it atomically."""
+    atomic_write_bytes(path, json.dumps(payload, **dumps_kwargs).encode("utf-8"))
+
+
+class LazyDefault(Generic[T]):
+    """Process-wide instance built on first use from an optional config path.
+
+    ``get()`` returns None when the path setting is disabled (``None``), and
+    otherwise the one instance ``factory(path)`` built for this process.
+    """
+
+    def __init__(self, factory: Callable[[Path], T], path: Optional[Path]) -> None:
+        self._factory = factory
+        self._path = path
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[T]:
+        if self._path is None:
+            return None
+        with self._lock:
+            if self._instance is None:
+                self._instance = self._factory(self._path)
+            return self._instance
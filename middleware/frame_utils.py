@@ -0,0 +1,145 @@
+"""frame_utils — columnar ingestion helpers for spreadsheet exports.
+
+Form exports, consent exports, church applications and venue workbooks are
+read with ``pd.read_excel`` and then normalized cell by cell.  Walking the
+frame with ``DataFrame.iterrows()`` builds a pandas Series per row and runs
+the normalizers in Python for every cell, which dominates load time on
+multi-season archives.  The helpers here normalize a whole column at once
+and hand back plain Python lists, so loaders can zip them into dicts.
+
+Every column helper accepts a missing column and returns blanks for it,
+matching the ``row.get(column, "")`` idiom the row-wise loaders used.
+"""
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+
+FORM_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y")
+
+
+def _column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return ``df[column]`` as an object Series, or all-missing when absent."""
+    if column in df.columns:
+        return df[column].astype(object)
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _blank_missing(values: pd.Series) -> pd.Series:
+    """Replace NaN/None/NaT with an empty string, leaving other cells as-is."""
+    return values.where(values.notna(), "")
+
+
+def text_column(
+    df: pd.DataFrame,
+    column: str,
+    *,
+    lower: bool = False,
+    collapse_whitespace: bool = False,
+) -> List[str]:
+    """Return a column as stripped strings; blank/NaN cells become ``""``.
+
+    ``lower`` lowercases the result (email/name keys) and
+    ``collapse_whitespace`` folds internal runs of whitespace to one space.
+    """
+    values = _blank_missing(_column(df, column)).astype(str).str.strip()
+    if lower:
+        values = values.str.lower()
+    if collapse_whitespace:
+        values = values.str.replace(r"\s+", " ", regex=True)
+    return values.tolist()
+
+
+def first_text_column(df: pd.DataFrame, *columns: str) -> List[str]:
+    """Return the first non-blank stripped value across ``columns`` per row."""
+    result = pd.Series([""] * len(df), index=df.index, dtype=object)
+    for column in columns:
+        if column not in df.columns:
+            continue
+        values = pd.Series(text_column(df, column), index=df.index, dtype=object)
+        result = result.where(result != "", values)
+    return result.tolist()
+
+
+def phone_column(df: pd.DataFrame, column: str) -> List[str]:
+    """Return a column reduced to its digits; blank/NaN cells become ``""``."""
+    values = _blank_missing(_column(df, column)).astype(str)
+    return values.str.replace(r"\D+", "", regex=True).tolist()
+
+
+def _strip_text_cells(values: pd.Series) -> pd.Series:
+    """Strip surrounding whitespace from string cells, leaving other cells as-is."""
+    try:
+        stripped = values.str.strip()
+    except AttributeError:
+        # No string cells at all (e.g. an all-datetime column).
+        return values
+    return stripped.where(stripped.notna(), values)
+
+
+def _parse_datetime_series(
+    values: pd.Series, formats: Sequence[str]
+) -> pd.Series:
+    """Parse an object Series trying each format in order, then inference."""
+    values = _strip_text_cells(values)
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    remaining = values.notna() & (values != "")
+    for fmt in (*formats, "mixed"):
+        if not remaining.any():
+            break
+        attempt = pd.to_datetime(values[remaining], format=fmt, errors="coerce")
+        hits = attempt[attempt.notna()]
+        if hits.empty:
+            continue
+        parsed.loc[hits.index] = hits
+        remaining.loc[hits.index] = False
+    return parsed
+
+
+def iso_date_column(
+    df: pd.DataFrame,
+    column: str,
+    formats: Sequence[str] = FORM_DATE_FORMATS,
+) -> List[str]:
+    """Return a column as ISO ``YYYY-MM-DD`` strings; unparseable cells become ``""``.
+
+    Datetime cells keep their calendar date.  Text cells are tried against
+    ``formats`` in order and then pandas' per-value inference, the same
+    fallback order ``group_assignment._parse_form_date`` uses for one cell.
+    """
+    parsed = _parse_datetime_series(_column(df, column), formats)
+    return parsed.dt.strftime("%Y-%m-%d").fillna("").tolist()
+
+
+def datetime_column(
+    df: pd.DataFrame,
+    column: str,
+    formats: Sequence[str] = (),
+) -> List[Optional[datetime.datetime]]:
+    """Return a column as ``datetime`` objects, or ``None`` for unparseable cells."""
+    parsed = _parse_datetime_series(_column(df, column), formats)
+    return [
+        None if pd.isna(value) else value.to_pydatetime()
+        for value in parsed.tolist()
+    ]
+
+
+def source_row_numbers(df: pd.DataFrame) -> List[int]:
+    """Return the 1-based spreadsheet row number of each frame row (header is row 1)."""
+    return [int(index) + 2 for index in df.index]
+
+
+def zip_records(columns: Dict[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+    """Turn ``{key: column_values}`` into a list of per-row dicts."""
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+def frame_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Return the frame as plain per-row dicts without building a Series per row.
+
+    Cells keep their column dtype (no row-wise upcasting), and missing cells
+    stay NaN so existing ``pd.isna`` checks behave as before.
+    """
+    return df.to_dict("records")
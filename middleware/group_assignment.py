@@ -2,7 +2,6 @@
 import html
 import os
 import sys
-import time
 from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
@@ -24,8 +23,14 @@ from config import (
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-from chmeetings.backend_connector import (
-    ChMeetingsConnector, ChMeetingsReadError, CHM_MIN_REQUEST_INTERVAL_SECONDS,
+from chmeetings.backend_connector import ChMeetingsConnector, ChMeetingsReadError
+from frame_utils import (
+    first_text_column, iso_date_column, phone_column, source_row_numbers,
+    text_column, zip_records,
+)
+from group_membership import (
+    REMOVE, MembershipChange, apply_membership_changes, default_membership_cache,
+    load_membership_snapshot,
 )
 from wordpress.frontend_connector import WordPressConnector
 
@@ -79,55 +84,46 @@ def _clean_cell(value: Optional[str]) -> str:
     return str(value or "").strip()
 
 
-def _row_first_clean(row: pd.Series, *columns: str) -> str:
-    for column in columns:
-        value = _clean_cell(row.get(column, ""))
-        if value:
-            return value
-    return ""
-
-
 def _load_source_export_rows(source_file: str) -> List[Dict[str, str]]:
     """Load current-season registrants from an Individual Application export."""
-    df = pd.read_excel(source_file)
+    return _source_export_rows_from_frame(pd.read_excel(source_file))
+
+
+def _source_export_rows_from_frame(df: pd.DataFrame) -> List[Dict[str, str]]:
+    """Normalize an Individual Application export frame column by column."""
     required_columns = ["First Name", "Last Name", "Church Team"]
     missing = [col for col in required_columns if col not in df.columns]
     if missing:
         raise ValueError(f"Missing required column(s) in source export: {missing}")
 
-    rows: List[Dict[str, str]] = []
-    for _, row in df.iterrows():
-        church_code = str(row.get("Church Team", "") or "").strip().upper()
-        if not church_code:
-            continue
-        rows.append({
-            "source_row": str(int(row.name) + 2),
-            "first_name": _clean_cell(row.get("First Name", "")),
-            "last_name": _clean_cell(row.get("Last Name", "")),
-            "email": _normalize_text(row.get("Email", "")),
-            "email_display": _clean_cell(row.get("Email", "")),
-            "mobile_phone": _normalize_phone(row.get("Mobile Phone", "")),
-            "mobile_phone_display": _clean_cell(row.get("Mobile Phone", "")),
-            "gender": _clean_cell(row.get("Gender", "")),
-            "birth_date": _parse_form_date(row.get("Birthdate", "")),
-            "church_code": church_code,
-            "role": _clean_cell(row.get("My role is", "")),
-            "is_member": _row_first_clean(
-                row,
-                MEMBERSHIP_QUESTION,
-                "Would the church pastor say that you belong to his church?",
-            ),
-            "age_verification": _clean_cell(row.get("Age verification (by the date of Sports Fest)", "")),
-            "parent_name": _clean_cell(row.get(CHM_FIELDS["PARENT_NAME"], "")),
-            "parent_email": _clean_cell(row.get(CHM_FIELDS["PARENT_EMAIL"], "")),
-            "parent_phone": _clean_cell(row.get(CHM_FIELDS["PARENT_PHONE"], "")),
-            "additional_info": _clean_cell(row.get("Additional Info", "")),
-            "submission_date": _clean_cell(row.get("Submission Date", "")),
-            "primary_sport": _clean_cell(row.get("Primary Sport", "")),
-            "secondary_sport": _clean_cell(row.get("Secondary Sport", "")),
-            "other_events": _clean_cell(row.get("Other Events", "")),
-        })
-    return rows
+    columns = {
+        "source_row": [str(number) for number in source_row_numbers(df)],
+        "first_name": text_column(df, "First Name"),
+        "last_name": text_column(df, "Last Name"),
+        "email": text_column(df, "Email", lower=True),
+        "email_display": text_column(df, "Email"),
+        "mobile_phone": phone_column(df, "Mobile Phone"),
+        "mobile_phone_display": text_column(df, "Mobile Phone"),
+        "gender": text_column(df, "Gender"),
+        "birth_date": iso_date_column(df, "Birthdate"),
+        "church_code": [code.upper() for code in text_column(df, "Church Team")],
+        "role": text_column(df, "My role is"),
+        "is_member": first_text_column(
+            df,
+            MEMBERSHIP_QUESTION,
+            "Would the church pastor say that you belong to his church?",
+        ),
+        "age_verification": text_column(df, "Age verification (by the date of Sports Fest)"),
+        "parent_name": text_column(df, CHM_FIELDS["PARENT_NAME"]),
+        "parent_email": text_column(df, CHM_FIELDS["PARENT_EMAIL"]),
+        "parent_phone": text_column(df, CHM_FIELDS["PARENT_PHONE"]),
+        "additional_info": text_column(df, "Additional Info"),
+        "submission_date": text_column(df, "Submission Date"),
+        "primary_sport": text_column(df, "Primary Sport"),
+        "secondary_sport": text_column(df, "Secondary Sport"),
+        "other_events": text_column(df, "Other Events"),
+    }
+    return [row for row in zip_records(columns) if row["church_code"]]
 
 
 def _index_people_for_form_audit(
@@ -286,16 +282,16 @@ def _load_repair_extra_cols(source_file: str) -> Dict[str, Dict[str, str]]:
     """
     try:
         df = pd.read_excel(source_file)
-        result: Dict[str, Dict[str, str]] = {}
-        for i, row in df.iterrows():
-            row_key = str(int(i) + 2)
-            result[row_key] = {
-                "primary_format":   _clean_cell(row.get(CHM_FIELDS["PRIMARY_FORMAT"],   "")),
-                "primary_partner":  _clean_cell(row.get(CHM_FIELDS["PRIMARY_PARTNER"],  "")),
-                "secondary_format": _clean_cell(row.get(CHM_FIELDS["SECONDARY_FORMAT"], "")),
-                "secondary_partner":_clean_cell(row.get(CHM_FIELDS["SECONDARY_PARTNER"],"" )),
-            }
-        return result
+        records = zip_records({
+            "primary_format":    text_column(df, CHM_FIELDS["PRIMARY_FORMAT"]),
+            "primary_partner":   text_column(df, CHM_FIELDS["PRIMARY_PARTNER"]),
+            "secondary_format":  text_column(df, CHM_FIELDS["SECONDARY_FORMAT"]),
+            "secondary_partner": text_column(df, CHM_FIELDS["SECONDARY_PARTNER"]),
+        })
+        return {
+            str(row_number): record
+            for row_number, record in zip(source_row_numbers(df), records)
+        }
     except Exception as exc:
         logger.warning(f"Could not load racquet extra columns from {source_file!r}: {exc}")
         return {}
@@ -795,7 +791,6 @@ def repair_form_people(
                 additional_fields=payload.get("additional_fields"),
                 extra_fields=payload.get("extra_fields"),
             )
-            time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
 
             if not created_person:
                 counts["errored"] += 1
@@ -823,7 +818,9 @@ def repair_form_people(
             group_note = ""
             if group_id and new_id:
                 ok = chm_connector.add_person_to_group(group_id, new_id)
-                time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
+                membership_cache = default_membership_cache()
+                if ok and membership_cache is not None:
+                    membership_cache.invalidate([group_id])
                 group_note = (
                     f", added to {group_name}" if ok
                     else f", failed to add to {group_name}"
@@ -1425,7 +1422,6 @@ def _assign_people_to_church_team_groups_legacy(
                     outcome = "dry_run"
                 else:
                     ok = chm_connector.add_person_to_group(group_id, person["person_id"])
-                    time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
                     if ok:
                         logger.info(
                             f"[REVIEW NEEDED] Added {person['first_name']} {person['last_name']} "
@@ -1454,7 +1450,6 @@ def _assign_people_to_church_team_groups_legacy(
             else:
                 group_id = team_group_by_name[target_group_name]
                 ok = chm_connector.add_person_to_group(group_id, person["person_id"])
-                time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
                 if ok:
                     added += 1
                     outcome = "added"
@@ -1564,15 +1559,14 @@ def assign_people_to_church_team_groups(
             None,
         )
         laf_group_id: Optional[str] = str(laf_group["id"]) if laf_group else None
-        people_in_laf: set = set()
-        if laf_group_id:
-            for p in chm_connector.get_group_people(laf_group_id):
-                people_in_laf.add(str(p.get("person_id")))
-
-        people_in_teams = set()
-        for group in team_groups:
-            for person in chm_connector.get_group_people(group["id"]):
-                people_in_teams.add(str(person.get("person_id")))
+        membership_cache = default_membership_cache()
+        membership = load_membership_snapshot(
+            chm_connector,
+            team_groups + ([laf_group] if laf_group else []),
+            cache=membership_cache,
+        )
+        people_in_laf = membership.people_in([laf_group_id] if laf_group_id else [])
+        people_in_teams = membership.people_in(team_group_by_name.values())
 
         logger.info(f"Found {len(people_in_teams)} people already in team groups")
 
@@ -1611,7 +1605,6 @@ def assign_people_to_church_team_groups(
                         continue
                 if source_row:
                     fresh_person = chm_connector.get_person(person_id)
-                    time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
                     if not fresh_person:
                         hydration = _hydration_audit(
                             "blocked",
@@ -1666,7 +1659,6 @@ def assign_people_to_church_team_groups(
                                 update_fields,
                                 extra_person_data=person,
                             )
-                            time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
                             if ok:
                                 hydrated += 1
                                 hydration["outcome"] = (
@@ -1822,6 +1814,8 @@ def assign_people_to_church_team_groups(
         logger.info(f"Found {len(people_for_assignment)} people needing team assignment")
 
         if not people_for_assignment:
+            if membership_cache is not None:
+                membership_cache.store(membership)
             if audit_rows:
                 _write_audit_file("church_team_assignments.xlsx", audit_rows)
             logger.info(
@@ -1835,63 +1829,65 @@ def assign_people_to_church_team_groups(
         failed = 0
         missing_group = 0
 
+        # Plan the whole run as one change set against the snapshot, then
+        # issue only those writes.
+        wanted: List[Tuple[str, str]] = []
+        for person in people_for_assignment:
+            target_group_name = person["target_group"]
+            if target_group_name == Config.LOST_AND_FOUND_GROUP_NAME:
+                person["group_id"] = laf_group_id
+            else:
+                person["group_id"] = team_group_by_name.get(target_group_name)
+            if person["group_id"] is not None:
+                wanted.append((person["group_id"], person["person_id"]))
+
+        changes = membership.plan_additions(wanted)
+        if dry_run:
+            outcomes = ["dry_run"] * len(changes)
+        else:
+            outcomes = apply_membership_changes(chm_connector, membership, changes)
+        outcome_by_membership = {
+            (change.group_id, change.person_id): outcome
+            for change, outcome in zip(changes, outcomes)
+        }
+
         for person in people_for_assignment:
             target_group_name = person["target_group"]
             is_laf = target_group_name == Config.LOST_AND_FOUND_GROUP_NAME
-            if is_laf:
-                group_id = laf_group_id
-                if group_id is None:
+            group_id = person["group_id"]
+            if group_id is None:
+                if is_laf:
                     logger.warning(
                         f"Lost and Found group '{Config.LOST_AND_FOUND_GROUP_NAME}' not found "
                         f"in ChMeetings - skipping {person['first_name']} {person['last_name']} "
                         f"(id={person['person_id']}). Create the group in ChMeetings first."
                     )
-                    missing_group += 1
-                    outcome = "missing_group"
-                elif dry_run:
+                else:
+                    logger.warning(
+                        f"Group '{target_group_name}' not found in ChMeetings - "
+                        f"skipping {person['first_name']} {person['last_name']} "
+                        f"(id={person['person_id']})"
+                    )
+                missing_group += 1
+                outcome = "missing_group"
+            else:
+                outcome = outcome_by_membership.get((group_id, person["person_id"]), "already_in_team")
+                if outcome == "dry_run":
                     logger.info(
                         f"[dry-run] Would add {person['first_name']} {person['last_name']} "
-                        f"(id={person['person_id']}) to '{target_group_name}' [REVIEW NEEDED]"
+                        f"(id={person['person_id']}) to "
+                        + (f"'{target_group_name}' [REVIEW NEEDED]" if is_laf else target_group_name)
                     )
-                    outcome = "dry_run"
-                else:
-                    ok = chm_connector.add_person_to_group(group_id, person["person_id"])
-                    time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
-                    if ok:
+                elif outcome == "added":
+                    added += 1
+                    if is_laf:
                         logger.info(
                             f"[REVIEW NEEDED] Added {person['first_name']} {person['last_name']} "
                             f"(id={person['person_id']}) to '{Config.LOST_AND_FOUND_GROUP_NAME}' "
                             f"- submitted church/team: Other"
                         )
-                        added += 1
-                        outcome = "added"
-                    else:
-                        failed += 1
-                        outcome = "failed"
-            elif team_group_by_name.get(target_group_name) is None:
-                logger.warning(
-                    f"Group '{target_group_name}' not found in ChMeetings - "
-                    f"skipping {person['first_name']} {person['last_name']} "
-                    f"(id={person['person_id']})"
-                )
-                missing_group += 1
-                outcome = "missing_group"
-            elif dry_run:
-                logger.info(
-                    f"[dry-run] Would add {person['first_name']} {person['last_name']} "
-                    f"(id={person['person_id']}) to {target_group_name}"
-                )
-                outcome = "dry_run"
-            else:
-                group_id = team_group_by_name[target_group_name]
-                ok = chm_connector.add_person_to_group(group_id, person["person_id"])
-                time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
-                if ok:
-                    added += 1
-                    outcome = "added"
-                else:
+                elif outcome == "failed":
                     failed += 1
-                    outcome = "failed"
 
             audit_rows.append(_assignment_audit_row(
                 person,
@@ -1901,6 +1897,9 @@ def assign_people_to_church_team_groups(
                 hydration=person.get("hydration"),
             ))
 
+        if membership_cache is not None:
+            membership_cache.store(membership)
+
         _write_audit_file("church_team_assignments.xlsx", audit_rows)
 
         if dry_run:
@@ -1963,21 +1962,40 @@ def clear_team_groups(
 
         logger.info(f"Found {len(team_groups)} target team group(s) to inspect.")
 
-        groups_processed = 0
+        # Clearing always plans from a live read; the refreshed snapshot is
+        # written back so a following assign-groups run can reuse it.
+        membership_cache = default_membership_cache()
+        membership = load_membership_snapshot(
+            chm_connector, team_groups, cache=membership_cache, max_age_seconds=0
+        )
+        member_records = {
+            (group_id, record["person_id"]): record
+            for group_id in membership.group_names
+            for record in membership.members(group_id)
+        }
+        changes = membership.plan_removals(membership.group_names)
+        if dry_run:
+            outcomes = ["dry_run"] * len(changes)
+        else:
+            outcomes = apply_membership_changes(chm_connector, membership, changes)
+        if membership_cache is not None:
+            membership_cache.store(membership)
+
+        groups_processed = len(team_groups)
         empty_groups = 0
-        memberships_found = 0
-        removed = 0
-        already_absent = 0
-        failed = 0
+        memberships_found = len(changes)
+        removed = outcomes.count("removed")
+        already_absent = outcomes.count("already_absent")
+        failed = outcomes.count("failed")
         audit_rows: List[Dict[str, str]] = []
 
-        for group in team_groups:
-            group_id = str(group["id"])
-            group_name = group.get("name", "")
-            groups_processed += 1
+        changes_by_group: Dict[str, List[Tuple[MembershipChange, str]]] = {}
+        for change, outcome in zip(changes, outcomes):
+            changes_by_group.setdefault(change.group_id, []).append((change, outcome))
 
-            group_people = chm_connector.get_group_people(group_id)
-            if not group_people:
+        for group_id, group_name in membership.group_names.items():
+            group_changes = changes_by_group.get(group_id, [])
+            if not group_changes:
                 empty_groups += 1
                 logger.info(f"Group '{group_name}' is already empty.")
                 audit_rows.append({
@@ -1991,46 +2009,20 @@ def clear_team_groups(
                 })
                 continue
 
-            memberships_found += len(group_people)
-
-            for person in group_people:
-                person_id = str(person.get("person_id") or person.get("id") or "")
-                first_name = person.get("first_name", "")
-                last_name = person.get("last_name", "")
-                email = person.get("email", "")
-
-                if dry_run:
+            for change, outcome in group_changes:
+                record = member_records[(group_id, change.person_id)]
+                if outcome == "dry_run":
                     logger.info(
-                        f"[dry-run] Would remove {first_name} {last_name} "
-                        f"(id={person_id}) from {group_name}"
-                    )
-                    outcome = "dry_run"
-                else:
-                    ok = chm_connector.remove_person_from_group(
-                        group_id, person_id, not_found_ok=True
+                        f"[dry-run] Would remove {record['first_name']} {record['last_name']} "
+                        f"(id={change.person_id}) from {group_name}"
                     )
-                    time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
-                    if ok:
-                        delete_status = getattr(
-                            chm_connector, "last_group_membership_delete_status", "removed"
-                        )
-                        if delete_status == "already_absent":
-                            already_absent += 1
-                            outcome = "already_absent"
-                        else:
-                            removed += 1
-                            outcome = "removed"
-                    else:
-                        failed += 1
-                        outcome = "failed"
-
                 audit_rows.append({
                     "Group Id": group_id,
                     "Group Name": group_name,
-                    "Person Id": person_id,
-                    "First Name": first_name,
-                    "Last Name": last_name,
-                    "Email": email,
+                    "Person Id": change.person_id,
+                    "First Name": record["first_name"],
+                    "Last Name": record["last_name"],
+                    "Email": record["email"],
                     "Outcome": outcome,
                 })
 
@@ -2059,9 +2051,9 @@ def audit_team_groups(church_code: Optional[str] = None,
     A membership is considered orphaned when it appears in a Team group but
     GET /people/{id} returns 404 Not Found.
 
-    If remove_orphans=True, each orphaned membership is deleted from ChMeetings
-    immediately after identification. This is irreversible — run without the flag
-    first to review the audit file before committing to removal.
+    If remove_orphans=True, the orphaned memberships found by the audit pass are
+    deleted from ChMeetings as one change set. This is irreversible — run without
+    the flag first to review the audit file before committing to removal.
     """
     normalized_code = church_code.strip().upper() if church_code else None
     logger.info(
@@ -2090,6 +2082,12 @@ def audit_team_groups(church_code: Optional[str] = None,
 
         logger.info(f"Found {len(team_groups)} target team group(s) to audit.")
 
+        # Audits plan from a live read, like clear-team-groups.
+        membership_cache = default_membership_cache()
+        membership = load_membership_snapshot(
+            chm_connector, team_groups, cache=membership_cache, max_age_seconds=0
+        )
+
         groups_processed = 0
         memberships_found = 0
         orphans_found = 0
@@ -2098,13 +2096,12 @@ def audit_team_groups(church_code: Optional[str] = None,
         resolved_found = 0
         failed_lookups = 0
         audit_rows: List[Dict[str, str]] = []
+        orphan_rows: List[Tuple[MembershipChange, Dict[str, str]]] = []
 
-        for group in team_groups:
-            group_id = str(group["id"])
-            group_name = group.get("name", "")
+        for group_id, group_name in membership.group_names.items():
             groups_processed += 1
 
-            group_people = chm_connector.get_group_people(group_id)
+            group_people = membership.members(group_id)
             logger.info(f"Auditing group '{group_name}' with {len(group_people)} membership(s).")
             memberships_found += len(group_people)
 
@@ -2127,18 +2124,18 @@ def audit_team_groups(church_code: Optional[str] = None,
                 continue
 
             for person in group_people:
-                person_id = str(person.get("person_id") or person.get("id") or "")
-                membership_first_name = person.get("first_name", "")
-                membership_last_name = person.get("last_name", "")
-                membership_email = person.get("email", "")
+                person_id = person["person_id"]
+                membership_first_name = person["first_name"]
+                membership_last_name = person["last_name"]
+                membership_email = person["email"]
 
                 resolved_person = chm_connector.get_person(person_id) if person_id else None
-                time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)
 
                 lookup_status = getattr(chm_connector, "last_get_person_status", "failed")
                 resolved_first_name = ""
                 resolved_last_name = ""
                 resolved_email = ""
+                orphan_change: Optional[MembershipChange] = None
 
                 if resolved_person:
                     resolved_found += 1
@@ -2152,33 +2149,7 @@ def audit_team_groups(church_code: Optional[str] = None,
                         f"Orphaned Team-group membership found: {group_name} has person_id={person_id}, "
                         f"but ChMeetings GET /people/{person_id} returned 404."
                     )
-                    if remove_orphans:
-                        removed = chm_connector.remove_person_from_group(
-                            group_id, person_id, not_found_ok=True
-                        )
-                        delete_status = getattr(
-                            chm_connector, "last_group_membership_delete_status", "failed"
-                        )
-                        if removed and delete_status == "removed":
-                            orphans_removed += 1
-                            lookup_status = "orphan_removed"
-                            logger.info(
-                                f"Removed orphaned membership: person_id={person_id} from {group_name}."
-                            )
-                        elif removed and delete_status == "already_absent":
-                            orphans_stuck += 1
-                            lookup_status = "orphan_stuck"
-                            logger.warning(
-                                f"Cannot remove orphaned membership: person_id={person_id} from "
-                                f"{group_name} — ChMeetings DELETE also returned 404. "
-                                f"This record is permanently stuck (ChMeetings bug ticket #20188) "
-                                f"and must be resolved by ChMeetings support."
-                            )
-                        else:
-                            lookup_status = "orphan_remove_failed"
-                            logger.error(
-                                f"Failed to remove orphaned membership: person_id={person_id} from {group_name}."
-                            )
+                    orphan_change = MembershipChange(REMOVE, group_id, group_name, person_id)
                 else:
                     failed_lookups += 1
                     logger.warning(
@@ -2210,6 +2181,37 @@ def audit_team_groups(church_code: Optional[str] = None,
                     "WP Participant IDs": wp_ids,
                     "WP Names": wp_names,
                 })
+                if orphan_change is not None:
+                    orphan_rows.append((orphan_change, audit_rows[-1]))
+
+        if remove_orphans and orphan_rows:
+            outcomes = apply_membership_changes(
+                chm_connector, membership, [change for change, _ in orphan_rows]
+            )
+            for (change, row), outcome in zip(orphan_rows, outcomes):
+                if outcome == "removed":
+                    orphans_removed += 1
+                    row["Lookup Status"] = "orphan_removed"
+                    logger.info(
+                        f"Removed orphaned membership: person_id={change.person_id} from {change.group_name}."
+                    )
+                elif outcome == "already_absent":
+                    orphans_stuck += 1
+                    row["Lookup Status"] = "orphan_stuck"
+                    logger.warning(
+                        f"Cannot remove orphaned membership: person_id={change.person_id} from "
+                        f"{change.group_name} — ChMeetings DELETE also returned 404. "
+                        f"This record is permanently stuck (ChMeetings bug ticket #20188) "
+                        f"and must be resolved by ChMeetings support."
+                    )
+                else:
+                    row["Lookup Status"] = "orphan_remove_failed"
+                    logger.error(
+                        f"Failed to remove orphaned membership: person_id={change.person_id} "
+                        f"from {change.group_name}."
+                    )
+        if membership_cache is not None:
+            membership_cache.store(membership)
 
         _write_audit_file("team_group_orphan_audit.xlsx", audit_rows)
         summary = (
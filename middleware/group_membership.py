@@ -0,0 +1,297 @@
+# middleware/group_membership.py
+"""
+Team-group membership snapshot shared by assign-groups, clear-team-groups and
+audit-team-groups.
+
+A ``MembershipSnapshot`` is one pass over a set of ChMeetings groups, held as a
+bidirectional index (group -> members, person -> groups).  Commands plan from
+the snapshot into a minimal list of ``MembershipChange`` add/remove entries,
+and ``apply_membership_changes`` issues exactly those writes and keeps the
+snapshot in step with what succeeded.
+
+``MembershipSnapshotCache`` persists the per-group member lists with the time
+each group was last read from ChMeetings.  Groups read within the TTL are
+served from the cache, so a rerun that changes nothing costs no group reads.
+Local writes update the cached members but not the read time, so edits made
+in the ChMeetings UI are still picked up once the TTL runs out.  The cache is
+scoped to one ChMeetings API URL.
+"""
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from config import Config, TEAM_MEMBERSHIP_CACHE_FILE, TEAM_MEMBERSHIP_CACHE_TTL_MINUTES
+from file_utils import LazyDefault, atomic_write_json
+
+
+MEMBERSHIP_CACHE_VERSION = 1
+ADD = "add"
+REMOVE = "remove"
+_MEMBER_FIELDS = ("first_name", "last_name", "email")
+
+
+def membership_person_id(member: Dict[str, Any]) -> str:
+    """Person id of a get_group_people() record (``person_id``, falling back to ``id``)."""
+    return str(member.get("person_id") or member.get("id") or "")
+
+
+def _member_record(member: Dict[str, Any]) -> Dict[str, str]:
+    record = {"person_id": membership_person_id(member)}
+    record.update({name: str(member.get(name) or "") for name in _MEMBER_FIELDS})
+    return record
+
+
+@dataclass(frozen=True)
+class MembershipChange:
+    """One planned membership write."""
+
+    action: str  # ADD or REMOVE
+    group_id: str
+    group_name: str
+    person_id: str
+
+
+@dataclass
+class MembershipSnapshot:
+    """Members of a fixed set of groups, indexed both ways."""
+
+    group_names: Dict[str, str]
+    fetched_at: Dict[str, float] = field(default_factory=dict)
+    failed_groups: Set[str] = field(default_factory=set)
+    _members: Dict[str, Dict[str, Dict[str, str]]] = field(default_factory=dict)
+    _groups_by_person: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def set_members(self, group_id: str, members: Iterable[Dict[str, Any]]) -> None:
+        group_id = str(group_id)
+        for person_id in list(self._members.get(group_id, {})):
+            self._unlink(group_id, person_id)
+        self._members[group_id] = {}
+        for member in members:
+            record = _member_record(member)
+            if record["person_id"]:
+                self._link(group_id, record)
+
+    def _link(self, group_id: str, record: Dict[str, str]) -> None:
+        self._members.setdefault(group_id, {})[record["person_id"]] = record
+        self._groups_by_person.setdefault(record["person_id"], set()).add(group_id)
+
+    def _unlink(self, group_id: str, person_id: str) -> None:
+        self._members.get(group_id, {}).pop(person_id, None)
+        groups = self._groups_by_person.get(person_id)
+        if groups is not None:
+            groups.discard(group_id)
+            if not groups:
+                del self._groups_by_person[person_id]
+
+    def members(self, group_id: str) -> List[Dict[str, str]]:
+        """Member records of ``group_id`` in the order ChMeetings returned them."""
+        return list(self._members.get(str(group_id), {}).values())
+
+    def groups_of(self, person_id: str) -> Set[str]:
+        return set(self._groups_by_person.get(str(person_id), ()))
+
+    def is_member(self, group_id: str, person_id: str) -> bool:
+        return str(person_id) in self._members.get(str(group_id), {})
+
+    def people_in(self, group_ids: Iterable[str]) -> Set[str]:
+        people: Set[str] = set()
+        for group_id in group_ids:
+            people.update(self._members.get(str(group_id), {}))
+        return people
+
+    def plan_additions(self, wanted: Iterable[Tuple[str, str]]) -> List[MembershipChange]:
+        """Adds for the ``(group_id, person_id)`` pairs not already in the snapshot."""
+        changes: List[MembershipChange] = []
+        seen: Set[Tuple[str, str]] = set()
+        for group_id, person_id in wanted:
+            key = (str(group_id), str(person_id))
+            if key in seen or self.is_member(*key):
+                continue
+            seen.add(key)
+            changes.append(MembershipChange(ADD, key[0], self.group_names.get(key[0], ""), key[1]))
+        return changes
+
+    def plan_removals(
+        self,
+        group_ids: Iterable[str],
+        person_ids: Optional[Iterable[str]] = None,
+    ) -> List[MembershipChange]:
+        """Removes for the current members of ``group_ids`` (optionally only ``person_ids``)."""
+        only = {str(person_id) for person_id in person_ids} if person_ids is not None else None
+        changes: List[MembershipChange] = []
+        for group_id in group_ids:
+            group_id = str(group_id)
+            for person_id in self._members.get(group_id, {}):
+                if only is None or person_id in only:
+                    changes.append(
+                        MembershipChange(REMOVE, group_id, self.group_names.get(group_id, ""), person_id)
+                    )
+        return changes
+
+    def record_change(self, change: MembershipChange) -> None:
+        if change.action == ADD:
+            self._link(change.group_id, {"person_id": change.person_id, **{name: "" for name in _MEMBER_FIELDS}})
+        else:
+            self._unlink(change.group_id, change.person_id)
+
+
+def apply_membership_changes(
+    chm_connector: Any,
+    snapshot: MembershipSnapshot,
+    changes: Iterable[MembershipChange],
+) -> List[str]:
+    """
+    Issue one API write per change and return an outcome per change.
+
+    Outcomes are ``added``, ``removed``, ``already_absent`` (DELETE 404) or
+    ``failed``.  Successful changes are recorded in ``snapshot``.
+    """
+    outcomes: List[str] = []
+    for change in changes:
+        if change.action == ADD:
+            ok = chm_connector.add_person_to_group(change.group_id, change.person_id)
+            outcome = "added" if ok else "failed"
+        else:
+            ok = chm_connector.remove_person_from_group(
+                change.group_id, change.person_id, not_found_ok=True
+            )
+            delete_status = getattr(chm_connector, "last_group_membership_delete_status", "removed")
+            if not ok:
+                outcome = "failed"
+            elif delete_status == "already_absent":
+                outcome = "already_absent"
+            else:
+                outcome = "removed"
+        if ok:
+            snapshot.record_change(change)
+        outcomes.append(outcome)
+    return outcomes
+
+
+class MembershipSnapshotCache:
+    """JSON-backed per-group member lists with the time each group was read."""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = TEAM_MEMBERSHIP_CACHE_TTL_MINUTES * 60,
+        scope: Optional[str] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.scope = (Config.CHM_API_URL or "") if scope is None else scope
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable team-membership cache {self.path}: {exc}")
+            return {}
+        if payload.get("version") != MEMBERSHIP_CACHE_VERSION or payload.get("scope") != self.scope:
+            return {}
+        return dict(payload.get("groups") or {})
+
+    def fresh_members(self, group_id: str, max_age_seconds: float) -> Optional[Tuple[float, List[Dict[str, str]]]]:
+        """``(fetched_at, members)`` for a group read within ``max_age_seconds``, else None."""
+        with self._lock:
+            entry = self._groups.get(str(group_id))
+        if not entry:
+            return None
+        fetched_at = float(entry.get("fetched_at") or 0)
+        if time.time() - fetched_at >= max_age_seconds:
+            return None
+        return fetched_at, list(entry.get("members") or [])
+
+    def store(self, snapshot: MembershipSnapshot) -> None:
+        """Write every successfully read group of ``snapshot`` back to disk."""
+        with self._lock:
+            for group_id, fetched_at in snapshot.fetched_at.items():
+                if group_id in snapshot.failed_groups:
+                    self._groups.pop(group_id, None)
+                    continue
+                self._groups[group_id] = {
+                    "name": snapshot.group_names.get(group_id, ""),
+                    "fetched_at": fetched_at,
+                    "members": snapshot.members(group_id),
+                }
+            self._save_locked()
+
+    def invalidate(self, group_ids: Optional[Iterable[str]] = None) -> None:
+        """Drop the given groups (or every group) so the next load re-reads them."""
+        with self._lock:
+            if group_ids is None:
+                self._groups.clear()
+            else:
+                for group_id in group_ids:
+                    self._groups.pop(str(group_id), None)
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        try:
+            atomic_write_json(
+                self.path,
+                {"version": MEMBERSHIP_CACHE_VERSION, "scope": self.scope, "groups": self._groups},
+                sort_keys=True,
+            )
+        except OSError as exc:
+            logger.warning(f"Could not write team-membership cache {self.path}: {exc}")
+
+
+def load_membership_snapshot(
+    chm_connector: Any,
+    groups: Iterable[Dict[str, Any]],
+    cache: Optional[MembershipSnapshotCache] = None,
+    max_age_seconds: Optional[float] = None,
+) -> MembershipSnapshot:
+    """
+    Build a snapshot of ``groups`` (get_groups() records) in one pass.
+
+    Groups with a cache entry younger than ``max_age_seconds`` (default: the
+    cache TTL; 0 forces a live read) are served from ``cache``; the rest are
+    read with get_group_people().  A failed read leaves the group empty and
+    listed in ``failed_groups``, which keeps it out of the cache.
+    """
+    group_list = [(str(group["id"]), group.get("name", "")) for group in groups]
+    snapshot = MembershipSnapshot(group_names=dict(group_list))
+    if cache is not None and max_age_seconds is None:
+        max_age_seconds = cache.ttl_seconds
+    cached = 0
+    for group_id, _ in group_list:
+        hit = cache.fresh_members(group_id, max_age_seconds) if cache is not None else None
+        if hit is not None:
+            snapshot.fetched_at[group_id], members = hit
+            cached += 1
+        else:
+            if hasattr(chm_connector, "last_get_group_people_status"):
+                chm_connector.last_get_group_people_status = None
+            fetched_at = time.time()
+            members = chm_connector.get_group_people(group_id)
+            if getattr(chm_connector, "last_get_group_people_status", None) == "failed":
+                snapshot.failed_groups.add(group_id)
+            snapshot.fetched_at[group_id] = fetched_at
+        snapshot.set_members(group_id, members)
+    logger.info(
+        f"Membership snapshot: {len(group_list)} group(s), "
+        f"{cached} from cache, {len(group_list) - cached} read from ChMeetings"
+        + (f", {len(snapshot.failed_groups)} failed read(s)" if snapshot.failed_groups else "")
+    )
+    return snapshot
+
+
+_DEFAULT_CACHE: LazyDefault[MembershipSnapshotCache] = LazyDefault(
+    MembershipSnapshotCache, TEAM_MEMBERSHIP_CACHE_FILE
+)
+
+
+def default_membership_cache() -> Optional[MembershipSnapshotCache]:
+    """Return the process-wide cache at TEAM_MEMBERSHIP_CACHE_FILE, or None when disabled."""
+    return _DEFAULT_CACHE.get()
@@ -6,7 +6,7 @@ import argparse
 import time
 import datetime
 import json
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 from loguru import logger
 import schedule
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -17,11 +17,8 @@ from pathlib import Path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-from sync.manager import SyncManager
-from chmeetings.backend_connector import ChMeetingsConnector  # Import for export command
-from wordpress.frontend_connector import WordPressConnector   # Import for export command
-from church_teams_export import ChurchTeamsExporter           # Import for export command
-from season_reset import SeasonResetter                       # Import for reset-season command
+if TYPE_CHECKING:
+    from sync.manager import SyncManager
 
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments for the VAYSF middleware."""
@@ -331,6 +328,10 @@ def parse_args() -> argparse.Namespace:
                               help="Process a single ChMeetings person ID instead of the whole group (for testing)")
     reset_parser.add_argument("--probe", action="store_true",
                               help="Diagnostic: test what the PUT endpoint accepts for a single person (requires --person-id)")
+    reset_parser.add_argument("--workers", type=int, default=None,
+                              help="Members processed concurrently behind the ChMeetings rate limiter (default: 4)")
+    reset_parser.add_argument("--no-resume", action="store_true",
+                              help="Ignore steps recorded in DATA_DIR/season_reset_<year>.journal.jsonl and redo every member")
 
     # Generate-badges command (Issue #77)
     badges_parser = subparsers.add_parser(
@@ -366,9 +367,9 @@ def parse_args() -> argparse.Namespace:
     )
     scoresheets_parser.add_argument(
         "--sport",
-        choices=["basketball", "bible-challenge", "soccer", "volleyball"],
+        choices=["all", "basketball", "bible-challenge", "soccer", "volleyball"],
         default="basketball",
-        help="Sport score-sheet type to generate (default: basketball)",
+        help="Sport score-sheet type to generate; 'all' writes every sport's PDF in one pass (default: basketball)",
     )
     scoresheets_parser.add_argument(
         "--input",
@@ -400,6 +401,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Output directory for generated PDFs (default: EXPORT_DIR/scoresheets)",
     )
+    scoresheets_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Render processes for --sport all (default: CPU count; 1 renders in-process)",
+    )
     scoresheets_parser.add_argument(
         "--stage",
         choices=sorted(["playoff", "quarterfinal", "semifinal", "final", "3rd-place"]),
@@ -549,6 +556,11 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional path to the persisted pool_assignments.json sidecar (default: pool_assignments.json beside the workbook output)",
     )
+    build_workbook_parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Rebuild every tab even when the .build.json manifest says its inputs are unchanged",
+    )
 
     assign_pools_parser = subparsers.add_parser(
         "assign-pools",
@@ -898,7 +910,7 @@ def _default_schedule_json_path(filename: str) -> Path:
     return Path(EXPORT_DIR) / filename if EXPORT_DIR else DATA_DIR / filename
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-def run_sync(manager: SyncManager, sync_type: str = "full", chm_id: Optional[str] = None,
+def run_sync(manager: "SyncManager", sync_type: str = "full", chm_id: Optional[str] = None,
              excel_fallback: bool = False) -> bool:
     """Run synchronization process with retry logic.
 
@@ -969,6 +981,8 @@ def validate_config() -> bool:
 
 def run_scheduled_sync(interval: int, daemon: bool = False) -> None:
     """Run sync jobs at scheduled intervals."""
+    from sync.manager import SyncManager
+
     logger.info(f"Starting scheduled sync with {interval}-minute intervals")
     with SyncManager() as manager:
         schedule.every(interval).minutes.do(run_sync, manager=manager, sync_type="full")
@@ -1393,6 +1407,9 @@ def inspect_person(chm_id: str) -> bool:
     record is gone, it still looks for any matching WordPress participant so we
     can identify who the stale ID used to belong to.
     """
+    from chmeetings.backend_connector import ChMeetingsConnector
+    from wordpress.frontend_connector import WordPressConnector
+
     logger.info(f"Inspecting ChMeetings person ID: {chm_id}")
     found_any = False
 
@@ -1438,906 +1455,1043 @@ def inspect_person(chm_id: str) -> bool:
             )
 
     return found_any
-    
-def main() -> None:
-    """Main entry point for the VAYSF middleware."""
-    args = parse_args()
-    logger.info(f"Executing command: {args.command}")
 
-# START --- Modified main() function's sync block in main.py ---
-    if args.command == "sync":
-        # Retrieve chm_id from args. It will be None if not provided.
-        participant_chm_id = args.chm_id if hasattr(args, 'chm_id') else None
-
-        # Optional: Add a check or warning if --chm-id is used with a sync type other than 'participants'  or 'approvals'
-        if participant_chm_id and args.type not in ["participants", "approvals"]: # Ensure "approvals" is in this list
-            logger.warning(f"--chm-id '{participant_chm_id}' was provided with sync type '{args.type}'. "
-                           "The --chm-id argument is only used when --type is 'participants' or 'approvals'. "
-                           "The specified ID will be ignored for this operation.")
-            # Reset to None if not applicable to ensure run_sync behaves as expected for other types or let run_sync handle the warning as implemented above.
-            # For clarity here, if it's not for 'participants', it shouldn't be passed as a specific ID.
-            # However, run_sync already has a conditional warning for 'full' type.
-            # Let's pass it and let run_sync decide.
-
-        excel_fallback = args.excel_fallback if hasattr(args, 'excel_fallback') else False
-        manager = SyncManager()
-        with manager:
-            # Pass the participant_chm_id and excel_fallback to run_sync
-            success = run_sync(manager, args.type, chm_id=participant_chm_id, excel_fallback=excel_fallback)
-# END --- Modified main() function's sync block in main.py ---
-    elif args.command == "sync-churches":
-        if not os.path.exists(args.file):
-            logger.error(f"Excel file not found at {args.file}")
-            success = False
+
+# Command registry: parse_args() only builds the parser, and each handler
+# imports its subsystem when it runs, so light commands (config, test,
+# inspect-person, ...) never load pandas, openpyxl, OR-Tools or Pillow.
+COMMAND_HANDLERS: Dict[str, Callable[[argparse.Namespace], bool]] = {}
+
+
+def _command(name: str) -> Callable[[Callable[[argparse.Namespace], bool]], Callable[[argparse.Namespace], bool]]:
+    """Register the decorated function as the handler for subcommand ``name``."""
+    def register(handler: Callable[[argparse.Namespace], bool]) -> Callable[[argparse.Namespace], bool]:
+        COMMAND_HANDLERS[name] = handler
+        return handler
+    return register
+
+
+@_command("sync")
+def _command_sync(args: argparse.Namespace) -> bool:
+    from sync.manager import SyncManager
+
+    # Retrieve chm_id from args. It will be None if not provided.
+    participant_chm_id = args.chm_id if hasattr(args, 'chm_id') else None
+
+    # Optional: Add a check or warning if --chm-id is used with a sync type other than 'participants'  or 'approvals'
+    if participant_chm_id and args.type not in ["participants", "approvals"]: # Ensure "approvals" is in this list
+        logger.warning(f"--chm-id '{participant_chm_id}' was provided with sync type '{args.type}'. "
+                       "The --chm-id argument is only used when --type is 'participants' or 'approvals'. "
+                       "The specified ID will be ignored for this operation.")
+        # Reset to None if not applicable to ensure run_sync behaves as expected for other types or let run_sync handle the warning as implemented above.
+        # For clarity here, if it's not for 'participants', it shouldn't be passed as a specific ID.
+        # However, run_sync already has a conditional warning for 'full' type.
+        # Let's pass it and let run_sync decide.
+
+    excel_fallback = args.excel_fallback if hasattr(args, 'excel_fallback') else False
+    manager = SyncManager()
+    with manager:
+        # Pass the participant_chm_id and excel_fallback to run_sync
+        success = run_sync(manager, args.type, chm_id=participant_chm_id, excel_fallback=excel_fallback)
+    return success
+
+
+@_command("sync-churches")
+def _command_sync_churches(args: argparse.Namespace) -> bool:
+    from sync.manager import SyncManager
+
+    if not os.path.exists(args.file):
+        logger.error(f"Excel file not found at {args.file}")
+        success = False
+    else:
+        with SyncManager() as manager:
+            success = manager.sync_churches_from_excel(args.file)  # Fixed
+    return success
+
+
+@_command("assign-groups")
+def _command_assign_groups(args: argparse.Namespace) -> bool:
+    from group_assignment import assign_people_to_church_team_groups
+    dry_run = getattr(args, "dry_run", False)
+    success = assign_people_to_church_team_groups(
+        dry_run=dry_run,
+        source_file=getattr(args, "file", None),
+        chm_ids=getattr(args, "chm_id", None),
+        church_codes=getattr(args, "church_code", None),
+    )
+    if success:
+        if dry_run:
+            logger.info("Dry-run complete. Check data/church_team_assignments.xlsx for the preview.")
         else:
-            with SyncManager() as manager:
-                success = manager.sync_churches_from_excel(args.file)  # Fixed
-    elif args.command == "assign-groups":
-        from group_assignment import assign_people_to_church_team_groups
-        dry_run = getattr(args, "dry_run", False)
-        success = assign_people_to_church_team_groups(
-            dry_run=dry_run,
-            source_file=getattr(args, "file", None),
-            chm_ids=getattr(args, "chm_id", None),
-            church_codes=getattr(args, "church_code", None),
-        )
+            logger.info("Group assignment complete. Check data/church_team_assignments.xlsx for the audit log.")
+    return success
+
+
+@_command("audit-form-people")
+def _command_audit_form_people(args: argparse.Namespace) -> bool:
+    from group_assignment import audit_form_people
+    if not os.path.exists(args.file):
+        logger.error(f"Individual Application export not found at {args.file}")
+        success = False
+    else:
+        success = audit_form_people(args.file)
         if success:
-            if dry_run:
-                logger.info("Dry-run complete. Check data/church_team_assignments.xlsx for the preview.")
-            else:
-                logger.info("Group assignment complete. Check data/church_team_assignments.xlsx for the audit log.")
-    elif args.command == "audit-form-people":
-        from group_assignment import audit_form_people
-        if not os.path.exists(args.file):
-            logger.error(f"Individual Application export not found at {args.file}")
-            success = False
-        else:
-            success = audit_form_people(args.file)
-            if success:
-                logger.info("Form/People audit complete. Check data/form_people_audit.xlsx for the audit log.")
-    elif args.command == "repair-form-people":
-        from group_assignment import repair_form_people
-        if not os.path.exists(args.file):
-            logger.error(f"Individual Application export not found at {args.file}")
-            success = False
-        else:
-            counts = repair_form_people(
-                args.file,
-                dry_run=args.dry_run,
-                chm_email=args.chm_email,
-                execute=args.execute,
-            )
-            success = counts is not None and counts.get("errored", 0) == 0
-            if args.dry_run:
-                logger.info(
-                    f"Dry-run complete — would create {counts.get('dry_run', 0)}, "
-                    f"skip {counts.get('skipped_matched', 0)} already-matched, "
-                    f"block {counts.get('blocked', 0)}. "
-                    "Check data/form_people_repair.xlsx for details."
-                )
-            else:
-                logger.info(
-                    f"Repair complete — created {counts.get('created', 0)}, "
-                    f"skipped {counts.get('skipped_matched', 0)} already-matched, "
-                    f"blocked {counts.get('blocked', 0)}, "
-                    f"errored {counts.get('errored', 0)}. "
-                    "Check data/form_people_repair.xlsx for details."
-                )
-    elif args.command == "clear-team-groups":
-        from group_assignment import clear_team_groups
-        success = clear_team_groups(
-            church_code=args.church_code,
+            logger.info("Form/People audit complete. Check data/form_people_audit.xlsx for the audit log.")
+    return success
+
+
+@_command("repair-form-people")
+def _command_repair_form_people(args: argparse.Namespace) -> bool:
+    from group_assignment import repair_form_people
+    if not os.path.exists(args.file):
+        logger.error(f"Individual Application export not found at {args.file}")
+        success = False
+    else:
+        counts = repair_form_people(
+            args.file,
             dry_run=args.dry_run,
+            chm_email=args.chm_email,
             execute=args.execute,
         )
-        if success:
-            if args.dry_run:
-                logger.info("Dry-run complete. Check data/team_group_clearing_audit.xlsx for the preview.")
-            else:
-                logger.info("Team-group clearing complete. Check data/team_group_clearing_audit.xlsx for the audit log.")
-    elif args.command == "audit-team-groups":
-        from group_assignment import audit_team_groups
-        success = audit_team_groups(church_code=args.church_code,
-                                    remove_orphans=args.remove_orphans)
-        if success:
-            logger.info("Team-group audit complete. Check data/team_group_orphan_audit.xlsx for the audit log.")
-    elif args.command == "export-church-teams":
-        output_path = Path(args.output) 
-        try:
-            output_path.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Report output directory set to: {output_path.resolve()}")
-        except OSError as e:
-            logger.error(f"Failed to create report output directory {output_path}: {e}")
-            success = False
-        else:
-            try:
-                # ChurchTeamsExporter is a context manager
-                with ChurchTeamsExporter() as exporter: 
-                    success = exporter.generate_reports( 
-                        target_church_code=args.church_code,
-                        output_dir=output_path,
-                        force_resend_pending=args.force_resend_pending,
-                        force_resend_validated1=args.force_resend_validated1,
-                        force_resend_validated2=args.force_resend_validated2,
-                        dry_run=args.dry_run,
-                        target_resend_chm_id=args.chm_id,
-                    )
-                if success: 
-                    logger.info(f"Church team reports generated successfully in {output_path.resolve()}.")
-                else:
-                    logger.error("Failed to generate church team reports (exporter returned False).")
-            except Exception as e:
-                logger.error(f"An exception occurred during report export: {e}", exc_info=True)
-                success = False
-    elif args.command == "solve-schedule":
-        from scheduler import run_solve_schedule
-        input_path = Path(args.input) if args.input else DATA_DIR / "schedule_input.json"
-        output_path = Path(args.output) if args.output else DATA_DIR / "schedule_output.json"
-        exit_code = run_solve_schedule(input_path, output_path)
-        sys.exit(exit_code)
-    elif args.command == "diagnose-schedule":
-        from schedule_diagnostics import run_diagnose_schedule
-        input_path = Path(args.input) if args.input else _default_schedule_json_path("schedule_input.json")
-        if args.schedule_output:
-            schedule_output_path = Path(args.schedule_output)
-        else:
-            default_output = _default_schedule_json_path("schedule_output.json")
-            schedule_output_path = default_output if default_output.exists() else None
-        diagnostics_path = Path(args.output) if args.output else None
-        exit_code = run_diagnose_schedule(
-            input_path,
-            schedule_output_path=schedule_output_path,
-            output_path=diagnostics_path,
-        )
-        sys.exit(exit_code)
-    elif args.command == "produce-schedule":
-        from schedule_workbook import ScheduleWorkbookBuilder
-        so_path = Path(args.schedule_output) if args.schedule_output else DATA_DIR / "schedule_output.json"
-        si_path = Path(args.schedule_input)  if args.schedule_input  else DATA_DIR / "schedule_input.json"
-        if args.output:
-            out_path = Path(args.output)
-        else:
-            today = datetime.date.today().strftime("%Y-%m-%d")
-            out_path = Path(EXPORT_DIR) / f"VAYSF_Schedule_{today}.xlsx"
-        from schedule_contracts import (
-            ScheduleContractError,
-            validate_output_against_input,
-            validate_schedule_input,
-            validate_schedule_output,
-        )
-        try:
-            parsed: dict[str, dict] = {}
-            for label, json_path in (
-                ("schedule_output", so_path), ("schedule_input", si_path),
-            ):
-                try:
-                    parsed[label] = json.loads(json_path.read_text(encoding="utf-8"))
-                except json.JSONDecodeError as exc:
-                    # Surface a damaged event-week file as a controlled
-                    # contract failure, not a traceback.
-                    raise ScheduleContractError(
-                        json_path.name, [f"not valid JSON: {exc}"]
-                    ) from exc
-            so_data = parsed["schedule_output"]
-            si_data = parsed["schedule_input"]
-            for warning in validate_schedule_input(si_data):
-                logger.warning(f"schedule_input contract: {warning}")
-            for warning in validate_schedule_output(so_data):
-                logger.warning(f"schedule_output contract: {warning}")
-            for warning in validate_output_against_input(so_data, si_data):
-                logger.warning(f"schedule_output contract: {warning}")
-        except FileNotFoundError as exc:
-            logger.error(f"export-schedule: required file not found — {exc.filename}")
-            success = False
-        except ScheduleContractError as exc:
-            logger.error(
-                f"produce-schedule: {exc.file_label} failed contract validation "
-                f"with {len(exc.errors)} error(s):"
+        success = counts is not None and counts.get("errored", 0) == 0
+        if args.dry_run:
+            logger.info(
+                f"Dry-run complete — would create {counts.get('dry_run', 0)}, "
+                f"skip {counts.get('skipped_matched', 0)} already-matched, "
+                f"block {counts.get('blocked', 0)}. "
+                "Check data/form_people_repair.xlsx for details."
             )
-            for violation in exc.errors:
-                logger.error(f"  - {violation}")
-            success = False
         else:
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            ScheduleWorkbookBuilder.write_schedule_output_workbook(
-                out_path, so_data, si_data
-            )
-            logger.info(f"Schedule Excel written to: {out_path.resolve()}")
-            success = True
-    elif args.command == "publish-schedule":
-        from schedule_publisher import run_publish_schedule
-        input_path = Path(args.input) if args.input else _default_schedule_json_path("schedule_input.json")
-        schedule_output_path = Path(args.schedule_output) if args.schedule_output else _default_schedule_json_path("schedule_output.json")
-        if args.force_cancel and not args.execute:
-            logger.error("publish-schedule: --force-cancel requires --execute")
-            sys.exit(1)
-        with WordPressConnector() as wp_conn:
-            exit_code = run_publish_schedule(
-                schedule_input_path=input_path,
-                schedule_output_path=schedule_output_path,
-                wp_connector=wp_conn,
-                dry_run=args.dry_run,
-                force_cancel=args.force_cancel,
-                allow_partial=args.allow_partial,
-                audit_output_path=Path(args.output) if args.output else None,
+            logger.info(
+                f"Repair complete — created {counts.get('created', 0)}, "
+                f"skipped {counts.get('skipped_matched', 0)} already-matched, "
+                f"blocked {counts.get('blocked', 0)}, "
+                f"errored {counts.get('errored', 0)}. "
+                "Check data/form_people_repair.xlsx for details."
             )
-        sys.exit(exit_code)
-    elif args.command == "build-schedule-workbook":
-        from schedule_workbook import ScheduleWorkbookBuilder
-        si_path = _resolve_build_schedule_input_path(
-            args.input_json,
-            args.input_xlsx,
-        )
-        if args.output:
-            out_path = Path(args.output)
+    return success
+
+
+@_command("clear-team-groups")
+def _command_clear_team_groups(args: argparse.Namespace) -> bool:
+    from group_assignment import clear_team_groups
+    success = clear_team_groups(
+        church_code=args.church_code,
+        dry_run=args.dry_run,
+        execute=args.execute,
+    )
+    if success:
+        if args.dry_run:
+            logger.info("Dry-run complete. Check data/team_group_clearing_audit.xlsx for the preview.")
         else:
-            today = datetime.date.today().strftime("%Y-%m-%d")
-            out_path = Path(EXPORT_DIR) / f"Schedule_Workbook_{today}.xlsx"
+            logger.info("Team-group clearing complete. Check data/team_group_clearing_audit.xlsx for the audit log.")
+    return success
+
+
+@_command("audit-team-groups")
+def _command_audit_team_groups(args: argparse.Namespace) -> bool:
+    from group_assignment import audit_team_groups
+    success = audit_team_groups(church_code=args.church_code,
+                                remove_orphans=args.remove_orphans)
+    if success:
+        logger.info("Team-group audit complete. Check data/team_group_orphan_audit.xlsx for the audit log.")
+    return success
+
+
+@_command("export-church-teams")
+def _command_export_church_teams(args: argparse.Namespace) -> bool:
+    from church_teams_export import ChurchTeamsExporter
+
+    output_path = Path(args.output)
+    try:
+        output_path.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Report output directory set to: {output_path.resolve()}")
+    except OSError as e:
+        logger.error(f"Failed to create report output directory {output_path}: {e}")
+        success = False
+    else:
         try:
-            schedule_input = json.loads(si_path.read_text(encoding="utf-8"))
-        except FileNotFoundError:
-            logger.error(f"build-schedule-workbook: schedule_input.json not found at {si_path}")
-            success = False
-        else:
-            builder = ScheduleWorkbookBuilder()
-            context_xlsx = _resolve_build_schedule_context_xlsx(
-                args.input_xlsx,
-                si_path,
-            )
-            if context_xlsx:
-                logger.info(
-                    f"build-schedule-workbook: using roster context workbook {context_xlsx}"
+            # ChurchTeamsExporter is a context manager
+            with ChurchTeamsExporter() as exporter:
+                success = exporter.generate_reports(
+                    target_church_code=args.church_code,
+                    output_dir=output_path,
+                    force_resend_pending=args.force_resend_pending,
+                    force_resend_validated1=args.force_resend_validated1,
+                    force_resend_validated2=args.force_resend_validated2,
+                    dry_run=args.dry_run,
+                    target_resend_chm_id=args.chm_id,
                 )
+            if success:
+                logger.info(f"Church team reports generated successfully in {output_path.resolve()}.")
             else:
-                logger.warning(
-                    "build-schedule-workbook: no Church_Team_Status_ALL workbook found; "
-                    "Venue-Estimator / pod planning tabs will be empty until one is available."
-                )
-            roster_rows, validation_rows = builder.read_roster_validation_rows(
-                context_xlsx
-            )
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            pool_assignments_path = _resolve_pool_assignments_sidecar_path(
-                args.pool_assignments,
-                out_path,
-            )
-            builder.write_schedule_workbook(
-                out_path,
-                roster_rows,
-                validation_rows,
-                schedule_input,
-                venue_input_path=None,
-                pool_assignment_path=pool_assignments_path,
-            )
-            logger.info(f"Schedule workbook written to: {out_path.resolve()}")
-            success = True
-    elif args.command == "assign-pools":
-        from schedule_workbook import ScheduleWorkbookBuilder
+                logger.error("Failed to generate church team reports (exporter returned False).")
+        except Exception as e:
+            logger.error(f"An exception occurred during report export: {e}", exc_info=True)
+            success = False
+    return success
 
-        workbook_path = Path(args.workbook)
-        output_path = Path(args.output) if args.output else workbook_path
-        pool_assignments_path = _resolve_pool_assignments_sidecar_path(
-            args.pool_assignments,
-            output_path,
+
+@_command("solve-schedule")
+def _command_solve_schedule(args: argparse.Namespace) -> bool:
+    from scheduler import run_solve_schedule
+    input_path = Path(args.input) if args.input else DATA_DIR / "schedule_input.json"
+    output_path = Path(args.output) if args.output else DATA_DIR / "schedule_output.json"
+    exit_code = run_solve_schedule(input_path, output_path)
+    sys.exit(exit_code)
+
+
+@_command("diagnose-schedule")
+def _command_diagnose_schedule(args: argparse.Namespace) -> bool:
+    from schedule_diagnostics import run_diagnose_schedule
+    input_path = Path(args.input) if args.input else _default_schedule_json_path("schedule_input.json")
+    if args.schedule_output:
+        schedule_output_path = Path(args.schedule_output)
+    else:
+        default_output = _default_schedule_json_path("schedule_output.json")
+        schedule_output_path = default_output if default_output.exists() else None
+    diagnostics_path = Path(args.output) if args.output else None
+    exit_code = run_diagnose_schedule(
+        input_path,
+        schedule_output_path=schedule_output_path,
+        output_path=diagnostics_path,
+    )
+    sys.exit(exit_code)
+
+
+@_command("produce-schedule")
+def _command_produce_schedule(args: argparse.Namespace) -> bool:
+    from schedule_workbook import ScheduleWorkbookBuilder
+    so_path = Path(args.schedule_output) if args.schedule_output else DATA_DIR / "schedule_output.json"
+    si_path = Path(args.schedule_input)  if args.schedule_input  else DATA_DIR / "schedule_input.json"
+    if args.output:
+        out_path = Path(args.output)
+    else:
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        out_path = Path(EXPORT_DIR) / f"VAYSF_Schedule_{today}.xlsx"
+    from schedule_contracts import (
+        ScheduleContractError,
+        validate_output_against_input,
+        validate_schedule_input,
+        validate_schedule_output,
+    )
+    try:
+        parsed: dict[str, dict] = {}
+        for label, json_path in (
+            ("schedule_output", so_path), ("schedule_input", si_path),
+        ):
+            try:
+                parsed[label] = json.loads(json_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                # Surface a damaged event-week file as a controlled
+                # contract failure, not a traceback.
+                raise ScheduleContractError(
+                    json_path.name, [f"not valid JSON: {exc}"]
+                ) from exc
+        so_data = parsed["schedule_output"]
+        si_data = parsed["schedule_input"]
+        for warning in validate_schedule_input(si_data):
+            logger.warning(f"schedule_input contract: {warning}")
+        for warning in validate_schedule_output(so_data):
+            logger.warning(f"schedule_output contract: {warning}")
+        for warning in validate_output_against_input(so_data, si_data):
+            logger.warning(f"schedule_output contract: {warning}")
+    except FileNotFoundError as exc:
+        logger.error(f"export-schedule: required file not found — {exc.filename}")
+        success = False
+    except ScheduleContractError as exc:
+        logger.error(
+            f"produce-schedule: {exc.file_label} failed contract validation "
+            f"with {len(exc.errors)} error(s):"
         )
-        if not workbook_path.exists():
-            logger.error(f"assign-pools: workbook not found at {workbook_path}")
-            success = False
-        else:
-            builder = ScheduleWorkbookBuilder()
-            builder.refresh_pool_assignments(
-                workbook_path,
-                output_path=output_path,
-                sidecar_path=pool_assignments_path,
-            )
-            logger.info(f"Pool assignments refreshed in: {output_path.resolve()}")
-            success = True
-    elif args.command == "import-team-matchups":
-        from schedule_workbook import ScheduleWorkbookBuilder
-        from scheduling import manual_matchups
-
-        workbook_path = (
-            Path(args.workbook)
-            if args.workbook
-            else manual_matchups.default_workbook_path(DATA_DIR)
+        for violation in exc.errors:
+            logger.error(f"  - {violation}")
+        success = False
+    else:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        ScheduleWorkbookBuilder.write_schedule_output_workbook(
+            out_path, so_data, si_data
         )
-        output_path = (
-            Path(args.output)
-            if args.output
-            else manual_matchups.default_sidecar_path(Path(EXPORT_DIR))
+        logger.info(f"Schedule Excel written to: {out_path.resolve()}")
+        success = True
+    return success
+
+
+@_command("publish-schedule")
+def _command_publish_schedule(args: argparse.Namespace) -> bool:
+    from wordpress.frontend_connector import WordPressConnector
+    from schedule_publisher import run_publish_schedule
+    input_path = Path(args.input) if args.input else _default_schedule_json_path("schedule_input.json")
+    schedule_output_path = Path(args.schedule_output) if args.schedule_output else _default_schedule_json_path("schedule_output.json")
+    if args.force_cancel and not args.execute:
+        logger.error("publish-schedule: --force-cancel requires --execute")
+        sys.exit(1)
+    with WordPressConnector() as wp_conn:
+        exit_code = run_publish_schedule(
+            schedule_input_path=input_path,
+            schedule_output_path=schedule_output_path,
+            wp_connector=wp_conn,
+            dry_run=args.dry_run,
+            force_cancel=args.force_cancel,
+            allow_partial=args.allow_partial,
+            audit_output_path=Path(args.output) if args.output else None,
         )
-        builder = ScheduleWorkbookBuilder()
-        context_xlsx = Path(args.input_xlsx) if args.input_xlsx else None
-        if context_xlsx is None:
-            context_xlsx = _find_latest_all_workbook(output_path.parent)
-            if context_xlsx is None and Path(EXPORT_DIR) != output_path.parent:
-                context_xlsx = _find_latest_all_workbook(Path(EXPORT_DIR))
+    sys.exit(exit_code)
 
-        roster_rows = None
+
+@_command("build-schedule-workbook")
+def _command_build_schedule_workbook(args: argparse.Namespace) -> bool:
+    from schedule_workbook import ScheduleWorkbookBuilder
+    si_path = _resolve_build_schedule_input_path(
+        args.input_json,
+        args.input_xlsx,
+    )
+    if args.output:
+        out_path = Path(args.output)
+    else:
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        out_path = Path(EXPORT_DIR) / f"Schedule_Workbook_{today}.xlsx"
+    try:
+        schedule_input = json.loads(si_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.error(f"build-schedule-workbook: schedule_input.json not found at {si_path}")
+        success = False
+    else:
+        builder = ScheduleWorkbookBuilder()
+        context_xlsx = _resolve_build_schedule_context_xlsx(
+            args.input_xlsx,
+            si_path,
+        )
         if context_xlsx:
-            logger.info(f"import-team-matchups: using roster context workbook {context_xlsx}")
-            roster_rows, _validation_rows = builder.read_roster_validation_rows(context_xlsx)
+            logger.info(
+                f"build-schedule-workbook: using roster context workbook {context_xlsx}"
+            )
         else:
             logger.warning(
-                "import-team-matchups: no Church_Team_Status_ALL workbook found; "
-                "team-code validation against the roster will be skipped."
+                "build-schedule-workbook: no Church_Team_Status_ALL workbook found; "
+                "Venue-Estimator / pod planning tabs will be empty until one is available."
             )
+        roster_rows, validation_rows = builder.read_roster_validation_rows(
+            context_xlsx
+        )
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        pool_assignments_path = _resolve_pool_assignments_sidecar_path(
+            args.pool_assignments,
+            out_path,
+        )
+        builder.write_schedule_workbook(
+            out_path,
+            roster_rows,
+            validation_rows,
+            schedule_input,
+            venue_input_path=None,
+            pool_assignment_path=pool_assignments_path,
+            incremental=not getattr(args, "full_rebuild", False),
+        )
+        logger.info(f"Schedule workbook written to: {out_path.resolve()}")
+        success = True
+    return success
+
+
+@_command("assign-pools")
+def _command_assign_pools(args: argparse.Namespace) -> bool:
+    from schedule_workbook import ScheduleWorkbookBuilder
 
-        payload = manual_matchups.build_manual_matchup_payload(
+    workbook_path = Path(args.workbook)
+    output_path = Path(args.output) if args.output else workbook_path
+    pool_assignments_path = _resolve_pool_assignments_sidecar_path(
+        args.pool_assignments,
+        output_path,
+    )
+    if not workbook_path.exists():
+        logger.error(f"assign-pools: workbook not found at {workbook_path}")
+        success = False
+    else:
+        builder = ScheduleWorkbookBuilder()
+        builder.refresh_pool_assignments(
             workbook_path,
-            roster_rows=roster_rows,
-            active_sheets=args.sheet,
+            output_path=output_path,
+            sidecar_path=pool_assignments_path,
         )
-        for line in manual_matchups.summarize_payload_for_log(payload):
-            logger.info(line)
-        validation = payload.get("validation", {}) or {}
-        for warning in validation.get("warnings", []) or []:
-            logger.warning(f"manual matchup validation: {warning}")
-        errors = validation.get("errors", []) or []
-        if errors:
-            logger.error(
-                f"manual matchup validation failed with {len(errors)} error(s):"
-            )
-            for error in errors:
-                logger.error(f"  - {error}")
-            success = False
-        else:
-            manual_matchups.write_manual_matchup_sidecar(payload, output_path)
-            logger.info(f"Manual team matchup sidecar written to: {output_path.resolve()}")
-            success = True
-    elif args.command == "import-master-schedule":
-        from scheduling import master_schedule
+        logger.info(f"Pool assignments refreshed in: {output_path.resolve()}")
+        success = True
+    return success
 
-        workbook_path = (
-            Path(args.workbook)
-            if args.workbook
-            else master_schedule.default_workbook_path(DATA_DIR)
-        )
-        output_path = (
-            Path(args.output)
-            if args.output
-            else master_schedule.default_sidecar_path(Path(EXPORT_DIR))
+
+@_command("import-team-matchups")
+def _command_import_team_matchups(args: argparse.Namespace) -> bool:
+    from schedule_workbook import ScheduleWorkbookBuilder
+    from scheduling import manual_matchups
+
+    workbook_path = (
+        Path(args.workbook)
+        if args.workbook
+        else manual_matchups.default_workbook_path(DATA_DIR)
+    )
+    output_path = (
+        Path(args.output)
+        if args.output
+        else manual_matchups.default_sidecar_path(Path(EXPORT_DIR))
+    )
+    builder = ScheduleWorkbookBuilder()
+    context_xlsx = Path(args.input_xlsx) if args.input_xlsx else None
+    if context_xlsx is None:
+        context_xlsx = _find_latest_all_workbook(output_path.parent)
+        if context_xlsx is None and Path(EXPORT_DIR) != output_path.parent:
+            context_xlsx = _find_latest_all_workbook(Path(EXPORT_DIR))
+
+    roster_rows = None
+    if context_xlsx:
+        logger.info(f"import-team-matchups: using roster context workbook {context_xlsx}")
+        roster_rows, _validation_rows = builder.read_roster_validation_rows(context_xlsx)
+    else:
+        logger.warning(
+            "import-team-matchups: no Church_Team_Status_ALL workbook found; "
+            "team-code validation against the roster will be skipped."
         )
-        schedule_input_path = (
-            Path(args.schedule_input)
-            if args.schedule_input
-            else _default_schedule_json_path("schedule_input.json")
+
+    payload = manual_matchups.build_manual_matchup_payload(
+        workbook_path,
+        roster_rows=roster_rows,
+        active_sheets=args.sheet,
+    )
+    for line in manual_matchups.summarize_payload_for_log(payload):
+        logger.info(line)
+    validation = payload.get("validation", {}) or {}
+    for warning in validation.get("warnings", []) or []:
+        logger.warning(f"manual matchup validation: {warning}")
+    errors = validation.get("errors", []) or []
+    if errors:
+        logger.error(
+            f"manual matchup validation failed with {len(errors)} error(s):"
         )
+        for error in errors:
+            logger.error(f"  - {error}")
+        success = False
+    else:
+        manual_matchups.write_manual_matchup_sidecar(payload, output_path)
+        logger.info(f"Manual team matchup sidecar written to: {output_path.resolve()}")
+        success = True
+    return success
 
-        if not workbook_path.exists():
-            logger.error(f"import-master-schedule: workbook not found at {workbook_path}")
-            success = False
-        else:
-            games = resources = None
-            if schedule_input_path.exists():
-                try:
-                    schedule_input = json.loads(
-                        schedule_input_path.read_text(encoding="utf-8")
-                    )
-                except json.JSONDecodeError as exc:
-                    logger.error(
-                        f"import-master-schedule: schedule_input.json is not valid JSON "
-                        f"at {schedule_input_path}: {exc}"
-                    )
-                    success = False
-                else:
-                    games = schedule_input.get("games", []) or []
-                    resources = schedule_input.get("resources", []) or []
-                    logger.info(
-                        "import-master-schedule: validating against "
-                        f"{schedule_input_path} ({len(games)} game(s), "
-                        f"{len(resources)} resource(s))"
-                    )
-                    success = True
+
+@_command("import-master-schedule")
+def _command_import_master_schedule(args: argparse.Namespace) -> bool:
+    from scheduling import master_schedule
+
+    workbook_path = (
+        Path(args.workbook)
+        if args.workbook
+        else master_schedule.default_workbook_path(DATA_DIR)
+    )
+    output_path = (
+        Path(args.output)
+        if args.output
+        else master_schedule.default_sidecar_path(Path(EXPORT_DIR))
+    )
+    schedule_input_path = (
+        Path(args.schedule_input)
+        if args.schedule_input
+        else _default_schedule_json_path("schedule_input.json")
+    )
+
+    if not workbook_path.exists():
+        logger.error(f"import-master-schedule: workbook not found at {workbook_path}")
+        success = False
+    else:
+        games = resources = None
+        if schedule_input_path.exists():
+            try:
+                schedule_input = json.loads(
+                    schedule_input_path.read_text(encoding="utf-8")
+                )
+            except json.JSONDecodeError as exc:
+                logger.error(
+                    f"import-master-schedule: schedule_input.json is not valid JSON "
+                    f"at {schedule_input_path}: {exc}"
+                )
+                success = False
             else:
-                logger.warning(
-                    "import-master-schedule: no schedule_input.json found at "
-                    f"{schedule_input_path}; writing parse-only sidecar."
+                games = schedule_input.get("games", []) or []
+                resources = schedule_input.get("resources", []) or []
+                logger.info(
+                    "import-master-schedule: validating against "
+                    f"{schedule_input_path} ({len(games)} game(s), "
+                    f"{len(resources)} resource(s))"
                 )
                 success = True
-
-            if success:
-                payload = master_schedule.build_master_schedule_payload(
-                    workbook_path,
-                    games=games,
-                    resources=resources,
-                )
-                for line in master_schedule.summarize_payload_for_log(payload):
-                    logger.info(line)
-                diagnostics = payload.get("diagnostics", {}) or {}
-                for warning in diagnostics.get("warnings", []) or []:
-                    logger.warning(f"master schedule import: {warning}")
-                validation = payload.get("validation", {}) or {}
-                for warning in validation.get("warnings", []) or []:
-                    logger.warning(f"master schedule validation: {warning}")
-                errors = list(diagnostics.get("errors", []) or [])
-                errors.extend(validation.get("errors", []) or [])
-                if errors:
-                    logger.error(
-                        f"master schedule import failed with {len(errors)} error(s):"
-                    )
-                    for error in errors:
-                        logger.error(f"  - {error}")
-                    success = False
-                else:
-                    master_schedule.write_master_schedule_sidecar(payload, output_path)
-                    logger.info(
-                        "Manual schedule override sidecar written to: "
-                        f"{output_path.resolve()}"
-                    )
-                    success = True
-    elif args.command == "import-match-schedule-overrides":
-        from schedule_workbook import ScheduleWorkbookBuilder
-        from scheduling import match_schedule_overrides
-
-        workbook_path = (
-            Path(args.workbook)
-            if args.workbook
-            else match_schedule_overrides.default_workbook_path(DATA_DIR)
-        )
-        events = (
-            [code.strip().upper() for code in args.events.split(",") if code.strip()]
-            if args.events
-            else list(match_schedule_overrides.DEFAULT_EVENT_CODES)
-        )
-        default_audit_path = Path(EXPORT_DIR) / "match_schedule_overrides.audit.json"
-        output_path = (
-            Path(args.output)
-            if args.output
-            else (
-                default_audit_path
-                if args.dry_run
-                else match_schedule_overrides.default_sidecar_path(Path(EXPORT_DIR))
+        else:
+            logger.warning(
+                "import-master-schedule: no schedule_input.json found at "
+                f"{schedule_input_path}; writing parse-only sidecar."
             )
-        )
-        schedule_input_path = (
-            Path(args.schedule_input)
-            if args.schedule_input
-            else _default_schedule_json_path("schedule_input.json")
-        )
+            success = True
 
-        if not workbook_path.exists():
-            logger.error(f"import-match-schedule-overrides: workbook not found at {workbook_path}")
-            success = False
-        else:
-            context_xlsx = Path(args.input_xlsx) if args.input_xlsx else None
-            if context_xlsx is None:
-                context_xlsx = _find_latest_all_workbook(output_path.parent)
-                if context_xlsx is None and Path(EXPORT_DIR) != output_path.parent:
-                    context_xlsx = _find_latest_all_workbook(Path(EXPORT_DIR))
-            roster_rows = None
-            if context_xlsx:
-                logger.info(f"import-match-schedule-overrides: using roster context workbook {context_xlsx}")
-                builder = ScheduleWorkbookBuilder()
-                roster_rows, _validation_rows = builder.read_roster_validation_rows(context_xlsx)
-            else:
-                logger.warning(
-                    "import-match-schedule-overrides: no Church_Team_Status_ALL workbook found; "
-                    "team-code validation against the roster will be skipped."
+        if success:
+            payload = master_schedule.build_master_schedule_payload(
+                workbook_path,
+                games=games,
+                resources=resources,
+            )
+            for line in master_schedule.summarize_payload_for_log(payload):
+                logger.info(line)
+            diagnostics = payload.get("diagnostics", {}) or {}
+            for warning in diagnostics.get("warnings", []) or []:
+                logger.warning(f"master schedule import: {warning}")
+            validation = payload.get("validation", {}) or {}
+            for warning in validation.get("warnings", []) or []:
+                logger.warning(f"master schedule validation: {warning}")
+            errors = list(diagnostics.get("errors", []) or [])
+            errors.extend(validation.get("errors", []) or [])
+            if errors:
+                logger.error(
+                    f"master schedule import failed with {len(errors)} error(s):"
                 )
-
-            games = resources = None
-            if schedule_input_path.exists():
-                try:
-                    schedule_input = json.loads(schedule_input_path.read_text(encoding="utf-8"))
-                except json.JSONDecodeError as exc:
-                    logger.error(
-                        f"import-match-schedule-overrides: schedule_input.json is not valid JSON "
-                        f"at {schedule_input_path}: {exc}"
-                    )
-                    success = False
-                else:
-                    games = schedule_input.get("games", []) or []
-                    resources = schedule_input.get("resources", []) or []
-                    logger.info(
-                        "import-match-schedule-overrides: cross-referencing against "
-                        f"{schedule_input_path} ({len(games)} game(s), {len(resources)} resource(s))"
-                    )
-                    success = True
+                for error in errors:
+                    logger.error(f"  - {error}")
+                success = False
             else:
-                logger.warning(
-                    "import-match-schedule-overrides: no schedule_input.json found at "
-                    f"{schedule_input_path}; pairings will be created from the visual schedule "
-                    "without cross-referencing generated pool games."
+                master_schedule.write_master_schedule_sidecar(payload, output_path)
+                logger.info(
+                    "Manual schedule override sidecar written to: "
+                    f"{output_path.resolve()}"
                 )
                 success = True
+    return success
 
-            if success:
-                payload = match_schedule_overrides.build_match_schedule_overrides_payload(
-                    workbook_path,
-                    events=events,
-                    roster_rows=roster_rows,
-                    games=games,
-                    resources=resources,
-                )
-                for line in match_schedule_overrides.summarize_payload_for_log(payload):
-                    logger.info(line)
-                diagnostics = payload.get("diagnostics", {}) or {}
-                for warning in diagnostics.get("unmapped_cells", []) or []:
-                    logger.warning(f"match schedule overrides: {warning}")
-                validation = payload.get("validation", {}) or {}
-                for warning in validation.get("warnings", []) or []:
-                    logger.warning(f"match schedule overrides validation: {warning}")
-                errors = list(diagnostics.get("errors", []) or [])
-                errors.extend(validation.get("errors", []) or [])
-                if errors:
-                    logger.error(
-                        f"match schedule overrides import found {len(errors)} error(s):"
-                    )
-                    for error in errors:
-                        logger.error(f"  - {error}")
-
-                if args.dry_run:
-                    match_schedule_overrides.write_match_schedule_overrides_sidecar(payload, output_path)
-                    logger.info(f"Match schedule overrides audit written to: {output_path.resolve()}")
-                    success = not errors
-                elif errors:
-                    success = False
-                else:
-                    match_schedule_overrides.write_match_schedule_overrides_sidecar(payload, output_path)
-                    logger.info(f"Match schedule overrides sidecar written to: {output_path.resolve()}")
-                    success = True
-    elif args.command == "import-approved-games":
-        from schedule_workbook import ScheduleWorkbookBuilder
-        from schedule_contracts import (
-            ScheduleContractError,
-            validate_output_against_input,
-            validate_schedule_input,
-            validate_schedule_output,
-        )
-        from scheduling import approved_games
 
-        main_schedule_path = (
-            Path(args.main_schedule)
-            if args.main_schedule
-            else approved_games.default_main_schedule_path(DATA_DIR)
-        )
-        badminton_path = (
-            Path(args.badminton)
-            if args.badminton
-            else approved_games.default_badminton_path(DATA_DIR)
-        )
-        soccer_path = (
-            Path(args.soccer)
-            if args.soccer
-            else approved_games.default_soccer_path(DATA_DIR)
-        )
-        table_tennis_path = (
-            Path(args.table_tennis)
-            if args.table_tennis
-            else approved_games.default_table_tennis_path(DATA_DIR)
-        )
-        schedule_input_path = (
-            Path(args.schedule_input)
-            if args.schedule_input
-            else _default_schedule_json_path("schedule_input.json")
-        )
-        output_path = (
-            Path(args.output)
-            if args.output
-            else (
-                approved_games.default_audit_path(Path(EXPORT_DIR))
-                if args.dry_run
-                else approved_games.default_sidecar_path(Path(EXPORT_DIR))
-            )
-        )
-        publish_input_path = (
-            Path(args.publish_input)
-            if args.publish_input
-            else approved_games.default_publish_input_path(Path(EXPORT_DIR))
-        )
-        publish_output_path = (
-            Path(args.publish_output)
-            if args.publish_output
-            else approved_games.default_publish_output_path(Path(EXPORT_DIR))
+@_command("import-match-schedule-overrides")
+def _command_import_match_schedule_overrides(args: argparse.Namespace) -> bool:
+    from schedule_workbook import ScheduleWorkbookBuilder
+    from scheduling import match_schedule_overrides
+
+    workbook_path = (
+        Path(args.workbook)
+        if args.workbook
+        else match_schedule_overrides.default_workbook_path(DATA_DIR)
+    )
+    events = (
+        [code.strip().upper() for code in args.events.split(",") if code.strip()]
+        if args.events
+        else list(match_schedule_overrides.DEFAULT_EVENT_CODES)
+    )
+    default_audit_path = Path(EXPORT_DIR) / "match_schedule_overrides.audit.json"
+    output_path = (
+        Path(args.output)
+        if args.output
+        else (
+            default_audit_path
+            if args.dry_run
+            else match_schedule_overrides.default_sidecar_path(Path(EXPORT_DIR))
         )
+    )
+    schedule_input_path = (
+        Path(args.schedule_input)
+        if args.schedule_input
+        else _default_schedule_json_path("schedule_input.json")
+    )
+
+    if not workbook_path.exists():
+        logger.error(f"import-match-schedule-overrides: workbook not found at {workbook_path}")
+        success = False
+    else:
         context_xlsx = Path(args.input_xlsx) if args.input_xlsx else None
         if context_xlsx is None:
             context_xlsx = _find_latest_all_workbook(output_path.parent)
             if context_xlsx is None and Path(EXPORT_DIR) != output_path.parent:
                 context_xlsx = _find_latest_all_workbook(Path(EXPORT_DIR))
-
         roster_rows = None
         if context_xlsx:
-            logger.info(f"import-approved-games: using roster context workbook {context_xlsx}")
+            logger.info(f"import-match-schedule-overrides: using roster context workbook {context_xlsx}")
             builder = ScheduleWorkbookBuilder()
             roster_rows, _validation_rows = builder.read_roster_validation_rows(context_xlsx)
         else:
             logger.warning(
-                "import-approved-games: no Church_Team_Status_ALL workbook found; "
-                "Table Tennis source-vs-roster validation will be skipped."
+                "import-match-schedule-overrides: no Church_Team_Status_ALL workbook found; "
+                "team-code validation against the roster will be skipped."
             )
 
-        try:
-            schedule_input = json.loads(schedule_input_path.read_text(encoding="utf-8"))
-        except FileNotFoundError:
-            logger.error(f"import-approved-games: schedule_input.json not found at {schedule_input_path}")
-            success = False
-        except json.JSONDecodeError as exc:
-            logger.error(
-                f"import-approved-games: schedule_input.json is not valid JSON "
-                f"at {schedule_input_path}: {exc}"
-            )
-            success = False
+        games = resources = None
+        if schedule_input_path.exists():
+            try:
+                schedule_input = json.loads(schedule_input_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                logger.error(
+                    f"import-match-schedule-overrides: schedule_input.json is not valid JSON "
+                    f"at {schedule_input_path}: {exc}"
+                )
+                success = False
+            else:
+                games = schedule_input.get("games", []) or []
+                resources = schedule_input.get("resources", []) or []
+                logger.info(
+                    "import-match-schedule-overrides: cross-referencing against "
+                    f"{schedule_input_path} ({len(games)} game(s), {len(resources)} resource(s))"
+                )
+                success = True
         else:
-            logger.info(
-                "import-approved-games: validating against "
-                f"{schedule_input_path} ({len(schedule_input.get('games', []) or [])} game(s), "
-                f"{len(schedule_input.get('resources', []) or [])} resource(s))"
+            logger.warning(
+                "import-match-schedule-overrides: no schedule_input.json found at "
+                f"{schedule_input_path}; pairings will be created from the visual schedule "
+                "without cross-referencing generated pool games."
             )
-            payload = approved_games.build_approved_games_payload(
-                main_schedule_path=main_schedule_path,
-                badminton_path=badminton_path,
-                soccer_path=soccer_path,
-                table_tennis_path=table_tennis_path,
-                venue_input_path=Path(args.venue_input) if args.venue_input else None,
-                schedule_input=schedule_input,
+            success = True
+
+        if success:
+            payload = match_schedule_overrides.build_match_schedule_overrides_payload(
+                workbook_path,
+                events=events,
                 roster_rows=roster_rows,
-                roster_context_path=context_xlsx,
-                waive_table_tennis_discrepancy=args.waive_table_tennis_discrepancy,
+                games=games,
+                resources=resources,
             )
-            for line in approved_games.summarize_payload_for_log(payload):
+            for line in match_schedule_overrides.summarize_payload_for_log(payload):
                 logger.info(line)
+            diagnostics = payload.get("diagnostics", {}) or {}
+            for warning in diagnostics.get("unmapped_cells", []) or []:
+                logger.warning(f"match schedule overrides: {warning}")
             validation = payload.get("validation", {}) or {}
             for warning in validation.get("warnings", []) or []:
-                logger.warning(f"approved games validation: {warning}")
-            errors = list(validation.get("errors", []) or [])
-
-            if not errors:
-                publish_input = payload["publish_artifacts"]["schedule_input"]
-                publish_output = payload["publish_artifacts"]["schedule_output"]
-                try:
-                    for warning in validate_schedule_input(publish_input):
-                        logger.warning(f"approved publish input contract: {warning}")
-                    for warning in validate_schedule_output(publish_output):
-                        logger.warning(f"approved publish output contract: {warning}")
-                    for warning in validate_output_against_input(publish_output, publish_input):
-                        logger.warning(f"approved publish artifacts contract: {warning}")
-                except ScheduleContractError as exc:
-                    errors.append(str(exc))
-
+                logger.warning(f"match schedule overrides validation: {warning}")
+            errors = list(diagnostics.get("errors", []) or [])
+            errors.extend(validation.get("errors", []) or [])
             if errors:
-                logger.error(f"approved games import found {len(errors)} error(s):")
+                logger.error(
+                    f"match schedule overrides import found {len(errors)} error(s):"
+                )
                 for error in errors:
                     logger.error(f"  - {error}")
 
             if args.dry_run:
-                approved_games.write_json(payload, output_path)
-                logger.info(f"Approved games audit written to: {output_path.resolve()}")
+                match_schedule_overrides.write_match_schedule_overrides_sidecar(payload, output_path)
+                logger.info(f"Match schedule overrides audit written to: {output_path.resolve()}")
                 success = not errors
             elif errors:
                 success = False
             else:
-                approved_games.write_json(payload, output_path)
-                approved_games.write_json(
-                    payload["publish_artifacts"]["schedule_input"],
-                    publish_input_path,
-                )
-                approved_games.write_json(
-                    payload["publish_artifacts"]["schedule_output"],
-                    publish_output_path,
-                )
-                logger.info(f"Approved games sidecar written to: {output_path.resolve()}")
-                logger.info(f"Approved publish schedule_input written to: {publish_input_path.resolve()}")
-                logger.info(f"Approved publish schedule_output written to: {publish_output_path.resolve()}")
+                match_schedule_overrides.write_match_schedule_overrides_sidecar(payload, output_path)
+                logger.info(f"Match schedule overrides sidecar written to: {output_path.resolve()}")
                 success = True
-    elif args.command == "generate-venue-template":
-        out = Path(args.output) if args.output else None
-        success = generate_venue_template(out)
-        if success:
-            logger.info("Venue input template created. Copy it to data/venue_input.xlsx, fill in your pod details, then re-run export-church-teams.")
-    elif args.command == "config":
-        success = validate_config()
-    elif args.command == "schedule":
-        run_scheduled_sync(args.interval, args.daemon)
-        success = True  # No exit until interrupted
-    elif args.command == "test":
-        success = test_connectivity(args.system, args.test_type, args.test_email)
-    elif args.command == "inspect-person":
-        success = inspect_person(args.chm_id)
-    elif args.command == "upload-person-photo":
-        from photo_repair import upload_person_photo
-
-        summary = upload_person_photo(
-            args.chm_id,
-            photo_file=args.photo_file,
-            photo_url=args.photo_url,
-            dry_run=args.dry_run,
-            execute=args.execute,
+    return success
+
+
+@_command("import-approved-games")
+def _command_import_approved_games(args: argparse.Namespace) -> bool:
+    from schedule_workbook import ScheduleWorkbookBuilder
+    from schedule_contracts import (
+        ScheduleContractError,
+        validate_output_against_input,
+        validate_schedule_input,
+        validate_schedule_output,
+    )
+    from scheduling import approved_games
+
+    main_schedule_path = (
+        Path(args.main_schedule)
+        if args.main_schedule
+        else approved_games.default_main_schedule_path(DATA_DIR)
+    )
+    badminton_path = (
+        Path(args.badminton)
+        if args.badminton
+        else approved_games.default_badminton_path(DATA_DIR)
+    )
+    soccer_path = (
+        Path(args.soccer)
+        if args.soccer
+        else approved_games.default_soccer_path(DATA_DIR)
+    )
+    table_tennis_path = (
+        Path(args.table_tennis)
+        if args.table_tennis
+        else approved_games.default_table_tennis_path(DATA_DIR)
+    )
+    schedule_input_path = (
+        Path(args.schedule_input)
+        if args.schedule_input
+        else _default_schedule_json_path("schedule_input.json")
+    )
+    output_path = (
+        Path(args.output)
+        if args.output
+        else (
+            approved_games.default_audit_path(Path(EXPORT_DIR))
+            if args.dry_run
+            else approved_games.default_sidecar_path(Path(EXPORT_DIR))
+        )
+    )
+    publish_input_path = (
+        Path(args.publish_input)
+        if args.publish_input
+        else approved_games.default_publish_input_path(Path(EXPORT_DIR))
+    )
+    publish_output_path = (
+        Path(args.publish_output)
+        if args.publish_output
+        else approved_games.default_publish_output_path(Path(EXPORT_DIR))
+    )
+    context_xlsx = Path(args.input_xlsx) if args.input_xlsx else None
+    if context_xlsx is None:
+        context_xlsx = _find_latest_all_workbook(output_path.parent)
+        if context_xlsx is None and Path(EXPORT_DIR) != output_path.parent:
+            context_xlsx = _find_latest_all_workbook(Path(EXPORT_DIR))
+
+    roster_rows = None
+    if context_xlsx:
+        logger.info(f"import-approved-games: using roster context workbook {context_xlsx}")
+        builder = ScheduleWorkbookBuilder()
+        roster_rows, _validation_rows = builder.read_roster_validation_rows(context_xlsx)
+    else:
+        logger.warning(
+            "import-approved-games: no Church_Team_Status_ALL workbook found; "
+            "Table Tennis source-vs-roster validation will be skipped."
+        )
+
+    try:
+        schedule_input = json.loads(schedule_input_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.error(f"import-approved-games: schedule_input.json not found at {schedule_input_path}")
+        success = False
+    except json.JSONDecodeError as exc:
+        logger.error(
+            f"import-approved-games: schedule_input.json is not valid JSON "
+            f"at {schedule_input_path}: {exc}"
+        )
+        success = False
+    else:
+        logger.info(
+            "import-approved-games: validating against "
+            f"{schedule_input_path} ({len(schedule_input.get('games', []) or [])} game(s), "
+            f"{len(schedule_input.get('resources', []) or [])} resource(s))"
+        )
+        payload = approved_games.build_approved_games_payload(
+            main_schedule_path=main_schedule_path,
+            badminton_path=badminton_path,
+            soccer_path=soccer_path,
+            table_tennis_path=table_tennis_path,
+            venue_input_path=Path(args.venue_input) if args.venue_input else None,
+            schedule_input=schedule_input,
+            roster_rows=roster_rows,
+            roster_context_path=context_xlsx,
+            waive_table_tennis_discrepancy=args.waive_table_tennis_discrepancy,
         )
+        for line in approved_games.summarize_payload_for_log(payload):
+            logger.info(line)
+        validation = payload.get("validation", {}) or {}
+        for warning in validation.get("warnings", []) or []:
+            logger.warning(f"approved games validation: {warning}")
+        errors = list(validation.get("errors", []) or [])
+
+        if not errors:
+            publish_input = payload["publish_artifacts"]["schedule_input"]
+            publish_output = payload["publish_artifacts"]["schedule_output"]
+            try:
+                for warning in validate_schedule_input(publish_input):
+                    logger.warning(f"approved publish input contract: {warning}")
+                for warning in validate_schedule_output(publish_output):
+                    logger.warning(f"approved publish output contract: {warning}")
+                for warning in validate_output_against_input(publish_output, publish_input):
+                    logger.warning(f"approved publish artifacts contract: {warning}")
+            except ScheduleContractError as exc:
+                errors.append(str(exc))
+
+        if errors:
+            logger.error(f"approved games import found {len(errors)} error(s):")
+            for error in errors:
+                logger.error(f"  - {error}")
+
         if args.dry_run:
-            success = bool(summary["validated"])
+            approved_games.write_json(payload, output_path)
+            logger.info(f"Approved games audit written to: {output_path.resolve()}")
+            success = not errors
+        elif errors:
+            success = False
         else:
-            success = bool(summary["uploaded"] and summary["confirmed_photo"])
-    elif args.command == "approval-drift-history":
-        from approval_drift_history import find_latest_status_workbook, run as run_drift_history
+            approved_games.write_json(payload, output_path)
+            approved_games.write_json(
+                payload["publish_artifacts"]["schedule_input"],
+                publish_input_path,
+            )
+            approved_games.write_json(
+                payload["publish_artifacts"]["schedule_output"],
+                publish_output_path,
+            )
+            logger.info(f"Approved games sidecar written to: {output_path.resolve()}")
+            logger.info(f"Approved publish schedule_input written to: {publish_input_path.resolve()}")
+            logger.info(f"Approved publish schedule_output written to: {publish_output_path.resolve()}")
+            success = True
+    return success
+
+
+@_command("generate-venue-template")
+def _command_generate_venue_template(args: argparse.Namespace) -> bool:
+    out = Path(args.output) if args.output else None
+    success = generate_venue_template(out)
+    if success:
+        logger.info("Venue input template created. Copy it to data/venue_input.xlsx, fill in your pod details, then re-run export-church-teams.")
+    return success
+
+
+@_command("config")
+def _command_config(args: argparse.Namespace) -> bool:
+    return validate_config()
 
-        workbook_path = Path(args.file) if args.file else find_latest_status_workbook(
-            Path(EXPORT_DIR),
-            DATA_DIR,
+
+@_command("schedule")
+def _command_schedule(args: argparse.Namespace) -> bool:
+    run_scheduled_sync(args.interval, args.daemon)
+    success = True  # No exit until interrupted
+    return success
+
+
+@_command("test")
+def _command_test(args: argparse.Namespace) -> bool:
+    return test_connectivity(args.system, args.test_type, args.test_email)
+
+
+@_command("inspect-person")
+def _command_inspect_person(args: argparse.Namespace) -> bool:
+    return inspect_person(args.chm_id)
+
+
+@_command("upload-person-photo")
+def _command_upload_person_photo(args: argparse.Namespace) -> bool:
+    from photo_repair import upload_person_photo
+
+    summary = upload_person_photo(
+        args.chm_id,
+        photo_file=args.photo_file,
+        photo_url=args.photo_url,
+        dry_run=args.dry_run,
+        execute=args.execute,
+    )
+    if args.dry_run:
+        success = bool(summary["validated"])
+    else:
+        success = bool(summary["uploaded"] and summary["confirmed_photo"])
+    return success
+
+
+@_command("approval-drift-history")
+def _command_approval_drift_history(args: argparse.Namespace) -> bool:
+    from approval_drift_history import find_latest_status_workbook, run as run_drift_history
+
+    workbook_path = Path(args.file) if args.file else find_latest_status_workbook(
+        Path(EXPORT_DIR),
+        DATA_DIR,
+    )
+    if not workbook_path:
+        logger.error(
+            "approval-drift-history: no Church_Team_Status_ALL_*.xlsx workbook found; "
+            "pass --file explicitly."
+        )
+        success = False
+    else:
+        output_path = (
+            Path(args.output)
+            if args.output
+            else Path(EXPORT_DIR) / "approval_drift_history.xlsx"
         )
-        if not workbook_path:
-            logger.error(
-                "approval-drift-history: no Church_Team_Status_ALL_*.xlsx workbook found; "
-                "pass --file explicitly."
+        try:
+            summary = run_drift_history(
+                workbook_path=workbook_path,
+                logs_dir=Path(args.logs_dir),
+                output_path=output_path,
+                status=args.status,
+                church_code=args.church_code,
+                since=args.since,
             )
+        except Exception as exc:
+            logger.error(f"approval-drift-history failed: {exc}")
             success = False
         else:
-            output_path = (
-                Path(args.output)
-                if args.output
-                else Path(EXPORT_DIR) / "approval_drift_history.xlsx"
+            logger.info(
+                "approval-drift-history: "
+                f"{summary['participants']} participant(s), "
+                f"{summary['participants_with_history']} with local drift history, "
+                f"{summary['rows']} audit row(s)"
             )
-            try:
-                summary = run_drift_history(
+            logger.info(f"Approval drift history written to: {summary['output']}")
+            success = True
+    return success
+
+
+@_command("approval-drift-accept")
+def _command_approval_drift_accept(args: argparse.Namespace) -> bool:
+    from wordpress.frontend_connector import WordPressConnector
+    from approval_drift_history import accept_reviewed_drift, find_latest_status_workbook
+
+    workbook_path = Path(args.file) if args.file else find_latest_status_workbook(
+        Path(EXPORT_DIR),
+        DATA_DIR,
+    )
+    if not workbook_path:
+        logger.error(
+            "approval-drift-accept: no Church_Team_Status_ALL_*.xlsx workbook found; "
+            "pass --file explicitly."
+        )
+        success = False
+    else:
+        output_path = (
+            Path(args.output)
+            if args.output
+            else Path(EXPORT_DIR) / "approval_drift_acceptance.xlsx"
+        )
+        try:
+            with WordPressConnector() as wp_conn:
+                summary = accept_reviewed_drift(
+                    wordpress_connector=wp_conn,
                     workbook_path=workbook_path,
-                    logs_dir=Path(args.logs_dir),
                     output_path=output_path,
-                    status=args.status,
                     church_code=args.church_code,
-                    since=args.since,
-                )
-            except Exception as exc:
-                logger.error(f"approval-drift-history failed: {exc}")
-                success = False
-            else:
-                logger.info(
-                    "approval-drift-history: "
-                    f"{summary['participants']} participant(s), "
-                    f"{summary['participants_with_history']} with local drift history, "
-                    f"{summary['rows']} audit row(s)"
+                    chm_id=args.chm_id,
+                    status=args.status,
+                    reason=args.reason,
+                    execute=args.execute,
+                    logs_dir=Path(args.logs_dir),
+                    force_approved=args.force_approved,
                 )
-                logger.info(f"Approval drift history written to: {summary['output']}")
-                success = True
-    elif args.command == "approval-drift-accept":
-        from approval_drift_history import accept_reviewed_drift, find_latest_status_workbook
-
-        workbook_path = Path(args.file) if args.file else find_latest_status_workbook(
-            Path(EXPORT_DIR),
-            DATA_DIR,
-        )
-        if not workbook_path:
-            logger.error(
-                "approval-drift-accept: no Church_Team_Status_ALL_*.xlsx workbook found; "
-                "pass --file explicitly."
-            )
+        except Exception as exc:
+            logger.error(f"approval-drift-accept failed: {exc}")
             success = False
         else:
-            output_path = (
-                Path(args.output)
-                if args.output
-                else Path(EXPORT_DIR) / "approval_drift_acceptance.xlsx"
+            mode = "execute" if args.execute else "dry-run"
+            logger.info(
+                f"approval-drift-accept ({mode}): "
+                f"{summary['targets']} target(s), "
+                f"{summary['accepted']} accepted, "
+                f"{summary['would_accept']} would_accept, "
+                f"{summary['skipped']} skipped/blocked, "
+                f"{summary['errors']} error(s)"
             )
-            try:
-                with WordPressConnector() as wp_conn:
-                    summary = accept_reviewed_drift(
-                        wordpress_connector=wp_conn,
-                        workbook_path=workbook_path,
-                        output_path=output_path,
-                        church_code=args.church_code,
-                        chm_id=args.chm_id,
-                        status=args.status,
-                        reason=args.reason,
-                        execute=args.execute,
-                        logs_dir=Path(args.logs_dir),
-                        force_approved=args.force_approved,
-                    )
-            except Exception as exc:
-                logger.error(f"approval-drift-accept failed: {exc}")
-                success = False
-            else:
-                mode = "execute" if args.execute else "dry-run"
-                logger.info(
-                    f"approval-drift-accept ({mode}): "
-                    f"{summary['targets']} target(s), "
-                    f"{summary['accepted']} accepted, "
-                    f"{summary['would_accept']} would_accept, "
-                    f"{summary['skipped']} skipped/blocked, "
-                    f"{summary['errors']} error(s)"
-                )
-                logger.info(f"Approval drift acceptance audit written to: {summary['output']}")
-                success = summary["errors"] == 0
-    elif args.command == "reset-season":
-        if args.archive_only and args.reset_only:
-            logger.error("--archive-only and --reset-only are mutually exclusive.")
+            logger.info(f"Approval drift acceptance audit written to: {summary['output']}")
+            success = summary["errors"] == 0
+    return success
+
+
+@_command("reset-season")
+def _command_reset_season(args: argparse.Namespace) -> bool:
+    from chmeetings.backend_connector import ChMeetingsConnector
+    from season_reset import SEASON_RESET_WORKERS, ResetJournal, SeasonResetter, default_journal_path
+    from wordpress.frontend_connector import WordPressConnector
+
+    if args.archive_only and args.reset_only:
+        logger.error("--archive-only and --reset-only are mutually exclusive.")
+        success = False
+    elif args.probe:
+        if not args.person_id:
+            logger.error("--probe requires --person-id.")
             success = False
-        elif args.probe:
-            if not args.person_id:
-                logger.error("--probe requires --person-id.")
-                success = False
-            else:
-                with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
-                    resetter = SeasonResetter(chm_conn, wp_conn)
-                    success = resetter.probe_put_endpoint(args.person_id)
         else:
             with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
                 resetter = SeasonResetter(chm_conn, wp_conn)
-                success = resetter.run(
-                    args.year,
-                    dry_run=args.dry_run,
-                    archive_only=args.archive_only,
-                    reset_only=args.reset_only,
-                    person_id=args.person_id,
-                )
-    elif args.command == "generate-badges":
-        from badges import BadgeGenerator, BadgeRunner
-        from pathlib import Path as _Path
+                success = resetter.probe_put_endpoint(args.person_id)
+    else:
+        journal = None
+        if not args.person_id and not args.dry_run:
+            journal = ResetJournal(default_journal_path(args.year), args.year, resume=not args.no_resume)
+        with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
+            resetter = SeasonResetter(chm_conn, wp_conn, workers=args.workers or SEASON_RESET_WORKERS)
+            success = resetter.run(
+                args.year,
+                dry_run=args.dry_run,
+                archive_only=args.archive_only,
+                reset_only=args.reset_only,
+                person_id=args.person_id,
+                journal=journal,
+            )
+    return success
 
-        output_dir = _Path(args.output) if args.output else _Path(EXPORT_DIR)
-        church_subdirs = args.output is None
-        try:
-            generator = BadgeGenerator(
-                output_dir=output_dir,
-                church_subdirs=church_subdirs,
+
+@_command("generate-badges")
+def _command_generate_badges(args: argparse.Namespace) -> bool:
+    from chmeetings.backend_connector import ChMeetingsConnector
+    from wordpress.frontend_connector import WordPressConnector
+    from badges import BadgeGenerator, BadgeRunner
+    from pathlib import Path as _Path
+
+    output_dir = _Path(args.output) if args.output else _Path(EXPORT_DIR)
+    church_subdirs = args.output is None
+    try:
+        generator = BadgeGenerator(
+            output_dir=output_dir,
+            church_subdirs=church_subdirs,
+        )
+    except ValueError as exc:
+        logger.error(f"Badge configuration error: {exc}")
+        success = False
+    else:
+        with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
+            runner = BadgeRunner(chm_conn, wp_conn, generator)
+            success = runner.run(
+                church_code=args.church_code,
+                chm_id=args.chm_id,
+                dry_run=args.dry_run,
+                force=args.force,
+                upload=args.upload,
+                write_chmeetings_badge_url=args.write_chmeetings_badge_url,
             )
-        except ValueError as exc:
-            logger.error(f"Badge configuration error: {exc}")
-            success = False
-        else:
-            with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
-                runner = BadgeRunner(chm_conn, wp_conn, generator)
-                success = runner.run(
-                    church_code=args.church_code,
-                    chm_id=args.chm_id,
-                    dry_run=args.dry_run,
-                    force=args.force,
-                    upload=args.upload,
-                    write_chmeetings_badge_url=args.write_chmeetings_badge_url,
-                )
-    elif args.command == "generate-scoresheets":
-        from schedule_workbook import ScheduleWorkbookBuilder
-        from scoresheets import (
-            ScoreSheetError,
-            enrich_roster_photos_from_workbook,
-            write_basketball_scoresheets_pdf,
-            write_bible_challenge_scoresheets_pdf,
-            write_soccer_scoresheets_pdf,
-            write_volleyball_scoresheets_pdf,
+    return success
+
+
+@_command("generate-scoresheets")
+def _command_generate_scoresheets(args: argparse.Namespace) -> bool:
+    from schedule_workbook import ScheduleWorkbookBuilder
+    from scoresheets import (
+        ScoreSheetError,
+        enrich_roster_photos_from_workbook,
+        write_basketball_scoresheets_pdf,
+        write_bible_challenge_scoresheets_pdf,
+        write_soccer_scoresheets_pdf,
+        write_scoresheets_pdfs,
+        write_volleyball_scoresheets_pdf,
+    )
+
+    writer_by_sport = {
+        "basketball": write_basketball_scoresheets_pdf,
+        "bible-challenge": write_bible_challenge_scoresheets_pdf,
+        "soccer": write_soccer_scoresheets_pdf,
+        "volleyball": write_volleyball_scoresheets_pdf,
+    }
+    writer = writer_by_sport.get(args.sport)
+    if writer is None and args.sport != "all":
+        logger.error(f"generate-scoresheets: unsupported sport {args.sport!r}")
+        success = False
+    else:
+        input_path = (
+            Path(args.input)
+            if args.input
+            else _default_schedule_json_path("approved_schedule_input.json")
         )
+        schedule_output_path = (
+            Path(args.schedule_output)
+            if args.schedule_output
+            else _default_schedule_json_path("approved_schedule_output.json")
+        )
+        output_dir = Path(args.output) if args.output else Path(EXPORT_DIR) / "scoresheets"
+        logo_path = Path(args.logo) if args.logo else None
+        score_entry_base_url = args.score_entry_url
+        context_xlsx = Path(args.input_xlsx) if args.input_xlsx else None
+        if context_xlsx is None:
+            context_xlsx = _find_latest_all_workbook(input_path.parent)
+            if context_xlsx is None and Path(EXPORT_DIR) != input_path.parent:
+                context_xlsx = _find_latest_all_workbook(Path(EXPORT_DIR))
 
-        writer_by_sport = {
-            "basketball": write_basketball_scoresheets_pdf,
-            "bible-challenge": write_bible_challenge_scoresheets_pdf,
-            "soccer": write_soccer_scoresheets_pdf,
-            "volleyball": write_volleyball_scoresheets_pdf,
-        }
-        writer = writer_by_sport.get(args.sport)
-        if writer is None:
-            logger.error(f"generate-scoresheets: unsupported sport {args.sport!r}")
-            success = False
+        roster_rows = []
+        if context_xlsx:
+            logger.info(f"generate-scoresheets: using roster context workbook {context_xlsx}")
+            roster_rows, _validation_rows = ScheduleWorkbookBuilder.read_roster_validation_rows(context_xlsx)
+            roster_rows = enrich_roster_photos_from_workbook(roster_rows, context_xlsx)
         else:
-            input_path = (
-                Path(args.input)
-                if args.input
-                else _default_schedule_json_path("approved_schedule_input.json")
-            )
-            schedule_output_path = (
-                Path(args.schedule_output)
-                if args.schedule_output
-                else _default_schedule_json_path("approved_schedule_output.json")
+            logger.warning(
+                "generate-scoresheets: no Church_Team_Status_ALL workbook found; "
+                f"{args.sport} roster tables will include blank writable rows."
             )
-            output_dir = Path(args.output) if args.output else Path(EXPORT_DIR) / "scoresheets"
-            logo_path = Path(args.logo) if args.logo else None
-            score_entry_base_url = args.score_entry_url
-            context_xlsx = Path(args.input_xlsx) if args.input_xlsx else None
-            if context_xlsx is None:
-                context_xlsx = _find_latest_all_workbook(input_path.parent)
-                if context_xlsx is None and Path(EXPORT_DIR) != input_path.parent:
-                    context_xlsx = _find_latest_all_workbook(Path(EXPORT_DIR))
-
-            roster_rows = []
-            if context_xlsx:
-                logger.info(f"generate-scoresheets: using roster context workbook {context_xlsx}")
-                roster_rows, _validation_rows = ScheduleWorkbookBuilder.read_roster_validation_rows(context_xlsx)
-                roster_rows = enrich_roster_photos_from_workbook(roster_rows, context_xlsx)
-            else:
-                logger.warning(
-                    "generate-scoresheets: no Church_Team_Status_ALL workbook found; "
-                    f"{args.sport} roster tables will include blank writable rows."
-                )
 
-            try:
-                pdf_path, page_count = writer(
+        try:
+            if writer is None:
+                results = write_scoresheets_pdfs(
+                    sorted(writer_by_sport),
                     schedule_input_path=input_path,
                     schedule_output_path=schedule_output_path,
                     output_dir=output_dir,
@@ -2346,44 +2500,82 @@ def main() -> None:
                     score_entry_base_url=score_entry_base_url,
                     stage=args.stage,
                     game_keys=args.game_key,
+                    workers=getattr(args, "workers", None),
                 )
-            except ScoreSheetError as exc:
-                logger.error(f"generate-scoresheets: {exc}")
-                success = False
             else:
-                logger.info(
-                    f"{args.sport.title()} score sheets written to: {pdf_path.resolve()} "
-                    f"({page_count} page(s))"
+                pdf_path, page_count = writer(
+                    schedule_input_path=input_path,
+                    schedule_output_path=schedule_output_path,
+                    output_dir=output_dir,
+                    roster_rows=roster_rows,
+                    logo_path=logo_path,
+                    score_entry_base_url=score_entry_base_url,
+                    stage=args.stage,
+                    game_keys=args.game_key,
                 )
-                success = True
-    elif args.command == "check-consent":
-        if not os.path.exists(args.file):
-            logger.error(f"Consent export file not found at {args.file}")
+                results = [(args.sport, pdf_path, page_count)]
+        except ScoreSheetError as exc:
+            logger.error(f"generate-scoresheets: {exc}")
             success = False
         else:
-            from sync.consent_checker import ConsentChecker
-
-            with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
-                checker = ConsentChecker(chm_conn, wp_conn)
-                summary = checker.run(
-                    args.file,
-                    dry_run=args.dry_run,
-                    church_code=args.church_code,
+            for sport, pdf_path, page_count in results:
+                logger.info(
+                    f"{sport.title()} score sheets written to: {pdf_path.resolve()} "
+                    f"({page_count} page(s))"
                 )
-                success = summary["api_error"] == 0
-    elif args.command == "investigate-consent-404s":
-        from sync.consent_404_investigator import Consent404Investigator
+            success = True
+    return success
+
+
+@_command("check-consent")
+def _command_check_consent(args: argparse.Namespace) -> bool:
+    from chmeetings.backend_connector import ChMeetingsConnector
+    from wordpress.frontend_connector import WordPressConnector
+
+    if not os.path.exists(args.file):
+        logger.error(f"Consent export file not found at {args.file}")
+        success = False
+    else:
+        from sync.consent_checker import ConsentChecker
 
         with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
-            investigator = Consent404Investigator(chm_conn, wp_conn)
-            summary = investigator.run(
-                log_file=args.log_file,
-                output_file=args.output,
+            checker = ConsentChecker(chm_conn, wp_conn)
+            summary = checker.run(
+                args.file,
+                dry_run=args.dry_run,
+                church_code=args.church_code,
             )
             success = summary["api_error"] == 0
-    else:
+    return success
+
+
+@_command("investigate-consent-404s")
+def _command_investigate_consent_404s(args: argparse.Namespace) -> bool:
+    from chmeetings.backend_connector import ChMeetingsConnector
+    from wordpress.frontend_connector import WordPressConnector
+    from sync.consent_404_investigator import Consent404Investigator
+
+    with ChMeetingsConnector() as chm_conn, WordPressConnector() as wp_conn:
+        investigator = Consent404Investigator(chm_conn, wp_conn)
+        summary = investigator.run(
+            log_file=args.log_file,
+            output_file=args.output,
+        )
+        success = summary["api_error"] == 0
+    return success
+
+
+def main() -> None:
+    """Main entry point for the VAYSF middleware."""
+    args = parse_args()
+    logger.info(f"Executing command: {args.command}")
+
+    handler = COMMAND_HANDLERS.get(args.command)
+    if handler is None:
         logger.error(f"Unknown command: {args.command}")
         success = False
+    else:
+        success = handler(args)
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,320 @@
+"""photo_store — persistent, content-addressed cache for roster and badge photos.
+
+Score sheets (``scoresheets.PhotoCache``), athlete badges
+(``BadgeRunner._fetch_photo_bytes``) and the roster-workbook photo enrichment
+all need the same athlete photos.  Each used to download them again on every
+run.  ``PhotoStore`` keeps them on disk across runs so regenerating badges or
+score sheets after a schedule tweak performs no photo network I/O.
+
+Layout under the store root::
+
+    index.json                     url -> sha256, ETag, Last-Modified, timestamps
+    blobs/<sha256>                 downloaded image bytes, shared by every URL
+                                   that serves the same content
+    thumbs/<sha256>-<w>x<h>.rgb    pre-decoded RGB thumbnails fitted to one box
+    artifacts/<name>.json          small derived data (e.g. workbook formulas)
+
+Entries checked less than ``revalidate_after_seconds`` ago (a week by
+default) are served straight from disk, so regeneration does no photo network
+I/O.  Past that window a store revalidates the URL once — the first time it
+is asked for — with ``If-None-Match`` / ``If-Modified-Since``; a 304 keeps the
+cached blob, so a photo replaced behind the same URL is picked up while an
+unchanged one is never downloaded again.  Operators who need every run to
+revalidate set PHOTO_CACHE_REVALIDATE_HOURS=0.  ``save()`` persists the index
+and evicts the least recently used photos once the store grows past
+``max_bytes``.
+
+The index is written only by the process that owns the store; score-sheet
+render workers read blobs and add thumbnails (atomic, content-addressed file
+names) but never rewrite ``index.json``.
+"""
+import hashlib
+import io
+import json
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import requests
+from loguru import logger
+from PIL import Image
+
+from config import PHOTO_CACHE_DIR, PHOTO_CACHE_MAX_BYTES, PHOTO_CACHE_REVALIDATE_HOURS
+from file_utils import LazyDefault, atomic_write_bytes, atomic_write_json
+
+
+INDEX_VERSION = 1
+_THUMB_HEADER = struct.Struct(">HH")
+
+
+def _is_remote(url: str) -> bool:
+    return str(url or "").startswith(("http://", "https://"))
+
+
+class PhotoStore:
+    """Disk-backed photo cache keyed by URL and validated by ETag/Last-Modified."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int = PHOTO_CACHE_MAX_BYTES,
+        revalidate_after_seconds: float = PHOTO_CACHE_REVALIDATE_HOURS * 3600,
+        timeout: Tuple[float, float] = (5, 20),
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.revalidate_after_seconds = revalidate_after_seconds
+        self.timeout = timeout
+        self.downloads = 0
+        self.hits = 0
+        self._lock = threading.RLock()
+        # URLs downloaded or revalidated by this store, i.e. during this run.
+        self._checked: set = set()
+        self._local = threading.local()
+        self._dirty = False
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+
+    # Stores are handed to score-sheet worker processes inside the render
+    # context; locks and HTTP sessions are per-process.
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        state["_local"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    # ── Paths ─────────────────────────────────────────────────────────────────
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.root / "blobs" / sha256
+
+    def _thumb_path(self, sha256: str, size: Tuple[int, int]) -> Path:
+        return self.root / "thumbs" / f"{sha256}-{size[0]}x{size[1]}.rgb"
+
+    def _artifact_path(self, name: str) -> Path:
+        return self.root / "artifacts" / f"{name}.json"
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable photo cache index {self.index_path}: {exc}")
+            return {}
+        if payload.get("version") != INDEX_VERSION:
+            return {}
+        return dict(payload.get("entries") or {})
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    # ── Fetching ──────────────────────────────────────────────────────────────
+
+    def fetch(self, url: str) -> Tuple[bytes, str]:
+        """Return ``(image_bytes, status)`` for ``url``.
+
+        ``status`` is ``"cached"``, ``"revalidated"`` (304) or ``"downloaded"``.
+        Network and decode failures raise ``requests.RequestException``,
+        ``OSError`` or ``ValueError`` like a direct download would.
+        """
+        now = time.time()
+        with self._lock:
+            entry = dict(self._index.get(url) or {})
+            checked_this_run = url in self._checked
+        blob_path = self._blob_path(entry["sha256"]) if entry.get("sha256") else None
+        cached = blob_path is not None and blob_path.is_file()
+
+        if cached and (
+            checked_this_run
+            or now - float(entry.get("checked_at") or 0) < self.revalidate_after_seconds
+        ):
+            self._touch(url, now)
+            with self._lock:
+                self.hits += 1
+            return blob_path.read_bytes(), "cached"
+
+        headers = {}
+        if cached and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if cached and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        response = self._session().get(url, timeout=self.timeout, headers=headers)
+        if cached and response.status_code == 304:
+            self._touch(url, now, checked=True)
+            with self._lock:
+                self._checked.add(url)
+                self.hits += 1
+            return blob_path.read_bytes(), "revalidated"
+        response.raise_for_status()
+        data = response.content
+        with Image.open(io.BytesIO(data)) as image:
+            image.verify()
+
+        sha256 = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(sha256)
+        if not blob_path.is_file():
+            atomic_write_bytes(blob_path, data)
+        with self._lock:
+            self._index[url] = {
+                "sha256": sha256,
+                "etag": response.headers.get("ETag") or "",
+                "last_modified": response.headers.get("Last-Modified") or "",
+                "checked_at": now,
+                "last_used": now,
+                "size": len(data),
+            }
+            self._dirty = True
+            self._checked.add(url)
+            self.downloads += 1
+        return data, "downloaded"
+
+    def get_bytes(self, url: str) -> Optional[bytes]:
+        """Return cached or downloaded bytes for ``url``, or None when unusable."""
+        if not _is_remote(url):
+            return None
+        try:
+            return self.fetch(url)[0]
+        except (requests.RequestException, OSError, ValueError) as exc:
+            logger.debug(f"Could not load photo {url!r}: {exc}")
+            return None
+
+    def thumbnail(self, url: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+        """Return an RGB image of ``url`` fitted inside ``size`` (aspect kept).
+
+        The decoded thumbnail is stored once per photo and box size, so later
+        runs skip both the download and the JPEG decode + resample.
+        """
+        data = self.get_bytes(url)
+        if data is None:
+            return None
+        with self._lock:
+            sha256 = (self._index.get(url) or {}).get("sha256") or hashlib.sha256(data).hexdigest()
+        size = (int(size[0]), int(size[1]))
+        thumb_path = self._thumb_path(sha256, size)
+        try:
+            raw = thumb_path.read_bytes()
+            width, height = _THUMB_HEADER.unpack_from(raw)
+            return Image.frombytes("RGB", (width, height), raw[_THUMB_HEADER.size:])
+        except (OSError, ValueError, struct.error):
+            pass
+        try:
+            image = Image.open(io.BytesIO(data)).convert("RGB")
+        except (OSError, ValueError) as exc:
+            logger.debug(f"Could not decode photo {url!r}: {exc}")
+            return None
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+        atomic_write_bytes(thumb_path, _THUMB_HEADER.pack(*image.size) + image.tobytes())
+        return image
+
+    def prefetch(self, urls: Iterable[str], workers: int = 8) -> int:
+        """Download every uncached remote URL concurrently; return how many were fetched."""
+        wanted = list(dict.fromkeys(url for url in urls if _is_remote(url)))
+        if not wanted:
+            return 0
+        before = self.downloads
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(wanted)))) as executor:
+            list(executor.map(self.get_bytes, wanted))
+        fetched = self.downloads - before
+        logger.info(
+            f"Photo cache: {len(wanted)} photo(s) requested, {fetched} downloaded, "
+            f"{len(wanted) - fetched} served from {self.root}"
+        )
+        self.save()
+        return fetched
+
+    def _touch(self, url: str, now: float, checked: bool = False) -> None:
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return
+            entry["last_used"] = now
+            if checked:
+                entry["checked_at"] = now
+            self._dirty = True
+
+    # ── Derived artifacts ─────────────────────────────────────────────────────
+
+    def load_artifact(self, name: str) -> Optional[Any]:
+        try:
+            return json.loads(self._artifact_path(name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save_artifact(self, name: str, payload: Any) -> None:
+        atomic_write_json(self._artifact_path(name), payload, default=str)
+
+    # ── Persistence and eviction ──────────────────────────────────────────────
+
+    def save(self) -> None:
+        """Persist the index and evict LRU photos beyond ``max_bytes``."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._evict()
+            atomic_write_json(
+                self.index_path,
+                {"version": INDEX_VERSION, "entries": self._index},
+                indent=1,
+                sort_keys=True,
+            )
+            self._dirty = False
+
+    def _evict(self) -> None:
+        sizes: Dict[str, int] = {}
+        for folder in ("blobs", "thumbs"):
+            directory = self.root / folder
+            if not directory.is_dir():
+                continue
+            for path in directory.iterdir():
+                if path.suffix == ".tmp":
+                    continue
+                sha256 = path.name.split("-", 1)[0]
+                sizes[sha256] = sizes.get(sha256, 0) + path.stat().st_size
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        last_used: Dict[str, float] = {}
+        for entry in self._index.values():
+            sha256 = entry.get("sha256") or ""
+            last_used[sha256] = max(last_used.get(sha256, 0.0), float(entry.get("last_used") or 0))
+        # Unreferenced content first (last_used 0), then least recently used.
+        for sha256 in sorted(sizes, key=lambda sha: last_used.get(sha, 0.0)):
+            if total <= self.max_bytes:
+                break
+            self._remove_content(sha256)
+            total -= sizes[sha256]
+        self._index = {
+            url: entry for url, entry in self._index.items()
+            if self._blob_path(entry.get("sha256") or "").is_file()
+        }
+
+    def _remove_content(self, sha256: str) -> None:
+        self._blob_path(sha256).unlink(missing_ok=True)
+        thumbs_dir = self.root / "thumbs"
+        if thumbs_dir.is_dir():
+            for path in thumbs_dir.glob(f"{sha256}-*"):
+                path.unlink(missing_ok=True)
+
+
+_DEFAULT_STORE: LazyDefault[PhotoStore] = LazyDefault(PhotoStore, PHOTO_CACHE_DIR)
+
+
+def default_photo_store() -> Optional[PhotoStore]:
+    """Return the process-wide store at PHOTO_CACHE_DIR, or None when disabled."""
+    return _DEFAULT_STORE.get()
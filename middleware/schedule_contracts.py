@@ -31,10 +31,14 @@ Design rules (per #161 review):
 
 from __future__ import annotations
 
+import operator
 import re
-from typing import Any, Optional
+import types
+from typing import Any, Optional, Union, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+import annotated_types
+from pydantic import BaseModel, ConfigDict, Field, Strict, ValidationError, field_validator
+from pydantic.fields import FieldInfo
 
 _TIME_RE = re.compile(r"^\d{1,2}:\d{2}$")
 
@@ -255,6 +259,180 @@ class _ConflictAuditRowContract(BaseModel):
         return value
 
 
+# ---------------------------------------------------------------------------
+# Columnar fast path
+# ---------------------------------------------------------------------------
+#
+# A real document is almost entirely valid, and one model_validate() call per
+# item dominates validation of a 50k-game schedule.  Each item model is
+# compiled once into per-field column checks that test a whole section with
+# builtins (type sets, all()) and only ever *accept* values pydantic would
+# accept.  Items a check cannot vouch for — and only those — still go through
+# model_validate(), so every error message is pydantic's own.
+
+class _Missing:
+    pass
+
+
+_MISSING = _Missing()
+# constraint type -> (attribute, comparison, extreme value that decides it)
+_BOUND_CHECKS = {
+    annotated_types.Gt: ("gt", operator.gt, min),
+    annotated_types.Ge: ("ge", operator.ge, min),
+    annotated_types.Lt: ("lt", operator.lt, max),
+    annotated_types.Le: ("le", operator.le, max),
+}
+
+
+class _ColumnCheck:
+    """Conservative whole-column test for one model field."""
+
+    def __init__(self, name: str, info: FieldInfo, validators: list) -> None:
+        self.name = name
+        self.required = info.is_required()
+        self.supported = True
+        self.validators = validators
+        self.bounds: list[tuple[Any, Any, Any]] = []
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.element: Optional[type] = None
+
+        annotation = info.annotation
+        optional = False
+        if get_origin(annotation) in (Union, types.UnionType):
+            args = get_args(annotation)
+            non_none = [arg for arg in args if arg is not type(None)]
+            optional = len(non_none) < len(args)
+            annotation = non_none[0] if len(non_none) == 1 else None
+        if get_origin(annotation) is list:
+            element = get_args(annotation)[0] if get_args(annotation) else None
+            self.element = get_origin(element) or element
+            if self.element not in (str, dict):
+                self.supported = False
+            annotation = list
+        if annotation not in (str, int, float, bool, list):
+            self.supported = False
+        # Exact types only: strict and lax mode both accept these unchanged
+        # (bool is its own type, so it never passes for int or float).
+        self.value_types = {annotation, int} if annotation is float else {annotation}
+        self.allowed_types = set(self.value_types)
+        if optional:
+            self.allowed_types.add(type(None))
+        if not self.required:
+            self.allowed_types.add(_Missing)
+
+        for meta in info.metadata:
+            if isinstance(meta, Strict):
+                continue
+            if type(meta) in _BOUND_CHECKS:
+                attr, compare, extreme = _BOUND_CHECKS[type(meta)]
+                self.bounds.append((compare, getattr(meta, attr), extreme))
+            elif isinstance(meta, annotated_types.MinLen):
+                self.min_length = meta.min_length
+            elif isinstance(meta, annotated_types.MaxLen):
+                self.max_length = meta.max_length
+            else:
+                self.supported = False
+
+    def _accepts(self, values: list[Any]) -> bool:
+        kinds = set(map(type, values))
+        if not kinds <= self.allowed_types:
+            return False
+        present = (
+            values if kinds <= self.value_types
+            else [value for value in values if type(value) in self.value_types]
+        )
+        if self.element is str:
+            if not all(type(e) is str for value in present for e in value):
+                return False
+        elif self.element is dict:
+            if not all(
+                type(e) is dict and all(type(key) is str for key in e)
+                for value in present for e in value
+            ):
+                return False
+        for compare, limit, extreme in self.bounds:
+            if float in kinds:
+                # NaN must fail every bound, which min()/max() cannot see.
+                if not all(compare(value, limit) for value in present):
+                    return False
+            elif present and not compare(extreme(present), limit):
+                return False
+        if self.min_length is not None:
+            if self.min_length == 1:
+                if not all(present):
+                    return False
+            elif not all(len(value) >= self.min_length for value in present):
+                return False
+        if self.max_length is not None and not all(
+            len(value) <= self.max_length for value in present
+        ):
+            return False
+        try:
+            for validator in self.validators:
+                for value in present:
+                    validator(value)
+        except Exception:
+            return False
+        return True
+
+    def rejected(self, values: list[Any]) -> list[int]:
+        """Positions in ``values`` this check cannot vouch for."""
+        if not self.supported:
+            return list(range(len(values)))
+        if self._accepts(values):
+            return []
+        return [index for index, value in enumerate(values) if not self._accepts([value])]
+
+
+class _SectionChecker:
+    """All column checks for one item model."""
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.known_fields = frozenset(model.model_fields)
+        decorators = model.__pydantic_decorators__
+        validators: dict[str, list] = {}
+        self.supported = not (
+            decorators.model_validators or decorators.root_validators
+            or decorators.validators or decorators.field_serializers
+            or decorators.model_serializers or decorators.computed_fields
+        )
+        for decorator in decorators.field_validators.values():
+            if decorator.info.mode != "after":
+                self.supported = False
+            for name in decorator.info.fields:
+                validators.setdefault(name, []).append(decorator.func)
+        self.columns = [
+            _ColumnCheck(name, info, validators.get(name, []))
+            for name, info in model.model_fields.items()
+        ]
+
+    def suspects(self, items: list[dict[str, Any]], present_fields: set[str]) -> set[int]:
+        """Positions of the items model_validate() still has to look at."""
+        if not self.supported:
+            return set(range(len(items)))
+        suspects: set[int] = set()
+        for column in self.columns:
+            if column.name not in present_fields and not column.required:
+                continue  # absent everywhere: every item takes the default
+            try:
+                values = list(map(operator.itemgetter(column.name), items))
+            except KeyError:
+                values = [item.get(column.name, _MISSING) for item in items]
+            suspects.update(column.rejected(values))
+        return suspects
+
+
+_SECTION_CHECKERS: dict[type[BaseModel], _SectionChecker] = {}
+
+
+def _section_checker(model: type[BaseModel]) -> _SectionChecker:
+    checker = _SECTION_CHECKERS.get(model)
+    if checker is None:
+        checker = _SECTION_CHECKERS[model] = _SectionChecker(model)
+    return checker
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
@@ -274,6 +452,11 @@ def _is_annotation_field(name: str) -> bool:
     return name == _ANNOTATION_FIELD or name.startswith(_ANNOTATION_PREFIX)
 
 
+def _identity_note(item: dict[str, Any], id_field: str) -> str:
+    identity = item.get(id_field)
+    return f" ({id_field}={identity!r})" if identity else ""
+
+
 def _validate_items(
     items: Any,
     model: type[BaseModel],
@@ -284,39 +467,73 @@ def _validate_items(
     warned_unknown: set[tuple[str, str]],
 ) -> None:
     """Validate one top-level list section, collecting errors and
-    deduplicated unknown-field warnings."""
+    deduplicated unknown-field warnings.
+
+    The whole section is screened by the model's columnar checker first;
+    only non-objects and the items it flags are reported, in index order,
+    through model_validate()."""
     if items is None:
         return
     if not isinstance(items, list):
         errors.append(f"{section}: must be a list, got {type(items).__name__}")
         return
-    known_fields = set(model.model_fields)
-    for index, item in enumerate(items):
+    checker = _section_checker(model)
+    not_objects = [] if set(map(type, items)) <= {dict} else [
+        index for index, item in enumerate(items) if not isinstance(item, dict)
+    ]
+    if not_objects:
+        positions = [
+            index for index, item in enumerate(items) if isinstance(item, dict)
+        ]
+        dict_items = [items[index] for index in positions]
+    else:
+        positions = None
+        dict_items = items
+    present_fields: set[str] = set().union(*dict_items)
+    suspects = checker.suspects(dict_items, present_fields)
+    if positions is not None:
+        suspects = {positions[index] for index in suspects}
+
+    for index in sorted(suspects.union(not_objects)):
+        item = items[index]
         if not isinstance(item, dict):
             errors.append(
                 f"{section}[{index}]: must be an object, got {type(item).__name__}"
             )
             continue
-        identity = item.get(id_field)
-        identity_note = f" ({id_field}={identity!r})" if identity else ""
         try:
             model.model_validate(item)
         except ValidationError as exc:
             errors.extend(
-                _format_pydantic_errors(exc, f"{section}[{index}]", identity_note)
+                _format_pydantic_errors(
+                    exc, f"{section}[{index}]", _identity_note(item, id_field)
+                )
             )
+
+    unknown = {
+        field_name for field_name in present_fields - checker.known_fields
+        if not _is_annotation_field(field_name)
+        and (section, field_name) not in warned_unknown
+    }
+    if not unknown:
+        return
+    # Warn in first-seen order: by item index, then key order in the item.
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or unknown.isdisjoint(item):
+            continue
         for field_name in item:
-            if field_name in known_fields or _is_annotation_field(field_name):
+            if field_name not in unknown:
                 continue
-            key = (section, field_name)
-            if key not in warned_unknown:
-                warned_unknown.add(key)
-                warnings.append(
-                    f"{section}: unknown field {field_name!r} (first seen at "
-                    f"{section}[{index}]{identity_note}) — not part of the "
-                    "documented schema; use 'operator_notes' or an 'x_' prefix "
-                    "for operator annotations"
-                )
+            unknown.discard(field_name)
+            warned_unknown.add((section, field_name))
+            warnings.append(
+                f"{section}: unknown field {field_name!r} (first seen at "
+                f"{section}[{index}]{_identity_note(item, id_field)}) — not "
+                "part of the documented schema; use 'operator_notes' or an "
+                "'x_' prefix for operator annotations"
+            )
+        if not unknown:
+            return
 
 
 def _warn_unknown_top_level(
@@ -394,6 +611,18 @@ def _find_precedence_cycle(rules: list[dict[str, Any]]) -> Optional[list[str]]:
     return None
 
 
+def _report_duplicates(ids: list[str], message: str, errors: list[str]) -> None:
+    """Append ``message`` for every repeat of a non-empty id, in list order."""
+    non_empty = [item_id for item_id in ids if item_id]
+    if len(set(non_empty)) == len(non_empty):
+        return
+    seen: set[str] = set()
+    for item_id in non_empty:
+        if item_id in seen:
+            errors.append(f"{message} {item_id!r}")
+        seen.add(item_id)
+
+
 def _resource_capacity_slots(resource: dict[str, Any]) -> int:
     """How many whole slots fit in one resource's daily window."""
     try:
@@ -491,19 +720,17 @@ def validate_schedule_input(data: Any) -> list[str]:
     game_dicts = [g for g in games if isinstance(g, dict)]
     resource_dicts = [r for r in resources if isinstance(r, dict)]
 
+    # Per-game keys, derived once and reused by every check below.
+    game_ids = [str(game.get("game_id") or "").strip() for game in game_dicts]
+    game_pools = [_solver_pool_key(game) for game in game_dicts]
+
     # Duplicate IDs make assignments ambiguous — always an error.
-    seen_game_ids: set[str] = set()
-    for game in game_dicts:
-        gid = str(game.get("game_id") or "").strip()
-        if gid and gid in seen_game_ids:
-            errors.append(f"games: duplicate game_id {gid!r}")
-        seen_game_ids.add(gid)
-    seen_resource_ids: set[str] = set()
-    for resource in resource_dicts:
-        rid = str(resource.get("resource_id") or "").strip()
-        if rid and rid in seen_resource_ids:
-            errors.append(f"resources: duplicate resource_id {rid!r}")
-        seen_resource_ids.add(rid)
+    _report_duplicates(game_ids, "games: duplicate game_id", errors)
+    resource_ids = [
+        str(resource.get("resource_id") or "").strip() for resource in resource_dicts
+    ]
+    _report_duplicates(resource_ids, "resources: duplicate resource_id", errors)
+    seen_resource_ids = set(resource_ids)
 
     # Real clock windows: close_time must be after open_time.
     for index, resource in enumerate(resource_dicts):
@@ -573,15 +800,32 @@ def validate_schedule_input(data: Any) -> list[str]:
     }
     warned_missing_types: set[str] = set()
     warned_missing_pool_types: set[tuple[str, str]] = set()
-    for game in game_dicts:
-        gid = str(game.get("game_id") or "").strip() or "<unknown>"
-        rtype = str(game.get("resource_type") or "").strip()
-        duration = game.get("duration_minutes")
+    # The outcome depends only on (resource_type, pool, duration), so the
+    # per-game walk below runs only when some combination needs a message.
+    fit_keys = list(zip(
+        (str(game.get("resource_type") or "").strip() for game in game_dicts),
+        game_pools,
+        (game.get("duration_minutes") for game in game_dicts),
+    ))
+    measurable = {
+        (rtype, pool, duration) for rtype, pool, duration in fit_keys
+        if rtype and not isinstance(duration, bool)
+        and isinstance(duration, (int, float)) and not duration <= 0
+    }
+    all_fit = all(
+        rtype in types_with_resources
+        and capacity_by_pool_type.get((pool, rtype), -1) >= duration
+        for rtype, pool, duration in measurable
+    )
+    for game_index, (rtype, pool, duration) in enumerate(
+        () if all_fit else fit_keys
+    ):
         if (
             not rtype or isinstance(duration, bool)
             or not isinstance(duration, (int, float)) or duration <= 0
         ):
             continue  # field-level errors already recorded above
+        gid = game_ids[game_index] or "<unknown>"
         if rtype not in types_with_resources:
             if rtype not in warned_missing_types:
                 warned_missing_types.add(rtype)
@@ -590,7 +834,7 @@ def validate_schedule_input(data: Any) -> list[str]:
                     "resources — those games will be reported as unscheduled"
                 )
             continue
-        key = (_solver_pool_key(game), rtype)
+        key = (pool, rtype)
         if key not in capacity_by_pool_type:
             if key not in warned_missing_pool_types:
                 warned_missing_pool_types.add(key)
@@ -631,11 +875,9 @@ def validate_schedule_input(data: Any) -> list[str]:
     }
     # Pinned games take the pool of their pinned resource, mirroring how
     # solve() registers them for precedence routing.
-    pool_by_game_id: dict[str, str] = {}
-    for game in game_dicts:
-        gid = str(game.get("game_id") or "").strip()
-        if gid:
-            pool_by_game_id[gid] = _solver_pool_key(game)
+    pool_by_game_id: dict[str, str] = {
+        gid: pool for gid, pool in zip(game_ids, game_pools) if gid
+    }
     for playoff_slot in playoff_dicts:
         gid = str(playoff_slot.get("game_id") or "").strip()
         resource = resource_by_id.get(
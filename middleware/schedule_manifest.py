@@ -0,0 +1,138 @@
+# middleware/schedule_manifest.py
+"""
+Local copy of the published sf_schedules manifest for publish-schedule.
+
+build_publish_diff only compares game_key, game_status and source_hash, so
+publish-schedule reads WordPress's manifest mode (those columns plus
+schedule_version, updated_at and the few fields its report prints) instead
+of every column of every row.  ``ScheduleManifestCache`` keeps the last
+manifest on disk with the table's ``max_updated_at`` cursor; the next read
+asks only for rows with ``updated_at >= cursor`` and merges them in.
+
+A delta is trusted only while the merged row count matches the table's
+``total``, and a full manifest read happens at least every
+SCHEDULE_MANIFEST_FULL_REFRESH_MINUTES.  The cache is scoped to one
+WordPress site (``Config.WP_URL``).
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from config import Config, SCHEDULE_MANIFEST_CACHE_FILE, SCHEDULE_MANIFEST_FULL_REFRESH_MINUTES
+from file_utils import LazyDefault, atomic_write_json
+
+
+MANIFEST_CACHE_VERSION = 1
+
+
+class ScheduleManifestCache:
+    """JSON-backed ``game_key -> manifest row`` map plus its update cursor."""
+
+    def __init__(
+        self,
+        path: Path,
+        full_refresh_seconds: float = SCHEDULE_MANIFEST_FULL_REFRESH_MINUTES * 60,
+        scope: Optional[str] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.full_refresh_seconds = full_refresh_seconds
+        self.scope = (Config.WP_URL or "") if scope is None else scope
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """The stored manifest (``rows``, ``cursor``, ``full_read_at``), or None."""
+        with self._lock:
+            try:
+                payload = json.loads(self.path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as exc:
+                logger.warning(f"Ignoring unreadable schedule manifest cache {self.path}: {exc}")
+                return None
+        if payload.get("version") != MANIFEST_CACHE_VERSION or payload.get("scope") != self.scope:
+            return None
+        return payload
+
+    def store(self, rows: Dict[str, Dict[str, Any]], cursor: Optional[str], full_read_at: float) -> None:
+        with self._lock:
+            try:
+                atomic_write_json(
+                    self.path,
+                    {
+                        "version": MANIFEST_CACHE_VERSION,
+                        "scope": self.scope,
+                        "cursor": cursor,
+                        "full_read_at": full_read_at,
+                        "rows": rows,
+                    },
+                    sort_keys=True,
+                )
+            except OSError as exc:
+                logger.warning(f"Could not write schedule manifest cache {self.path}: {exc}")
+
+
+def _rows_by_key(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {str(row.get("game_key")): row for row in rows if row.get("game_key")}
+
+
+def load_published_manifest(
+    wp_connector: Any,
+    cache: Optional[ScheduleManifestCache] = None,
+    full: bool = False,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return the published schedule as manifest rows, or None when WordPress
+    could not be read.
+
+    With a usable ``cache`` (and ``full`` not set) only rows updated since
+    the cached cursor are fetched; otherwise the whole manifest is read.
+    Either way the result is written back to ``cache``.
+    """
+    cached = cache.load() if cache is not None and not full else None
+    if cached is not None and (
+        not cached.get("cursor")
+        or time.time() - float(cached.get("full_read_at") or 0) >= cache.full_refresh_seconds
+    ):
+        cached = None
+
+    if cached is not None:
+        delta = wp_connector.get_schedule_manifest(updated_since=cached["cursor"])
+        if delta is None:
+            return None
+        rows = dict(cached.get("rows") or {})
+        rows.update(_rows_by_key(delta.get("rows") or []))
+        if len(rows) == int(delta.get("total") or 0):
+            logger.info(
+                f"Schedule manifest: {len(delta.get('rows') or [])} row(s) updated since "
+                f"{cached['cursor']}, {len(rows)} total"
+            )
+            if cache is not None:
+                cache.store(rows, delta.get("max_updated_at"), float(cached.get("full_read_at") or 0))
+            return list(rows.values())
+        logger.info(
+            f"Schedule manifest: cached copy has {len(rows)} row(s) but WordPress has "
+            f"{delta.get('total')}; re-reading the full manifest"
+        )
+
+    full_read_at = time.time()
+    manifest = wp_connector.get_schedule_manifest()
+    if manifest is None:
+        return None
+    rows = _rows_by_key(manifest.get("rows") or [])
+    if cache is not None:
+        cache.store(rows, manifest.get("max_updated_at"), full_read_at)
+    return list(manifest.get("rows") or [])
+
+
+_DEFAULT_CACHE: LazyDefault[ScheduleManifestCache] = LazyDefault(
+    ScheduleManifestCache, SCHEDULE_MANIFEST_CACHE_FILE
+)
+
+
+def default_manifest_cache() -> Optional[ScheduleManifestCache]:
+    """Return the process-wide cache at SCHEDULE_MANIFEST_CACHE_FILE, or None when disabled."""
+    return _DEFAULT_CACHE.get()
@@ -14,6 +14,12 @@ Design rules (RFC docs/EVENT_DAY_RESULTS_WORKFLOW_RFC.md §7):
     scheduler/game-key-drift bug, not a legitimate cancellation — it is
     reported separately (missing_completed) rather than silently folded into
     the ordinary cancellation bucket.
+  - --execute sends the upsert in chunks of PUBLISH_SCHEDULE_CHUNK_SIZE
+    games, each with its own idempotency key, and records progress in a
+    publish journal next to schedule_output.json.  Rerunning the same
+    command after a failure resumes the same schedule_version and skips
+    chunks the journal marks done or whose rows WordPress already shows at
+    that version with the same source_hash.
 """
 
 from __future__ import annotations
@@ -25,10 +31,14 @@ from typing import Any, Optional
 
 from loguru import logger
 
+from config import Config, PUBLISH_SCHEDULE_CHUNK_SIZE
+from file_utils import atomic_write_json
+from schedule_manifest import default_manifest_cache, load_published_manifest
 from scheduler import _game_team_ids
 
 PROTECTED_GAME_STATUSES = {"reported", "official", "under_review"}
 CANCELLABLE_GAME_STATUSES = {"scheduled", "in_progress"}
+PUBLISH_JOURNAL_VERSION = 1
 
 # Fields carried into the sf_schedules upsert payload, and included in the
 # source_hash. game_key/schedule_version/game_status/source_hash/published_at
@@ -242,6 +252,122 @@ def format_publish_report(
     return lines
 
 
+def publish_journal_path(schedule_output_path: Path) -> Path:
+    """Default publish journal location: beside the schedule_output being published."""
+    path = Path(schedule_output_path)
+    return path.with_name(f"{path.stem}.publish_journal.json")
+
+
+def _publish_fingerprint(merged_games: list[dict[str, Any]], force_cancel: bool) -> str:
+    """Identity of one publish: the generated games and the cancel mode."""
+    rows = sorted((game["game_key"], game.get("source_hash") or "") for game in merged_games)
+    canonical = json.dumps({"games": rows, "force_cancel": force_cancel}, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _chunk_idempotency_key(schedule_version: int, games: list[dict[str, Any]]) -> str:
+    rows = [
+        (game.get("game_key"), game.get("source_hash"), game.get("game_status"))
+        for game in games
+    ]
+    canonical = json.dumps({"version": schedule_version, "games": rows}, separators=(",", ":"))
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"publish-v{schedule_version}-{digest[:32]}"
+
+
+def _chunk_landed(
+    games: list[dict[str, Any]],
+    published_by_key: dict[str, dict[str, Any]],
+    schedule_version: int,
+) -> bool:
+    """True when WordPress already shows every game of a chunk at
+    ``schedule_version`` with the same source_hash (and cancellations
+    cancelled) — i.e. the chunk applied but its response was lost."""
+    for game in games:
+        row = published_by_key.get(str(game.get("game_key")))
+        if row is None:
+            return False
+        if int(row.get("schedule_version") or 0) != schedule_version:
+            return False
+        if row.get("source_hash") != game.get("source_hash"):
+            return False
+        if game.get("game_status") == "cancelled" and row.get("game_status") != "cancelled":
+            return False
+    return True
+
+
+class PublishJournal:
+    """On-disk progress of one chunked publish-schedule --execute run."""
+
+    def __init__(self, path: Path, payload: dict[str, Any]) -> None:
+        self.path = Path(path)
+        self.payload = payload
+
+    @classmethod
+    def load_active(cls, path: Path, fingerprint: str) -> Optional["PublishJournal"]:
+        """The unfinished journal for this publish, or None."""
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable publish journal {path}: {exc}")
+            return None
+        if (
+            payload.get("version") != PUBLISH_JOURNAL_VERSION
+            or payload.get("scope") != (Config.WP_URL or "")
+            or payload.get("fingerprint") != fingerprint
+            or payload.get("completed")
+        ):
+            return None
+        return cls(path, payload)
+
+    @classmethod
+    def start(
+        cls,
+        path: Path,
+        fingerprint: str,
+        schedule_version: int,
+        force_cancel: bool,
+        games: list[dict[str, Any]],
+        chunk_size: int,
+    ) -> "PublishJournal":
+        chunk_size = max(1, int(chunk_size))
+        chunks = []
+        for start in range(0, len(games), chunk_size):
+            chunk_games = games[start:start + chunk_size]
+            chunks.append({
+                "idempotency_key": _chunk_idempotency_key(schedule_version, chunk_games),
+                "games": chunk_games,
+                "status": "pending",
+            })
+        journal = cls(path, {
+            "version": PUBLISH_JOURNAL_VERSION,
+            "scope": Config.WP_URL or "",
+            "fingerprint": fingerprint,
+            "schedule_version": schedule_version,
+            "force_cancel": force_cancel,
+            "completed": False,
+            "chunks": chunks,
+        })
+        journal.save()
+        return journal
+
+    @property
+    def schedule_version(self) -> int:
+        return int(self.payload["schedule_version"])
+
+    @property
+    def chunks(self) -> list[dict[str, Any]]:
+        return self.payload["chunks"]
+
+    def save(self) -> None:
+        try:
+            atomic_write_json(self.path, self.payload, indent=2)
+        except OSError as exc:
+            logger.warning(f"Could not write publish journal {self.path}: {exc}")
+
+
 def run_publish_schedule(
     schedule_input_path: Path,
     schedule_output_path: Path,
@@ -250,9 +376,16 @@ def run_publish_schedule(
     force_cancel: bool = False,
     allow_partial: bool = False,
     audit_output_path: Optional[Path] = None,
+    chunk_size: Optional[int] = None,
+    journal_path: Optional[Path] = None,
 ) -> int:
     """Load, contract-validate, diff, and (if --execute) upsert a schedule.
 
+    The upsert goes out in chunks of ``chunk_size`` games (default
+    PUBLISH_SCHEDULE_CHUNK_SIZE) tracked in the publish journal at
+    ``journal_path`` (default: publish_journal_path(schedule_output_path)).
+    The published state is read as a manifest through default_manifest_cache().
+
     Returns a process exit code: 0 on success, 1 on any contract or I/O
     failure.
     """
@@ -306,7 +439,13 @@ def run_publish_schedule(
 
     merged_games = merge_schedule(schedule_input, schedule_output)
     try:
-        published_rows = wp_connector.get_schedules()
+        # Dry runs diff against the cached manifest plus a delta; --execute
+        # always re-reads the whole manifest before writing.
+        published_rows = load_published_manifest(
+            wp_connector,
+            default_manifest_cache(),
+            full=not dry_run,
+        )
     except Exception as exc:
         logger.error(f"publish-schedule: failed to read WordPress schedule: {exc}")
         return 1
@@ -316,10 +455,23 @@ def run_publish_schedule(
             "refusing to diff against an unknown published state."
         )
         return 1
-    existing_versions = [
-        int(row.get("schedule_version") or 0) for row in published_rows
-    ]
-    schedule_version = (max(existing_versions) if existing_versions else 0) + 1
+    fingerprint = _publish_fingerprint(merged_games, force_cancel)
+    journal_file = Path(journal_path) if journal_path else publish_journal_path(schedule_output_path)
+    journal = PublishJournal.load_active(journal_file, fingerprint)
+    if journal is not None:
+        # Chunks that already landed carry this version, so a fresh max()+1
+        # would split one publish across two versions.
+        schedule_version = journal.schedule_version
+        done = sum(1 for chunk in journal.chunks if chunk["status"] == "done")
+        logger.info(
+            f"publish-schedule: resuming schedule_version {schedule_version} from "
+            f"{journal_file} ({done}/{len(journal.chunks)} chunk(s) already applied)"
+        )
+    else:
+        existing_versions = [
+            int(row.get("schedule_version") or 0) for row in published_rows
+        ]
+        schedule_version = (max(existing_versions) if existing_versions else 0) + 1
 
     diff = build_publish_diff(merged_games, published_rows)
     for line in format_publish_report(diff, schedule_version, force_cancel):
@@ -340,28 +492,79 @@ def run_publish_schedule(
     if dry_run:
         return 0
 
-    upsert_games = (
-        list(diff["new"])
-        + list(diff["changed"])
-        + list(diff["unchanged"])
-        + list(diff["protected_unchanged"])
-    )
-    if force_cancel:
-        for row in diff["cancelled_candidates"]:
-            upsert_games.append({**row, "game_status": "cancelled"})
+    if journal is None:
+        upsert_games = (
+            list(diff["new"])
+            + list(diff["changed"])
+            + list(diff["unchanged"])
+            + list(diff["protected_unchanged"])
+        )
+        if force_cancel:
+            for row in diff["cancelled_candidates"]:
+                upsert_games.append({**row, "game_status": "cancelled"})
+
+        if not upsert_games:
+            logger.info("publish-schedule: nothing to upsert.")
+            return 0
+
+        journal = PublishJournal.start(
+            journal_file,
+            fingerprint,
+            schedule_version,
+            force_cancel,
+            upsert_games,
+            chunk_size or PUBLISH_SCHEDULE_CHUNK_SIZE,
+        )
 
-    if not upsert_games:
-        logger.info("publish-schedule: nothing to upsert.")
-        return 0
+    published_by_key = {
+        str(row.get("game_key")): row for row in published_rows if row.get("game_key")
+    }
+    chunk_count = len(journal.chunks)
+    results: list[dict[str, Any]] = []
+    for number, chunk in enumerate(journal.chunks, start=1):
+        if chunk["status"] == "done":
+            continue
+        if _chunk_landed(chunk["games"], published_by_key, schedule_version):
+            logger.info(f"publish-schedule: chunk {number}/{chunk_count} already applied; skipping")
+            chunk.update(status="done", counts={})
+            journal.save()
+            continue
 
-    response = wp_connector.upsert_schedules(
-        games=upsert_games,
-        schedule_version=schedule_version,
-        force_cancel=force_cancel,
-    )
-    if response is None or not response.get("success"):
-        logger.error("publish-schedule: upsert request failed.")
-        return 1
+        response = wp_connector.upsert_schedules(
+            games=chunk["games"],
+            schedule_version=schedule_version,
+            force_cancel=force_cancel,
+            idempotency_key=chunk["idempotency_key"],
+        )
+        if response is None or not response.get("success"):
+            chunk["status"] = "failed"
+            journal.save()
+            logger.error(
+                f"publish-schedule: upsert request failed for chunk {number}/{chunk_count}; "
+                "rerun the same command to resume from it."
+            )
+            return 1
+        chunk.update(
+            status="done",
+            counts={
+                key: int(response.get(key) or 0)
+                for key in ("created_count", "updated_count", "skipped_count")
+            },
+        )
+        journal.save()
+        results.extend(response.get("results") or [])
+        logger.info(f"publish-schedule: chunk {number}/{chunk_count} applied")
+
+    journal.payload["completed"] = True
+    journal.save()
+    response = {
+        "success": True,
+        "schedule_version": schedule_version,
+        "chunk_count": chunk_count,
+        "results": results,
+    }
+    for key in ("created_count", "updated_count", "skipped_count"):
+        response[key] = sum(chunk["counts"].get(key, 0) for chunk in journal.chunks)
 
     logger.info(
         f"publish-schedule: created={response.get('created_count')} "
@@ -66,6 +66,8 @@ from scheduling import input_builder
 from scheduling import conflict_edges
 from scheduling import game_builder
 from scheduling import pool_assignment
+from scheduling import workbook_fingerprints
+from scheduling.roster_table import RosterTable
 
 
 class ScheduleWorkbookBuilder:
@@ -549,24 +551,8 @@ class ScheduleWorkbookBuilder:
         if min_team_size <= 0:
             return {"n_estimating": 0, "n_potential": 0, "team_codes": ""}
         target_type, target_gender, _ = cls._decompose_event_name(event_name)
-        counts_by_team: Dict[Tuple[str, str], int] = {}
-        for r in roster_rows:
-            r_type = str(r.get("sport_type") or "").strip()
-            r_gender = str(r.get("sport_gender") or "").strip()
-            # Primary/secondary sports are stored as the base name (e.g. "Basketball");
-            # Other-Events sports are stored as the full SPORT_TYPE value verbatim.
-            # Accept either so both paths match.
-            if (r_type.casefold() != target_type.casefold() and
-                    r_type.casefold() != event_name.casefold()):
-                continue
-            if target_gender and r_gender.casefold() != target_gender.casefold():
-                continue
-            church = str(r.get("Church Team") or "").strip().upper()
-            if not church:
-                continue
-            team_order = str(r.get("team_order") or "").strip().upper()
-            team_key = (church, team_order)
-            counts_by_team[team_key] = counts_by_team.get(team_key, 0) + 1
+        teams = RosterTable.of(roster_rows).event_teams(event_name, target_type, target_gender)
+        counts_by_team = {team_key: len(entries) for team_key, entries in teams.items()}
         estimating = sorted(
             church if not team_order else f"{church}-{team_order}"
             for (church, team_order), n in counts_by_team.items()
@@ -709,12 +695,10 @@ class ScheduleWorkbookBuilder:
         singles_by_church: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
         doubles_regs_by_church: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
         fallback_potential_by_church: Dict[str, int] = defaultdict(int)
-        for r in roster_rows:
-            if str(r.get("sport_type") or "").strip().casefold() != sport_name.casefold():
-                continue
-            fmt = str(r.get("sport_format") or "").strip().casefold()
-            church = str(r.get("Church Team") or "").strip().upper()
-            parameter = self._racquet_rule_parameter_for_row(r)
+        for entry in RosterTable.of(roster_rows).sport_entries(sport_name):
+            fmt = entry.sport_format_cf
+            church = entry.church
+            parameter = self._racquet_rule_parameter_for_row(entry.row)
             if "single" in fmt:
                 n_singles += 1
                 if church and parameter:
@@ -809,12 +793,11 @@ class ScheduleWorkbookBuilder:
         divs: Dict[tuple, Dict[str, Any]] = {}
         seen_singles_ids: Dict[tuple, set[str]] = defaultdict(set)
 
-        for r in roster_rows:
-            sport_type = str(r.get("sport_type") or "").strip()
-            if sport_type not in RACQUET_SPORTS:
-                continue
-            sport_gender = str(r.get("sport_gender") or "").strip()
-            sport_format = str(r.get("sport_format") or "").strip()
+        for entry in RosterTable.of(roster_rows).racquet_entries:
+            r = entry.row
+            sport_type = entry.sport_type
+            sport_gender = entry.sport_gender
+            sport_format = entry.sport_format
             fmt_class = self._pod_format_class(sport_format)
 
             key = (sport_type, sport_gender, fmt_class)
@@ -903,17 +886,14 @@ class ScheduleWorkbookBuilder:
         doubles_rows: List[Dict[str, Any]] = []
         anomaly_rows: List[Dict[str, Any]] = []
 
-        for r in roster_rows:
-            sport_type = str(r.get("sport_type") or "").strip()
-            if sport_type not in RACQUET_SPORTS:
-                continue
-            fmt_class = self._pod_format_class(str(r.get("sport_format") or ""))
+        for entry in RosterTable.of(roster_rows).racquet_entries:
+            fmt_class = self._pod_format_class(entry.sport_format)
             if fmt_class == "singles":
-                singles_rows.append(r)
+                singles_rows.append(entry.row)
             elif fmt_class == "doubles":
-                doubles_rows.append(r)
+                doubles_rows.append(entry.row)
             else:
-                anomaly_rows.append(r)
+                anomaly_rows.append(entry.row)
 
         entry_rows: List[Dict[str, Any]] = []
         entry_counter = 0
@@ -1084,30 +1064,25 @@ class ScheduleWorkbookBuilder:
         div_meta: Dict[str, Tuple[str, str]] = {}
         # participant_id -> {name, primary_sport} across all racquet entries.
         pid_info: Dict[str, Dict[str, str]] = {}
-        for r in roster_rows:
-            sport_type = str(r.get("sport_type") or "").strip()
-            if sport_type not in RACQUET_SPORTS:
-                continue
-            sport_gender = str(r.get("sport_gender") or "").strip()
-            pid = str(r.get("Participant ID (WP)") or r.get("ChMeetings ID") or "").strip()
+        roster = RosterTable.of(roster_rows)
+        for entry in roster.racquet_entries:
+            sport_type = entry.sport_type
+            sport_gender = entry.sport_gender
+            pid = entry.participant_id
             if pid:
-                full_name = (
-                    f"{str(r.get('First Name') or '').strip()} "
-                    f"{str(r.get('Last Name') or '').strip()}"
-                ).strip()
                 pid_info[pid] = {
-                    "name": full_name or pid,
+                    "name": entry.full_name or pid,
                     "primary_sport": self._normalize_primary_sport_name(
-                        r.get("participant_primary_sport")
+                        entry.row.get("participant_primary_sport")
                     ),
                 }
-            if self._pod_format_class(str(r.get("sport_format") or "")) == "doubles":
+            if self._pod_format_class(entry.sport_format) == "doubles":
                 division_id = self._make_division_id(sport_type, sport_gender, "doubles")
                 div_meta[division_id] = (sport_type, sport_gender)
 
         confirmed_by_division: Dict[str, List[Dict[str, Any]]] = {}
         unprotected: List[Dict[str, Any]] = []
-        for row in self._build_pod_entries_review_rows(roster_rows, validation_rows):
+        for row in self._build_pod_entries_review_rows(roster, validation_rows):
             division_id = str(row.get("division_id") or "").strip()
             if row.get("entry_type") == "DoublesPair":
                 pids = [
@@ -1181,33 +1156,28 @@ class ScheduleWorkbookBuilder:
         """
         by_division: Dict[str, List[Dict[str, Any]]] = {}
         seen_in_div: Dict[str, set] = {}
-        for r in roster_rows:
-            sport_type = str(r.get("sport_type") or "").strip()
-            if sport_type not in RACQUET_SPORTS:
+        for entry in RosterTable.of(roster_rows).racquet_entries:
+            if self._pod_format_class(entry.sport_format) != "singles":
                 continue
-            if self._pod_format_class(str(r.get("sport_format") or "")) != "singles":
-                continue
-            sport_gender = str(r.get("sport_gender") or "").strip()
+            sport_type = entry.sport_type
+            sport_gender = entry.sport_gender
             division_id = self._make_division_id(sport_type, sport_gender, "singles")
-            pid = str(r.get("Participant ID (WP)") or r.get("ChMeetings ID") or "").strip()
+            pid = entry.participant_id
             if pid:
                 if pid in seen_in_div.setdefault(division_id, set()):
                     continue  # duplicate roster row for the same player
                 seen_in_div[division_id].add(pid)
-            full_name = (
-                f"{str(r.get('First Name') or '').strip()} "
-                f"{str(r.get('Last Name') or '').strip()}"
-            ).strip()
+            full_name = entry.full_name
             by_division.setdefault(division_id, []).append({
                 "division_id": division_id,
                 "sport_type": sport_type,
                 "sport_gender": sport_gender,
-                "sport_format": str(r.get("sport_format") or "").strip(),
+                "sport_format": entry.sport_format,
                 "participant_ids": [pid] if pid else [],
                 "participant_names": {pid: full_name or pid} if pid else {},
                 "primary_sports": {
                     pid: self._normalize_primary_sport_name(
-                        r.get("participant_primary_sport")
+                        entry.row.get("participant_primary_sport")
                     )
                 } if pid else {},
                 "player_name": full_name,
@@ -1658,16 +1628,46 @@ class ScheduleWorkbookBuilder:
         schedule_input: Dict[str, Any],
         venue_input_path: Optional[Path],
         pool_assignment_path: Optional[Path] = None,
+        incremental: bool = False,
     ) -> None:
         """Write the Schedule_Workbook xlsx with all scheduling tabs.
         Called by build-schedule-workbook command (Step 3).
         For the solver-rendered two-tab workbook, use write_schedule_output_workbook().
         When venue_input_path is None, derive resource availability from the
         schedule_input resources so offline builds stay self-consistent.
+
+        With incremental=True, tabs whose input fingerprints match the
+        manifest from the previous build are kept as-is and only dirty tabs
+        are recomputed and rewritten (see scheduling/workbook_fingerprints.py).
         """
-        # Build workbook with pandas ExcelWriter for the DataFrame-based tabs,
-        # then attach the openpyxl-native tabs using writer.book.
-        venue_rows = self._build_venue_capacity_rows(roster_rows)
+        output_path = Path(output_path)
+        # Normalize and index the roster once; every tab builder below reads
+        # from the same table instead of rescanning the raw row dicts.
+        roster_rows = RosterTable.of(roster_rows)
+        fingerprints = workbook_fingerprints._tab_fingerprints(
+            self._schedule_workbook_input_hashes(
+                roster_rows,
+                validation_rows,
+                schedule_input,
+                venue_input_path,
+                pool_assignment_path,
+            )
+        )
+        all_tabs = set(fingerprints)
+        dirty = (
+            workbook_fingerprints._dirty_tabs(output_path, fingerprints)
+            if incremental else all_tabs
+        )
+        if not dirty:
+            logger.info(f"Schedule workbook is up to date; no tabs rebuilt: {output_path}")
+            return
+        full_build = dirty == all_tabs
+        if not full_build:
+            logger.info(
+                "Incremental schedule workbook rebuild: "
+                + ", ".join(workbook_fingerprints._ordered(dirty))
+            )
+
         venue_cols = [
             "Event", "Potential Teams/Entries", "Estimating Teams/Entries", "Teams",
             "Target Pool Games/Team", "Actual Pool Games/Team",
@@ -1675,99 +1675,155 @@ class ScheduleWorkbookBuilder:
             "Playoff Teams", "Playoff Slots", "Third Place?",
             "Third Place Slots", "Total Court Slots", "Estimated Court Hours",
         ]
-
-        pod_div_rows = self._build_pod_divisions_rows(roster_rows, validation_rows)
         pod_div_cols = [
             "division_id", "sport_type", "sport_gender", "sport_format",
             "resource_type", "minutes_per_game",
             "planning_entries", "confirmed_entries", "provisional_entries",
             "anomaly_count", "division_status", "notes",
         ]
-
-        pod_entry_rows = self._build_pod_entries_review_rows(roster_rows, validation_rows)
         pod_entry_cols = [
             "entry_id", "division_id", "entry_type",
             "participant_1_name", "participant_2_name",
             "source_participant_ids", "church_team",
             "partner_status", "review_status", "notes",
         ]
-        pool_assignment_rows = self._build_pool_assignment_rows(
-            roster_rows,
-            pool_assignment_path,
-        )
 
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+        # Build workbook with pandas ExcelWriter for the DataFrame-based tabs,
+        # then attach the openpyxl-native tabs using writer.book.  Incremental
+        # rebuilds open the existing workbook and replace only dirty tabs in
+        # place, so clean tabs are carried forward untouched.
+        writer_kwargs: Dict[str, Any] = (
+            {} if full_build else {"mode": "a", "if_sheet_exists": "replace"}
+        )
+        with pd.ExcelWriter(output_path, engine="openpyxl", **writer_kwargs) as writer:
             # Venue-Estimator tab (pandas)
-            df_venue = pd.DataFrame(venue_rows, columns=venue_cols)
-            df_venue.to_excel(writer, sheet_name="Venue-Estimator", index=False, startrow=0)
-            snapshot_note = (
-                f"Roster snapshot as of {datetime.now().strftime('%Y-%m-%d')} — "
-                "Estimating = complete entries; Potential = rule-aware ceiling from current "
-                "registrations (including incomplete doubles pairings), capped by 2026 entry limits. "
-                "Approval-agnostic. Updates with each export run."
-            )
-            venue_ws = writer.sheets["Venue-Estimator"]
-            self._annotate_venue_estimator_tab(venue_ws, len(venue_cols))
-            note_row = len(df_venue) + 3
-            venue_ws.cell(row=note_row, column=1, value=snapshot_note)
-            logger.debug(f"Venue-Estimator tab: {len(df_venue)} rows.")
+            if "Venue-Estimator" in dirty:
+                venue_rows = self._build_venue_capacity_rows(roster_rows)
+                df_venue = pd.DataFrame(venue_rows, columns=venue_cols)
+                df_venue.to_excel(writer, sheet_name="Venue-Estimator", index=False, startrow=0)
+                snapshot_note = (
+                    f"Roster snapshot as of {datetime.now().strftime('%Y-%m-%d')} — "
+                    "Estimating = complete entries; Potential = rule-aware ceiling from current "
+                    "registrations (including incomplete doubles pairings), capped by 2026 entry limits. "
+                    "Approval-agnostic. Updates with each export run."
+                )
+                venue_ws = writer.sheets["Venue-Estimator"]
+                self._annotate_venue_estimator_tab(venue_ws, len(venue_cols))
+                note_row = len(df_venue) + 3
+                venue_ws.cell(row=note_row, column=1, value=snapshot_note)
+                logger.debug(f"Venue-Estimator tab: {len(df_venue)} rows.")
 
             # Pool-Assignment tab (openpyxl native - editable seed/draw workspace)
-            pool_ws = writer.book.create_sheet(title="Pool-Assignment", index=1)
-            self._write_pool_assignment_tab(pool_ws, pool_assignment_rows)
-            logger.debug(f"Pool-Assignment tab: {len(pool_assignment_rows)} rows.")
+            if "Pool-Assignment" in dirty:
+                pool_assignment_rows = self._build_pool_assignment_rows(
+                    roster_rows,
+                    pool_assignment_path,
+                )
+                pool_ws = self._fresh_workbook_sheet(writer.book, "Pool-Assignment", index=1)
+                self._write_pool_assignment_tab(pool_ws, pool_assignment_rows)
+                logger.debug(f"Pool-Assignment tab: {len(pool_assignment_rows)} rows.")
 
             # Pod-Divisions tab (pandas)
-            df_pod_div = pd.DataFrame(pod_div_rows, columns=pod_div_cols)
-            df_pod_div.to_excel(writer, sheet_name="Pod-Divisions", index=False)
-            self._annotate_pod_divisions_tab(writer.sheets["Pod-Divisions"], len(pod_div_cols))
-            logger.debug(f"Pod-Divisions tab: {len(df_pod_div)} rows.")
+            if "Pod-Divisions" in dirty:
+                pod_div_rows = self._build_pod_divisions_rows(roster_rows, validation_rows)
+                df_pod_div = pd.DataFrame(pod_div_rows, columns=pod_div_cols)
+                df_pod_div.to_excel(writer, sheet_name="Pod-Divisions", index=False)
+                self._annotate_pod_divisions_tab(writer.sheets["Pod-Divisions"], len(pod_div_cols))
+                logger.debug(f"Pod-Divisions tab: {len(df_pod_div)} rows.")
 
             # Pod-Entries-Review tab (pandas)
-            df_pod_entries = pd.DataFrame(pod_entry_rows, columns=pod_entry_cols)
-            df_pod_entries.to_excel(writer, sheet_name="Pod-Entries-Review", index=False)
-            self._annotate_pod_entries_review_tab(
-                writer.sheets["Pod-Entries-Review"], len(pod_entry_cols)
-            )
-            logger.debug(f"Pod-Entries-Review tab: {len(df_pod_entries)} rows.")
+            if "Pod-Entries-Review" in dirty:
+                pod_entry_rows = self._build_pod_entries_review_rows(roster_rows, validation_rows)
+                df_pod_entries = pd.DataFrame(pod_entry_rows, columns=pod_entry_cols)
+                df_pod_entries.to_excel(writer, sheet_name="Pod-Entries-Review", index=False)
+                self._annotate_pod_entries_review_tab(
+                    writer.sheets["Pod-Entries-Review"], len(pod_entry_cols)
+                )
+                logger.debug(f"Pod-Entries-Review tab: {len(df_pod_entries)} rows.")
 
             # Court-Schedule-Sketch tab (openpyxl native)
-            sketch_ws = writer.book.create_sheet(title="Court-Schedule-Sketch")
-            self._write_court_schedule_sketch(sketch_ws, roster_rows)
+            if "Court-Schedule-Sketch" in dirty:
+                sketch_ws = self._fresh_workbook_sheet(writer.book, "Court-Schedule-Sketch")
+                self._write_court_schedule_sketch(sketch_ws, roster_rows)
 
             # Pod-Resource-Estimate tab (openpyxl native)
-            if venue_input_path is None:
-                available_by_resource = self._load_available_slots_from_schedule_input(
-                    schedule_input
+            if "Pod-Resource-Estimate" in dirty:
+                if venue_input_path is None:
+                    available_by_resource = self._load_available_slots_from_schedule_input(
+                        schedule_input
+                    )
+                    availability_source_label = "schedule_input.json resources"
+                else:
+                    available_by_resource = self._load_venue_input(venue_input_path)
+                    availability_source_label = VENUE_INPUT_FILENAME
+                pod_res_rows = self._build_pod_resource_rows(roster_rows, available_by_resource)
+                pod_ws = self._fresh_workbook_sheet(writer.book, "Pod-Resource-Estimate")
+                self._write_pod_resource_estimate(
+                    pod_ws,
+                    pod_res_rows,
+                    available_by_resource,
+                    availability_source_label=availability_source_label,
                 )
-                availability_source_label = "schedule_input.json resources"
-            else:
-                available_by_resource = self._load_venue_input(venue_input_path)
-                availability_source_label = VENUE_INPUT_FILENAME
-            pod_res_rows = self._build_pod_resource_rows(roster_rows, available_by_resource)
-            pod_ws = writer.book.create_sheet(title="Pod-Resource-Estimate")
-            self._write_pod_resource_estimate(
-                pod_ws,
-                pod_res_rows,
-                available_by_resource,
-                availability_source_label=availability_source_label,
-            )
 
             # Schedule-Input tab (openpyxl native — echo of the JSON)
-            si_ws = writer.book.create_sheet(title="Schedule-Input")
-            self._write_schedule_input_tab(si_ws, schedule_input)
+            if "Schedule-Input" in dirty:
+                si_ws = self._fresh_workbook_sheet(writer.book, "Schedule-Input")
+                self._write_schedule_input_tab(si_ws, schedule_input)
 
             # Gym-Allocation tab (openpyxl native — Stage-A allocator summary)
-            gym_alloc_ws = writer.book.create_sheet(title="Gym-Allocation")
-            self._write_gym_allocation_tab(gym_alloc_ws, schedule_input.get("gym_allocation"))
+            if "Gym-Allocation" in dirty:
+                gym_alloc_ws = self._fresh_workbook_sheet(writer.book, "Gym-Allocation")
+                self._write_gym_allocation_tab(gym_alloc_ws, schedule_input.get("gym_allocation"))
 
             # Summary tab (openpyxl native — operator guide / command cheat sheet)
-            summary_ws = writer.book.create_sheet(title="Summary", index=0)
-            self._write_summary_tab(summary_ws)
-            self._stamp_known_tab_statuses(writer.book)
+            if "Summary" in dirty:
+                summary_ws = self._fresh_workbook_sheet(writer.book, "Summary", index=0)
+                self._write_summary_tab(summary_ws)
+            self._stamp_known_tab_statuses(writer.book, titles=dirty)
 
+        workbook_fingerprints._write_manifest(output_path, fingerprints)
         logger.info(f"Schedule workbook written to: {output_path}")
 
+    @staticmethod
+    def _fresh_workbook_sheet(book, title: str, index: Optional[int] = None):
+        """Create ``title`` in ``book``, replacing an existing sheet in its position."""
+        if title in book.sheetnames:
+            existing = book[title]
+            index = book.index(existing)
+            book.remove(existing)
+        return book.create_sheet(title=title, index=index)
+
+    @classmethod
+    def _schedule_workbook_input_hashes(
+        cls,
+        roster_rows: List[Dict[str, Any]],
+        validation_rows: List[Dict[str, Any]],
+        schedule_input: Dict[str, Any],
+        venue_input_path: Optional[Path],
+        pool_assignment_path: Optional[Path],
+    ) -> Dict[str, str]:
+        """Hash each input the Schedule_Workbook tabs depend on."""
+        rules_manager = cls._get_rules_manager()
+        rules_file = Path(rules_manager.rules_file) if rules_manager is not None else None
+        if venue_input_path is None:
+            venue_hash = workbook_fingerprints._hash_payload(
+                ["schedule_input", schedule_input.get("resources") or []]
+            )
+        else:
+            venue_hash = workbook_fingerprints._hash_payload(
+                ["venue_input", workbook_fingerprints._hash_file(venue_input_path)]
+            )
+        return {
+            "code": workbook_fingerprints._code_fingerprint(),
+            "roster": workbook_fingerprints._hash_payload(list(roster_rows)),
+            "validation": workbook_fingerprints._hash_payload(validation_rows),
+            "schedule_input": workbook_fingerprints._hash_payload(schedule_input),
+            "venue": venue_hash,
+            "sidecar": workbook_fingerprints._hash_file(pool_assignment_path),
+            "rules": workbook_fingerprints._hash_file(rules_file),
+            "build_date": datetime.now().strftime("%Y-%m-%d"),
+        }
+
     @staticmethod
     def write_schedule_output_workbook(
         output_path: Path,
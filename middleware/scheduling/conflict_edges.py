@@ -8,9 +8,7 @@ Functions that need builder state take the ``ScheduleWorkbookBuilder``
 reach everything through it.
 """
 from typing import Any, Dict, List, Optional, Tuple
-from config import (
-    SPORT_FORMAT,
-)
+from scheduling.roster_table import RosterTable
 
 
 def _build_core_gym_team_lookup(
@@ -19,62 +17,39 @@ def _build_core_gym_team_lookup(
 ) -> Dict[Tuple[str, str], Dict[str, Any]]:
     """Return team membership metadata keyed by (event_name, team_id)."""
     team_lookup: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    roster = RosterTable.of(roster_rows)
 
     for event_name, _prefix in builder._POOL_ASSIGNMENT_EVENT_DEFS:
         min_team_size = builder._get_min_team_size(event_name)
         target_type, target_gender, _target_format = builder._decompose_event_name(event_name)
         provisional: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        teams = roster.event_teams(
+            event_name, target_type, target_gender, team_format_only=True
+        )
 
-        for roster_row in roster_rows:
-            r_type = str(roster_row.get("sport_type") or "").strip()
-            r_gender = str(roster_row.get("sport_gender") or "").strip()
-            r_format = str(roster_row.get("sport_format") or "").strip()
-            if (
-                r_type.casefold() != target_type.casefold()
-                and r_type.casefold() != event_name.casefold()
-            ):
-                continue
-            if target_gender and r_gender.casefold() != target_gender.casefold():
-                continue
-            if r_format and r_format.casefold() != SPORT_FORMAT["TEAM"].casefold():
-                continue
-
-            church_code = str(roster_row.get("Church Team") or "").strip().upper()
-            if not church_code:
-                continue
-            team_order = str(roster_row.get("team_order") or "").strip().upper()
-            team_id = church_code if not team_order else f"{church_code}-{team_order}"
-            key = (event_name, team_id)
-            team_state = provisional.setdefault(
-                key,
-                {
-                    "event": event_name,
-                    "team_id": team_id,
-                    "solver_team_id": builder._solver_team_id(event_name, team_id),
-                    "display_label": team_id,
-                    "participant_ids": set(),
-                    "participant_names": {},
-                    "primary_sports": {},
-                },
-            )
-            participant_id = str(
-                roster_row.get("Participant ID (WP)")
-                or roster_row.get("ChMeetings ID")
-                or ""
-            ).strip()
-            if not participant_id:
-                continue
-
-            team_state["participant_ids"].add(participant_id)
-            full_name = (
-                f"{str(roster_row.get('First Name') or '').strip()} "
-                f"{str(roster_row.get('Last Name') or '').strip()}"
-            ).strip()
-            if full_name:
-                team_state["participant_names"][participant_id] = full_name
-            team_state["primary_sports"][participant_id] = builder._normalize_primary_sport_name(
-                roster_row.get("participant_primary_sport")
-            )
+        for entries in teams.values():
+            team_id = entries[0].team_id
+            team_state = {
+                "event": event_name,
+                "team_id": team_id,
+                "solver_team_id": builder._solver_team_id(event_name, team_id),
+                "display_label": team_id,
+                "participant_ids": set(),
+                "participant_names": {},
+                "primary_sports": {},
+            }
+            provisional[(event_name, team_id)] = team_state
+            for entry in entries:
+                participant_id = entry.participant_id
+                if not participant_id:
+                    continue
+
+                team_state["participant_ids"].add(participant_id)
+                if entry.full_name:
+                    team_state["participant_names"][participant_id] = entry.full_name
+                team_state["primary_sports"][participant_id] = builder._normalize_primary_sport_name(
+                    entry.row.get("participant_primary_sport")
+                )
 
         for key, team_state in provisional.items():
             if len(team_state["participant_ids"]) < min_team_size:
@@ -9,7 +9,8 @@ reach everything through it.
 """
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Set, Tuple
 from loguru import logger
 from config import (
     SPORT_TYPE,
@@ -23,6 +24,8 @@ from config import (
     COURT_ESTIMATE_BC_TEAMS_PER_GAME,
     COURT_ESTIMATE_BC_RR_GAMES_PER_TEAM,
     COURT_ESTIMATE_BC_MIN_TEAMS_FOR_PLAYOFF,
+    BC_TRIPLET_SOLVER_TIMEOUT,
+    SCHEDULE_SOLVER_RANDOM_SEED,
     COURT_ESTIMATE_PLAYOFF_RULES,
     SCHEDULE_SKETCH_SATURDAY_START,
     SCHEDULE_SKETCH_SATURDAY_LAST_GAME,
@@ -45,9 +48,163 @@ def _pool_numeric_suffix(value: str, prefix: str) -> int:
         return int(match.group(1))
     return 0
 
+# Feasible BC draws take well under a hundred backtracking nodes up to 40
+# teams; past this budget the search hands over to CP-SAT, which also proves
+# impossible draws instead of exhausting the tree.
+BC_TRIPLET_BACKTRACK_NODES = 1_000
+
+
+def _backtrack_bc_triplets(
+    n: int,
+    games_per_team: int,
+    seeded: Set[int],
+    node_budget: int,
+) -> Tuple[str, List[Tuple[int, int, int]]]:
+    """Most-constrained-first backtracking over the allowed triples.
+
+    Returns ``("FEASIBLE", triples)`` in search order, ``("INFEASIBLE", [])``
+    when the whole tree was exhausted, or ``("UNKNOWN", [])`` once
+    ``node_budget`` recursion steps have been spent.
+    """
+    n_games = (n * games_per_team) // COURT_ESTIMATE_BC_TEAMS_PER_GAME
+    # Each team's candidate triples in lexicographic order, so the pivot scan
+    # never touches triples that cannot contain the pivot.
+    by_team: List[List[Tuple[int, int, int]]] = [[] for _ in range(n)]
+    for triple in combinations(range(n), 3):
+        if sum(i in seeded for i in triple) <= 1:
+            for team in triple:
+                by_team[team].append(triple)
+
+    used_pairs: Set[Tuple[int, int]] = set()
+    count = [0] * n
+    chosen: List[Tuple[int, int, int]] = []
+    nodes = 0
+
+    def _solve() -> Optional[bool]:
+        nonlocal nodes
+        nodes += 1
+        if nodes > node_budget:
+            return None
+        if len(chosen) == n_games:
+            return True
+        pivot = min(
+            (i for i in range(n) if count[i] < games_per_team),
+            key=lambda i: count[i],
+        )
+        for triple in by_team[pivot]:
+            a, b, c = triple
+            pairs = ((a, b), (a, c), (b, c))
+            if (
+                count[a] >= games_per_team
+                or count[b] >= games_per_team
+                or count[c] >= games_per_team
+                or any(pair in used_pairs for pair in pairs)
+            ):
+                continue
+            count[a] += 1; count[b] += 1; count[c] += 1
+            used_pairs.update(pairs)
+            chosen.append(triple)
+            found = _solve()
+            if found is not False:
+                return found
+            count[a] -= 1; count[b] -= 1; count[c] -= 1
+            used_pairs.difference_update(pairs)
+            chosen.pop()
+        return False
+
+    found = _solve()
+    if found is None:
+        return "UNKNOWN", []
+    return ("FEASIBLE", list(chosen)) if found else ("INFEASIBLE", [])
+
+def _cp_sat_bc_triplets(
+    n: int,
+    games_per_team: int,
+    seeded: Set[int],
+    time_limit_seconds: float,
+) -> Tuple[str, List[Tuple[int, int, int]]]:
+    """CP-SAT set-packing model for the same draw.
+
+    One Boolean per allowed triple (at most one seeded team), an exact
+    appearance count per team, and at most one chosen triple per pair of
+    teams.  Returns the CP-SAT status name and, when feasible, the chosen
+    triples in play order; ``INFEASIBLE`` is a proof that no such draw
+    exists, ``UNKNOWN`` means the time limit ran out.
+    """
+    from ortools.sat.python import cp_model  # import guard
+
+    model = cp_model.CpModel()
+    triples = [
+        t for t in combinations(range(n), 3)
+        if sum(i in seeded for i in t) <= 1
+    ]
+    chosen_vars = [model.NewBoolVar(f"t_{a}_{b}_{c}") for a, b, c in triples]
+    by_team: List[List[Any]] = [[] for _ in range(n)]
+    by_pair: Dict[Tuple[int, int], List[Any]] = defaultdict(list)
+    for triple, var in zip(triples, chosen_vars):
+        for team in triple:
+            by_team[team].append(var)
+        for pair in combinations(triple, 2):
+            by_pair[pair].append(var)
+    for team_vars in by_team:
+        model.Add(sum(team_vars) == games_per_team)
+    for pair_vars in by_pair.values():
+        model.AddAtMostOne(pair_vars)
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = time_limit_seconds
+    # One worker plus the shared seed keeps the draw reproducible.  Presolve
+    # only rewrites this already-tight model and was most of the wall time.
+    solver.parameters.num_workers = 1
+    solver.parameters.cp_model_presolve = False
+    if SCHEDULE_SOLVER_RANDOM_SEED:
+        solver.parameters.random_seed = SCHEDULE_SOLVER_RANDOM_SEED
+    status_name = solver.StatusName(solver.Solve(model))
+    if status_name not in ("OPTIMAL", "FEASIBLE"):
+        return status_name, []
+
+    remaining = [t for t, var in zip(triples, chosen_vars) if solver.Value(var)]
+    # Play order: the same pivot rule the backtracking search follows — the
+    # next game goes to the lowest-numbered team with the fewest games so
+    # far, so opening rounds spread across every team before anyone plays twice.
+    count = [0] * n
+    ordered: List[Tuple[int, int, int]] = []
+    while remaining:
+        pivot = min(
+            (i for i in range(n) if count[i] < games_per_team),
+            key=lambda i: count[i],
+        )
+        triple = next(t for t in remaining if pivot in t)
+        remaining.remove(triple)
+        for team in triple:
+            count[team] += 1
+        ordered.append(triple)
+    return status_name, ordered
+
+def _solve_bc_triplets(
+    n: int,
+    games_per_team: int,
+    seeded: Set[int],
+    time_limit_seconds: float,
+    node_budget: int = BC_TRIPLET_BACKTRACK_NODES,
+) -> Tuple[str, List[Tuple[int, int, int]]]:
+    """Pick triplets of team indices so each team plays ``games_per_team`` times.
+
+    Runs the budgeted backtracking search first, which settles every
+    ordinary draw in milliseconds, and falls back to CP-SAT within
+    ``time_limit_seconds`` only when the budget runs out.  Returns a status
+    (``FEASIBLE``/``OPTIMAL``, ``INFEASIBLE`` as a proof, or ``UNKNOWN`` on
+    timeout) and the triples in play order.
+    """
+    status, chosen = _backtrack_bc_triplets(n, games_per_team, seeded, node_budget)
+    if status != "UNKNOWN":
+        return status, chosen
+    return _cp_sat_bc_triplets(n, games_per_team, seeded, time_limit_seconds)
+
 def _bc_no_repeat_triplets(
     builder,
     all_rows: List[Dict[str, Any]],
+    time_limit_seconds: Optional[float] = None,
 ) -> List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]:
     """Generate BC round-robin triplets across all teams in one global pool.
 
@@ -59,9 +216,11 @@ def _bc_no_repeat_triplets(
     same triplet as another seeded team, preserving the convention that top
     seeds meet each other only in the playoffs.
 
-    Uses backtracking with a most-constrained-first pivot.  For n ≥ 7 with
-    3 games/team a valid schedule always exists; for smaller n the constraint
-    cannot be satisfied and the method returns [] with a warning.
+    The draw is solved by _solve_bc_triplets: a budgeted backtracking search,
+    then CP-SAT within BC_TRIPLET_SOLVER_TIMEOUT seconds (or
+    ``time_limit_seconds``) when the search runs out of budget.  For n ≥ 7
+    with 3 games/team and few enough seeds a valid schedule always exists;
+    otherwise the search or the solver proves it impossible and the method returns [] with a warning.
     """
     ordered = sorted(
         all_rows,
@@ -75,71 +234,31 @@ def _bc_no_repeat_triplets(
     gpt = COURT_ESTIMATE_BC_RR_GAMES_PER_TEAM
     if n < COURT_ESTIMATE_BC_TEAMS_PER_GAME:
         return []
-    n_games = (n * gpt) // COURT_ESTIMATE_BC_TEAMS_PER_GAME
+    if time_limit_seconds is None:
+        time_limit_seconds = BC_TRIPLET_SOLVER_TIMEOUT
 
-    # Track which indices correspond to seeded teams so the validity check
-    # can reject any triplet that pairs two seeded teams together.
-    seeded: set = {
+    # Track which indices correspond to seeded teams so the model never
+    # offers a triplet that pairs two seeded teams together.
+    seeded: Set[int] = {
         i for i, r in enumerate(ordered)
         if str(r.get("Seed") or "").strip() not in ("", "0")
     }
 
-    from itertools import combinations as _combinations
-    all_triples: List[Tuple[int, int, int]] = list(_combinations(range(n), 3))
-
-    used_pairs: set = set()
-    count = [0] * n
-    chosen: List[Tuple[int, int, int]] = []
-
-    def _pair(a: int, b: int) -> Tuple[int, int]:
-        return (a, b) if a < b else (b, a)
-
-    def _valid(a: int, b: int, c: int) -> bool:
-        # Seeded teams must not share a triplet with another seeded team.
-        seed_count = (a in seeded) + (b in seeded) + (c in seeded)
-        return (
-            seed_count <= 1
-            and count[a] < gpt and count[b] < gpt and count[c] < gpt
-            and _pair(a, b) not in used_pairs
-            and _pair(b, c) not in used_pairs
-            and _pair(a, c) not in used_pairs
+    status, chosen = _solve_bc_triplets(n, gpt, seeded, time_limit_seconds)
+    if status == "INFEASIBLE":
+        logger.warning(
+            f"BC: no-repeat triplet schedule is not possible for {n} teams "
+            f"({len(seeded)} seeded) with {gpt} games/team (need n ≥ 7 for "
+            f"3 games/team, and at most one seeded team per game). "
+            f"BC pool games will be omitted."
         )
-
-    def _apply(a: int, b: int, c: int) -> None:
-        count[a] += 1; count[b] += 1; count[c] += 1
-        used_pairs.add(_pair(a, b))
-        used_pairs.add(_pair(b, c))
-        used_pairs.add(_pair(a, c))
-        chosen.append((a, b, c))
-
-    def _undo(a: int, b: int, c: int) -> None:
-        count[a] -= 1; count[b] -= 1; count[c] -= 1
-        used_pairs.discard(_pair(a, b))
-        used_pairs.discard(_pair(b, c))
-        used_pairs.discard(_pair(a, c))
-        chosen.pop()
-
-    def _solve() -> bool:
-        if len(chosen) == n_games:
-            return True
-        incomplete = [i for i in range(n) if count[i] < gpt]
-        pivot = min(incomplete, key=lambda i: count[i])
-        for a, b, c in all_triples:
-            if pivot not in (a, b, c):
-                continue
-            if _valid(a, b, c):
-                _apply(a, b, c)
-                if _solve():
-                    return True
-                _undo(a, b, c)
-        return False
-
-    if not _solve():
+        return []
+    if not chosen:
         logger.warning(
-            "BC: no-repeat triplet schedule is not possible for %d teams "
-            "with %d games/team (need n ≥ 7 for 3 games/team). "
-            "BC pool games will be omitted.",
-            n, gpt,
+            f"BC: no triplet schedule found for {n} teams within "
+            f"{time_limit_seconds:g}s ({status}); this is not proven impossible — "
+            f"raise BC_TRIPLET_SOLVER_TIMEOUT and re-run. "
+            f"BC pool games will be omitted."
         )
         return []
 
@@ -31,6 +31,7 @@ from scheduling import xlsx_utils
 from scheduling import manual_matchups
 from scheduling import master_schedule
 from scheduling import match_schedule_overrides
+from scheduling.roster_table import RosterTable
 
 
 def _warn_if_resource_slot_minutes_differ_from_config(
@@ -491,6 +492,8 @@ def _build_schedule_input(
     from gym_allocator import (
         aggregate_demand_by_mode, extract_gym_blocks, allocate,
     )
+    # Normalize and index the roster once for every game/conflict builder.
+    roster_rows = RosterTable.of(roster_rows)
     gym_modes = builder._load_gym_modes(venue_input_path)
     venue_rows, day_order = builder._load_venue_input_rows(venue_input_path)
     playoff_slots = builder._load_playoff_slots(venue_input_path)
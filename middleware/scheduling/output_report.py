@@ -3,8 +3,10 @@
 Pure functions; no class state.  Extracted as part of Issue #152.
 """
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
@@ -31,6 +33,212 @@ from scheduling.xlsx_utils import (
 
 _GYM_CORE_SOLVER_POOL = "Gym Core"
 
+ResourceGroupKey = Tuple[str, str, str, str, int]
+
+
+def _time_sort_key(hhmm: str) -> int:
+    h, m = map(int, hhmm.split(":"))
+    return h * 60 + m
+
+
+@lru_cache(maxsize=256)
+def _window_slot_times(open_time: str, close_time: str, slot_minutes: int) -> Tuple[str, ...]:
+    open_min  = _time_sort_key(open_time)
+    close_min = _time_sort_key(close_time)
+    times: List[str] = []
+    t = open_min
+    while t + slot_minutes <= close_min:
+        times.append(f"{t // 60:02d}:{t % 60:02d}")
+        t += slot_minutes
+    return tuple(times)
+
+
+def _slot_times(res: Dict[str, Any]) -> Tuple[str, ...]:
+    # Most resources share a handful of windows, so the slot list is built
+    # once per (open, close, slot length) rather than once per resource.
+    return _window_slot_times(res["open_time"], res["close_time"], res["slot_minutes"])
+
+
+def _canonical_minutes(hhmm: str) -> Optional[int]:
+    """Minutes past midnight for a zero-padded ``HH:MM``; None for anything else."""
+    try:
+        minutes = _time_sort_key(hhmm)
+    except ValueError:
+        return None
+    return minutes if f"{minutes // 60:02d}:{minutes % 60:02d}" == hhmm else None
+
+
+def _resource_group_key(res: Dict[str, Any]) -> ResourceGroupKey:
+    solver_pool = str(res.get("solver_pool") or "").strip()
+    day = str(res.get("day", ""))
+    resource_type = str(res.get("resource_type", ""))
+    slot_minutes = int(res.get("slot_minutes", 0) or 0)
+    if solver_pool == _GYM_CORE_SOLVER_POOL:
+        # Render one continuous operator-facing section per Day/resource_type
+        # for the shared gym solver pool, even when the allocator produced
+        # multiple overlapping time windows for the same sport.
+        return (day, resource_type, "", "", slot_minutes)
+    return (
+        day,
+        resource_type,
+        str(res.get("open_time", "")),
+        str(res.get("close_time", "")),
+        slot_minutes,
+    )
+
+
+@dataclass
+class _ScheduleGridGroup:
+    """One Schedule-by-Time section: a day/window/resource pool and its rows."""
+    key: ResourceGroupKey
+    resources: List[Dict[str, Any]]
+    slot_times: List[str]
+
+
+@dataclass
+class _ScheduleGrid:
+    """Schedule documents indexed once so every report tab reads by lookup.
+
+    ``games`` holds each assigned game under ``(day, resource_id, "HH:MM")``.
+    ``master_cells`` pre-buckets the Master-Schedule hits per
+    ``(day_rank, minutes)`` row, in resource order, as ``(resource, game,
+    slot_label)``; the tab only has to drop them into columns.
+    """
+    games: Dict[Tuple[str, str, str], Dict[str, Any]]
+    groups: List[_ScheduleGridGroup]
+    group_counts_by_day: Dict[str, int]
+    max_resources: int
+    day_order: List[str]
+    master_rows: List[Tuple[Tuple[int, int], str, str]]
+    master_cells: Dict[Tuple[int, int], List[Tuple[Dict[str, Any], Dict[str, Any], str]]]
+    occupied_slots: Set[str]
+
+    def game_at(self, day: str, resource_id: str, hhmm: str) -> Optional[Dict[str, Any]]:
+        return self.games.get((day, resource_id, hhmm))
+
+
+def _build_schedule_grid(
+    schedule_output: Dict[str, Any],
+    schedule_input: Dict[str, Any],
+) -> _ScheduleGrid:
+    """Index schedule_output assignments by (day, resource, slot) in one pass.
+
+    Later assignments to the same resource/slot replace earlier ones, the
+    same as the per-tab ``(resource_id, slot)`` maps this replaces.  Slots
+    that are not ``<day>-<HH:MM>`` labels can never land on a grid row and
+    are left out of the index.
+    """
+    game_meta: Dict[str, Dict[str, Any]] = {
+        g["game_id"]: g for g in schedule_input.get("games", [])
+    }
+    resources: List[Dict[str, Any]] = list(schedule_input.get("resources", []))
+
+    games: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    assignments = schedule_output.get("assignments", [])
+    for a in assignments:
+        day, sep, hhmm = a["slot"].rpartition("-")
+        if not sep:
+            continue
+        games[(day, a["resource_id"], hhmm)] = game_meta.get(
+            a["game_id"], {"game_id": a["game_id"]}
+        )
+
+    # Group resources by uniform day/window/resource pool so pod schedules with
+    # mixed slot lengths do not get collapsed into one broken "Day-1" grid.
+    grouped: Dict[ResourceGroupKey, List[Dict[str, Any]]] = {}
+    for res in resources:
+        grouped.setdefault(_resource_group_key(res), []).append(res)
+
+    group_counts_by_day: Dict[str, int] = {}
+    for day, _, _, _, _ in grouped.keys():
+        group_counts_by_day[day] = group_counts_by_day.get(day, 0) + 1
+
+    groups: List[_ScheduleGridGroup] = []
+    for key in sorted(
+        grouped.keys(),
+        key=lambda key: (
+            _day_sort_key(key[0]),
+            _time_sort_key(key[2]) if key[2] else 0,
+            _time_sort_key(key[3]) if key[3] else 0,
+            key[4],
+            key[1],
+        ),
+    ):
+        day_res = sorted(
+            grouped[key],
+            key=lambda r: (
+                _time_sort_key(str(r.get("open_time") or "00:00")),
+                str(r.get("exclusive_group") or ""),
+                str(r.get("label") or ""),
+                r["resource_id"],
+            ),
+        )
+        slot_times = sorted(
+            {t_str for res in day_res for t_str in _slot_times(res)},
+            key=_time_sort_key,
+        )
+        groups.append(_ScheduleGridGroup(key, day_res, slot_times))
+
+    # Chronological day order — calendar-date-derived when available.
+    day_order: List[str] = list(schedule_input.get("day_order") or [])
+    if not day_order:
+        day_order = sorted(
+            {str(r.get("day", "")) for r in resources if r.get("day")},
+            key=_day_sort_key,
+        )
+    day_rank: Dict[str, int] = {}
+    for rank, day in enumerate(day_order):
+        day_rank.setdefault(day, rank)
+
+    # Master-Schedule rows: the union of every resource's slot times per day.
+    slot_index: Dict[Tuple[int, int], Tuple[str, str]] = {}
+    for res in resources:
+        day = str(res.get("day") or "").strip()
+        if not day:
+            continue
+        rank = day_rank.get(day, len(day_order))
+        for t_str in _slot_times(res):
+            slot_index[(rank, _time_sort_key(t_str))] = (day, t_str)
+    master_rows = [(key, *slot_index[key]) for key in sorted(slot_index)]
+
+    # Master-Schedule cells: walk each resource's own games rather than every
+    # resource at every row.  A resource listed twice contributes twice, so
+    # the tab still sees the double-booking it flags.
+    games_by_resource: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {}
+    for (day, rid, hhmm), game in games.items():
+        if game:
+            games_by_resource.setdefault(rid, []).append((day, hhmm, game))
+    master_cells: Dict[Tuple[int, int], List[Tuple[Dict[str, Any], Dict[str, Any], str]]] = {}
+    for res in resources:
+        rid = str(res.get("resource_id") or "").strip()
+        res_games = games_by_resource.get(rid)
+        if not res_games:
+            continue
+        res_day = str(res.get("day") or "").strip()
+        open_min  = _time_sort_key(res["open_time"])
+        close_min = _time_sort_key(res["close_time"])
+        sm = int(res.get("slot_minutes") or 20)
+        for day, hhmm, game in res_games:
+            if day != res_day:
+                continue
+            time_min = _canonical_minutes(hhmm)
+            if time_min is None or not (open_min <= time_min and time_min + sm <= close_min):
+                continue
+            master_cells.setdefault(
+                (day_rank.get(day, len(day_order)), time_min), []
+            ).append((res, game, f"{day}-{hhmm}"))
+
+    return _ScheduleGrid(
+        games=games,
+        groups=groups,
+        group_counts_by_day=group_counts_by_day,
+        max_resources=max((len(v) for v in grouped.values()), default=4),
+        day_order=day_order,
+        master_rows=master_rows,
+        master_cells=master_cells,
+        occupied_slots={a["slot"] for a in assignments},
+    )
+
 
 def _warn_if_schedules_mismatched(
     schedule_output: Dict[str, Any],
@@ -380,16 +588,9 @@ def _write_schedule_output_report(
     from openpyxl.styles import PatternFill, Font, Alignment
     from openpyxl.utils import get_column_letter
 
-    game_meta: Dict[str, Dict[str, Any]] = {
-        g["game_id"]: g for g in schedule_input.get("games", [])
-    }
-    res_meta: Dict[str, Dict[str, Any]] = {
-        r["resource_id"]: r for r in schedule_input.get("resources", [])
-    }
-    assign_map: Dict[Tuple[str, str], Dict[str, Any]] = {
-        (a["resource_id"], a["slot"]): game_meta.get(a["game_id"], {"game_id": a["game_id"]})
-        for a in schedule_output.get("assignments", [])
-    }
+    # Every tab below reads games through this one (day, resource, slot)
+    # index instead of re-walking resources × slots × assignments.
+    grid = _build_schedule_grid(schedule_output, schedule_input)
 
     solved_at     = schedule_output.get("solved_at", "")
     status        = schedule_output.get("status", "")
@@ -409,25 +610,26 @@ def _write_schedule_output_report(
     red_fill      = PatternFill(fgColor="FFC7CE", fill_type="solid")
     conflict_fill = PatternFill(fgColor="FFCC00", fill_type="solid")
 
+    # One style object per sport / category colour, shared by every cell that
+    # uses it, rather than a fresh PatternFill/Font per game cell.
+    sport_fills: Dict[str, PatternFill] = {}
+    category_fonts: Dict[Tuple[str, bool], Font] = {}
+
     def _sport_fill(event: str) -> PatternFill:
-        return PatternFill(fgColor=sport_style(event).fill_color, fill_type="solid")
+        fill = sport_fills.get(event)
+        if fill is None:
+            fill = PatternFill(fgColor=sport_style(event).fill_color, fill_type="solid")
+            sport_fills[event] = fill
+        return fill
 
     def _category_font(game: Dict[str, Any], bold: bool = False) -> Font:
         _, cat_style, _ = style_for_game(game)
-        return Font(color=cat_style.text_color, bold=bold)
-
-    def _slot_times(res: Dict[str, Any]) -> List[str]:
-        o_h, o_m = map(int, res["open_time"].split(":"))
-        c_h, c_m = map(int, res["close_time"].split(":"))
-        sm        = res["slot_minutes"]
-        open_min  = o_h * 60 + o_m
-        close_min = c_h * 60 + c_m
-        times: List[str] = []
-        t = open_min
-        while t + sm <= close_min:
-            times.append(f"{t // 60:02d}:{t % 60:02d}")
-            t += sm
-        return times
+        key = (cat_style.text_color, bold)
+        font = category_fonts.get(key)
+        if font is None:
+            font = Font(color=cat_style.text_color, bold=bold)
+            category_fonts[key] = font
+        return font
 
     def _cell_text(game: Dict[str, Any]) -> str:
         gid    = game.get("game_id", "")
@@ -446,28 +648,6 @@ def _write_schedule_output_report(
             return f"{header}\n{a} vs {b}"
         return header
 
-    def _time_sort_key(hhmm: str) -> int:
-        h, m = map(int, hhmm.split(":"))
-        return h * 60 + m
-
-    def _resource_group_key(res: Dict[str, Any]) -> Tuple[str, str, str, str, int]:
-        solver_pool = str(res.get("solver_pool") or "").strip()
-        day = str(res.get("day", ""))
-        resource_type = str(res.get("resource_type", ""))
-        slot_minutes = int(res.get("slot_minutes", 0) or 0)
-        if solver_pool == _GYM_CORE_SOLVER_POOL:
-            # Render one continuous operator-facing section per Day/resource_type
-            # for the shared gym solver pool, even when the allocator produced
-            # multiple overlapping time windows for the same sport.
-            return (day, resource_type, "", "", slot_minutes)
-        return (
-            day,
-            resource_type,
-            str(res.get("open_time", "")),
-            str(res.get("close_time", "")),
-            slot_minutes,
-        )
-
     def _group_open_close(day_res: List[Dict[str, Any]]) -> Tuple[str, str]:
         open_times = [
             str(res.get("open_time", "")).strip()
@@ -483,16 +663,6 @@ def _write_schedule_output_report(
         merged_close = max(close_times, key=_time_sort_key) if close_times else ""
         return merged_open, merged_close
 
-    def _group_slot_times(day_res: List[Dict[str, Any]]) -> List[str]:
-        return sorted(
-            {
-                t_str
-                for res in day_res
-                for t_str in _slot_times(res)
-            },
-            key=_time_sort_key,
-        )
-
     def _resource_header_labels(day_res: List[Dict[str, Any]]) -> Dict[str, str]:
         labels_by_resource: Dict[str, str] = {}
         base_labels: Dict[str, str] = {}
@@ -562,31 +732,10 @@ def _write_schedule_output_report(
 
         return labels_by_resource
 
-    # Group resources by uniform day/window/resource pool so pod schedules with
-    # mixed slot lengths do not get collapsed into one broken "Day-1" grid.
-    resource_groups: Dict[Tuple[str, str, str, str, int], List[Dict[str, Any]]] = {}
-    for res in schedule_input.get("resources", []):
-        resource_groups.setdefault(_resource_group_key(res), []).append(res)
-
-    group_counts_by_day: Dict[str, int] = {}
-    for day, _, _, _, _ in resource_groups.keys():
-        group_counts_by_day[day] = group_counts_by_day.get(day, 0) + 1
-
-    sorted_group_keys = sorted(
-        resource_groups.keys(),
-        key=lambda key: (
-            _day_sort_key(key[0]),
-            _time_sort_key(key[2]) if key[2] else 0,
-            _time_sort_key(key[3]) if key[3] else 0,
-            key[4],
-            key[1],
-        ),
-    )
-    max_resources = max((len(v) for v in resource_groups.values()), default=4)
-    n_cols        = 1 + max_resources
+    n_cols = 1 + grid.max_resources
 
     def _section_label(
-        group_key: Tuple[str, str, str, str, int],
+        group_key: ResourceGroupKey,
         day_res: List[Dict[str, Any]],
     ) -> str:
         day, resource_type, open_time, close_time, slot_minutes = group_key
@@ -596,7 +745,7 @@ def _write_schedule_output_report(
         if (
             day_label != day
             and resource_type in (GYM_RESOURCE_TYPE, GYM_RESOURCE_TYPE_BASKETBALL, GYM_RESOURCE_TYPE_VOLLEYBALL)
-            and group_counts_by_day.get(day, 0) == 1
+            and grid.group_counts_by_day.get(day, 0) == 1
         ):
             return day_label
         return (
@@ -640,16 +789,8 @@ def _write_schedule_output_report(
     ws1.freeze_panes = "A3"
 
     cur_row = 4
-    for group_key in sorted_group_keys:
-        day_res = sorted(
-            resource_groups[group_key],
-            key=lambda r: (
-                _time_sort_key(str(r.get("open_time") or "00:00")),
-                str(r.get("exclusive_group") or ""),
-                str(r.get("label") or ""),
-                r["resource_id"],
-            ),
-        )
+    for group in grid.groups:
+        group_key, day_res = group.key, group.resources
         if not day_res:
             continue
         header_labels = _resource_header_labels(day_res)
@@ -681,11 +822,10 @@ def _write_schedule_output_report(
 
         day = group_key[0]
         # Data rows — one per unioned time slot in this resource group.
-        for t_str in _group_slot_times(day_res):
-            slot_label = f"{day}-{t_str}"
+        for t_str in group.slot_times:
             ws1.cell(row=cur_row, column=1, value=t_str).alignment = center
             for ci, res in enumerate(day_res, start=2):
-                game = assign_map.get((res["resource_id"], slot_label))
+                game = grid.game_at(day, res["resource_id"], t_str)
                 cell = ws1.cell(row=cur_row, column=ci)
                 if game:
                     cell.value = _cell_text(game)
@@ -910,20 +1050,6 @@ def _write_schedule_output_report(
 
     all_resources: List[Dict[str, Any]] = list(schedule_input.get("resources", []))
 
-    # Chronological day order — calendar-date-derived when available.
-    ms_day_order: List[str] = list(schedule_input.get("day_order") or [])
-    if not ms_day_order:
-        ms_day_order = sorted(
-            {str(r.get("day", "")) for r in all_resources if r.get("day")},
-            key=_day_sort_key,
-        )
-
-    def _ms_day_rank(day: str) -> int:
-        try:
-            return ms_day_order.index(day)
-        except ValueError:
-            return len(ms_day_order)
-
     # Physical venue group label for a resource.
     def _venue_group(res: Dict[str, Any]) -> str:
         solver_pool = str(res.get("solver_pool") or "").strip()
@@ -1067,22 +1193,10 @@ def _write_schedule_output_report(
 
     ws4.freeze_panes = "C4"
 
-    # ── Build unified time-slot grid ─────────────────────────────────────
-    slot_index: Dict[Tuple[int, int], Tuple[str, str]] = {}
-    for res in all_resources:
-        day = str(res.get("day") or "").strip()
-        if not day:
-            continue
-        day_rank = _ms_day_rank(day)
-        for t_str in _slot_times(res):
-            h, m = map(int, t_str.split(":"))
-            slot_index[(day_rank, h * 60 + m)] = (day, t_str)
-
-    sorted_slot_keys = sorted(slot_index.keys())
-
-    # Pre-compute which slot labels have at least one assignment so we can
-    # skip entirely empty rows (e.g. 12:30 half-hour gaps between games).
-    occupied_slots: set = {a["slot"] for a in schedule_output.get("assignments", [])}
+    # Rows are the unified per-day time slots from the grid; slot labels
+    # with no assignment anywhere are skipped (e.g. 12:30 half-hour gaps
+    # between games).
+    occupied_slots = grid.occupied_slots
 
     # ── Data rows ────────────────────────────────────────────────────────
     cur_row4 = 4
@@ -1092,8 +1206,7 @@ def _write_schedule_output_report(
     # first non-empty row so a day with all-empty slots is also suppressed.
     pending_day_header: Optional[Tuple[str, str]] = None  # (day_display, day) or None
 
-    for day_rank, time_min in sorted_slot_keys:
-        day, t_str = slot_index[(day_rank, time_min)]
+    for row_key, day, t_str in grid.master_rows:
         slot_label = f"{day}-{t_str}"
 
         if slot_label not in occupied_slots:
@@ -1127,29 +1240,15 @@ def _write_schedule_output_report(
         time_cell = ws4.cell(row=cur_row4, column=2, value=t_str)
         time_cell.alignment = center
 
-        for res in all_resources:
+        for res, game, game_slot in grid.master_cells.get(row_key, ()):
+            if game_slot != slot_label:
+                continue
             rid = str(res.get("resource_id") or "").strip()
             col_key = rid_to_col_key.get(rid)
             if col_key is None or col_key not in col_key_idx:
                 continue
             col = col_key_idx[col_key]
 
-            res_day = str(res.get("day") or "").strip()
-            if res_day != day:
-                continue
-
-            o_h, o_m = map(int, res["open_time"].split(":"))
-            c_h, c_m = map(int, res["close_time"].split(":"))
-            sm = int(res.get("slot_minutes") or 20)
-            open_min  = o_h * 60 + o_m
-            close_min = c_h * 60 + c_m
-            if not (open_min <= time_min and time_min + sm <= close_min):
-                continue
-
-            game = assign_map.get((rid, slot_label))
-            if not game:
-                continue
-
             cell = ws4.cell(row=cur_row4, column=col)
             if cell.value is not None:
                 # Two resources share the same physical column at this slot
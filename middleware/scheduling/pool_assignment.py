@@ -16,10 +16,10 @@ from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 from loguru import logger
 from config import (
-    SPORT_FORMAT,
     COURT_ESTIMATE_DEFAULT_POOL_GAMES_PER_TEAM,
     COURT_ESTIMATE_POOL_GAMES_PER_TEAM,
 )
+from scheduling.roster_table import RosterTable
 
 
 def _pool_assignments_sidecar_path(base_dir: Path) -> Path:
@@ -149,33 +149,16 @@ def _build_pool_assignment_base_rows(
     """Build one Pool-Assignment row per eligible core gym team."""
     persisted_state = persisted_state or {}
     rows: List[Dict[str, Any]] = []
+    roster = RosterTable.of(roster_rows)
 
     for event_name, _prefix in builder._POOL_ASSIGNMENT_EVENT_DEFS:
         min_team_size = builder._get_min_team_size(event_name)
         target_type, target_gender, _target_format = builder._decompose_event_name(event_name)
 
-        counts_by_key: Dict[Tuple[str, str], int] = {}
-        for roster_row in roster_rows:
-            r_type = str(roster_row.get("sport_type") or "").strip()
-            r_gender = str(roster_row.get("sport_gender") or "").strip()
-            r_format = str(roster_row.get("sport_format") or "").strip()
-            if (
-                r_type.casefold() != target_type.casefold()
-                and r_type.casefold() != event_name.casefold()
-            ):
-                continue
-            if target_gender and r_gender.casefold() != target_gender.casefold():
-                continue
-            if r_format and r_format.casefold() != SPORT_FORMAT["TEAM"].casefold():
-                continue
-
-            church_code = str(roster_row.get("Church Team") or "").strip().upper()
-            if not church_code:
-                continue
-            team_order = str(roster_row.get("team_order") or "").strip().upper()
-            counts_by_key[(church_code, team_order)] = (
-                counts_by_key.get((church_code, team_order), 0) + 1
-            )
+        teams = roster.event_teams(
+            event_name, target_type, target_gender, team_format_only=True
+        )
+        counts_by_key = {team_key: len(entries) for team_key, entries in teams.items()}
 
         for (church_code, team_order), roster_count in sorted(counts_by_key.items()):
             if roster_count < min_team_size:
@@ -0,0 +1,167 @@
+"""roster_table — normalized, indexed view of the Roster rows for one build.
+
+The schedule builders all filter the same ``roster_rows`` list of dicts by
+sport, gender, format, church and team order, re-running
+``str(...).strip().casefold()`` on every cell for every pass.  ``RosterTable``
+does that normalization once per workbook build and keeps group-by indexes so
+each builder reads its slice by lookup instead of rescanning every row.
+
+A ``RosterTable`` is also a read-only sequence of the original row dicts, so
+code that still iterates ``roster_rows`` directly keeps working unchanged.
+Builders call ``RosterTable.of(roster_rows)``, which reuses an existing table
+and only builds one when handed a plain list (e.g. from tests).
+"""
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import RACQUET_SPORTS, SPORT_FORMAT
+
+
+def _clean(value: Any) -> str:
+    return str(value or "").strip()
+
+
+@dataclass(frozen=True)
+class RosterEntry:
+    """One roster row with its matching keys precomputed."""
+    row: Dict[str, Any]
+    position: int
+    sport_type: str
+    sport_gender: str
+    sport_format: str
+    sport_type_cf: str
+    sport_gender_cf: str
+    sport_format_cf: str
+    church: str
+    team_order: str
+    participant_id: str
+    full_name: str
+
+    @property
+    def team_id(self) -> str:
+        return self.church if not self.team_order else f"{self.church}-{self.team_order}"
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any], position: int) -> "RosterEntry":
+        sport_type = _clean(row.get("sport_type"))
+        sport_gender = _clean(row.get("sport_gender"))
+        sport_format = _clean(row.get("sport_format"))
+        return cls(
+            row=row,
+            position=position,
+            sport_type=sport_type,
+            sport_gender=sport_gender,
+            sport_format=sport_format,
+            sport_type_cf=sport_type.casefold(),
+            sport_gender_cf=sport_gender.casefold(),
+            sport_format_cf=sport_format.casefold(),
+            church=_clean(row.get("Church Team")).upper(),
+            team_order=_clean(row.get("team_order")).upper(),
+            participant_id=_clean(
+                row.get("Participant ID (WP)") or row.get("ChMeetings ID")
+            ),
+            full_name=(
+                f"{_clean(row.get('First Name'))} {_clean(row.get('Last Name'))}"
+            ).strip(),
+        )
+
+
+TeamKey = Tuple[str, str]
+
+
+class RosterTable(Sequence):
+    """Roster rows normalized once, with sport and team indexes."""
+
+    def __init__(self, rows: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.rows: List[Dict[str, Any]] = list(rows or [])
+        self.entries: List[RosterEntry] = [
+            RosterEntry.from_row(row, position)
+            for position, row in enumerate(self.rows)
+        ]
+        self._by_sport_type: Dict[str, List[RosterEntry]] = {}
+        for entry in self.entries:
+            self._by_sport_type.setdefault(entry.sport_type_cf, []).append(entry)
+        self.racquet_entries: List[RosterEntry] = [
+            entry for entry in self.entries if entry.sport_type in RACQUET_SPORTS
+        ]
+        self._event_team_cache: Dict[Tuple[str, str, str, bool], Dict[TeamKey, List[RosterEntry]]] = {}
+
+    @classmethod
+    def of(cls, roster: Any) -> "RosterTable":
+        """Return ``roster`` itself when already a table, else build one."""
+        if isinstance(roster, cls):
+            return roster
+        return cls(roster)
+
+    # Sequence protocol — behaves like the original list of row dicts.
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.rows)
+
+    def sport_entries(self, sport_type: str) -> List[RosterEntry]:
+        """Entries whose sport_type matches ``sport_type`` case-insensitively."""
+        return self._by_sport_type.get(_clean(sport_type).casefold(), [])
+
+    def event_entries(
+        self,
+        event_name: str,
+        target_type: str,
+        target_gender: str,
+        team_format_only: bool = False,
+    ) -> List[RosterEntry]:
+        """Entries registered for one team event, in roster order.
+
+        Primary/secondary sports are stored as the base name (e.g.
+        "Basketball"); Other-Events sports carry the full SPORT_TYPE value
+        verbatim, so both spellings match.  ``target_gender`` blank matches
+        every gender.  ``team_format_only`` drops rows whose non-blank
+        sport_format is anything other than Team.
+        """
+        type_cf = target_type.casefold()
+        event_cf = event_name.casefold()
+        candidates = self._by_sport_type.get(type_cf, [])
+        if event_cf != type_cf and event_cf in self._by_sport_type:
+            candidates = sorted(
+                candidates + self._by_sport_type[event_cf],
+                key=lambda entry: entry.position,
+            )
+        gender_cf = target_gender.casefold()
+        team_cf = SPORT_FORMAT["TEAM"].casefold()
+        return [
+            entry
+            for entry in candidates
+            if (not target_gender or entry.sport_gender_cf == gender_cf)
+            and not (team_format_only and entry.sport_format_cf and entry.sport_format_cf != team_cf)
+        ]
+
+    def event_teams(
+        self,
+        event_name: str,
+        target_type: str,
+        target_gender: str,
+        team_format_only: bool = False,
+    ) -> Dict[TeamKey, List[RosterEntry]]:
+        """Group one event's entries by (church, team_order), first-seen order.
+
+        Rows without a Church Team are skipped.  Results are cached per
+        event so repeated builders in the same build share one grouping.
+        """
+        cache_key = (event_name, target_type, target_gender, team_format_only)
+        cached = self._event_team_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        teams: Dict[TeamKey, List[RosterEntry]] = {}
+        for entry in self.event_entries(
+            event_name, target_type, target_gender, team_format_only
+        ):
+            if not entry.church:
+                continue
+            teams.setdefault((entry.church, entry.team_order), []).append(entry)
+        self._event_team_cache[cache_key] = teams
+        return teams
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import pandas as pd
 from loguru import logger
 
+from frame_utils import frame_records
 from scheduling.xlsx_utils import (
     _clean_excel_text,
     _coerce_excel_date,
@@ -48,7 +49,7 @@ def _load_venue_input_rows(venue_input_path: Path) -> Tuple[List[Dict[str, Any]]
         if "Date" in df.columns else {}
     )
 
-    for _, row in df.iterrows():
+    for row in frame_records(df):
         resource_type = _normalize_resource_type_name(row.get("Resource Type"))
         if not resource_type:
             continue
@@ -152,7 +153,7 @@ def _load_playoff_slots(venue_input_path: Path) -> List[Dict[str, Any]]:
         return []
 
     slots: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
+    for row in frame_records(df):
         game_id = _clean_excel_text(row.get("game_id"))
         if not game_id:
             continue
@@ -233,7 +234,7 @@ def _load_venue_date_day_map(venue_input_path: Path) -> Dict[str, str]:
     derived = _derive_day_labels_from_dates(df["Date"].tolist())
     has_day_col = "Day" in df.columns
     date_day_map: Dict[str, str] = {}
-    for _, row in df.iterrows():
+    for row in frame_records(df):
         parsed = _coerce_excel_date(row.get("Date"))
         if not parsed:
             continue
@@ -342,7 +343,7 @@ def _load_gym_modes(venue_input_path: Path) -> Dict[str, Dict[str, int]]:
         return {}
 
     gym_modes: Dict[str, Dict[str, int]] = {}
-    for _, row in df.iterrows():
+    for row in frame_records(df):
         gym_name = _clean_excel_text(row.get("Gym Name"))
         if not gym_name:
             continue
@@ -377,7 +378,7 @@ def _load_venue_input(venue_input_path: Path) -> Dict[str, int]:
         return {}
 
     totals: Dict[str, int] = {}
-    for _, row in df.iterrows():
+    for row in frame_records(df):
         resource_type = _normalize_resource_type_name(
             row.get("Resource Type")
         )
@@ -0,0 +1,132 @@
+"""workbook_fingerprints — per-tab dependency fingerprints for incremental
+Schedule_Workbook rebuilds.
+
+``build-schedule-workbook`` used to regenerate every tab on every run.  Each
+tab now records a fingerprint of the inputs it reads (roster, validation
+issues, venue availability, Pool-Assignment sidecar, rules file, schedule
+input).  The fingerprints live in a small JSON manifest beside the workbook,
+together with the SHA-256 of the workbook file as last written, so a rebuild
+only recomputes the tabs whose inputs changed and keeps the rest in place.
+
+Any doubt falls back to a full rebuild: no manifest, an unreadable manifest,
+a manifest from another fingerprint version, or a workbook that was modified
+after the last build (e.g. by ``assign-pools`` or by hand in Excel).
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+from loguru import logger
+
+
+# Bump when a tab's rendering changes in a way the input hashes cannot see.
+FINGERPRINT_VERSION = 1
+
+# Tab title -> input names it depends on, in final workbook order.
+SCHEDULE_WORKBOOK_TAB_INPUTS: Dict[str, tuple] = {
+    "Summary": ("code",),
+    "Venue-Estimator": ("code", "roster", "rules", "build_date"),
+    "Pool-Assignment": ("code", "roster", "rules", "sidecar"),
+    "Pod-Divisions": ("code", "roster", "validation"),
+    "Pod-Entries-Review": ("code", "roster", "validation"),
+    "Court-Schedule-Sketch": ("code", "roster", "rules"),
+    "Pod-Resource-Estimate": ("code", "roster", "rules", "venue"),
+    "Schedule-Input": ("code", "schedule_input"),
+    "Gym-Allocation": ("code", "schedule_input"),
+}
+
+_CODE_FILES = (
+    Path(__file__).resolve().parents[1] / "config.py",
+    Path(__file__).resolve().parents[1] / "schedule_workbook.py",
+    Path(__file__).resolve().parents[1] / "schedule_styles.py",
+)
+
+
+def _hash_payload(payload: Any) -> str:
+    """Stable SHA-256 of a JSON-serializable payload."""
+    text = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _hash_file(path: Optional[Path]) -> str:
+    """SHA-256 of a file's bytes, or '' when the path is unset or missing."""
+    if path is None:
+        return ""
+    path = Path(path)
+    if not path.is_file():
+        return ""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _code_fingerprint() -> str:
+    """Hash the renderer sources so upgrading the middleware dirties every tab."""
+    scheduling_dir = Path(__file__).resolve().parent
+    paths = sorted(scheduling_dir.glob("*.py")) + list(_CODE_FILES)
+    return _hash_payload([[path.name, _hash_file(path)] for path in paths])
+
+
+def _tab_fingerprints(input_hashes: Dict[str, str]) -> Dict[str, str]:
+    """Combine input hashes into one fingerprint per tab."""
+    return {
+        title: _hash_payload(
+            [FINGERPRINT_VERSION, title, [[name, input_hashes.get(name, "")] for name in inputs]]
+        )
+        for title, inputs in SCHEDULE_WORKBOOK_TAB_INPUTS.items()
+    }
+
+
+def _manifest_path(workbook_path: Path) -> Path:
+    """Return the fingerprint manifest path that sits beside one workbook."""
+    workbook_path = Path(workbook_path)
+    return workbook_path.with_name(f"{workbook_path.name}.build.json")
+
+
+def _dirty_tabs(workbook_path: Path, fingerprints: Dict[str, str]) -> Set[str]:
+    """Return the tab titles that must be rebuilt for ``fingerprints``."""
+    all_tabs = set(fingerprints)
+    workbook_path = Path(workbook_path)
+    manifest_path = _manifest_path(workbook_path)
+    if not workbook_path.is_file() or not manifest_path.is_file():
+        return all_tabs
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning(f"Ignoring unreadable workbook manifest {manifest_path}: {exc}")
+        return all_tabs
+    if manifest.get("version") != FINGERPRINT_VERSION:
+        return all_tabs
+    if manifest.get("workbook_sha256") != _hash_file(workbook_path):
+        logger.info(
+            f"{workbook_path.name} changed since its last build; rebuilding every tab."
+        )
+        return all_tabs
+    previous = manifest.get("tabs") or {}
+    return {title for title, fp in fingerprints.items() if previous.get(title) != fp}
+
+
+def _write_manifest(workbook_path: Path, fingerprints: Dict[str, str]) -> None:
+    """Record the fingerprints and the freshly written workbook hash."""
+    workbook_path = Path(workbook_path)
+    _manifest_path(workbook_path).write_text(
+        json.dumps(
+            {
+                "version": FINGERPRINT_VERSION,
+                "workbook_sha256": _hash_file(workbook_path),
+                "tabs": fingerprints,
+            },
+            indent=2,
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+
+
+def _ordered(titles: Iterable[str]) -> list:
+    """Return ``titles`` in workbook tab order for stable log output."""
+    wanted = set(titles)
+    return [title for title in SCHEDULE_WORKBOOK_TAB_INPUTS if title in wanted]
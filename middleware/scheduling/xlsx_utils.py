@@ -8,7 +8,7 @@ import zipfile
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 from loguru import logger
@@ -420,9 +420,21 @@ _TAB_STATUS_GUIDE: Dict[str, Tuple[str, str, str]] = {
 }
 
 
-def _stamp_known_tab_statuses(wb, *, default_unknown: Optional[Tuple[str, str, str]] = None) -> None:
-    """Stamp known workbook sheets with operator-facing role guidance."""
+def _stamp_known_tab_statuses(
+    wb,
+    *,
+    default_unknown: Optional[Tuple[str, str, str]] = None,
+    titles: Optional[Iterable[str]] = None,
+) -> None:
+    """Stamp known workbook sheets with operator-facing role guidance.
+
+    ``titles`` limits stamping to freshly written sheets so an incremental
+    rebuild does not stamp a second banner onto tabs it carried forward.
+    """
+    only = set(titles) if titles is not None else None
     for ws in wb.worksheets:
+        if only is not None and ws.title not in only:
+            continue
         guide = _TAB_STATUS_GUIDE.get(ws.title)
         if guide is None:
             guide = default_unknown
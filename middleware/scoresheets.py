@@ -10,21 +10,29 @@ middleware dependencies.
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
 import io
 import json
 import math
+import os
 import re
+import time
 import urllib.error
 import urllib.request
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 from urllib.parse import urlencode
 
 import qrcode
 from loguru import logger
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, PdfParser
 
 from config import Config
+from photo_store import PhotoStore, default_photo_store
 from schedule_publisher import merge_schedule
 from score_sheet_verses import BibleVerse, VerseSetError, load_bible_verse_set
 
@@ -135,6 +143,7 @@ def score_entry_url_for_game(game_key: str, score_entry_base_url: Optional[str]
     return f"{base_url}{separator}{urlencode({'action': 'score', 'game_key': game_key})}"
 
 
+@lru_cache(maxsize=None)
 def _font(kind: str, size: int) -> ImageFont.ImageFont:
     for path in _FONT_CANDIDATES.get(kind, []):
         if path.exists():
@@ -195,6 +204,13 @@ def _draw_wrapped(
 
 
 def _load_logo(logo_path: Path) -> Optional[Image.Image]:
+    """Return the decoded logo, shared across pages (callers paste a copy)."""
+    return _load_logo_cached(str(Path(logo_path).resolve()))
+
+
+@lru_cache(maxsize=8)
+def _load_logo_cached(logo_path_str: str) -> Optional[Image.Image]:
+    logo_path = Path(logo_path_str)
     if not logo_path.exists():
         logger.warning(f"Score-sheet logo not found at {logo_path}; rendering without logo")
         return None
@@ -205,9 +221,12 @@ def _load_logo(logo_path: Path) -> Optional[Image.Image]:
         return None
 
 
+def _box_size(box: tuple[int, int, int, int]) -> tuple[int, int]:
+    return box[2] - box[0], box[3] - box[1]
+
+
 def _paste_contained(canvas: Image.Image, source: Image.Image, box: tuple[int, int, int, int]) -> None:
-    max_w = box[2] - box[0]
-    max_h = box[3] - box[1]
+    max_w, max_h = _box_size(box)
     image = source.copy()
     image.thumbnail((max_w, max_h), Image.Resampling.LANCZOS)
     x = box[0] + (max_w - image.width) // 2
@@ -216,23 +235,67 @@ def _paste_contained(canvas: Image.Image, source: Image.Image, box: tuple[int, i
 
 
 class PhotoCache:
-    """Small per-run cache for roster photo thumbnails."""
+    """Per-run cache for roster photo thumbnails.
+
+    Remote photos go through the persistent ``PhotoStore`` when one is
+    configured, which also keeps decoded thumbnails per box size on disk;
+    otherwise (and for local paths) images are loaded directly and kept for
+    the run only.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, store: Optional[PhotoStore] = None) -> None:
+        self.store = store if store is not None else default_photo_store()
         self._cache: dict[str, Optional[Image.Image]] = {}
+        self._thumbs: dict[tuple[str, tuple[int, int]], Optional[Image.Image]] = {}
 
-    def load(self, photo_ref: Any) -> Optional[Image.Image]:
+    def load(self, photo_ref: Any, size: Optional[tuple[int, int]] = None) -> Optional[Image.Image]:
         url_or_path = _extract_photo_ref(photo_ref)
         if not url_or_path:
             return None
+        if size is None:
+            return self._load_full(url_or_path)
+
+        key = (url_or_path, size)
+        if key not in self._thumbs:
+            if self.store is not None and url_or_path.startswith(("http://", "https://")):
+                image = self.store.thumbnail(url_or_path, size)
+            else:
+                image = self._load_full(url_or_path)
+                if image is not None:
+                    image.thumbnail(size, Image.Resampling.LANCZOS)
+            self._thumbs[key] = image
+        cached = self._thumbs[key]
+        return cached.copy() if cached is not None else None
+
+    def _load_full(self, url_or_path: str) -> Optional[Image.Image]:
         if url_or_path in self._cache:
             cached = self._cache[url_or_path]
             return cached.copy() if cached is not None else None
 
-        image = _load_photo_image(url_or_path)
+        image = None
+        if self.store is not None and url_or_path.startswith(("http://", "https://")):
+            data = self.store.get_bytes(url_or_path)
+            if data is not None:
+                try:
+                    image = Image.open(io.BytesIO(data)).convert("RGB")
+                except (OSError, ValueError) as exc:
+                    logger.debug(f"Could not decode roster photo {url_or_path!r}: {exc}")
+        else:
+            image = _load_photo_image(url_or_path)
         self._cache[url_or_path] = image
         return image.copy() if image is not None else None
 
+    def prefetch(self, roster_rows: Iterable[dict[str, Any]]) -> None:
+        """Download every roster photo into the persistent store concurrently."""
+
+        if self.store is None:
+            return
+        self.store.prefetch(_extract_photo_ref(row.get("Photo")) for row in roster_rows)
+
+    def save(self) -> None:
+        if self.store is not None:
+            self.store.save()
+
 
 def _extract_photo_ref(photo_ref: Any) -> str:
     if _is_blank_photo_ref(photo_ref):
@@ -268,45 +331,77 @@ def _load_photo_image(url_or_path: str) -> Optional[Image.Image]:
     return None
 
 
+def _read_workbook_photo_formulas(workbook_path: Path) -> Optional[list[Any]]:
+    """Return the Roster tab's Photo cells (formulas kept), one per data row."""
+
+    try:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(workbook_path, data_only=False, read_only=True)
+        ws = wb["Roster"]
+    except Exception as exc:
+        logger.debug(f"Could not read roster photo formulas from {workbook_path}: {exc}")
+        return None
+
+    try:
+        headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
+        try:
+            photo_idx = headers.index("Photo")
+        except ValueError:
+            return None
+        return [
+            cells[photo_idx].value if photo_idx < len(cells) else None
+            for cells in ws.iter_rows(min_row=2)
+        ]
+    finally:
+        wb.close()
+
+
+def _workbook_photo_formulas(workbook_path: Path, store: Optional[PhotoStore]) -> Optional[list[Any]]:
+    """Photo formulas for one workbook, memoized in the photo store by file identity."""
+
+    if store is None:
+        return _read_workbook_photo_formulas(workbook_path)
+    try:
+        stat = Path(workbook_path).stat()
+    except OSError:
+        return _read_workbook_photo_formulas(workbook_path)
+    identity = f"{Path(workbook_path).resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+    artifact = "workbook-photos-" + hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+    cached = store.load_artifact(artifact)
+    if isinstance(cached, dict) and "formulas" in cached:
+        return cached["formulas"]
+    formulas = _read_workbook_photo_formulas(workbook_path)
+    store.save_artifact(artifact, {"workbook": str(workbook_path), "formulas": formulas})
+    return formulas
+
+
 def enrich_roster_photos_from_workbook(
     roster_rows: Iterable[dict[str, Any]],
     workbook_path: Path,
+    store: Optional[PhotoStore] = None,
 ) -> list[dict[str, Any]]:
     """Fill blank Photo values with formula text from the source roster workbook.
 
     pandas/openpyxl reads Excel IMAGE() cells as their cached display value, which
     is often blank. The score sheets need the formula URL, so this helper reopens
     only the Roster tab with formulas preserved and patches copied row dicts.
+    With a photo store (default: the configured persistent store) the formulas
+    are remembered per workbook file, so an unchanged workbook is read once.
     """
 
     rows = [dict(row) for row in roster_rows]
     if not rows:
         return rows
 
-    try:
-        from openpyxl import load_workbook
-
-        wb = load_workbook(workbook_path, data_only=False, read_only=True)
-        ws = wb["Roster"]
-    except Exception as exc:
-        logger.debug(f"Could not read roster photo formulas from {workbook_path}: {exc}")
-        return rows
-
-    headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-    try:
-        photo_idx = headers.index("Photo")
-    except ValueError:
-        wb.close()
+    formulas = _workbook_photo_formulas(workbook_path, store if store is not None else default_photo_store())
+    if formulas is None:
         return rows
 
-    for row_dict, cells in zip(rows, ws.iter_rows(min_row=2), strict=False):
-        if not _is_blank_photo_ref(row_dict.get("Photo")):
+    for row_dict, formula_or_value in zip(rows, formulas, strict=False):
+        if not _is_blank_photo_ref(row_dict.get("Photo")) or _is_blank_photo_ref(formula_or_value):
             continue
-        if photo_idx < len(cells):
-            formula_or_value = cells[photo_idx].value
-            if not _is_blank_photo_ref(formula_or_value):
-                row_dict["Photo"] = formula_or_value
-    wb.close()
+        row_dict["Photo"] = formula_or_value
     return rows
 
 
@@ -511,14 +606,18 @@ def _draw_logo(canvas: Image.Image, logo: Optional[Image.Image]) -> None:
         _center_text(draw, LOGO_BOX, "VAY", _font("bold", 28), COL_BLUE)
 
 
-def _draw_qr(canvas: Image.Image, game_key: str, score_entry_base_url: Optional[str]) -> None:
-    qr_payload = score_entry_url_for_game(game_key, score_entry_base_url)
+@lru_cache(maxsize=1024)
+def _qr_image(qr_payload: str) -> Image.Image:
     qr = qrcode.QRCode(border=1, box_size=10)
     qr.add_data(qr_payload)
     qr.make(fit=True)
     qr_image = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-    qr_image = qr_image.resize((QR_SIZE, QR_SIZE), Image.Resampling.NEAREST)
-    canvas.paste(qr_image, QR_BOX)
+    return qr_image.resize((QR_SIZE, QR_SIZE), Image.Resampling.NEAREST)
+
+
+def _draw_qr(canvas: Image.Image, game_key: str, score_entry_base_url: Optional[str]) -> None:
+    qr_payload = score_entry_url_for_game(game_key, score_entry_base_url)
+    canvas.paste(_qr_image(qr_payload), QR_BOX)
 
 
 def _draw_header(draw: ImageDraw.ImageDraw, game: dict[str, Any]) -> None:
@@ -813,7 +912,7 @@ def _draw_volleyball_roster_table(
             name = _roster_name(row)
             age = row.get("Age (at Event)")
             age_text = f"{int(age)}" if isinstance(age, (int, float)) else str(age or "").strip()
-            photo = photo_cache.load(row.get("Photo"))
+            photo = photo_cache.load(row.get("Photo"), size=_box_size(photo_box))
             if photo is not None:
                 _paste_contained(canvas, photo, photo_box)
             _draw_wrapped(draw, name, (name_x, row_y + 10), _font("regular", 14), age_x - name_x - 6, COL_BLACK, line_gap=1)
@@ -883,7 +982,7 @@ def _draw_roster_table(
             name = _roster_name(row)
             age = row.get("Age (at Event)")
             age_text = f"{int(age)}" if isinstance(age, (int, float)) else str(age or "").strip()
-            photo = photo_cache.load(row.get("Photo"))
+            photo = photo_cache.load(row.get("Photo"), size=_box_size(photo_box))
             if photo is not None:
                 _paste_contained(canvas, photo, photo_box)
             draw.line((x + 8, row_y + 30, no_x - 8, row_y + 30), fill=(170, 178, 188), width=1)
@@ -1025,7 +1124,7 @@ def _draw_compact_roster_table(
         name = _roster_name(row)
         age = row.get("Age (at Event)")
         age_text = f"{int(age)}" if isinstance(age, (int, float)) else str(age or "").strip()
-        photo = photo_cache.load(row.get("Photo"))
+        photo = photo_cache.load(row.get("Photo"), size=_box_size(photo_box))
         if photo is not None:
             _paste_contained(canvas, photo, photo_box)
         _draw_wrapped(draw, name, (name_x, row_y + 6), _font("regular", 13), age_x - name_x - 6, COL_BLACK, line_gap=1)
@@ -1354,48 +1453,309 @@ def _filter_games(
     return filtered
 
 
-def _basketball_games(schedule_input: dict[str, Any], schedule_output: dict[str, Any]) -> list[dict[str, Any]]:
+def _select_games(
+    merged_games: list[dict[str, Any]],
+    events: Iterable[str],
+    key_prefixes: tuple[str, ...],
+) -> list[dict[str, Any]]:
+    event_set = set(events)
     games = [
         game
-        for game in merge_schedule(schedule_input, schedule_output)
-        if str(game.get("event") or "").strip() == BASKETBALL_EVENT
-        and str(game.get("game_key") or "").startswith("BBM-")
+        for game in merged_games
+        if str(game.get("event") or "").strip() in event_set
+        and str(game.get("game_key") or "").startswith(key_prefixes)
     ]
     games.sort(key=lambda game: (str(game.get("scheduled_slot") or ""), str(game.get("resource_id") or ""), str(game.get("game_key") or "")))
     return games
 
 
+def _basketball_games(schedule_input: dict[str, Any], schedule_output: dict[str, Any]) -> list[dict[str, Any]]:
+    return _select_games(merge_schedule(schedule_input, schedule_output), *SCORESHEET_SPORTS["basketball"].game_filter)
+
+
 def _bible_challenge_games(schedule_input: dict[str, Any], schedule_output: dict[str, Any]) -> list[dict[str, Any]]:
-    games = [
-        game
-        for game in merge_schedule(schedule_input, schedule_output)
-        if str(game.get("event") or "").strip() == BIBLE_CHALLENGE_EVENT
-        and str(game.get("game_key") or "").startswith("BC-")
-    ]
-    games.sort(key=lambda game: (str(game.get("scheduled_slot") or ""), str(game.get("resource_id") or ""), str(game.get("game_key") or "")))
-    return games
+    return _select_games(merge_schedule(schedule_input, schedule_output), *SCORESHEET_SPORTS["bible-challenge"].game_filter)
 
 
 def _volleyball_games(schedule_input: dict[str, Any], schedule_output: dict[str, Any]) -> list[dict[str, Any]]:
-    games = [
-        game
-        for game in merge_schedule(schedule_input, schedule_output)
-        if str(game.get("event") or "").strip() in VOLLEYBALL_EVENTS
-        and str(game.get("game_key") or "").startswith(("VBM-", "VBW-"))
-    ]
-    games.sort(key=lambda game: (str(game.get("scheduled_slot") or ""), str(game.get("resource_id") or ""), str(game.get("game_key") or "")))
-    return games
+    return _select_games(merge_schedule(schedule_input, schedule_output), *SCORESHEET_SPORTS["volleyball"].game_filter)
 
 
 def _soccer_games(schedule_input: dict[str, Any], schedule_output: dict[str, Any]) -> list[dict[str, Any]]:
-    games = [
-        game
-        for game in merge_schedule(schedule_input, schedule_output)
-        if str(game.get("event") or "").strip() == SOCCER_EVENT
-        and str(game.get("game_key") or "").startswith("SOC-")
-    ]
-    games.sort(key=lambda game: (str(game.get("scheduled_slot") or ""), str(game.get("resource_id") or ""), str(game.get("game_key") or "")))
-    return games
+    return _select_games(merge_schedule(schedule_input, schedule_output), *SCORESHEET_SPORTS["soccer"].game_filter)
+
+
+@dataclass(frozen=True)
+class _SportSheetSpec:
+    """How one sport selects, indexes and names its score sheets."""
+
+    label: str
+    game_filter: tuple[frozenset[str], tuple[str, ...]]
+    roster_index_builder: Callable[[Iterable[dict[str, Any]]], dict[str, Any]]
+    filename_prefix: str
+
+
+SCORESHEET_SPORTS: dict[str, _SportSheetSpec] = {
+    "basketball": _SportSheetSpec(
+        label="basketball",
+        game_filter=(frozenset({BASKETBALL_EVENT}), ("BBM-",)),
+        roster_index_builder=build_roster_index,
+        filename_prefix="Basketball",
+    ),
+    "bible-challenge": _SportSheetSpec(
+        label="Bible Challenge",
+        game_filter=(frozenset({BIBLE_CHALLENGE_EVENT}), ("BC-",)),
+        roster_index_builder=build_bible_challenge_roster_index,
+        filename_prefix="Bible_Challenge",
+    ),
+    "soccer": _SportSheetSpec(
+        label="soccer",
+        game_filter=(frozenset({SOCCER_EVENT}), ("SOC-",)),
+        roster_index_builder=build_soccer_roster_index,
+        filename_prefix="Soccer",
+    ),
+    "volleyball": _SportSheetSpec(
+        label="volleyball",
+        game_filter=(frozenset(VOLLEYBALL_EVENTS), ("VBM-", "VBW-")),
+        roster_index_builder=build_volleyball_roster_index,
+        filename_prefix="Volleyball",
+    ),
+}
+
+
+class _StreamingPdfWriter:
+    """Write an image-backed PDF one page at a time.
+
+    ``Image.save(..., save_all=True, append_images=...)`` needs every page in
+    memory before it writes anything.  The page count is known up front (one
+    per game), so the page tree is allocated first and each page is encoded
+    and flushed to disk as soon as it is rendered.
+    """
+
+    def __init__(self, output_path: Path, page_count: int, resolution: float = 150.0) -> None:
+        self.output_path = Path(output_path)
+        self.resolution = resolution
+        self._pdf = PdfParser.PdfParser(filename=str(self.output_path), mode="w+b")
+        self._pdf.info["Title"] = self.output_path.stem
+        self._pdf.info["CreationDate"] = self._pdf.info["ModDate"] = time.gmtime()
+        self._pdf.start_writing()
+        self._pdf.write_header()
+        self._pdf.write_comment("created by Pillow PDF driver")
+        self._refs = []
+        for _ in range(page_count):
+            image_ref = self._pdf.next_object_id(0)
+            page_ref = self._pdf.next_object_id(0)
+            contents_ref = self._pdf.next_object_id(0)
+            self._pdf.pages.append(page_ref)
+            self._refs.append((image_ref, page_ref, contents_ref))
+        self._pdf.write_catalog()
+        self.pages_written = 0
+
+    def add_page(self, page: Image.Image) -> None:
+        self.add_encoded_page(_encode_page(page), page.size)
+
+    def add_encoded_page(self, jpeg_bytes: bytes, size: tuple[int, int]) -> None:
+        image_ref, page_ref, contents_ref = self._refs[self.pages_written]
+        width, height = size
+        self._pdf.write_obj(
+            image_ref,
+            stream=jpeg_bytes,
+            Type=PdfParser.PdfName("XObject"),
+            Subtype=PdfParser.PdfName("Image"),
+            Width=width,
+            Height=height,
+            Filter=PdfParser.PdfName("DCTDecode"),
+            BitsPerComponent=8,
+            ColorSpace=PdfParser.PdfName("DeviceRGB"),
+        )
+        page_w = width * 72.0 / self.resolution
+        page_h = height * 72.0 / self.resolution
+        self._pdf.write_page(
+            page_ref,
+            Resources=PdfParser.PdfDict(
+                ProcSet=[PdfParser.PdfName("PDF"), PdfParser.PdfName("ImageC")],
+                XObject=PdfParser.PdfDict(image=image_ref),
+            ),
+            MediaBox=[0, 0, page_w, page_h],
+            Contents=contents_ref,
+        )
+        self._pdf.write_obj(contents_ref, stream=b"q %f 0 0 %f 0 0 cm /image Do Q\n" % (page_w, page_h))
+        self.pages_written += 1
+
+    def close(self) -> None:
+        if self.pages_written != len(self._refs):
+            raise ScoreSheetError(
+                f"Score-sheet PDF {self.output_path.name} expected {len(self._refs)} page(s), "
+                f"rendered {self.pages_written}."
+            )
+        self._pdf.write_xref_and_trailer()
+        self._pdf.close()
+
+    def abort(self) -> None:
+        self._pdf.close()
+        self.output_path.unlink(missing_ok=True)
+
+
+def _encode_page(page: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    page.convert("RGB").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@dataclass
+class _RenderContext:
+    """Per-run assets shared by every page: roster indexes, logo, QR base, photos."""
+
+    roster_indexes: dict[str, dict[str, Any]]
+    logo_path: Optional[Path]
+    score_entry_base_url: Optional[str]
+    photo_cache: PhotoCache = field(default_factory=PhotoCache)
+
+
+def _context_roster_rows(context: _RenderContext) -> Iterator[dict[str, Any]]:
+    """Yield every roster row referenced by the context's roster indexes."""
+
+    def walk(node: Any) -> Iterator[dict[str, Any]]:
+        if isinstance(node, dict):
+            for value in node.values():
+                yield from walk(value)
+        elif isinstance(node, list):
+            yield from node
+
+    for index in context.roster_indexes.values():
+        yield from walk(index)
+
+
+def _render_sport_page(
+    context: _RenderContext,
+    sport: str,
+    game: dict[str, Any],
+    bible_verse: Optional[BibleVerse] = None,
+) -> Image.Image:
+    kwargs = {
+        "roster_index": context.roster_indexes[sport],
+        "logo_path": context.logo_path,
+        "score_entry_base_url": context.score_entry_base_url,
+        "photo_cache": context.photo_cache,
+    }
+    if sport == "basketball":
+        return render_basketball_scoresheet_page(game, **kwargs)
+    if sport == "bible-challenge":
+        return render_bible_challenge_scoresheet_page(game, bible_verse=bible_verse, **kwargs)
+    if sport == "soccer":
+        return render_soccer_scoresheet_page(game, **kwargs)
+    if sport == "volleyball":
+        return render_volleyball_scoresheet_page(game, **kwargs)
+    raise ScoreSheetError(f"Unsupported score-sheet sport {sport!r}.")
+
+
+_WORKER_CONTEXT: Optional[_RenderContext] = None
+
+
+def _init_render_worker(context: _RenderContext) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _render_encoded_page(task: tuple[str, dict[str, Any], Optional[BibleVerse]]) -> tuple[bytes, tuple[int, int]]:
+    """Process-pool entry point: render one page and return it JPEG-encoded."""
+
+    sport, game, bible_verse = task
+    page = _render_sport_page(_WORKER_CONTEXT, sport, game, bible_verse)
+    return _encode_page(page), page.size
+
+
+def _sport_tasks(sport: str, games: list[dict[str, Any]]) -> list[tuple[str, dict[str, Any], Optional[BibleVerse]]]:
+    if sport != "bible-challenge":
+        return [(sport, game, None) for game in games]
+    try:
+        bible_verses = load_bible_verse_set(
+            DEFAULT_BIBLE_CHALLENGE_VERSE_SET_KEY,
+            event="bible-challenge",
+        )
+    except VerseSetError as exc:
+        raise ScoreSheetError(str(exc)) from exc
+    return [(sport, game, bible_verses[idx % len(bible_verses)]) for idx, game in enumerate(games)]
+
+
+def _sport_output_path(sport: str, output_dir: Path, output_filename: Optional[str] = None) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    filename = output_filename or f"{SCORESHEET_SPORTS[sport].filename_prefix}_Scoresheets_{dt.date.today().isoformat()}.pdf"
+    return output_dir / filename
+
+
+def _write_pages(
+    output_path: Path,
+    tasks: list[tuple[str, dict[str, Any], Optional[BibleVerse]]],
+    context: _RenderContext,
+    executor: Optional[ProcessPoolExecutor] = None,
+    window: int = 1,
+) -> int:
+    """Render ``tasks`` in order into one streamed PDF and return the page count.
+
+    Without an executor pages render in-process.  With one, at most ``window``
+    pages are in flight, so memory holds a bounded number of encoded pages
+    regardless of how many games the PDF covers.
+    """
+
+    writer = _StreamingPdfWriter(output_path, len(tasks))
+    try:
+        if executor is None:
+            for sport, game, bible_verse in tasks:
+                writer.add_page(_render_sport_page(context, sport, game, bible_verse))
+        else:
+            pending: deque = deque()
+            remaining = iter(tasks)
+            for task in remaining:
+                pending.append(executor.submit(_render_encoded_page, task))
+                if len(pending) >= window:
+                    break
+            while pending:
+                writer.add_encoded_page(*pending.popleft().result())
+                next_task = next(remaining, None)
+                if next_task is not None:
+                    pending.append(executor.submit(_render_encoded_page, next_task))
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return len(tasks)
+
+
+def _write_single_sport_pdf(
+    sport: str,
+    schedule_input_path: Path,
+    schedule_output_path: Path,
+    output_dir: Path,
+    roster_rows: Optional[list[dict[str, Any]]],
+    logo_path: Optional[Path],
+    score_entry_base_url: Optional[str],
+    output_filename: Optional[str],
+    stage: Optional[str],
+    game_keys: Optional[Iterable[str]],
+) -> tuple[Path, int]:
+    spec = SCORESHEET_SPORTS[sport]
+    schedule_input = _load_json(schedule_input_path)
+    schedule_output = _load_json(schedule_output_path)
+    games = _select_games(merge_schedule(schedule_input, schedule_output), *spec.game_filter)
+    if not games:
+        raise ScoreSheetError(f"No scheduled {spec.label} games found in the supplied schedule artifacts.")
+    games = _filter_games(games, spec.label, stage=stage, game_keys=game_keys)
+
+    roster_rows = list(roster_rows or [])
+    _warn_if_approval_status_missing(roster_rows, spec.label[:1].upper() + spec.label[1:])
+    context = _RenderContext(
+        roster_indexes={sport: spec.roster_index_builder(roster_rows)},
+        logo_path=logo_path,
+        score_entry_base_url=score_entry_base_url,
+    )
+    tasks = _sport_tasks(sport, games)
+    output_path = _sport_output_path(sport, output_dir, output_filename)
+    context.photo_cache.prefetch(_context_roster_rows(context))
+    try:
+        return output_path, _write_pages(output_path, tasks, context)
+    finally:
+        context.photo_cache.save()
 
 
 def write_basketball_scoresheets_pdf(
@@ -1411,33 +1771,18 @@ def write_basketball_scoresheets_pdf(
 ) -> tuple[Path, int]:
     """Write one combined basketball score-sheet PDF and return (path, pages)."""
 
-    schedule_input = _load_json(schedule_input_path)
-    schedule_output = _load_json(schedule_output_path)
-    games = _basketball_games(schedule_input, schedule_output)
-    if not games:
-        raise ScoreSheetError("No scheduled basketball games found in the supplied schedule artifacts.")
-    games = _filter_games(games, "basketball", stage=stage, game_keys=game_keys)
-
-    roster_rows = list(roster_rows or [])
-    _warn_if_approval_status_missing(roster_rows, "Basketball")
-    roster_index = build_roster_index(roster_rows)
-    photo_cache = PhotoCache()
-    pages = [
-        render_basketball_scoresheet_page(
-            game,
-            roster_index=roster_index,
-            logo_path=logo_path,
-            score_entry_base_url=score_entry_base_url,
-            photo_cache=photo_cache,
-        )
-        for game in games
-    ]
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    filename = output_filename or f"Basketball_Scoresheets_{dt.date.today().isoformat()}.pdf"
-    output_path = output_dir / filename
-    pages[0].save(output_path, "PDF", save_all=True, append_images=pages[1:], resolution=150.0)
-    return output_path, len(pages)
+    return _write_single_sport_pdf(
+        "basketball",
+        schedule_input_path,
+        schedule_output_path,
+        output_dir,
+        roster_rows,
+        logo_path,
+        score_entry_base_url,
+        output_filename,
+        stage,
+        game_keys,
+    )
 
 
 def write_bible_challenge_scoresheets_pdf(
@@ -1453,41 +1798,18 @@ def write_bible_challenge_scoresheets_pdf(
 ) -> tuple[Path, int]:
     """Write one combined Bible Challenge score-sheet PDF and return (path, pages)."""
 
-    schedule_input = _load_json(schedule_input_path)
-    schedule_output = _load_json(schedule_output_path)
-    games = _bible_challenge_games(schedule_input, schedule_output)
-    if not games:
-        raise ScoreSheetError("No scheduled Bible Challenge games found in the supplied schedule artifacts.")
-    games = _filter_games(games, "Bible Challenge", stage=stage, game_keys=game_keys)
-
-    roster_rows = list(roster_rows or [])
-    _warn_if_approval_status_missing(roster_rows, "Bible Challenge")
-    roster_index = build_bible_challenge_roster_index(roster_rows)
-    try:
-        bible_verses = load_bible_verse_set(
-            DEFAULT_BIBLE_CHALLENGE_VERSE_SET_KEY,
-            event="bible-challenge",
-        )
-    except VerseSetError as exc:
-        raise ScoreSheetError(str(exc)) from exc
-    photo_cache = PhotoCache()
-    pages = [
-        render_bible_challenge_scoresheet_page(
-            game,
-            roster_index=roster_index,
-            logo_path=logo_path,
-            score_entry_base_url=score_entry_base_url,
-            photo_cache=photo_cache,
-            bible_verse=bible_verses[idx % len(bible_verses)],
-        )
-        for idx, game in enumerate(games)
-    ]
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    filename = output_filename or f"Bible_Challenge_Scoresheets_{dt.date.today().isoformat()}.pdf"
-    output_path = output_dir / filename
-    pages[0].save(output_path, "PDF", save_all=True, append_images=pages[1:], resolution=150.0)
-    return output_path, len(pages)
+    return _write_single_sport_pdf(
+        "bible-challenge",
+        schedule_input_path,
+        schedule_output_path,
+        output_dir,
+        roster_rows,
+        logo_path,
+        score_entry_base_url,
+        output_filename,
+        stage,
+        game_keys,
+    )
 
 
 def write_soccer_scoresheets_pdf(
@@ -1503,33 +1825,18 @@ def write_soccer_scoresheets_pdf(
 ) -> tuple[Path, int]:
     """Write one combined soccer score-sheet PDF and return (path, pages)."""
 
-    schedule_input = _load_json(schedule_input_path)
-    schedule_output = _load_json(schedule_output_path)
-    games = _soccer_games(schedule_input, schedule_output)
-    if not games:
-        raise ScoreSheetError("No scheduled soccer games found in the supplied schedule artifacts.")
-    games = _filter_games(games, "soccer", stage=stage, game_keys=game_keys)
-
-    roster_rows = list(roster_rows or [])
-    _warn_if_approval_status_missing(roster_rows, "Soccer")
-    roster_index = build_soccer_roster_index(roster_rows)
-    photo_cache = PhotoCache()
-    pages = [
-        render_soccer_scoresheet_page(
-            game,
-            roster_index=roster_index,
-            logo_path=logo_path,
-            score_entry_base_url=score_entry_base_url,
-            photo_cache=photo_cache,
-        )
-        for game in games
-    ]
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    filename = output_filename or f"Soccer_Scoresheets_{dt.date.today().isoformat()}.pdf"
-    output_path = output_dir / filename
-    pages[0].save(output_path, "PDF", save_all=True, append_images=pages[1:], resolution=150.0)
-    return output_path, len(pages)
+    return _write_single_sport_pdf(
+        "soccer",
+        schedule_input_path,
+        schedule_output_path,
+        output_dir,
+        roster_rows,
+        logo_path,
+        score_entry_base_url,
+        output_filename,
+        stage,
+        game_keys,
+    )
 
 
 def write_volleyball_scoresheets_pdf(
@@ -1545,30 +1852,95 @@ def write_volleyball_scoresheets_pdf(
 ) -> tuple[Path, int]:
     """Write one combined volleyball score-sheet PDF and return (path, pages)."""
 
+    return _write_single_sport_pdf(
+        "volleyball",
+        schedule_input_path,
+        schedule_output_path,
+        output_dir,
+        roster_rows,
+        logo_path,
+        score_entry_base_url,
+        output_filename,
+        stage,
+        game_keys,
+    )
+
+
+def write_scoresheets_pdfs(
+    sports: Iterable[str],
+    schedule_input_path: Path,
+    schedule_output_path: Path,
+    output_dir: Path,
+    roster_rows: Optional[list[dict[str, Any]]] = None,
+    logo_path: Optional[Path] = None,
+    score_entry_base_url: Optional[str] = None,
+    stage: Optional[str] = None,
+    game_keys: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+) -> list[tuple[str, Path, int]]:
+    """Write one score-sheet PDF per sport in a single pass and return (sport, path, pages).
+
+    Used by ``generate-scoresheets --sport all``.  The schedule artifacts are
+    loaded and merged once, each sport's roster index is built once, and pages
+    render in a process pool (``workers`` processes; 1 renders in-process).
+    Each worker keeps its own font/logo/QR/photo caches for the whole run, and
+    pages stream into their PDF as they finish.  Sports with no scheduled (or
+    no matching) games are skipped with a warning; it is an error only when
+    no sport produced any pages.
+    """
+
     schedule_input = _load_json(schedule_input_path)
     schedule_output = _load_json(schedule_output_path)
-    games = _volleyball_games(schedule_input, schedule_output)
-    if not games:
-        raise ScoreSheetError("No scheduled volleyball games found in the supplied schedule artifacts.")
-    games = _filter_games(games, "volleyball", stage=stage, game_keys=game_keys)
-
+    merged_games = merge_schedule(schedule_input, schedule_output)
     roster_rows = list(roster_rows or [])
-    _warn_if_approval_status_missing(roster_rows, "Volleyball")
-    roster_index = build_volleyball_roster_index(roster_rows)
-    photo_cache = PhotoCache()
-    pages = [
-        render_volleyball_scoresheet_page(
-            game,
-            roster_index=roster_index,
-            logo_path=logo_path,
-            score_entry_base_url=score_entry_base_url,
-            photo_cache=photo_cache,
-        )
-        for game in games
-    ]
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    filename = output_filename or f"Volleyball_Scoresheets_{dt.date.today().isoformat()}.pdf"
-    output_path = output_dir / filename
-    pages[0].save(output_path, "PDF", save_all=True, append_images=pages[1:], resolution=150.0)
-    return output_path, len(pages)
+    if roster_rows:
+        _warn_if_approval_status_missing(roster_rows, "Score sheet")
+
+    planned: list[tuple[str, list[tuple[str, dict[str, Any], Optional[BibleVerse]]]]] = []
+    for sport in sports:
+        spec = SCORESHEET_SPORTS[sport]
+        games = _select_games(merged_games, *spec.game_filter)
+        try:
+            if not games:
+                raise ScoreSheetError(f"No scheduled {spec.label} games found in the supplied schedule artifacts.")
+            games = _filter_games(games, spec.label, stage=stage, game_keys=game_keys)
+        except ScoreSheetError as exc:
+            logger.warning(f"generate-scoresheets: skipping {spec.label}: {exc}")
+            continue
+        planned.append((sport, _sport_tasks(sport, games)))
+    if not planned:
+        raise ScoreSheetError("No scheduled games found for any score-sheet sport.")
+
+    context = _RenderContext(
+        roster_indexes={
+            sport: SCORESHEET_SPORTS[sport].roster_index_builder(roster_rows)
+            for sport, _tasks in planned
+        },
+        logo_path=logo_path,
+        # Resolve the default once here so workers never need Config.WP_URL.
+        score_entry_base_url=score_entry_base_url or default_score_entry_base_url(),
+    )
+    # Download every roster photo once, concurrently, before any page renders;
+    # render workers then read the shared on-disk store instead of the network.
+    context.photo_cache.prefetch(_context_roster_rows(context))
+    total_pages = sum(len(tasks) for _sport, tasks in planned)
+    workers = max(1, min(workers or os.cpu_count() or 1, total_pages))
+
+    results: list[tuple[str, Path, int]] = []
+    if workers == 1:
+        for sport, tasks in planned:
+            output_path = _sport_output_path(sport, output_dir)
+            results.append((sport, output_path, _write_pages(output_path, tasks, context)))
+        context.photo_cache.save()
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_render_worker,
+        initargs=(context,),
+    ) as executor:
+        for sport, tasks in planned:
+            output_path = _sport_output_path(sport, output_dir)
+            page_count = _write_pages(output_path, tasks, context, executor=executor, window=workers * 2)
+            results.append((sport, output_path, page_count))
+    return results
@@ -0,0 +1,85 @@
+"""
+bench_badge_render.py  —  per-badge CPU cost of BadgeGenerator
+THROWAWAY — lives under scratch/, not part of the main pipeline.
+
+Renders N synthetic athletes (a mix of photo and initials badges, consent and
+minor tags, one to four event rows) with the production template, times
+render() and the PNG encode separately, and prints the generator's per-stage
+breakdown when it keeps one.  A second pass re-renders the same athletes so
+the QR cache is exercised the way ``generate-badges --force`` does.
+
+Run:
+    cd middleware
+    python scratch/bench_badge_render.py [badges]
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("APP_ENV", "test")
+
+from PIL import Image  # noqa: E402
+
+from badges.generator import BadgeGenerator  # noqa: E402
+
+DEFAULT_COUNT = 60
+SPORTS = ["Basketball", "Volleyball", "Badminton", "Pickleball", "Table Tennis", "Soccer"]
+
+
+def _photo(index: int) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (640 + index % 7 * 40, 480), (index * 37 % 255, 90, 160)).save(buf, "JPEG")
+    return buf.getvalue()
+
+
+def build_participants(count: int) -> list[tuple[dict, bytes | None]]:
+    rows = []
+    for index in range(count):
+        participant = {
+            "chmeetings_id": str(3_600_000 + index),
+            "church_code": ["RPC", "GAC", "TLC", "NHC"][index % 4],
+            "first_name": f"Athlete{index}",
+            "last_name": "Nguyễn",
+            "primary_sport": SPORTS[index % len(SPORTS)],
+            "primary_format": "Team" if index % 2 else "Doubles",
+            "primary_partner": "Partner Name" if index % 3 == 0 else "",
+            "secondary_sport": SPORTS[(index + 2) % len(SPORTS)] if index % 2 else "",
+            "other_events": "Bible Challenge, Tug of War, Scripture Memory" if index % 5 == 0 else "",
+            "consent_status": index % 4 != 0,
+            "age_at_event": 15 if index % 6 == 0 else 25,
+        }
+        rows.append((participant, _photo(index) if index % 3 else None))
+    return rows
+
+
+def main(count: int) -> None:
+    participants = build_participants(count)
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = BadgeGenerator(output_dir=Path(tmp), filename_salt="bench-salt-0123456789")
+        for label in ("first pass", "re-render"):
+            render_s = encode_s = 0.0
+            for participant, photo in participants:
+                start = time.perf_counter()
+                image = generator.render(participant, photo)
+                mid = time.perf_counter()
+                image.save(io.BytesIO(), format="PNG", optimize=True)
+                render_s += mid - start
+                encode_s += time.perf_counter() - mid
+            print(
+                f"{label:>10}: {count} badges  render {render_s / count * 1000:6.1f} ms/badge  "
+                f"encode {encode_s / count * 1000:6.1f} ms/badge"
+            )
+        breakdown = getattr(generator, "timing_breakdown", None)
+        if breakdown is not None:
+            print(breakdown())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,116 @@
+"""
+bench_bc_triplets.py  —  Bible Challenge no-repeat triplet draw, n = 7…40 teams
+THROWAWAY — lives under scratch/, not part of the main pipeline.
+
+For each team count, times the draw (_solve_bc_triplets: budgeted search,
+then CP-SAT once the budget runs out) and names the engine that answered,
+against the old plain backtracking over itertools.combinations, with no seeds, with the
+most seeds a draw can hold (n // 3) and with one seed too many (provably
+impossible: every game can hold at most one seeded team).  The old search is
+capped at --legacy-cap seconds per case because it never finishes proving
+the impossible draws; capped runs print as ">cap".
+
+Run:
+    cd middleware
+    python scratch/bench_bc_triplets.py [--legacy-cap SECONDS] [n ...]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("APP_ENV", "test")
+
+from config import BC_TRIPLET_SOLVER_TIMEOUT, COURT_ESTIMATE_BC_RR_GAMES_PER_TEAM  # noqa: E402
+from scheduling.game_builder import (  # noqa: E402
+    BC_TRIPLET_BACKTRACK_NODES,
+    _backtrack_bc_triplets,
+    _solve_bc_triplets,
+)
+
+DEFAULT_SIZES = [7, 8, 9, 10, 12, 16, 20, 24, 28, 32, 36, 40]
+DEFAULT_LEGACY_CAP = 10.0
+
+
+class _Timeout(Exception):
+    pass
+
+
+def legacy_backtracking(n: int, gpt: int, seeded: set, deadline: float) -> bool:
+    """The pre-CP-SAT search, verbatim apart from the deadline check."""
+    n_games = (n * gpt) // 3
+    all_triples = list(combinations(range(n), 3))
+    used_pairs: set = set()
+    count = [0] * n
+    chosen: list = []
+
+    def _pair(a: int, b: int) -> tuple:
+        return (a, b) if a < b else (b, a)
+
+    def _valid(a: int, b: int, c: int) -> bool:
+        return (
+            (a in seeded) + (b in seeded) + (c in seeded) <= 1
+            and count[a] < gpt and count[b] < gpt and count[c] < gpt
+            and _pair(a, b) not in used_pairs
+            and _pair(b, c) not in used_pairs
+            and _pair(a, c) not in used_pairs
+        )
+
+    def _solve() -> bool:
+        if time.perf_counter() > deadline:
+            raise _Timeout
+        if len(chosen) == n_games:
+            return True
+        pivot = min((i for i in range(n) if count[i] < gpt), key=lambda i: count[i])
+        for a, b, c in all_triples:
+            if pivot not in (a, b, c) or not _valid(a, b, c):
+                continue
+            pairs = (_pair(a, b), _pair(b, c), _pair(a, c))
+            count[a] += 1; count[b] += 1; count[c] += 1
+            used_pairs.update(pairs)
+            chosen.append((a, b, c))
+            if _solve():
+                return True
+            count[a] -= 1; count[b] -= 1; count[c] -= 1
+            used_pairs.difference_update(pairs)
+            chosen.pop()
+        return False
+
+    return _solve()
+
+
+def main(sizes: list[int], legacy_cap: float) -> None:
+    gpt = COURT_ESTIMATE_BC_RR_GAMES_PER_TEAM
+    print(f"{'teams':>5} {'seeds':>5} {'status':>12} {'engine':>7} {'ms':>7} {'legacy':>7} {'ms':>8}")
+    for n in sizes:
+        for seed_count in (0, n // 3, n // 3 + 1):
+            seeded = set(range(seed_count))
+            start = time.perf_counter()
+            status, chosen = _solve_bc_triplets(n, gpt, seeded, BC_TRIPLET_SOLVER_TIMEOUT)
+            solve_ms = (time.perf_counter() - start) * 1000
+            assert not chosen or len(chosen) == n * gpt // 3
+            search_status, _ = _backtrack_bc_triplets(n, gpt, seeded, BC_TRIPLET_BACKTRACK_NODES)
+            engine = "cp-sat" if search_status == "UNKNOWN" else "search"
+
+            start = time.perf_counter()
+            try:
+                legacy = "found" if legacy_backtracking(n, gpt, seeded, start + legacy_cap) else "none"
+                legacy_ms = f"{(time.perf_counter() - start) * 1000:.0f}"
+            except _Timeout:
+                legacy, legacy_ms = "-", f">{legacy_cap:g}s"
+            print(f"{n:>5} {seed_count:>5} {status:>12} {engine:>7} {solve_ms:>7.0f} {legacy:>7} {legacy_ms:>8}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    cap = DEFAULT_LEGACY_CAP
+    if "--legacy-cap" in args:
+        at = args.index("--legacy-cap")
+        cap = float(args[at + 1])
+        del args[at:at + 2]
+    main([int(arg) for arg in args] or DEFAULT_SIZES, cap)
@@ -0,0 +1,148 @@
+"""
+bench_consent_matching.py  —  blocked vs. full-scan consent matching
+THROWAWAY — lives under scratch/, not part of the main pipeline.
+
+Builds a synthetic consent export and participant list (5k x 5k by default)
+with realistic overlap: exact matches, guardian rows with parent contact
+details, typo'd names, shared family phones and unmatched rows.  Times the
+legacy O(rows x participants) scan over ConsentChecker._score against
+_ParticipantIndex.best_match and checks that both pick the same participant,
+score and breakdown for every row.
+
+The legacy scan re-parses every participant birthdate with pandas on every
+pair, so a full 5k x 5k scan takes tens of minutes.  By default it runs on
+an evenly spaced sample of ``legacy_rows`` consent rows and its time is
+extrapolated; pass ``all`` to scan (and compare) every row.
+
+Run:
+    cd middleware
+    python scratch/bench_consent_matching.py [rows] [participants] [legacy_rows|all]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("APP_ENV", "test")
+
+from sync.consent_checker import ConsentChecker, _ParticipantIndex  # noqa: E402
+
+FIRST = ["Jerry", "Anna", "Minh", "Linh", "David", "Grace", "Peter", "Joy", "Tuan", "Mai"]
+LAST = ["Phan", "Nguyen", "Tran", "Le", "Pham", "Hoang", "Vu", "Dang", "Bui", "Do"]
+
+
+def _participants(count: int, rng: random.Random) -> list[dict]:
+    rows = []
+    for i in range(count):
+        family_phone = f"562555{rng.randrange(count // 2 or 1):04d}"
+        rows.append(
+            {
+                "chmeetings_id": str(100000 + i),
+                "first_name": rng.choice(FIRST),
+                "last_name": rng.choice(LAST),
+                "email": f"athlete{i}@example.com" if rng.random() < 0.85 else "",
+                "phone": family_phone if rng.random() < 0.9 else "",
+                "birthdate": f"20{rng.randrange(0, 12):02d}-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+            }
+        )
+    return rows
+
+
+def _consent_rows(count: int, participants: list[dict], rng: random.Random) -> list[dict]:
+    rows = []
+    for i in range(count):
+        source = rng.choice(participants)
+        kind = rng.random()
+        name = f"{source['first_name']} {source['last_name']}".lower()
+        row = {
+            "source_row_number": i + 2,
+            "athlete_birthdate": source["birthdate"],
+            "athlete_phone": "".join(ch for ch in source["phone"] if ch.isdigit()),
+            "athlete_email": source["email"],
+            "normalized_signer_name": name,
+        }
+        if kind < 0.15:  # guardian filled in their own contact details
+            row["athlete_phone"] = f"714555{rng.randrange(10000):04d}"
+            row["athlete_email"] = f"parent{i}@example.com"
+        elif kind < 0.25:  # typo'd name, missing birthdate
+            row["normalized_signer_name"] = name + "x"
+            row["athlete_birthdate"] = ""
+        elif kind < 0.32:  # not registered at all
+            row = {
+                "source_row_number": i + 2,
+                "athlete_birthdate": "1990-01-01",
+                "athlete_phone": "",
+                "athlete_email": f"stranger{i}@example.com",
+                "normalized_signer_name": f"stranger {i}",
+            }
+        rows.append(row)
+    return rows
+
+
+def _full_scan(checker: ConsentChecker, consent_rows, participants):
+    results = []
+    for consent_row in consent_rows:
+        best = (None, -1, {"birthdate": 0, "phone": 0, "email": 0, "name": 0})
+        for participant in participants:
+            score, breakdown = checker._score(consent_row, participant)
+            if score > best[1]:
+                best = (participant, score, breakdown)
+        results.append(best)
+    return results
+
+
+def _summarize(results):
+    # A full scan returns the first zero-score participant where the index
+    # returns None; run() treats both as "no_match" with an all-zero breakdown.
+    return [
+        (None, 0, {"birthdate": 0, "phone": 0, "email": 0, "name": 0})
+        if score <= 0
+        else (participant["chmeetings_id"], score, breakdown)
+        for participant, score, breakdown in results
+    ]
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    participant_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    rng = random.Random(20260601)
+    participants = _participants(participant_count, rng)
+    consent_rows = _consent_rows(row_count, participants, rng)
+    legacy_arg = sys.argv[3] if len(sys.argv) > 3 else "50"
+    legacy_count = row_count if legacy_arg == "all" else min(int(legacy_arg), row_count)
+    step = max(1, row_count // max(legacy_count, 1))
+    sample = list(range(0, row_count, step))[:legacy_count]
+    checker = ConsentChecker(MagicMock(), MagicMock())
+
+    started = time.perf_counter()
+    legacy = _full_scan(checker, [consent_rows[i] for i in sample], participants)
+    legacy_seconds = (time.perf_counter() - started) * row_count / len(sample)
+
+    started = time.perf_counter()
+    index = _ParticipantIndex(participants)
+    blocked = [index.best_match(row) for row in consent_rows]
+    blocked_seconds = time.perf_counter() - started
+    scored = sum(len(index.candidates(row)) for row in consent_rows)
+
+    assert _summarize(legacy) == _summarize([blocked[i] for i in sample]), (
+        "blocked matching diverged"
+    )
+    matched = sum(1 for _, score, _ in blocked if score > 0)
+    estimated = "" if len(sample) == row_count else f", extrapolated from {len(sample)} rows"
+    print(f"{row_count} consent rows x {participant_count} participants ({matched} matched)")
+    print(
+        f"  full scan : {legacy_seconds:8.2f} s  "
+        f"({row_count * participant_count:,} pairs scored{estimated})"
+    )
+    print(f"  blocked   : {blocked_seconds:8.2f} s  ({scored:,} pairs scored)")
+    print(f"  speedup   : {legacy_seconds / max(blocked_seconds, 1e-9):8.1f}x  — outputs identical on {len(sample)} compared rows")
+
+
+if __name__ == "__main__":
+    main()
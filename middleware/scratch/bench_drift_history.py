@@ -0,0 +1,107 @@
+"""
+bench_drift_history.py  —  streaming + indexed drift-log parsing
+THROWAWAY — lives under scratch/, not part of the main pipeline.
+
+Writes a season of synthetic sportsfest_*.log files (60 days x 50k lines by
+default, ~0.1% drift lines) into a temp folder and times:
+
+  legacy   read_text().splitlines() + both regexes on every line
+  stream   parse_drift_events() without an index (block scan + marker prefilter)
+  indexed  parse_drift_events() with the offset index, warm, after one more
+           day of log lines was appended
+
+and checks all three return the same events.
+
+Run:
+    cd middleware
+    python scratch/bench_drift_history.py [days] [lines_per_day]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import approval_drift_history as adh  # noqa: E402
+
+
+def _legacy_parse(log_paths):
+    events = []
+    for log_path in sorted(log_paths):
+        for line in log_path.read_text(encoding="utf-8", errors="replace").splitlines():
+            hard = adh._HARD_DRIFT_RE.search(line)
+            if hard:
+                events.extend(adh._line_events(line, log_path.name))
+                continue
+            if adh._SOFT_BIRTHDATE_RE.search(line):
+                events.extend(adh._line_events(line, log_path.name))
+    return events
+
+
+def _write_day(logs_dir: Path, day: int, lines: int, rng: random.Random) -> None:
+    stamp = f"2026-{5 + day // 28:02d}-{1 + day % 28:02d}"
+    rows = []
+    for i in range(lines):
+        ts = f"{stamp} {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}"
+        roll = rng.random()
+        if roll < 0.0007:
+            rows.append(
+                f"{ts} | WARNING | [VAY SM] APPROVAL IDENTITY DRIFT for chm_id={rng.randint(10**6, 10**7)} "
+                f"(WP participant_id={rng.randint(1, 900)}): Primary sport: 'Tennis' -> 'Badminton'; "
+                f"Gender: 'Male' -> 'Female'. Prior 'approved' invalidated -> 'reapproval_required'."
+            )
+        elif roll < 0.001:
+            rows.append(
+                f"{ts} | INFO | [VAY SM] Birthdate correction for chm_id={rng.randint(10**6, 10**7)}: "
+                f"'2001-01-01' -> '2001-01-02' (age unchanged)"
+            )
+        else:
+            rows.append(
+                f"{ts} | DEBUG | [_SYNC_SINGLE_PARTICIPANT - {rng.randint(10**6, 10**7)}] "
+                f"Checking roster_id={i}: key=('Basketball - Men Team', 'Team', 'Men', 1)"
+            )
+    path = logs_dir / f"sportsfest_{stamp.replace('-', '')}.log"
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write("\n".join(rows) + "\n")
+
+
+def main() -> None:
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        logs_dir = Path(tmp)
+        for day in range(days):
+            _write_day(logs_dir, day, lines, rng)
+        index_path = logs_dir / adh.DRIFT_INDEX_NAME
+        adh.parse_drift_events(sorted(logs_dir.glob(adh.LOG_GLOB)), index_path)  # cold index
+        _write_day(logs_dir, days - 1, lines, rng)  # today's log keeps growing
+        log_paths = sorted(logs_dir.glob(adh.LOG_GLOB))
+        size_mb = sum(path.stat().st_size for path in log_paths) / 1e6
+
+        started = time.perf_counter()
+        legacy = _legacy_parse(log_paths)
+        legacy_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        streamed = adh.parse_drift_events(log_paths)
+        stream_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        indexed = adh.parse_drift_events(log_paths, index_path)
+        indexed_seconds = time.perf_counter() - started
+
+    assert legacy == streamed == indexed, "parsers disagree"
+    print(f"{len(log_paths)} logs, {size_mb:.0f} MB, {len(legacy)} drift events")
+    print(f"  legacy  : {legacy_seconds:7.2f} s")
+    print(f"  stream  : {stream_seconds:7.2f} s")
+    print(f"  indexed : {indexed_seconds:7.2f} s  (warm index, one day appended)")
+
+
+if __name__ == "__main__":
+    main()
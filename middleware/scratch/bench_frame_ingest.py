@@ -0,0 +1,135 @@
+"""
+bench_frame_ingest.py  —  columnar vs. iterrows form-export ingestion
+THROWAWAY — lives under scratch/, not part of the main pipeline.
+
+Builds a synthetic 20k-row Individual Application export (the size of a
+multi-season archive), then times the legacy row-wise loader against
+group_assignment._source_export_rows_from_frame and checks that both
+produce identical rows.  Excel I/O is excluded so only normalization is
+measured.
+
+Run:
+    cd middleware
+    python scratch/bench_frame_ingest.py [rows]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("APP_ENV", "test")
+
+from config import CHM_FIELDS, MEMBERSHIP_QUESTION  # noqa: E402
+from group_assignment import (  # noqa: E402
+    _clean_cell,
+    _normalize_phone,
+    _normalize_text,
+    _parse_form_date,
+    _source_export_rows_from_frame,
+)
+
+CHURCHES = ["RPC", "ANH", "FVC", "GAC", "NSD", "TLC", "SFV", ""]
+SPORTS = ["Basketball", "Volleyball - Men", "Badminton", "Pickleball", "Tennis", ""]
+
+
+def synthetic_export(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = random.Random(seed)
+
+    def maybe(value, blank_rate=0.1):
+        return np.nan if rng.random() < blank_rate else value
+
+    records = []
+    for i in range(rows):
+        birth = f"{rng.randint(1,12):02d}/{rng.randint(1,28):02d}/{rng.randint(1975, 2012)}"
+        records.append({
+            "First Name": f" First{i} ",
+            "Last Name": f"Last{i % 997}",
+            "Church Team": maybe(rng.choice(CHURCHES), 0.02),
+            "Email": maybe(f" Person{i}@Example.COM "),
+            "Mobile Phone": maybe(f"({rng.randint(200, 999)}) 555-{i % 10000:04d}"),
+            "Gender": rng.choice(["Male", "Female"]),
+            "Birthdate": maybe(birth if i % 3 else pd.Timestamp(birth)),
+            "My role is": "Athlete/Participant",
+            MEMBERSHIP_QUESTION: maybe("Yes", 0.5),
+            "Would the church pastor say that you belong to his church?": maybe("No", 0.5),
+            "Age verification (by the date of Sports Fest)": maybe("I am 13 or older"),
+            CHM_FIELDS["PARENT_NAME"]: maybe("Parent Name", 0.7),
+            CHM_FIELDS["PARENT_EMAIL"]: maybe("parent@example.com", 0.7),
+            CHM_FIELDS["PARENT_PHONE"]: maybe("714-555-0000", 0.7),
+            "Additional Info": maybe("notes", 0.8),
+            "Submission Date": f"2026-0{rng.randint(1, 6)}-1{rng.randint(0, 9)} 10:00",
+            "Primary Sport": rng.choice(SPORTS),
+            "Secondary Sport": rng.choice(SPORTS),
+            "Other Events": maybe("Bible Challenge", 0.6),
+        })
+    return pd.DataFrame(records)
+
+
+def legacy_rows(df: pd.DataFrame) -> list[dict[str, str]]:
+    """The pre-frame_utils iterrows loader, kept here only for comparison."""
+    rows = []
+    for _, row in df.iterrows():
+        church_code = _clean_cell(row.get("Church Team", "")).upper()
+        if not church_code:
+            continue
+        is_member = ""
+        for column in (
+            MEMBERSHIP_QUESTION,
+            "Would the church pastor say that you belong to his church?",
+        ):
+            is_member = _clean_cell(row.get(column, ""))
+            if is_member:
+                break
+        rows.append({
+            "source_row": str(int(row.name) + 2),
+            "first_name": _clean_cell(row.get("First Name", "")),
+            "last_name": _clean_cell(row.get("Last Name", "")),
+            "email": _normalize_text(row.get("Email", "")),
+            "email_display": _clean_cell(row.get("Email", "")),
+            "mobile_phone": _normalize_phone(row.get("Mobile Phone", "")),
+            "mobile_phone_display": _clean_cell(row.get("Mobile Phone", "")),
+            "gender": _clean_cell(row.get("Gender", "")),
+            "birth_date": _parse_form_date(row.get("Birthdate", "")),
+            "church_code": church_code,
+            "role": _clean_cell(row.get("My role is", "")),
+            "is_member": is_member,
+            "age_verification": _clean_cell(row.get("Age verification (by the date of Sports Fest)", "")),
+            "parent_name": _clean_cell(row.get(CHM_FIELDS["PARENT_NAME"], "")),
+            "parent_email": _clean_cell(row.get(CHM_FIELDS["PARENT_EMAIL"], "")),
+            "parent_phone": _clean_cell(row.get(CHM_FIELDS["PARENT_PHONE"], "")),
+            "additional_info": _clean_cell(row.get("Additional Info", "")),
+            "submission_date": _clean_cell(row.get("Submission Date", "")),
+            "primary_sport": _clean_cell(row.get("Primary Sport", "")),
+            "secondary_sport": _clean_cell(row.get("Secondary Sport", "")),
+            "other_events": _clean_cell(row.get("Other Events", "")),
+        })
+    return rows
+
+
+def _time(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    df = synthetic_export(rows)
+    legacy, legacy_s = _time(legacy_rows, df)
+    columnar, columnar_s = _time(_source_export_rows_from_frame, df)
+    assert legacy == columnar, "columnar loader diverged from the iterrows loader"
+    print(f"rows={rows}  kept={len(columnar)}")
+    print(f"iterrows loader : {legacy_s:8.3f} s")
+    print(f"columnar loader : {columnar_s:8.3f} s  ({legacy_s / columnar_s:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
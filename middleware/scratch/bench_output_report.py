@@ -0,0 +1,120 @@
+"""
+bench_output_report.py  —  produce-schedule report build time vs game count
+THROWAWAY — lives under scratch/, not part of the main pipeline.
+
+Builds synthetic schedule_input / schedule_output documents (gym-core and
+racquet resources across four days, one assignment per game on a real
+resource slot, a sprinkling of double-booked venue columns) and times
+_write_schedule_output_report at each size.  The diagnostics tab is stubbed
+out so the numbers isolate the grid tabs this module builds; pass --with-
+diagnostics to include it.  Per-game cost should stay flat as games grow.
+
+Run:
+    cd middleware
+    python scratch/bench_output_report.py [--with-diagnostics] [games ...]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("APP_ENV", "test")
+
+import scheduling.output_report as output_report  # noqa: E402
+
+DEFAULT_SIZES = [500, 1_000, 2_000, 3_500, 5_000]
+EVENTS = [
+    ("Basketball - Men Team", "Basketball Court", 60, "Gym Core"),
+    ("Volleyball - Women Team", "Volleyball Court", 60, "Gym Core"),
+    ("Badminton", "Badminton Court", 30, ""),
+    ("Pickleball", "Pickleball Court", 30, ""),
+    ("Table Tennis", "Table Tennis Table", 20, ""),
+]
+DAYS = ["Sat-1", "Sun-1", "Sat-2", "Sun-2"]
+
+
+def build_documents(game_count: int) -> tuple[dict, dict]:
+    # Resources scale with games so slots per resource stay constant, the way
+    # a bigger Sports Fest books more courts rather than longer days.
+    per_type = max(2, game_count // 120)
+    resources = []
+    cells_by_type: dict[str, list[tuple[str, str]]] = {}
+    for _, rtype, minutes, pool in EVENTS:
+        for day in DAYS:
+            for court in range(1, per_type + 1):
+                rid = f"{rtype[:3].upper()}-{day}-{court}"
+                resources.append({
+                    "resource_id": rid,
+                    "resource_type": rtype,
+                    "label": f"Court-{court}",
+                    "day": day,
+                    "open_time": "08:00",
+                    "close_time": "18:00",
+                    "slot_minutes": minutes,
+                    "solver_pool": pool,
+                    "exclusive_group": f"Gym {court % 3}" if pool else "",
+                    "venue_name": f"{rtype} Hall",
+                })
+                for start in range(8 * 60, 18 * 60 - minutes + 1, minutes):
+                    cells_by_type.setdefault(rtype, []).append(
+                        (rid, f"{day}-{start // 60:02d}:{start % 60:02d}")
+                    )
+
+    games, assignments = [], []
+    cursor: dict[str, int] = {}
+    for index in range(game_count):
+        event, rtype, minutes, _ = EVENTS[index % len(EVENTS)]
+        games.append({
+            "game_id": f"G{index:05d}",
+            "event": event,
+            "stage": "Pool",
+            "round": index % 5 + 1,
+            "duration_minutes": minutes,
+            "resource_type": rtype,
+            "team_a_label": f"T{index % 300}",
+            "team_b_label": f"T{(index * 7 + 1) % 300}",
+        })
+        cells = cells_by_type[rtype]
+        n = cursor.get(rtype, 0)
+        cursor[rtype] = n + 1
+        # Stride through the cells so every day and court gets games.
+        rid, slot = cells[(n * 7919) % len(cells)]
+        assignments.append({"game_id": games[-1]["game_id"], "resource_id": rid, "slot": slot})
+
+    schedule_input = {"games": games, "resources": resources, "playoff_slots": [], "day_order": DAYS}
+    schedule_output = {
+        "solved_at": "2026-05-15T00:00:00",
+        "status": "FEASIBLE",
+        "assignments": assignments,
+        "unscheduled": [],
+        "conflict_audit": [],
+    }
+    return schedule_input, schedule_output
+
+
+def main(sizes: list[int], with_diagnostics: bool) -> None:
+    if not with_diagnostics:
+        output_report._write_schedule_diagnostics_tab = lambda ws, *_: setattr(ws, "title", "Schedule-Diagnostics")
+    print(f"{'games':>6} {'resources':>9} {'report':>9} {'us/game':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            schedule_input, schedule_output = build_documents(size)
+            out = Path(tmp) / f"report-{size}.xlsx"
+            start = time.perf_counter()
+            output_report._write_schedule_output_report(out, schedule_output, schedule_input)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{size:>6} {len(schedule_input['resources']):>9} {elapsed * 1000:>7.0f}ms "
+                f"{elapsed / size * 1e6:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    with_diagnostics = "--with-diagnostics" in args
+    main([int(arg) for arg in args if arg != "--with-diagnostics"] or DEFAULT_SIZES, with_diagnostics)
@@ -0,0 +1,214 @@
+"""
+bench_schedule_contracts.py  —  schedule_input / schedule_output contract validation at scale
+THROWAWAY — lives under scratch/, not part of the main pipeline.
+
+Builds synthetic schedule_input.json / schedule_output.json documents with
+5k–50k games (resources, playoff slots, precedence chains, conflict edges,
+one assignment per game and a conflict audit), times validate_schedule_input,
+validate_schedule_output and validate_output_against_input at each size, and
+checks that a copy with injected violations still raises the same number of
+errors at every size.
+
+Run:
+    cd middleware
+    python scratch/bench_schedule_contracts.py [games ...]
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("APP_ENV", "test")
+
+from schedule_contracts import (  # noqa: E402
+    ScheduleContractError,
+    validate_output_against_input,
+    validate_schedule_input,
+    validate_schedule_output,
+)
+
+DEFAULT_SIZES = [5_000, 10_000, 25_000, 50_000]
+EVENTS = [
+    ("Basketball - Men Team", "Gym Court", 60),
+    ("Volleyball - Men Team", "Gym Court", 60),
+    ("Volleyball - Women Team", "Gym Court", 60),
+    ("Badminton", "Badminton Court", 30),
+    ("Pickleball", "Pickleball Court", 30),
+    ("Table Tennis", "Table Tennis Table", 20),
+]
+DAYS = ["Sat-1", "Sun-1", "Sat-2", "Sun-2"]
+
+
+def build_documents(game_count: int) -> tuple[dict, dict]:
+    resources = []
+    slots_by_resource: dict[str, list[str]] = {}
+    per_type = max(4, game_count // 200)
+    for rtype in sorted({rtype for _, rtype, _ in EVENTS}):
+        for day in DAYS:
+            for court in range(1, per_type + 1):
+                rid = f"{rtype[:3].upper()}-{day}-{court}"
+                resources.append({
+                    "resource_id": rid,
+                    "resource_type": rtype,
+                    "label": f"{rtype} {court}",
+                    "day": day,
+                    "open_time": "08:00",
+                    "close_time": "20:00",
+                    "slot_minutes": 60 if rtype == "Gym Court" else 30,
+                    "exclusive_group": f"{day}-{rtype}",
+                    "venue_name": "Main Campus",
+                })
+                step = 60 if rtype == "Gym Court" else 30
+                slots_by_resource[rid] = [
+                    f"{day}-{8 + minute // 60:02d}:{minute % 60:02d}"
+                    for minute in range(0, 12 * 60, step)
+                ]
+
+    games = []
+    for index in range(game_count):
+        event, rtype, duration = EVENTS[index % len(EVENTS)]
+        games.append({
+            "game_id": f"G{index:06d}",
+            "event": event,
+            "stage": "Pool",
+            "pool_id": f"P{index % 97}",
+            "round": index % 5 + 1,
+            "duration_minutes": duration,
+            "resource_type": rtype,
+            "team_a_id": f"T{index % 400}",
+            "team_b_id": f"T{(index * 7 + 1) % 400}",
+            "team_a_label": f"Team {index % 400}",
+            "team_b_label": f"Team {(index * 7 + 1) % 400}",
+            "division_id": f"D{index % 13}",
+            "division_entry_count": 8,
+        })
+    playoff_slots = [
+        {
+            "game_id": f"PO{index:04d}",
+            "resource_id": resources[index % len(resources)]["resource_id"],
+            "slot": slots_by_resource[resources[index % len(resources)]["resource_id"]][-1],
+            "event": "Basketball - Men Team",
+            "stage": "Final",
+        }
+        for index in range(max(8, game_count // 500))
+    ]
+    precedence = [
+        {"before_game_id": f"G{index:06d}", "after_game_id": f"G{index + 6:06d}", "min_gap_slots": 1}
+        for index in range(0, game_count - 6, 50)
+    ]
+    team_conflicts = [
+        {
+            "team_a_id": f"T{index}",
+            "team_b_id": f"T{index + 1}",
+            "event_a": EVENTS[index % 6][0],
+            "event_b": EVENTS[(index + 1) % 6][0],
+            "shared_count": 2,
+            "primary_overlap_count": 1,
+            "secondary_only_count": 1,
+            "shared_participant_ids": ["1", "2"],
+            "shared_participant_names": ["A", "B"],
+        }
+        for index in range(0, 400, 2)
+    ]
+    schedule_input = {
+        "generated_at": "2026-05-15T00:00:00",
+        "games": games,
+        "resources": resources,
+        "playoff_slots": playoff_slots,
+        "precedence": precedence,
+        "team_conflicts": team_conflicts,
+        "day_order": DAYS,
+    }
+
+    assignments = []
+    cursor: dict[str, int] = {}
+    by_type = {}
+    for resource in resources:
+        by_type.setdefault(resource["resource_type"], []).append(resource["resource_id"])
+    for game in games:
+        pool = by_type[game["resource_type"]]
+        n = cursor.get(game["resource_type"], 0)
+        cursor[game["resource_type"]] = n + 1
+        rid = pool[n % len(pool)]
+        slot_list = slots_by_resource[rid]
+        assignments.append({
+            "game_id": game["game_id"],
+            "resource_id": rid,
+            "slot": f"{slot_list[(n // len(pool)) % len(slot_list)]}#{n // (len(pool) * len(slot_list))}",
+        })
+    schedule_output = {
+        "solved_at": "2026-05-15T00:00:00",
+        "status": "FEASIBLE",
+        "solver_wall_seconds": 12.5,
+        "assignments": assignments,
+        "unscheduled": [],
+        "pool_results": [
+            {"resource_type": rtype, "status": "FEASIBLE", "solver_wall_seconds": 1.0}
+            for rtype in by_type
+        ],
+        "conflict_audit": [
+            {
+                "team_a_label": edge["team_a_id"],
+                "team_b_label": edge["team_b_id"],
+                "status": "SeparatedInSchedule",
+                "shared_count": 2,
+                "overlap_count": 0,
+            }
+            for edge in team_conflicts
+        ],
+    }
+    return schedule_input, schedule_output
+
+
+def corrupt(schedule_input: dict, schedule_output: dict) -> tuple[dict, dict]:
+    bad_input = copy.deepcopy(schedule_input)
+    games = bad_input["games"]
+    for index in range(0, len(games), 997):
+        games[index]["duration_minutes"] = "60"
+        games[index]["x_note"] = "ok"
+        games[index]["surprise"] = 1
+    games.append("not a game")
+    bad_input["resources"][0]["open_time"] = "25:00"
+    bad_output = copy.deepcopy(schedule_output)
+    for index in range(0, len(bad_output["assignments"]), 991):
+        bad_output["assignments"][index]["slot"] = ""
+    return bad_input, bad_output
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    try:
+        result = fn(*args)
+    except ScheduleContractError as exc:
+        result = exc
+    return time.perf_counter() - start, result
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'games':>7} {'input':>9} {'output':>9} {'cross':>9}   errors(in/out)")
+    for size in sizes:
+        schedule_input, schedule_output = build_documents(size)
+        t_in, warnings_in = _timed(validate_schedule_input, schedule_input)
+        t_out, warnings_out = _timed(validate_schedule_output, schedule_output)
+        t_cross, _ = _timed(validate_output_against_input, schedule_output, schedule_input)
+        assert isinstance(warnings_in, list), warnings_in
+        assert isinstance(warnings_out, list), warnings_out
+
+        bad_input, bad_output = corrupt(schedule_input, schedule_output)
+        _, err_in = _timed(validate_schedule_input, bad_input)
+        _, err_out = _timed(validate_schedule_output, bad_output)
+        assert isinstance(err_in, ScheduleContractError)
+        assert isinstance(err_out, ScheduleContractError)
+        print(
+            f"{size:>7} {t_in * 1000:>7.0f}ms {t_out * 1000:>7.0f}ms {t_cross * 1000:>7.0f}ms"
+            f"   {len(err_in.errors)}/{len(err_out.errors)}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
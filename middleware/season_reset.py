@@ -9,21 +9,33 @@ Usage (via main.py):
     python main.py reset-season --year 2025 --dry-run    # preview only
     python main.py reset-season --year 2025 --archive-only
     python main.py reset-season --year 2025 --reset-only
+
+Full-membership live runs are resumable: every completed (person, step)
+pair is appended to a checkpoint journal
+(``DATA_DIR/season_reset_<year>.journal.jsonl`` via main.py), and a rerun
+skips the steps already recorded there — including the profile and notes
+reads for fully completed members.
+Members are processed by a small worker pool; pacing comes from the
+ChMeetings connector's shared rate limiter.
 """
 
 from __future__ import annotations
 
 import datetime
-import time
-from typing import Any, Dict, List, Optional
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from loguru import logger
 from tqdm import tqdm
 
-from chmeetings.backend_connector import ChMeetingsConnector, CHM_MIN_REQUEST_INTERVAL_SECONDS
+from chmeetings.backend_connector import ChMeetingsConnector
 from wordpress.frontend_connector import WordPressConnector
 from config import (
     Config,
+    DATA_DIR,
     SF_FIELD_IDS,
     SF_CHECKBOX_FIELD_IDS,
     SF_DROPDOWN_FIELD_IDS,
@@ -38,6 +50,82 @@ from config import (
 )
 
 
+SEASON_RESET_WORKERS = 4
+ARCHIVE_STEP = "archive"
+RESET_STEP = "reset"
+
+
+def default_journal_path(year: int) -> Path:
+    return DATA_DIR / f"season_reset_{year}.journal.jsonl"
+
+
+class ResetJournal:
+    """Append-only JSONL checkpoint of completed (person, step) pairs for one year."""
+
+    def __init__(self, path: Path, year: int, *, resume: bool = True) -> None:
+        self.path = Path(path)
+        self.year = year
+        self._lock = threading.Lock()
+        self._tail_checked = False
+        self._done: Set[Tuple[str, str]] = set(self._load()) if resume else set()
+
+    def _load(self) -> Iterable[Tuple[str, str]]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # a torn last line from a crash mid-write
+            if isinstance(entry, dict) and entry.get("year") == self.year:
+                yield str(entry.get("person_id")), str(entry.get("step"))
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def is_done(self, person_id: str, step: str) -> bool:
+        return (person_id, step) in self._done
+
+    def completed_people(self, steps: Iterable[str]) -> Set[str]:
+        """Person IDs for which every one of ``steps`` is recorded."""
+        steps = list(steps)
+        return {pid for pid, _ in self._done if all((pid, step) in self._done for step in steps)}
+
+    def _ends_mid_line(self) -> bool:
+        """Whether the file's last record was torn off before its newline."""
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(0, 2)
+                if handle.tell() == 0:
+                    return False
+                handle.seek(-1, 2)
+                return handle.read(1) != b"\n"
+        except FileNotFoundError:
+            return False
+
+    def mark(self, person_id: str, step: str) -> None:
+        with self._lock:
+            if (person_id, step) in self._done:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                if not self._tail_checked:
+                    # Close off a torn line so the first new record is not
+                    # glued onto it and lost on the next load.
+                    if self._ends_mid_line():
+                        handle.write("\n")
+                    self._tail_checked = True
+                handle.write(json.dumps({
+                    "year": self.year,
+                    "person_id": person_id,
+                    "step": step,
+                    "at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                }) + "\n")
+            self._done.add((person_id, step))
+
+
 def _build_reset_additional_fields(current_fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Return the additional_fields payload that clears every SF custom field
@@ -166,9 +254,11 @@ class SeasonResetter:
         self,
         chm_connector: ChMeetingsConnector,
         wp_connector: WordPressConnector,
+        workers: int = SEASON_RESET_WORKERS,
     ) -> None:
         self.chm = chm_connector
         self.wp  = wp_connector
+        self.workers = max(1, workers)
 
     # ------------------------------------------------------------------ #
     # Public entry point                                                   #
@@ -182,6 +272,7 @@ class SeasonResetter:
         archive_only: bool = False,
         reset_only: bool = False,
         person_id: Optional[str] = None,
+        journal: Optional[ResetJournal] = None,
     ) -> bool:
         """
         Execute the season reset.
@@ -193,6 +284,8 @@ class SeasonResetter:
             reset_only: If True, skip archive notes and only clear fields.
             person_id: If given, process only this one ChMeetings person ID
                 instead of the entire VAY-SM group.  Useful for spot-testing.
+            journal: Checkpoint journal.  Steps it already records are
+                skipped and newly completed steps are appended (live runs only).
 
         Returns:
             True if the operation completed without fatal errors.
@@ -202,6 +295,9 @@ class SeasonResetter:
         logger.info(f"{mode_tag}Season reset for {year} — scope: {scope} "
                     f"(archive={'yes' if not reset_only else 'no'}, "
                     f"reset={'yes' if not archive_only else 'no'})")
+        if dry_run:
+            journal = None
+        steps = [step for step, wanted in ((ARCHIVE_STEP, not reset_only), (RESET_STEP, not archive_only)) if wanted]
 
         # Step 1 — resolve the member list
         if person_id:
@@ -211,8 +307,12 @@ class SeasonResetter:
                 return False
             members = [member]
         else:
-            members = self._get_vaysm_members(Config.VAYSM_GROUP_ID)
-            if not members:
+            completed: Set[str] = set()
+            if journal is not None and len(journal):
+                logger.info(f"Resuming from checkpoint journal {journal.path} ({len(journal)} completed step(s)).")
+                completed = journal.completed_people(steps)
+            members = self._get_vaysm_members(Config.VAYSM_GROUP_ID, skip_ids=completed)
+            if not members and not completed:
                 logger.error("No VAY-SM members found; aborting reset.")
                 return False
 
@@ -224,67 +324,97 @@ class SeasonResetter:
             wp_participants_by_chmid = self._fetch_wp_participants_by_chmid()
 
         # Step 3 — process each member
+        def process(member: Dict[str, Any]) -> int:
+            return self._process_member(
+                member,
+                year,
+                wp_participants_by_chmid,
+                dry_run=dry_run,
+                archive_only=archive_only,
+                reset_only=reset_only,
+                journal=journal,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(members)))) as executor:
+            errors = sum(tqdm(executor.map(process, members), total=len(members),
+                              desc="Processing members", unit="person"))
+
+        logger.info(f"Season reset complete. Members processed: {len(members)}, errors: {errors}.")
+        return errors == 0
+
+    def _process_member(
+        self,
+        member: Dict[str, Any],
+        year: int,
+        wp_participants_by_chmid: Dict[str, Dict[str, Any]],
+        *,
+        dry_run: bool,
+        archive_only: bool,
+        reset_only: bool,
+        journal: Optional[ResetJournal],
+    ) -> int:
+        """Archive and/or reset one member; return the number of errors."""
+        pid        = str(member.get("id") or member.get("person_id", ""))
+        first_name = member.get("first_name", "")
+        last_name  = member.get("last_name", "")
+        if not pid:
+            logger.warning(f"Skipping member with no ID: {member}")
+            return 1
         errors = 0
         archive_note_prefix = f"Sports Fest {year} Archive"
 
-        for member in tqdm(members, desc="Processing members", unit="person"):
-            pid        = str(member.get("id") or member.get("person_id", ""))
-            first_name = member.get("first_name", "")
-            last_name  = member.get("last_name", "")
-            if not pid:
-                logger.warning(f"Skipping member with no ID: {member}")
-                errors += 1
-                continue
-
-            # Build reset payload from the person's actual current fields so we
-            # only touch fields that have values — sending resets for unfilled
-            # fields causes a 500 from the ChMeetings API.
-            current_fields = member.get("additional_fields", [])
-            reset_fields_payload = _build_reset_additional_fields(current_fields)
-
-            # a. Archive step
-            if not reset_only:
-                wp_participant = wp_participants_by_chmid.get(pid)
-                note = _build_archive_note(year, member, wp_participant)
-                if dry_run:
-                    logger.info(f"[DRY RUN] Would archive {first_name} {last_name} ({pid}):\n  {note}")
-                else:
-                    time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
-                    # Guard against duplicates: skip if an archive note for this
-                    # year already exists on the profile.
-                    existing_notes = self.chm.get_person_notes(pid)
-                    already_archived = any(
-                        archive_note_prefix in str(n.get("note", "") or n.get("content", "") or n.get("body", ""))
-                        for n in existing_notes
-                    )
-                    if already_archived:
-                        logger.info(f"Archive note for {year} already exists on {pid} — skipping.")
-                    else:
-                        ok = self.chm.add_member_note(pid, note)
-                        if not ok:
-                            logger.warning(f"Failed to write archive note for {pid}")
-                            errors += 1
-
-            # b. Reset step
-            if not archive_only:
-                if dry_run:
-                    logger.info(f"[DRY RUN] Would reset {len(reset_fields_payload)} field(s) "
-                                f"for {first_name} {last_name} ({pid}): "
-                                f"{[f['field_id'] for f in reset_fields_payload]}")
+        # Build reset payload from the person's actual current fields so we
+        # only touch fields that have values — sending resets for unfilled
+        # fields causes a 500 from the ChMeetings API.
+        current_fields = member.get("additional_fields", [])
+        reset_fields_payload = _build_reset_additional_fields(current_fields)
+
+        # a. Archive step
+        if not reset_only and not (journal is not None and journal.is_done(pid, ARCHIVE_STEP)):
+            wp_participant = wp_participants_by_chmid.get(pid)
+            note = _build_archive_note(year, member, wp_participant)
+            if dry_run:
+                logger.info(f"[DRY RUN] Would archive {first_name} {last_name} ({pid}):\n  {note}")
+            else:
+                # Guard against duplicates: skip if an archive note for this
+                # year already exists on the profile.  Still needed with a
+                # journal: a crash can land between the POST and the checkpoint.
+                existing_notes = self.chm.get_person_notes(pid)
+                already_archived = any(
+                    archive_note_prefix in str(n.get("note", "") or n.get("content", "") or n.get("body", ""))
+                    for n in existing_notes
+                )
+                if already_archived:
+                    logger.info(f"Archive note for {year} already exists on {pid} — skipping.")
+                    if journal is not None:
+                        journal.mark(pid, ARCHIVE_STEP)
+                elif self.chm.add_member_note(pid, note):
+                    if journal is not None:
+                        journal.mark(pid, ARCHIVE_STEP)
                 else:
-                    if not reset_fields_payload:
-                        logger.info(f"No SF fields with values found for {first_name} {last_name} ({pid}) — nothing to reset.")
-                    else:
-                        ok = self._reset_fields_with_fallback(
-                            pid, first_name, last_name, reset_fields_payload,
-                            person_data=member,
-                        )
-                        if not ok:
-                            logger.warning(f"Failed to reset fields for {pid}")
-                            errors += 1
-
-        logger.info(f"Season reset complete. Members processed: {len(members)}, errors: {errors}.")
-        return errors == 0
+                    logger.warning(f"Failed to write archive note for {pid}")
+                    errors += 1
+
+        # b. Reset step
+        if not archive_only and not (journal is not None and journal.is_done(pid, RESET_STEP)):
+            if dry_run:
+                logger.info(f"[DRY RUN] Would reset {len(reset_fields_payload)} field(s) "
+                            f"for {first_name} {last_name} ({pid}): "
+                            f"{[f['field_id'] for f in reset_fields_payload]}")
+            elif not reset_fields_payload:
+                logger.info(f"No SF fields with values found for {first_name} {last_name} ({pid}) — nothing to reset.")
+                if journal is not None:
+                    journal.mark(pid, RESET_STEP)
+            elif self._reset_fields_with_fallback(
+                pid, first_name, last_name, reset_fields_payload,
+                person_data=member,
+            ):
+                if journal is not None:
+                    journal.mark(pid, RESET_STEP)
+            else:
+                logger.warning(f"Failed to reset fields for {pid}")
+                errors += 1
+        return errors
 
     # ------------------------------------------------------------------ #
     # Private helpers                                                      #
@@ -475,39 +605,45 @@ class SeasonResetter:
         logger.info("=== Probe complete ===")
         return any_passed
 
-    def _get_vaysm_members(self, group_id: str) -> List[Dict[str, Any]]:
+    def _get_vaysm_members(self, group_id: str, skip_ids: Set[str] = frozenset()) -> List[Dict[str, Any]]:
         """Fetch all members of the VAY-SM group from ChMeetings.
 
         get_group_people() returns basic person records without additional_fields.
-        We follow up with get_person() for each member so the full profile
-        (including custom field values) is available for reset payload building
-        and checklist archiving.
+        We follow up with get_person() for each member (concurrently, behind the
+        connector's rate limiter) so the full profile (including custom field
+        values) is available for reset payload building and checklist archiving.
+        Members in ``skip_ids`` (already completed per the journal) are dropped
+        without a profile read.
         """
         logger.info(f"Fetching VAY-SM members from group {group_id}")
         members = self.chm.get_group_people(group_id)
         if not members:
             return []
 
-        logger.info(f"Enriching {len(members)} member profile(s) with additional_fields...")
+        pending = [m for m in members if str(m.get("id") or m.get("person_id", "")) not in skip_ids]
+        if len(pending) < len(members):
+            logger.info(f"Skipping {len(members) - len(pending)} member(s) already completed per the journal.")
+
+        def enrich(m: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            pid = str(m.get("id") or m.get("person_id", ""))
+            return self.chm.get_person(pid) if pid else m
+
+        logger.info(f"Enriching {len(pending)} member profile(s) with additional_fields...")
         enriched = []
         skipped = 0
-        for m in members:
-            pid = str(m.get("id") or m.get("person_id", ""))
-            if not pid:
-                enriched.append(m)
-                continue
-            full = self.chm.get_person(pid)
-            time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
-            if full:
-                enriched.append(full)
-            else:
-                # get_person() returns None for both 404 (deleted person) and
-                # exhausted 429 retries. Either way we cannot process this member.
-                logger.warning(
-                    f"Skipping person {pid} — could not retrieve from ChMeetings "
-                    f"(deleted record or persistent rate limit)."
-                )
-                skipped += 1
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(pending)))) as executor:
+            for m, full in zip(pending, executor.map(enrich, pending)):
+                if full:
+                    enriched.append(full)
+                else:
+                    # get_person() returns None for both 404 (deleted person) and
+                    # exhausted 429 retries. Either way we cannot process this member.
+                    pid = str(m.get("id") or m.get("person_id", ""))
+                    logger.warning(
+                        f"Skipping person {pid} — could not retrieve from ChMeetings "
+                        f"(deleted record or persistent rate limit)."
+                    )
+                    skipped += 1
         if skipped:
             logger.warning(f"Skipped {skipped} member(s) that could not be retrieved from ChMeetings.")
         return enriched
@@ -1,6 +1,7 @@
 # Begin of sync/churches.py
 import pandas as pd
 from loguru import logger
+from frame_utils import frame_records
 from wordpress.frontend_connector import WordPressConnector
 
 # Exact header of the Church Application Form's file-attachment column for the
@@ -25,7 +26,7 @@ class ChurchSyncer:
 
             has_insurance_column = INSURANCE_ATTACHMENT_COLUMN in df.columns
 
-            for _, row in df.iterrows():
+            for row in frame_records(df):
                 wp_church = {
                     "church_name": row["Church Name"],
                     "church_code": row["Church Code"].strip().upper(),
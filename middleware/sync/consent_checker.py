@@ -1,13 +1,22 @@
 import datetime
-import time
+import math
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 from loguru import logger
 
-from chmeetings.backend_connector import ChMeetingsConnector
+from chmeetings.backend_connector import ChMeetingsConnector, ChMeetingsReadError
 from config import DATA_DIR, SF_FIELD_IDS
+from frame_utils import (
+    datetime_column,
+    iso_date_column,
+    phone_column,
+    source_row_numbers,
+    text_column,
+    zip_records,
+)
 from wordpress.frontend_connector import WordPressConnector
 
 
@@ -24,6 +33,11 @@ CONSENT_SCORE_WEIGHTS = {
     "name": 16,
 }
 CONSENT_AUDIT_FILE = "consent_check_audit.xlsx"
+# Apply phase: a bulk people snapshot is taken only when the organization
+# fits in fewer get_people pages than there are matches to look up; writes go
+# through a small worker pool that shares the connector's rate limiter.
+CONSENT_SNAPSHOT_PAGE_SIZE = 100
+CONSENT_APPLY_WORKERS = 4
 CONSENT_REQUIRED_COLUMNS = [
     "First Name",
     "Last Name",
@@ -88,6 +102,83 @@ def _format_breakdown(breakdown: Dict[str, int]) -> str:
     )
 
 
+_MATCH_FIELDS = (
+    ("birthdate", "athlete_birthdate"),
+    ("phone", "athlete_phone"),
+    ("email", "athlete_email"),
+    ("name", "normalized_signer_name"),
+)
+
+
+def _participant_keys(participant: Dict[str, Any]) -> Dict[str, str]:
+    """Normalize the participant fields compared against a consent row."""
+    return {
+        "birthdate": _normalize_birthdate(participant.get("birthdate")),
+        "phone": _normalize_phone(participant.get("phone", "")),
+        "email": _normalize_text(participant.get("email", "")),
+        "name": _full_name(
+            participant.get("first_name", ""), participant.get("last_name", "")
+        ),
+    }
+
+
+def _score_keys(
+    consent_row: Dict[str, Any], keys: Dict[str, str]
+) -> Tuple[int, Dict[str, int]]:
+    breakdown = {
+        field: CONSENT_SCORE_WEIGHTS[field]
+        if consent_row[row_key] and consent_row[row_key] == keys[field]
+        else 0
+        for field, row_key in _MATCH_FIELDS
+    }
+    return sum(breakdown.values()), breakdown
+
+
+class _ParticipantIndex:
+    """Participants normalized once and blocked by exact-match key.
+
+    Every scoring field is an exact comparison, so a participant that shares
+    no non-empty birthdate, phone, email or name with a consent row scores 0
+    and can never be its match.  ``best_match`` therefore scores only the
+    participants found in the row's four hash buckets, in original order so
+    ties resolve exactly as a full scan would.
+    """
+
+    def __init__(self, participants: List[Dict[str, Any]]) -> None:
+        self.participants = participants
+        self.keys = [_participant_keys(participant) for participant in participants]
+        self.buckets: Dict[str, Dict[str, List[int]]] = {
+            field: {} for field, _ in _MATCH_FIELDS
+        }
+        for position, keys in enumerate(self.keys):
+            for field, _ in _MATCH_FIELDS:
+                if keys[field]:
+                    self.buckets[field].setdefault(keys[field], []).append(position)
+
+    def candidates(self, consent_row: Dict[str, Any]) -> List[int]:
+        positions = set()
+        for field, row_key in _MATCH_FIELDS:
+            value = consent_row[row_key]
+            if value:
+                positions.update(self.buckets[field].get(value, ()))
+        return sorted(positions)
+
+    def best_match(
+        self, consent_row: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], int, Dict[str, int]]:
+        """Return ``(participant, score, breakdown)`` for the top-scoring candidate."""
+        best_participant: Optional[Dict[str, Any]] = None
+        best_score = -1
+        best_breakdown = {field: 0 for field, _ in _MATCH_FIELDS}
+        for position in self.candidates(consent_row):
+            score, breakdown = _score_keys(consent_row, self.keys[position])
+            if score > best_score:
+                best_score = score
+                best_breakdown = breakdown
+                best_participant = self.participants[position]
+        return best_participant, best_score, best_breakdown
+
+
 class ConsentChecker:
     """Match consent-form exports to registered participants and update ChMeetings."""
 
@@ -110,40 +201,45 @@ class ConsentChecker:
                 f"Missing required column(s) in consent export: {missing_columns}"
             )
 
-        rows: List[Dict[str, Any]] = []
-        for index, row in df.iterrows():
-            rows.append(
-                {
-                    "source_row_number": index + 2,
-                    "signer_first_name": str(row.get("First Name", "") or "").strip(),
-                    "signer_last_name": str(row.get("Last Name", "") or "").strip(),
-                    "signer_name": str(
-                        f"{row.get('First Name', '') or ''} {row.get('Last Name', '') or ''}"
-                    ).strip(),
-                    "athlete_phone": _normalize_phone(row.get("Athlete Mobile Phone", "")),
-                    "athlete_email": _normalize_text(row.get("Athlete Email", "")),
-                    "athlete_birthdate": _normalize_birthdate(
-                        row.get("Athlete Birthdate", "")
-                    ),
-                    "signer_type": _normalize_signer_type(row.get("Select one:", "")),
-                    "guardian_name": str(
-                        row.get("Full Name of the parents or legal guardian", "") or ""
-                    ).strip(),
-                    "guardian_email": _normalize_text(
-                        row.get("Email of the parents or legal guardian", "")
-                    ),
-                    "guardian_phone": _normalize_phone(
-                        row.get("Cell phone of the parents or legal guardian", "")
-                    ),
-                    "submission_date": _parse_submission_date(row.get("Submission Date", "")),
-                    "submission_date_display": str(
-                        row.get("Submission Date", "") or ""
-                    ).strip(),
-                    "normalized_signer_name": _full_name(
-                        row.get("First Name", ""), row.get("Last Name", "")
-                    ),
-                }
-            )
+        first_names = text_column(df, "First Name")
+        last_names = text_column(df, "Last Name")
+        signer_names = [
+            f"{first} {last}".strip() for first, last in zip(first_names, last_names)
+        ]
+        rows = zip_records(
+            {
+                "source_row_number": source_row_numbers(df),
+                "signer_first_name": first_names,
+                "signer_last_name": last_names,
+                "signer_name": signer_names,
+                "athlete_phone": phone_column(df, "Athlete Mobile Phone"),
+                "athlete_email": text_column(
+                    df, "Athlete Email", lower=True, collapse_whitespace=True
+                ),
+                "athlete_birthdate": iso_date_column(df, "Athlete Birthdate", formats=()),
+                "signer_type": [
+                    _normalize_signer_type(value)
+                    for value in text_column(df, "Select one:")
+                ],
+                "guardian_name": text_column(
+                    df, "Full Name of the parents or legal guardian"
+                ),
+                "guardian_email": text_column(
+                    df,
+                    "Email of the parents or legal guardian",
+                    lower=True,
+                    collapse_whitespace=True,
+                ),
+                "guardian_phone": phone_column(
+                    df, "Cell phone of the parents or legal guardian"
+                ),
+                "submission_date": datetime_column(df, "Submission Date"),
+                "submission_date_display": text_column(df, "Submission Date"),
+                "normalized_signer_name": [
+                    _normalize_text(name) for name in signer_names
+                ],
+            }
+        )
 
         logger.info(f"Loaded {len(rows)} consent row(s) from {path}")
         return rows
@@ -152,32 +248,7 @@ class ConsentChecker:
         self, consent_row: Dict[str, Any], participant: Dict[str, Any]
     ) -> Tuple[int, Dict[str, int]]:
         """Return weighted score and per-field breakdown for one row/candidate pair."""
-        participant_birthdate = _normalize_birthdate(participant.get("birthdate"))
-        participant_phone = _normalize_phone(participant.get("phone", ""))
-        participant_email = _normalize_text(participant.get("email", ""))
-        participant_name = _full_name(
-            participant.get("first_name", ""), participant.get("last_name", "")
-        )
-
-        breakdown = {
-            "birthdate": CONSENT_SCORE_WEIGHTS["birthdate"]
-            if consent_row["athlete_birthdate"]
-            and consent_row["athlete_birthdate"] == participant_birthdate
-            else 0,
-            "phone": CONSENT_SCORE_WEIGHTS["phone"]
-            if consent_row["athlete_phone"]
-            and consent_row["athlete_phone"] == participant_phone
-            else 0,
-            "email": CONSENT_SCORE_WEIGHTS["email"]
-            if consent_row["athlete_email"]
-            and consent_row["athlete_email"] == participant_email
-            else 0,
-            "name": CONSENT_SCORE_WEIGHTS["name"]
-            if consent_row["normalized_signer_name"]
-            and consent_row["normalized_signer_name"] == participant_name
-            else 0,
-        }
-        return sum(breakdown.values()), breakdown
+        return _score_keys(consent_row, _participant_keys(participant))
 
     def _deduplicate(self, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Collapse multiple qualifying consent rows down to one row per participant."""
@@ -324,6 +395,78 @@ class ConsentChecker:
                 "API calls already made above are unaffected."
             )
 
+    def _people_snapshot(self, match_count: int) -> Dict[str, Dict[str, Any]]:
+        """Return ChMeetings people keyed by ID, or {} when per-person reads are cheaper.
+
+        One paged ``get_people`` read replaces a ``get_person`` call per match
+        for the already-checked and dry-run decisions, so it is only worth it
+        when the organization spans fewer pages than there are matches; a
+        one-row probe of the people count decides.  Writes still re-read the
+        person, so this is an upper bound on the reads saved.  A failed probe
+        or bulk read is not fatal: every match then uses its own ``get_person``.
+        """
+        if match_count < 2:
+            return {}
+        total = self.chm.count_people()
+        if total is None:
+            return {}
+        pages = max(1, math.ceil(total / CONSENT_SNAPSHOT_PAGE_SIZE))
+        if pages >= match_count:
+            logger.debug(
+                f"Skipping ChMeetings people snapshot: {total} person(s) need {pages} "
+                f"page(s) for {match_count} match(es)"
+            )
+            return {}
+        try:
+            people = self.chm.get_people({"page_size": CONSENT_SNAPSHOT_PAGE_SIZE})
+        except ChMeetingsReadError as exc:
+            logger.warning(
+                f"ChMeetings people snapshot failed ({exc}); "
+                "falling back to per-person reads"
+            )
+            return {}
+        snapshot = {str(person.get("id")): person for person in people if person.get("id")}
+        logger.info(f"Loaded ChMeetings people snapshot with {len(snapshot)} person(s)")
+        return snapshot
+
+    def _apply_match(
+        self,
+        match: Dict[str, Any],
+        snapshot: Dict[str, Dict[str, Any]],
+        *,
+        dry_run: bool,
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Decide and, unless dry-run, apply one match; return ``(action, person)``.
+
+        Runs on the apply worker pool.  Pacing comes from the connector's
+        rate limiter, so workers only overlap request latency.  The snapshot
+        answers "already checked?" without a request; writes always re-read
+        the person first because ``update_person`` is a full-replace PUT and
+        the re-read also catches a box checked since the snapshot was taken.
+        """
+        participant = match["participant"]
+        chm_id = str(participant.get("chmeetings_id"))
+        person = snapshot.get(chm_id)
+        if person and self._is_consent_already_checked(person):
+            return "skipped_already_done", person
+        if not (dry_run and person):
+            person = self.chm.get_person(chm_id)
+        if not person:
+            return "api_error", None
+        if self._is_consent_already_checked(person):
+            return "skipped_already_done", person
+        if dry_run:
+            return "dry_run", person
+
+        ok = self.chm.update_person(
+            chm_id,
+            person.get("first_name", participant.get("first_name", "")),
+            person.get("last_name", participant.get("last_name", "")),
+            self._build_checklist_update(person),
+            extra_person_data=person,
+        )
+        return ("checked" if ok else "api_error"), person
+
     def run(
         self,
         consent_file: str,
@@ -355,17 +498,11 @@ class ConsentChecker:
         qualifying_matches: List[Dict[str, Any]] = []
         audit_rows: List[Dict[str, Any]] = []
 
+        participant_index = _ParticipantIndex(participants)
         for consent_row in consent_rows:
-            best_participant: Optional[Dict[str, Any]] = None
-            best_score = -1
-            best_breakdown = {"birthdate": 0, "phone": 0, "email": 0, "name": 0}
-
-            for participant in participants:
-                score, breakdown = self._score(consent_row, participant)
-                if score > best_score:
-                    best_score = score
-                    best_breakdown = breakdown
-                    best_participant = participant
+            best_participant, best_score, best_breakdown = participant_index.best_match(
+                consent_row
+            )
 
             if best_participant is None or best_score <= 0:
                 summary["unmatched"] += 1
@@ -416,116 +553,66 @@ class ConsentChecker:
                 }
             )
 
-        for match in self._deduplicate(qualifying_matches):
+        matches = self._deduplicate(qualifying_matches)
+        snapshot = self._people_snapshot(len(matches))
+        with ThreadPoolExecutor(max_workers=CONSENT_APPLY_WORKERS) as executor:
+            outcomes = list(
+                executor.map(
+                    lambda match: self._apply_match(match, snapshot, dry_run=dry_run),
+                    matches,
+                )
+            )
+
+        for match, (action, person) in zip(matches, outcomes):
             participant = match["participant"]
             consent_row = match["consent_row"]
-            score = match["score"]
-            breakdown = match["breakdown"]
             duplicate_rows_collapsed = match["duplicate_rows_collapsed"]
             summary["duplicates_collapsed"] += duplicate_rows_collapsed
             chm_id = str(participant.get("chmeetings_id"))
 
-            person = self.chm.get_person(chm_id)
-            if not person:
+            if action == "api_error" and not person:
                 summary["api_error"] += 1
                 logger.warning(
                     f"Could not retrieve ChMeetings person {chm_id} while processing consent row "
                     f"{consent_row['source_row_number']}"
                 )
-                audit_rows.append(
-                    self._build_audit_row(
-                        consent_row,
-                        participant,
-                        score=score,
-                        breakdown=breakdown,
-                        action="api_error",
-                        duplicate_rows_collapsed=duplicate_rows_collapsed,
-                    )
-                )
-                continue
-
-            if self._is_consent_already_checked(person):
+            elif action == "skipped_already_done":
                 summary["skipped_already_done"] += 1
                 logger.info(
                     f"Skipped consent checkbox for {person.get('first_name', '')} "
                     f"{person.get('last_name', '')} ({chm_id}) - already checked"
                 )
-                audit_rows.append(
-                    self._build_audit_row(
-                        consent_row,
-                        participant,
-                        score=score,
-                        breakdown=breakdown,
-                        action="skipped_already_done",
-                        duplicate_rows_collapsed=duplicate_rows_collapsed,
-                        chm_person=person,
-                    )
-                )
-                continue
-
-            if dry_run:
+            elif action == "dry_run":
                 summary["dry_run"] += 1
                 logger.info(
                     f"[dry-run] Would check consent checkbox for "
                     f"{person.get('first_name', '')} {person.get('last_name', '')} ({chm_id})"
                 )
-                audit_rows.append(
-                    self._build_audit_row(
-                        consent_row,
-                        participant,
-                        score=score,
-                        breakdown=breakdown,
-                        action="dry_run",
-                        duplicate_rows_collapsed=duplicate_rows_collapsed,
-                        chm_person=person,
-                    )
-                )
-                continue
-
-            update_payload = self._build_checklist_update(person)
-            ok = self.chm.update_person(
-                chm_id,
-                person.get("first_name", participant.get("first_name", "")),
-                person.get("last_name", participant.get("last_name", "")),
-                update_payload,
-                extra_person_data=person,
-            )
-            time.sleep(0.2)
-            if ok:
+            elif action == "checked":
                 summary["checked"] += 1
                 logger.info(
                     f"Auto-checked consent checkbox for {person.get('first_name', '')} "
                     f"{person.get('last_name', '')} ({chm_id})"
                 )
                 self._push_consent_to_wordpress(participant)
-                audit_rows.append(
-                    self._build_audit_row(
-                        consent_row,
-                        participant,
-                        score=score,
-                        breakdown=breakdown,
-                        action="checked",
-                        duplicate_rows_collapsed=duplicate_rows_collapsed,
-                        chm_person=person,
-                    )
-                )
             else:
                 summary["api_error"] += 1
                 logger.warning(
                     f"Failed to update consent checkbox for "
                     f"{person.get('first_name', '')} {person.get('last_name', '')} ({chm_id})"
                 )
-                audit_rows.append(
-                    self._build_audit_row(
-                        consent_row,
-                        participant,
-                        score=score,
-                        breakdown=breakdown,
-                        action="api_error",
-                        duplicate_rows_collapsed=duplicate_rows_collapsed,
-                        chm_person=person,
-                    )
+
+            audit_rows.append(
+                self._build_audit_row(
+                    consent_row,
+                    participant,
+                    score=match["score"],
+                    breakdown=match["breakdown"],
+                    action=action,
+                    duplicate_rows_collapsed=duplicate_rows_collapsed,
+                    chm_person=person,
                 )
+            )
 
         self._write_audit_file(audit_rows)
 
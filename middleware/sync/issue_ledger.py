@@ -0,0 +1,106 @@
+"""issue_ledger — local record of the validation-issue sets last synced to WordPress.
+
+Every participant sync used to read the participant's open issues from
+WordPress and then create/update/resolve them one by one, even when the
+validator produced exactly the same issues as last time.  The ledger keeps a
+SHA-256 of the last issue set that was reconciled successfully, per
+participant and per church, so an unchanged set skips every WordPress read
+and write for that participant or church.
+
+Entries are trusted for ``max_age_seconds``; after that the set is reconciled
+against WordPress again even if unchanged, which picks up issues an admin
+resolved by hand in the meantime.  The ledger is scoped to one WordPress site
+(``Config.WP_URL``): a ledger written against another site is ignored.
+"""
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from loguru import logger
+
+from config import Config, VALIDATION_ISSUE_LEDGER_FILE, VALIDATION_ISSUE_LEDGER_MAX_AGE_HOURS
+from file_utils import LazyDefault, atomic_write_json
+
+
+LEDGER_VERSION = 1
+PARTICIPANT = "participants"
+CHURCH = "churches"
+
+
+def issue_set_digest(issues: Iterable[Dict[str, Any]], **context: Any) -> str:
+    """Order-independent SHA-256 of an issue set and the context it was synced under."""
+    rows = sorted(json.dumps(issue, sort_keys=True, default=str) for issue in issues)
+    text = json.dumps({"context": context, "issues": rows}, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ValidationIssueLedger:
+    """JSON-backed map of ``(kind, key) -> digest`` for synced issue sets."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_age_seconds: float = VALIDATION_ISSUE_LEDGER_MAX_AGE_HOURS * 3600,
+        scope: Optional[str] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_age_seconds = max_age_seconds
+        self.scope = (Config.WP_URL or "") if scope is None else scope
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[str, Dict[str, Dict[str, Any]]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        empty = {PARTICIPANT: {}, CHURCH: {}}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable validation-issue ledger {self.path}: {exc}")
+            return empty
+        if payload.get("version") != LEDGER_VERSION or payload.get("scope") != self.scope:
+            return empty
+        return {kind: dict(payload.get(kind) or {}) for kind in empty}
+
+    def is_unchanged(self, kind: str, key: Any, digest: str) -> bool:
+        """True when ``digest`` was synced for ``key`` within ``max_age_seconds``."""
+        with self._lock:
+            entry = self._entries[kind].get(str(key))
+        if not entry or entry.get("digest") != digest:
+            return False
+        return time.time() - float(entry.get("synced_at") or 0) < self.max_age_seconds
+
+    def record(self, kind: str, key: Any, digest: str) -> None:
+        with self._lock:
+            self._entries[kind][str(key)] = {"digest": digest, "synced_at": time.time()}
+            self._dirty = True
+
+    def forget(self, kind: str, key: Any) -> None:
+        with self._lock:
+            if self._entries[kind].pop(str(key), None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(
+                self.path,
+                {"version": LEDGER_VERSION, "scope": self.scope, **self._entries},
+                sort_keys=True,
+            )
+            self._dirty = False
+
+
+_DEFAULT_LEDGER: LazyDefault[ValidationIssueLedger] = LazyDefault(
+    ValidationIssueLedger, VALIDATION_ISSUE_LEDGER_FILE
+)
+
+
+def default_issue_ledger() -> Optional[ValidationIssueLedger]:
+    """Return the process-wide ledger at VALIDATION_ISSUE_LEDGER_FILE, or None when disabled."""
+    return _DEFAULT_LEDGER.get()
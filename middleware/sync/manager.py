@@ -5,7 +5,6 @@
 
 import os
 import json
-import time
 import sys
 import pandas as pd
 from typing import Dict, Any, Optional
@@ -13,10 +12,11 @@ from loguru import logger
 from config import (Config, DATA_DIR, APPROVAL_STATUS, CHECK_BOXES, MEMBERSHIP_QUESTION,
                    SPORT_TYPE, SPORT_CATEGORY, SPORT_FORMAT, GENDER, CHM_FIELDS,
                    VALIDATION_SEVERITY, VALIDATION_STATUS, RULE_LEVEL)
-from chmeetings.backend_connector import ChMeetingsConnector, CHM_MIN_REQUEST_INTERVAL_SECONDS
+from chmeetings.backend_connector import ChMeetingsConnector
 from wordpress.frontend_connector import WordPressConnector
 from sync.churches import ChurchSyncer
-from sync.participants import ParticipantSyncer
+from sync.participants import ParticipantSyncer, fetch_open_validation_issues
+from sync.issue_ledger import CHURCH, PARTICIPANT, default_issue_ledger, issue_set_digest
 from validation import ChurchValidator, TeamValidator
 from validation.models import RulesManager
 import datetime
@@ -80,6 +80,7 @@ class SyncManager:
 
         self.church_syncer = ChurchSyncer(self.wordpress_connector, self.stats)
         self.participant_syncer = ParticipantSyncer(self.chm_connector, self.wordpress_connector, self.stats, self.churches_cache) if self.chm_connector else None
+        self.issue_ledger = default_issue_ledger()
         logger.info("SyncManager initialized")
 
     def authenticate(self) -> bool:
@@ -580,7 +581,6 @@ class SyncManager:
             wp_id_str = str(participant["participant_id"])
 
             success = self.chm_connector.add_person_to_group(group_id, chm_id)
-            time.sleep(CHM_MIN_REQUEST_INTERVAL_SECONDS)  # paced to ChMeetings' conservative rate limit
             if success:
                 added_count += 1
                 # Mark approval as synced in WordPress
@@ -701,33 +701,7 @@ class SyncManager:
 
     def _fetch_open_validation_issues(self, church_id: Optional[int] = None) -> list[Dict[str, Any]]:
         """Fetch all open validation issues, optionally scoped to one church."""
-        open_issues = []
-        current_page = 1
-        fetch_per_page = 100
-
-        while True:
-            params = {
-                "status": VALIDATION_STATUS["OPEN"],
-                "page": current_page,
-                "per_page": fetch_per_page,
-            }
-            if church_id is not None:
-                params["church_id"] = church_id
-
-            page_issues = self.wordpress_connector.get_validation_issues(params=params)
-            if not page_issues:
-                break
-
-            open_issues.extend(page_issues)
-
-            if len(page_issues) < fetch_per_page:
-                break
-
-            current_page += 1
-            if current_page > 50:
-                logger.warning("Reached page limit (50) fetching open validation issues. Stopping.")
-                break
-
+        open_issues, _complete = fetch_open_validation_issues(self.wordpress_connector, church_id=church_id)
         return open_issues
 
     def _fetch_existing_group_issues(self, church_id: Optional[int] = None) -> list[Dict[str, Any]]:
@@ -1011,6 +985,8 @@ class SyncManager:
 
             if resolved_for_participant:
                 resolved_participant_count += 1
+                if self.issue_ledger:
+                    self.issue_ledger.forget(PARTICIPANT, participant_id)
                 logger.info(
                     f"Self-resolved {resolved_for_participant} orphaned INDIVIDUAL "
                     f"validation issue(s) for {participant_name} "
@@ -1235,15 +1211,30 @@ class SyncManager:
                     participants_by_church.get(church_id, []),
                     rosters=roster_snapshot or [],
                 ))
+                existing_church_issues = existing_group_issues_by_church.get(church_id, [])
+                digest = issue_set_digest(current_issues)
+                if self.issue_ledger and self.issue_ledger.is_unchanged(CHURCH, church_id, digest):
+                    self.stats["validation_issues"]["unchanged"] += len(current_issues)
+                    continue
+                errors_before = self.stats["validation_issues"]["errors"]
                 self._sync_group_validation_issues(
                     church_id,
                     current_issues,
-                    existing_group_issues_by_church.get(church_id, []),
+                    existing_church_issues,
                 )
+                if self.issue_ledger:
+                    if self.stats["validation_issues"]["errors"] == errors_before:
+                        self.issue_ledger.record(CHURCH, church_id, digest)
+                    else:
+                        self.issue_ledger.forget(CHURCH, church_id)
             except Exception as e:
                 logger.error(f"Error syncing validation issues for church {church_id}: {e}")
                 self.stats["validation_issues"]["errors"] += 1
+                if self.issue_ledger:
+                    self.issue_ledger.forget(CHURCH, church_id)
 
+        if self.issue_ledger:
+            self.issue_ledger.save()
         logger.info(f"Data validation completed: {self.stats['validation_issues']}")
         return True
 
@@ -9,7 +9,7 @@ from wordpress.frontend_connector import WordPressConnector
 from config import (Config, APPROVAL_STATUS, CHECK_BOXES, MEMBERSHIP_QUESTION, CHM_FIELDS,
                    SPORT_TYPE, SPORT_CATEGORY, SPORT_FORMAT, GENDER, RULE_LEVEL, FORMAT_MAPPINGS,
                    SPORT_UNSELECTED, RACQUET_SPORTS, VALIDATION_SEVERITY, REGISTRATION_DEADLINE, is_racquet_sport,
-                   SF_IS_MEMBER_OPTION_IDS, SF_FIELD_IDS)
+                   SF_IS_MEMBER_OPTION_IDS, SF_FIELD_IDS, VALIDATION_STATUS)
 import datetime
 import pytz
 from uuid import uuid4
@@ -19,6 +19,7 @@ from validation.individual_validator import IndividualValidator
 from validation.models import Participant
 from pydantic import ValidationError
 from time_utils import current_business_date, parse_wordpress_created_at_to_business_date
+from sync.issue_ledger import PARTICIPANT, default_issue_ledger, issue_set_digest
 
 # Helper functions
 def parse_format(format_value: str) -> tuple[str, str]:
@@ -34,6 +35,38 @@ def parse_format(format_value: str) -> tuple[str, str]:
         return SPORT_FORMAT["TEAM"], GENDER["MIXED"]
     format_value = format_value.strip()
     return FORMAT_MAPPINGS.get(format_value, (SPORT_FORMAT["TEAM"], GENDER["MIXED"]))
+
+def fetch_open_validation_issues(
+    wordpress_connector: WordPressConnector,
+    church_id: Optional[int] = None,
+    per_page: int = 100,
+    max_pages: int = 50,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Page through every open validation issue, optionally scoped to one church.
+
+    Returns (issues, complete); complete is False when a page read failed or
+    the page limit was reached, so callers can decide whether a partial
+    listing is good enough.
+    """
+    open_issues: List[Dict[str, Any]] = []
+    for page in range(1, max_pages + 1):
+        params = {
+            "status": VALIDATION_STATUS["OPEN"],
+            "page": page,
+            "per_page": per_page,
+        }
+        if church_id is not None:
+            params["church_id"] = church_id
+
+        page_issues = wordpress_connector.get_validation_issues(params)
+        if getattr(wordpress_connector, "last_get_validation_issues_status", "ok") == "failed":
+            return open_issues, False
+        open_issues.extend(page_issues or [])
+        if len(page_issues or []) < per_page:
+            return open_issues, True
+
+    logger.warning(f"Reached page limit ({max_pages}) fetching open validation issues. Stopping.")
+    return open_issues, False
     
 class ParticipantSyncer:
     """Handles synchronization of participant data from ChMeetings to WordPress."""
@@ -47,6 +80,14 @@ class ParticipantSyncer:
         # Initialize the IndividualValidator with the event collection
         self.validator = IndividualValidator(collection="SUMMER_2026")
         self.late_racquet_overrides = self._load_late_racquet_overrides()
+        # Validation-issue reconciliation state.  During a full sync the ledger
+        # is trusted and open issues come from one bulk read (see
+        # _begin_bulk_issue_sync); targeted syncs always read and reconcile.
+        self.issue_ledger = default_issue_ledger()
+        self._trust_issue_ledger = False
+        self._use_open_issue_snapshot = False
+        self._open_issue_snapshot: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._open_issue_snapshot_stale: set[str] = set()
 
     @staticmethod
     def _validation_issue_key(
@@ -687,6 +728,8 @@ class ParticipantSyncer:
             logger.info(f"Attempting to sync participant with ChMeetings ID: {chm_id_to_sync}.")
             # The _sync_single_participant method handles its own detailed logging using TARGET_CHM_ID_FOR_DEBUG
             success = self._sync_single_participant(chm_id_to_sync, TARGET_CHM_ID_FOR_DEBUG)
+            if self.issue_ledger:
+                self.issue_ledger.save()
             if success:
                 logger.info(f"Successfully processed participant with ChM ID: {chm_id_to_sync}.")
             else:
@@ -715,43 +758,47 @@ class ParticipantSyncer:
             
             all_participants_processed_successfully = True # Assume success unless a participant fails
 
-            for group in team_groups:
-                if hasattr(self.chm_connector, "last_get_group_people_status"):
-                    self.chm_connector.last_get_group_people_status = None
-                participants_in_group = self.chm_connector.get_group_people(group["id"])
-                if getattr(self.chm_connector, "last_get_group_people_status", None) == "failed":
-                    logger.error(
-                        f"Failed to load participants in group '{group['name']}' "
-                        f"(ID: {group['id']}). Full participant sync cannot safely continue."
-                    )
-                    all_participants_processed_successfully = False
-                    continue
-
-                if not participants_in_group:
-                    logger.info(f"No participants in group '{group['name']}' (ID: {group['id']}). Skipping.")
-                    continue
+            self._begin_bulk_issue_sync()
+            try:
+                for group in team_groups:
+                    if hasattr(self.chm_connector, "last_get_group_people_status"):
+                        self.chm_connector.last_get_group_people_status = None
+                    participants_in_group = self.chm_connector.get_group_people(group["id"])
+                    if getattr(self.chm_connector, "last_get_group_people_status", None) == "failed":
+                        logger.error(
+                            f"Failed to load participants in group '{group['name']}' "
+                            f"(ID: {group['id']}). Full participant sync cannot safely continue."
+                        )
+                        all_participants_processed_successfully = False
+                        continue
 
-                logger.info(f"Processing {len(participants_in_group)} participants in group '{group['name']}' (ID: {group['id']}).")
-                for person_summary in participants_in_group:
-                    # person_id from the group listing is the ChMeetings ID
-                    current_chm_id = str(person_summary.get("person_id")) 
-                    if not current_chm_id or current_chm_id == "None": # Check for valid ID
-                        logger.warning(f"Skipping a person in group '{group['name']}' due to missing or invalid person_id: {person_summary}")
-                        self.stats["participants"]["errors"] += 1
-                        all_participants_processed_successfully = False # Mark overall as not entirely successful
+                    if not participants_in_group:
+                        logger.info(f"No participants in group '{group['name']}' (ID: {group['id']}). Skipping.")
                         continue
+
+                    logger.info(f"Processing {len(participants_in_group)} participants in group '{group['name']}' (ID: {group['id']}).")
+                    for person_summary in participants_in_group:
+                        # person_id from the group listing is the ChMeetings ID
+                        current_chm_id = str(person_summary.get("person_id"))
+                        if not current_chm_id or current_chm_id == "None": # Check for valid ID
+                            logger.warning(f"Skipping a person in group '{group['name']}' due to missing or invalid person_id: {person_summary}")
+                            self.stats["participants"]["errors"] += 1
+                            all_participants_processed_successfully = False # Mark overall as not entirely successful
+                            continue
                     
-                    # Call the helper method for each person_chm_id
-                    # TARGET_CHM_ID_FOR_DEBUG is passed for detailed logging if current_chm_id matches
-                    if not self._sync_single_participant(
-                        current_chm_id,
-                        TARGET_CHM_ID_FOR_DEBUG,
-                        allow_missing_person_skip=True,
-                    ):
-                        # _sync_single_participant already logs its own errors and updates stats
-                        logger.warning(f"Failed to sync participant ChM ID {current_chm_id} from group '{group['name']}'.")
-                        all_participants_processed_successfully = False # Mark overall as not entirely successful
-                        # Continue processing other participants
+                        # Call the helper method for each person_chm_id
+                        # TARGET_CHM_ID_FOR_DEBUG is passed for detailed logging if current_chm_id matches
+                        if not self._sync_single_participant(
+                            current_chm_id,
+                            TARGET_CHM_ID_FOR_DEBUG,
+                            allow_missing_person_skip=True,
+                        ):
+                            # _sync_single_participant already logs its own errors and updates stats
+                            logger.warning(f"Failed to sync participant ChM ID {current_chm_id} from group '{group['name']}'.")
+                            all_participants_processed_successfully = False # Mark overall as not entirely successful
+                            # Continue processing other participants
+            finally:
+                self._end_bulk_issue_sync()
 
             if all_participants_processed_successfully:
                 logger.info("Full participant sync from groups completed. All encountered participants processed (either successfully synced or validly skipped).")
@@ -1546,6 +1593,7 @@ class ParticipantSyncer:
                     logger.info(f"Deleting roster_id={roster['roster_id']}: {roster_key} NOT in current_sports") ## debug
                     self.wordpress_connector.delete_roster(roster["roster_id"])
                     self.stats["rosters"]["deleted"] += 1
+                    self._invalidate_issue_state(participant_id)
                 elif roster_key in kept_current_sports:
                     logger.info(
                         f"Deleting duplicate roster_id={roster['roster_id']}: {roster_key} "
@@ -1553,6 +1601,7 @@ class ParticipantSyncer:
                     )
                     self.wordpress_connector.delete_roster(roster["roster_id"])
                     self.stats["rosters"]["deleted"] += 1
+                    self._invalidate_issue_state(participant_id)
                 else:
                     logger.debug(f"Keeping roster_id={roster['roster_id']}: {roster_key} found in current_sports")
                     kept_current_sports.add(roster_key)
@@ -1678,6 +1727,71 @@ class ParticipantSyncer:
             self.wordpress_connector.create_validation_issue(issue_data)
             self.stats["validation_issues"]["created"] += 1
 
+    def _begin_bulk_issue_sync(self) -> None:
+        """Trust the issue ledger and serve open issues from one bulk read."""
+        self._trust_issue_ledger = True
+        self._use_open_issue_snapshot = True
+        self._open_issue_snapshot = None
+        self._open_issue_snapshot_stale = set()
+
+    def _end_bulk_issue_sync(self) -> None:
+        self._trust_issue_ledger = False
+        self._use_open_issue_snapshot = False
+        self._open_issue_snapshot = None
+        self._open_issue_snapshot_stale = set()
+        if self.issue_ledger:
+            self.issue_ledger.save()
+
+    def _invalidate_issue_state(self, participant_id: Any) -> None:
+        """Forget cached issue state for a participant whose issues changed underneath us."""
+        self._open_issue_snapshot_stale.add(str(participant_id))
+        if self.issue_ledger:
+            self.issue_ledger.forget(PARTICIPANT, participant_id)
+
+    def _load_open_issue_snapshot(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Read every open validation issue once, grouped by participant_id.
+
+        Returns None when the listing failed or hit the page limit, so callers
+        fall back to per-participant reads instead of trusting a partial view.
+        """
+        open_issues, complete = fetch_open_validation_issues(self.wordpress_connector)
+        if not complete:
+            logger.warning("Bulk read of open validation issues was incomplete; falling back to per-participant reads.")
+            return None
+        snapshot: Dict[str, List[Dict[str, Any]]] = {}
+        for issue in open_issues:
+            snapshot.setdefault(str(issue.get("participant_id") or ""), []).append(issue)
+        logger.info(
+            f"Loaded {len(open_issues)} open validation issue(s) "
+            f"for {len(snapshot)} participant(s) in one bulk read."
+        )
+        return snapshot
+
+    def _get_open_validation_issues(self, participant_id: str) -> List[Dict[str, Any]]:
+        """Return the participant's open issues, from the bulk snapshot when one is active.
+
+        A participant is served from the snapshot once per run; later reads
+        (or reads after a roster delete resolved some of its issues) go to
+        WordPress, since the snapshot no longer reflects our own writes.
+        """
+        participant_key = str(participant_id)
+        if self._use_open_issue_snapshot and participant_key not in self._open_issue_snapshot_stale:
+            if self._open_issue_snapshot is None:
+                self._open_issue_snapshot = self._load_open_issue_snapshot()
+            if self._open_issue_snapshot is None:
+                self._use_open_issue_snapshot = False
+            else:
+                self._open_issue_snapshot_stale.add(participant_key)
+                return list(self._open_issue_snapshot.get(participant_key, []))
+
+        # per_page=200 avoids silent truncation at the PHP default; a single
+        # participant won't realistically exceed 200 issues
+        return self.wordpress_connector.get_validation_issues({
+            "participant_id": participant_id,
+            "status": "open",
+            "per_page": 200,
+        })
+
     def _sync_validation_issues(
         self,
         participant_id: str,
@@ -1694,13 +1808,18 @@ class ParticipantSyncer:
             issues: List of validation issues from the validator
             last_updated: Timestamp when the participant was last updated
         """
-        # Get existing issues for this participant (per_page=200 avoids silent truncation
-        # at the PHP default; a single participant won't realistically exceed 200 issues)
-        existing_issues = self.wordpress_connector.get_validation_issues({
-            "participant_id": participant_id,
-            "status": "open",
-            "per_page": 200,
-        })
+        digest = issue_set_digest(issues, church_code=church_code, approval_status=approval_status)
+        if (
+            self._trust_issue_ledger
+            and self.issue_ledger
+            and self.issue_ledger.is_unchanged(PARTICIPANT, participant_id, digest)
+        ):
+            self.stats["validation_issues"]["unchanged"] += len(issues)
+            logger.debug(f"Validation issues for participant {participant_id} unchanged since last sync; skipping.")
+            return
+
+        existing_issues = self._get_open_validation_issues(participant_id)
+        in_sync = True
         
         # Create a lookup dictionary of existing issues
         existing_lookup = {}
@@ -1775,7 +1894,9 @@ class ParticipantSyncer:
 #                "updated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 #            }
             
-            self._create_or_update_validation_issue(participant_id, church_code, issue, existing_lookup.get(key), last_updated)
+            in_sync &= self._create_or_update_validation_issue(
+                participant_id, church_code, issue, existing_lookup.get(key), last_updated
+            )
         
         # Close any issues that weren't in the current validation results
         # (This means the issue has been resolved)
@@ -1793,7 +1914,7 @@ class ParticipantSyncer:
                     )
                     continue
                 # Issue is no longer present, mark it as resolved
-                self.wordpress_connector.update_validation_issue(
+                resolved = self.wordpress_connector.update_validation_issue(
                     existing_issue["issue_id"],
                     {
                         "status": "resolved",
@@ -1801,12 +1922,19 @@ class ParticipantSyncer:
                         "updated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     }
                 )
+                in_sync &= bool(resolved)
                 self.stats["validation_issues"]["resolved"] += 1
                 logger.info(f"Resolved validation issue {existing_issue['issue_id']} for participant {participant_id}")
 
+        if self.issue_ledger:
+            if in_sync:
+                self.issue_ledger.record(PARTICIPANT, participant_id, digest)
+            else:
+                self.issue_ledger.forget(PARTICIPANT, participant_id)
+
     def _create_or_update_validation_issue(self, participant_id: str, church_code: str, 
                                           issue: Dict[str, str], existing_issue: Optional[Dict[str, Any]],
-                                          last_updated: str):
+                                          last_updated: str) -> bool:
         """Create or update a validation issue based on timestamps.
         
         Args:
@@ -1815,6 +1943,10 @@ class ParticipantSyncer:
             issue: The validation issue data
             existing_issue: Existing issue record from WordPress if any
             last_updated: Timestamp when the participant was last updated
+
+        Returns:
+            bool: True when the WordPress row now matches ``issue``; False when
+            the write failed or was skipped by the timestamp guard.
         """
         issue_type = issue["type"]
         rule_code = issue.get("rule_code", "")
@@ -1845,22 +1977,23 @@ class ParticipantSyncer:
                     existing_issue["severity"] != issue_data["severity"] or
                     existing_issue["status"] != "open"):  # Reopen if it was closed
                     
-                    self.wordpress_connector.update_validation_issue(
+                    updated = self.wordpress_connector.update_validation_issue(
                         existing_issue["issue_id"], 
                         issue_data
                     )
                     self.stats["validation_issues"]["updated"] += 1
                     logger.debug(f"Updated validation issue {existing_issue['issue_id']} for participant {participant_id}")
-                else:
-                    # Issue exists but hasn't changed
-                    self.stats["validation_issues"]["unchanged"] += 1
-            else:
-                # Participant hasn't been updated since this validation issue was created or updated
-                self.stats["validation_issues"]["skipped"] += 1
-        else:
-            # New issue, create it
-            self.wordpress_connector.create_validation_issue(issue_data)
-            self.stats["validation_issues"]["created"] += 1
-            logger.debug(f"Created new validation issue for participant {participant_id}: {issue_type}")
+                    return bool(updated)
+                # Issue exists but hasn't changed
+                self.stats["validation_issues"]["unchanged"] += 1
+                return True
+            # Participant hasn't been updated since this validation issue was created or updated
+            self.stats["validation_issues"]["skipped"] += 1
+            return False
+        # New issue, create it
+        created = self.wordpress_connector.create_validation_issue(issue_data)
+        self.stats["validation_issues"]["created"] += 1
+        logger.debug(f"Created new validation issue for participant {participant_id}: {issue_type}")
+        return bool(created)
 
 # End of sync/participants.py
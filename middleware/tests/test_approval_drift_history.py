@@ -558,3 +558,60 @@ def test_accept_reviewed_drift_force_approved_overrides_ambiguous_prior_statuses
     assert wp.updated_participants == [(74, {"approval_status": "approved"})]
     assert wp.updated_approvals[0][0] == 94
     assert wp.updated_approvals[0][1]["approval_status"] == "approved"
+
+
+def test_parse_drift_events_index_parses_only_appended_bytes(tmp_path, mocker):
+    import approval_drift_history
+
+    hard = (
+        "2026-07-13 03:32:48 | WARNING | [VAY SM] APPROVAL IDENTITY DRIFT for chm_id=3744979 "
+        "(WP participant_id=446): Other events: '' -> 'Soccer - Coed Exhibition'. "
+        "Prior 'approved' invalidated -> 'reapproval_required'.\n"
+    )
+    soft = (
+        "2026-07-13 04:00:00 | INFO | [VAY SM] Birthdate correction for chm_id=123: "
+        "'2000-01-01' -> '2000-01-02' (age unchanged)\n"
+    )
+    log_file = tmp_path / "sportsfest_20260713.log"
+    log_file.write_text("2026-07-13 03:00:00 | INFO | noise\n" + hard, encoding="utf-8")
+    index_path = tmp_path / ".approval_drift_index.json"
+
+    first = parse_drift_events([log_file], index_path)
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write("2026-07-13 03:59:00 | INFO | more noise\n" + soft + hard.rstrip("\n"))
+    scan = mocker.spy(approval_drift_history, "_scan_log")
+    second = parse_drift_events([log_file], index_path)
+    third = parse_drift_events([log_file], index_path)
+
+    assert [event.chmeetings_id for event in first] == ["3744979"]
+    assert second == third == parse_drift_events([log_file])
+    assert [event.event_type for event in second] == [
+        "approval_identity_drift",
+        "approval_birthdate_correction",
+        "approval_identity_drift",
+    ]
+    # Both later runs resume after the first run's bytes; the unterminated
+    # last line is never indexed, so the third run re-reads only that line.
+    first_offset = len(("2026-07-13 03:00:00 | INFO | noise\n" + hard).encode("utf-8"))
+    assert scan.call_args_list[0].args[1] == first_offset
+    assert scan.call_args_list[1].args[1] > first_offset
+
+
+def test_parse_drift_events_index_reparses_rewritten_log(tmp_path):
+    log_file = tmp_path / "sportsfest_20260713.log"
+    index_path = tmp_path / ".approval_drift_index.json"
+    log_file.write_text(
+        "2026-07-13 03:32:48 | WARNING | [VAY SM] APPROVAL IDENTITY DRIFT for chm_id=1 (WP participant_id=2): "
+        "Gender: 'Male' -> 'Female'. Prior 'approved' invalidated -> 'reapproval_required'.\n",
+        encoding="utf-8",
+    )
+    parse_drift_events([log_file], index_path)
+
+    log_file.write_text(
+        "2026-07-14 03:32:48 | WARNING | [VAY SM] APPROVAL IDENTITY DRIFT for chm_id=9 (WP participant_id=8): "
+        "Gender: 'Female' -> 'Male'. Prior 'pending' invalidated -> 'reapproval_required'.\n",
+        encoding="utf-8",
+    )
+    events = parse_drift_events([log_file], index_path)
+
+    assert [(event.chmeetings_id, event.prior_status) for event in events] == [("9", "pending")]
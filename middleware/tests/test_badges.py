@@ -34,7 +34,7 @@ from badges.generator import (
     _resolve_font_path,
 )
 from badges.runner import BadgeRunner
-from badges.uploader import BadgeUploadResult, WordPressBadgeUploader
+from badges.uploader import BadgeUploadManifest, BadgeUploadResult, WordPressBadgeUploader
 
 
 # ── Fixtures / helpers ─────────────────────────────────────────────────────────
@@ -53,13 +53,6 @@ def generator(tmp_path):
     )
 
 
-@pytest.fixture(autouse=True)
-def _no_real_sleep(monkeypatch):
-    """BadgeRunner paces ChMeetings calls with a real time.sleep (issue #296);
-    keep the mock suite fast by not actually pausing."""
-    monkeypatch.setattr("badges.runner.time.sleep", lambda *a, **k: None)
-
-
 def _participant(**overrides):
     base = {
         "chmeetings_id": "3139537",
@@ -228,6 +221,38 @@ def test_corrupt_photo_falls_back_without_raising(generator):
     assert img.size == (1080, 1920)
 
 
+def test_render_reuses_static_background_without_leaking_layers(generator, mocker):
+    load_template = mocker.spy(generator, "_load_template")
+    first = generator.render(_participant(), photo_bytes=_png_bytes())
+    other = generator.render(
+        _participant(chmeetings_id="42", church_code="GAC", consent_status=False),
+        photo_bytes=None,
+    )
+    again = generator.render(_participant(), photo_bytes=_png_bytes())
+
+    assert load_template.call_count == 1
+    assert other.tobytes() != first.tobytes()
+    assert again.tobytes() == first.tobytes()
+
+    fresh = BadgeGenerator(
+        output_dir=generator.output_dir,
+        filename_salt="test-only-badge-salt",
+    ).render(_participant(), photo_bytes=_png_bytes())
+    assert fresh.tobytes() == first.tobytes()
+
+
+def test_timing_breakdown_reports_per_badge_stages(generator):
+    generator.render_to_file(_participant(), photo_bytes=_png_bytes())
+    generator.render(_participant(chmeetings_id="42"), photo_bytes=None)
+
+    assert generator.rendered_count == 2
+    assert generator.stage_timings["encode"] > 0
+    breakdown = generator.timing_breakdown()
+    assert "over 2 badge(s)" in breakdown
+    for stage in ("background", "photo", "qr", "church_code", "cards", "encode"):
+        assert f"{stage}=" in breakdown
+
+
 def test_deterministic_filename(generator):
     p = _participant()
     assert generator.filename_for(p) == generator.filename_for(dict(p))
@@ -392,6 +417,15 @@ def test_ascii_initials_strips_accents():
 
 # ── BadgeRunner: orchestration ──────────────────────────────────────────────────
 
+def _mock_uploader():
+    # upload_badges() fans out to upload_badge() so tests can stub per badge.
+    uploader = MagicMock()
+    uploader.upload_badges.side_effect = lambda paths: [
+        (path, uploader.upload_badge(path)) for path in paths
+    ]
+    return uploader
+
+
 def _make_runner(participants, generator, person_photo=None, badge_uploader=None):
     chm = MagicMock()
     wp = MagicMock()
@@ -449,7 +483,7 @@ def test_runner_dry_run_writes_nothing(generator):
 
 
 def test_runner_uploads_rendered_badge(generator):
-    uploader = MagicMock()
+    uploader = _mock_uploader()
     runner, chm, wp = _make_runner([_participant()], generator, badge_uploader=uploader)
 
     assert runner.run(force=True, upload=True) is True
@@ -469,7 +503,7 @@ def test_runner_requires_upload_for_chmeetings_badge_url(generator):
 
 
 def test_runner_writes_uploaded_badge_url_to_chmeetings(generator):
-    uploader = MagicMock()
+    uploader = _mock_uploader()
     uploader.upload_badge.return_value = BadgeUploadResult(
         filename="RPC_3139537_abcd1234.png",
         url="https://sportsfest.example/wp-content/uploads/vaysf/badges/RPC_3139537_abcd1234.png",
@@ -507,6 +541,46 @@ def test_runner_writes_uploaded_badge_url_to_chmeetings(generator):
     assert kwargs["extra_person_data"] == chm.get_person.return_value
 
 
+def test_runner_skips_chmeetings_write_when_badge_url_is_current(generator):
+    def hosted(path):
+        url = f"https://sportsfest.example/wp-content/uploads/vaysf/badges/{path.name}"
+        return BadgeUploadResult(path.name, url, 1, "x", reused=True)
+
+    uploader = _mock_uploader()
+    uploader.upload_badge.side_effect = hosted
+    participants = [_participant(), _participant(chmeetings_id="42", first_name="Bao")]
+    runner, chm, wp = _make_runner(participants, generator, badge_uploader=uploader)
+    chm.get_member_fields.return_value = [
+        {"field_name": "Sports Fest Badge URL", "field_id": 98765, "field_type": "text"}
+    ]
+    current_url = hosted(generator.output_path_for(participants[0])).url
+    people = {
+        "3139537": {
+            "id": "3139537", "photo": None, "first_name": "An", "last_name": "Le",
+            "additional_fields": [
+                {"field_id": 98765, "field_type": "text",
+                 "value": BadgeRunner._badge_url_profile_value(current_url)},
+            ],
+        },
+        "42": {
+            "id": "42", "photo": None, "first_name": "Bao", "last_name": "Le",
+            "additional_fields": [
+                {"field_id": 98765, "field_type": "text", "value": "https://old.example/x.png"},
+            ],
+        },
+    }
+    chm.get_person.side_effect = lambda chm_id: people[chm_id]
+    chm.update_person.return_value = True
+
+    assert runner.run(force=True, upload=True, write_chmeetings_badge_url=True) is True
+
+    chm.update_person.assert_called_once()
+    assert chm.update_person.call_args.args[0] == "42"
+    # One enrichment read each, plus the pre-PUT re-read for the changed profile.
+    assert [call.args[0] for call in chm.get_person.call_args_list].count("3139537") == 1
+    assert [call.args[0] for call in chm.get_person.call_args_list].count("42") == 2
+
+
 def test_badge_url_profile_value_appends_chmeetings_img_tag():
     url = "https://sportsfest.example/wp-content/uploads/vaysf/badges/RPC_3139537_abcd1234.png"
 
@@ -517,7 +591,7 @@ def test_badge_url_profile_value_appends_chmeetings_img_tag():
 
 
 def test_runner_dry_run_upload_writes_and_uploads_nothing(generator):
-    uploader = MagicMock()
+    uploader = _mock_uploader()
     runner, chm, wp = _make_runner([_participant()], generator, badge_uploader=uploader)
 
     assert runner.run(dry_run=True, upload=True) is True
@@ -597,6 +671,110 @@ def test_badge_uploader_retries_403_with_reencoded_png(tmp_path, monkeypatch):
     assert not retry_path.exists()
 
 
+def _upload_session(*responses):
+    session = MagicMock()
+    session.headers = {}
+    session.cookies = {}
+    session.post.side_effect = list(responses)
+    return session
+
+
+def _ok_upload_response(filename):
+    response = MagicMock()
+    response.status_code = 200
+    response.raise_for_status.return_value = None
+    response.json.return_value = {
+        "filename": filename,
+        "url": f"https://sportsfest.example/wp-content/uploads/vaysf/badges/{filename}",
+        "size": 1234,
+        "sha256": "remote",
+    }
+    return response
+
+
+def test_badge_uploader_manifest_skips_identical_reupload(tmp_path):
+    png_path = tmp_path / "RPC_3139537_abcd1234.png"
+    png_path.write_bytes(_png_bytes(size=(1080, 1920)))
+    manifest_path = tmp_path / "badge_upload_manifest.json"
+
+    session = _upload_session(_ok_upload_response(png_path.name))
+    first = WordPressBadgeUploader(
+        session=session, manifest=BadgeUploadManifest(manifest_path, scope="site")
+    ).upload_badge(png_path)
+
+    rerun_session = _upload_session()
+    again = WordPressBadgeUploader(
+        session=rerun_session, manifest=BadgeUploadManifest(manifest_path, scope="site")
+    ).upload_badge(png_path)
+
+    assert session.post.call_count == 1
+    rerun_session.post.assert_not_called()
+    assert again.url == first.url
+    assert again.reused is True and first.reused is False
+
+    png_path.write_bytes(_png_bytes(color=(1, 2, 3), size=(1080, 1920)))
+    changed_session = _upload_session(_ok_upload_response(png_path.name))
+    WordPressBadgeUploader(
+        session=changed_session, manifest=BadgeUploadManifest(manifest_path, scope="site")
+    ).upload_badge(png_path)
+    assert changed_session.post.call_count == 1
+
+
+def test_badge_uploader_pre_encodes_after_firewall_retry(tmp_path, monkeypatch):
+    png_path = tmp_path / "RPC_3139537_abcd1234.png"
+    png_path.write_bytes(_png_bytes(size=(1080, 1920)))
+    next_path = tmp_path / "RPC_42_abcd1234.png"
+    next_path.write_bytes(_png_bytes(color=(1, 2, 3), size=(1080, 1920)))
+    manifest_path = tmp_path / "badge_upload_manifest.json"
+    reencoded = []
+
+    def fake_reencode(badge_path):
+        retry_path = tmp_path / f"retry-{len(reencoded)}.png"
+        retry_path.write_bytes(badge_path.read_bytes())
+        reencoded.append(badge_path)
+        return retry_path
+
+    monkeypatch.setattr(
+        WordPressBadgeUploader, "_reencode_for_firewall_retry", staticmethod(fake_reencode)
+    )
+    forbidden = MagicMock(status_code=403, text="Forbidden")
+    session = _upload_session(forbidden, _ok_upload_response(png_path.name))
+    WordPressBadgeUploader(
+        session=session, manifest=BadgeUploadManifest(manifest_path, scope="site")
+    ).upload_badge(png_path)
+
+    rerun_session = _upload_session(_ok_upload_response(next_path.name))
+    WordPressBadgeUploader(
+        session=rerun_session, manifest=BadgeUploadManifest(manifest_path, scope="site")
+    ).upload_badge(next_path)
+
+    assert reencoded == [png_path, next_path]
+    assert rerun_session.post.call_count == 1
+    assert not list(tmp_path.glob("retry-*.png"))
+
+
+def test_badge_uploader_batch_reports_failures_per_badge(tmp_path, monkeypatch):
+    paths = []
+    for chm_id in ("1", "2", "3"):
+        path = tmp_path / f"RPC_{chm_id}_abcd1234.png"
+        path.write_bytes(_png_bytes(size=(1080, 1920)))
+        paths.append(path)
+    uploader = WordPressBadgeUploader(session=_upload_session(), workers=2)
+
+    def fake_upload(path):
+        if path.name.startswith("RPC_2_"):
+            raise requests.HTTPError("500 Server Error")
+        return BadgeUploadResult(path.name, f"https://wp.example/{path.name}", 1, "x")
+
+    monkeypatch.setattr(uploader, "upload_badge", fake_upload)
+
+    results = uploader.upload_badges(paths)
+
+    assert [path for path, _ in results] == paths
+    assert isinstance(results[1][1], requests.HTTPError)
+    assert results[2][1].url.endswith("RPC_3_abcd1234.png")
+
+
 def test_badge_uploader_rejects_non_png_filename(tmp_path):
     png_path = tmp_path / "RPC_3139537_abcd1234.jpg"
     png_path.write_bytes(_png_bytes(size=(1080, 1920)))
@@ -173,6 +173,33 @@ def test_get_people_request_params(chm_connector, mocker):
         "page_size should default to 100"
 
 
+def test_count_people_reads_total_from_a_single_row_page(chm_connector, mocker):
+    """count_people probes one row and returns paging.total_count, or None without it."""
+    live_test = os.getenv("LIVE_TEST", "false").strip().lower() == "true"
+    if live_test:
+        pytest.skip("Count probe is a mock-only test")
+
+    calls = []
+    payloads = [
+        {"paging": {"total_count": 4321, "page": 1, "page_size": 1}, "data": [{}]},
+        {"data": [{}]},
+    ]
+
+    def capturing_get(*args, **kwargs):
+        calls.append(kwargs.get("params", {}))
+        mock_resp = mocker.Mock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = payloads[len(calls) - 1]
+        return mock_resp
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("requests.Session.get", capturing_get)
+        assert chm_connector.count_people() == 4321
+        assert chm_connector.count_people() is None
+
+    assert calls[0]["page_size"] == 1
+
+
 def test_create_person_posts_complete_payload(chm_connector, mocker):
     """Mock create_person should POST standard fields and SF custom fields."""
     live_test = os.getenv("LIVE_TEST", "false").strip().lower() == "true"
@@ -762,3 +789,34 @@ def test_api_request_no_sleep_on_first_try_success(chm_connector, mocker):
 
     assert response is ok_response
     mock_sleep.assert_not_called()
+
+
+def test_api_request_honors_retry_after_and_tightens_limiter(chm_connector, mocker):
+    """Retry-After replaces the schedule entry, and the shared limiter slows down."""
+    sleeps = []
+    mocker.patch("chmeetings.backend_connector.time.sleep", side_effect=sleeps.append)
+
+    rate_limited = mocker.Mock(status_code=429, headers={"Retry-After": "3"})
+    ok_response = mocker.Mock(status_code=200)
+    responses = iter([rate_limited, ok_response])
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("requests.Session.get", lambda *a, **k: next(responses))
+        response = chm_connector._api_request("GET", "api/v1/people")
+
+    assert response is ok_response
+    assert sleeps == [3.0]
+    assert chm_connector.rate_limiter.rate == 1 / CHM_MIN_REQUEST_INTERVAL_SECONDS / 2
+
+
+def test_api_request_paces_through_rate_limiter(chm_connector, mocker):
+    """Every first attempt takes a limiter token; call sites add no sleeps."""
+    acquire = mocker.patch.object(chm_connector.rate_limiter, "acquire", return_value=0.0)
+    ok_response = mocker.Mock(status_code=200)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("requests.Session.get", lambda *a, **k: ok_response)
+        chm_connector._api_request("GET", "api/v1/people")
+        chm_connector._api_request("GET", "api/v1/people")
+
+    assert acquire.call_count == 2
@@ -66,10 +66,10 @@ def consent_checker(mocker):
     chm = MagicMock()
     chm.authenticate.return_value = True
     chm.update_person.return_value = True
+    chm.count_people.return_value = None
     wp = MagicMock()
     captured = {}
 
-    mocker.patch("sync.consent_checker.time.sleep", return_value=None)
     checker = ConsentChecker(chm, wp)
     mocker.patch.object(
         checker,
@@ -546,3 +546,163 @@ def test_check_consent_dry_run_does_not_touch_wordpress(consent_checker, mocker)
 
     assert summary["dry_run"] == 1
     wp.update_participant.assert_not_called()
+
+
+def test_participant_index_matches_full_scan_including_ties():
+    from sync.consent_checker import _ParticipantIndex
+
+    participants = [
+        _make_wp_participant(chmeetings_id="1", email="a@example.com", phone="111"),
+        _make_wp_participant(chmeetings_id="2", email="b@example.com", phone="222"),
+        _make_wp_participant(
+            chmeetings_id="3",
+            first_name="Other",
+            birthdate="2001-01-01",
+            email="c@example.com",
+            phone="333",
+        ),
+    ]
+    consent_rows = [
+        {
+            "athlete_birthdate": "2008-04-15",
+            "athlete_phone": "222",
+            "athlete_email": "",
+            "normalized_signer_name": "jerry phan",
+        },
+        {
+            "athlete_birthdate": "2008-04-15",
+            "athlete_phone": "",
+            "athlete_email": "",
+            "normalized_signer_name": "jerry phan",
+        },
+        {
+            "athlete_birthdate": "1999-09-09",
+            "athlete_phone": "",
+            "athlete_email": "nobody@example.com",
+            "normalized_signer_name": "",
+        },
+    ]
+    checker = ConsentChecker(MagicMock(), MagicMock())
+    index = _ParticipantIndex(participants)
+
+    for consent_row in consent_rows:
+        expected = (None, -1, {"birthdate": 0, "phone": 0, "email": 0, "name": 0})
+        for participant in participants:
+            score, breakdown = checker._score(consent_row, participant)
+            if score > expected[1]:
+                expected = (participant, score, breakdown)
+        if expected[1] <= 0:
+            expected = (None, -1, {"birthdate": 0, "phone": 0, "email": 0, "name": 0})
+        assert index.best_match(consent_row) == expected
+
+    assert index.best_match(consent_rows[0])[0]["chmeetings_id"] == "2"
+    assert index.best_match(consent_rows[1])[0]["chmeetings_id"] == "1"
+    assert index.candidates(consent_rows[2]) == []
+
+
+def _season_export(count):
+    return [
+        {
+            "First Name": "Athlete",
+            "Last Name": f"Number{i}",
+            "Athlete Mobile Phone": f"562555{i:04d}",
+            "Athlete Email": f"athlete{i}@example.com",
+            "Athlete Birthdate": "2008-04-15",
+            "Select one:": "I am 18 or older and am signing this Agreement on my own behalf.",
+            "Full Name of the parents or legal guardian": "",
+            "Email of the parents or legal guardian": "",
+            "Cell phone of the parents or legal guardian": "",
+            "Submission Date": "2026-05-08 10:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def _season_participants(count):
+    return [
+        _make_wp_participant(
+            chmeetings_id=str(1000 + i),
+            first_name="Athlete",
+            last_name=f"Number{i}",
+            email=f"athlete{i}@example.com",
+            phone=f"562555{i:04d}",
+        )
+        for i in range(count)
+    ]
+
+
+def test_check_consent_snapshot_skips_already_checked_without_person_reads(
+    consent_checker, mocker
+):
+    checker, chm, wp, captured = consent_checker
+    chm.count_people.return_value = 4  # one page
+    _mock_consent_export(mocker, _season_export(3))
+    wp.get_participants.side_effect = [_season_participants(3), []]
+    chm.get_people.return_value = [
+        _make_chm_person(chmeetings_id="1000", selected_option_ids=[CONSENT_CHECKLIST_OPTION_ID]),
+        _make_chm_person(chmeetings_id="1001", selected_option_ids=[CONSENT_CHECKLIST_OPTION_ID]),
+        _make_chm_person(chmeetings_id="1002"),
+    ]
+    chm.get_person.side_effect = lambda chm_id: _make_chm_person(chmeetings_id=chm_id)
+
+    summary = checker.run("consent.xlsx")
+
+    assert summary["skipped_already_done"] == 2
+    assert summary["checked"] == 1
+    chm.get_people.assert_called_once()
+    chm.get_person.assert_called_once_with("1002")
+    assert chm.update_person.call_args.args[0] == "1002"
+    audit = _read_audit(captured)
+    assert list(audit["CHM ID"]) == ["1000", "1001", "1002"]
+    assert list(audit["Action Taken"]) == ["skipped_already_done"] * 2 + ["checked"]
+
+
+def test_check_consent_skips_snapshot_when_org_spans_more_pages_than_matches(
+    consent_checker, mocker
+):
+    checker, chm, wp, _ = consent_checker
+    chm.count_people.return_value = 5_000  # 50 pages for 3 matches
+    _mock_consent_export(mocker, _season_export(3))
+    wp.get_participants.side_effect = [_season_participants(3), []]
+    chm.get_person.side_effect = lambda chm_id: _make_chm_person(chmeetings_id=chm_id)
+
+    summary = checker.run("consent.xlsx")
+
+    assert summary["checked"] == 3
+    chm.get_people.assert_not_called()
+    assert chm.get_person.call_count == 3
+
+
+def test_check_consent_dry_run_reads_only_the_snapshot(consent_checker, mocker):
+    checker, chm, wp, _ = consent_checker
+    chm.count_people.return_value = 4  # one page
+    _mock_consent_export(mocker, _season_export(4))
+    wp.get_participants.side_effect = [_season_participants(4), []]
+    chm.get_people.return_value = [
+        _make_chm_person(chmeetings_id=str(1000 + i)) for i in range(4)
+    ]
+
+    summary = checker.run("consent.xlsx", dry_run=True)
+
+    assert summary["dry_run"] == 4
+    chm.get_person.assert_not_called()
+    chm.update_person.assert_not_called()
+
+
+def test_check_consent_rereads_person_when_snapshot_fails_or_misses(consent_checker, mocker):
+    from chmeetings.backend_connector import ChMeetingsReadError
+
+    checker, chm, wp, _ = consent_checker
+    chm.count_people.return_value = 4  # one page
+    _mock_consent_export(mocker, _season_export(2))
+    wp.get_participants.side_effect = [_season_participants(2), []]
+    chm.get_people.side_effect = ChMeetingsReadError("page 3 failed")
+    chm.get_person.side_effect = lambda chm_id: (
+        _make_chm_person(chmeetings_id=chm_id) if chm_id == "1000" else None
+    )
+
+    summary = checker.run("consent.xlsx")
+
+    assert summary["checked"] == 1
+    assert summary["api_error"] == 1
+    assert chm.get_person.call_count == 2
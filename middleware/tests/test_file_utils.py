@@ -0,0 +1,65 @@
+# Tests for file_utils — atomic writes and process-wide defaults shared by the
+# local caches, ledgers and manifests.
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from file_utils import LazyDefault, atomic_write_bytes, atomic_write_json
+
+
+def test_atomic_write_json_creates_parent_and_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "nested" / "state.json"
+
+    atomic_write_json(target, {"b": 1, "a": 2}, sort_keys=True)
+
+    assert target.read_text(encoding="utf-8") == '{"a": 2, "b": 1}'
+    assert [p.name for p in target.parent.iterdir()] == ["state.json"]
+
+
+def test_atomic_writes_from_many_threads_never_share_a_temp_file(tmp_path):
+    target = tmp_path / "jar.json"
+    errors = []
+
+    def write(n):
+        try:
+            for i in range(50):
+                atomic_write_json(target, {"writer": n, "i": i})
+        except OSError as exc:  # a shared temp name would be replaced from under us
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert json.loads(target.read_text(encoding="utf-8"))["i"] == 49
+    assert [p.name for p in tmp_path.iterdir()] == ["jar.json"]
+
+
+def test_atomic_write_bytes_removes_temp_file_when_replace_fails(tmp_path, mocker):
+    target = tmp_path / "blob"
+    mocker.patch("file_utils.os.replace", side_effect=OSError("read-only"))
+
+    with pytest.raises(OSError):
+        atomic_write_bytes(target, b"data")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_lazy_default_builds_one_instance_or_none_when_disabled(tmp_path):
+    built = []
+
+    def factory(path: Path):
+        built.append(path)
+        return object()
+
+    default = LazyDefault(factory, tmp_path / "cache.json")
+    assert default.get() is default.get()
+    assert built == [tmp_path / "cache.json"]
+
+    assert LazyDefault(factory, None).get() is None
+    assert len(built) == 1
@@ -0,0 +1,159 @@
+# Tests for frame_utils columnar ingestion helpers.
+# The column helpers must agree cell-for-cell with the scalar normalizers the
+# row-wise loaders used, so each test compares against those helpers directly.
+import datetime
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from frame_utils import (
+    datetime_column,
+    first_text_column,
+    frame_records,
+    iso_date_column,
+    phone_column,
+    source_row_numbers,
+    text_column,
+    zip_records,
+)
+from group_assignment import (
+    _clean_cell,
+    _load_source_export_rows,
+    _normalize_phone,
+    _normalize_text,
+    _parse_form_date,
+)
+
+
+MIXED_DATES = [
+    pd.Timestamp("2010-03-04"),
+    " 2010-03-05 ",
+    "03/06/2010",
+    "3/7/10",
+    None,
+    np.nan,
+    "not a date",
+    "March 8, 2010",
+    datetime.datetime(2011, 1, 1, 5, 30),
+    "",
+]
+
+
+def test_text_column_matches_scalar_clean_cell():
+    values = ["  Anna ", np.nan, None, "Bao  Tran", 42, "", "  "]
+    df = pd.DataFrame({"Name": values})
+
+    assert text_column(df, "Name") == [_clean_cell(v) for v in values]
+    assert text_column(df, "Name", lower=True) == [_normalize_text(v) for v in values]
+
+
+def test_text_column_collapse_whitespace():
+    df = pd.DataFrame({"Email": ["  A@Example.COM ", "first  last", np.nan]})
+
+    assert text_column(df, "Email", lower=True, collapse_whitespace=True) == [
+        "a@example.com",
+        "first last",
+        "",
+    ]
+
+
+def test_missing_column_yields_blanks():
+    df = pd.DataFrame({"Other": [1, 2]})
+
+    assert text_column(df, "Email") == ["", ""]
+    assert phone_column(df, "Mobile Phone") == ["", ""]
+    assert iso_date_column(df, "Birthdate") == ["", ""]
+    assert datetime_column(df, "Submission Date") == [None, None]
+
+
+def test_phone_column_matches_scalar_normalizer():
+    values = ["(714) 555-1234", np.nan, 7145551234.0, "", None, "ext. 12"]
+    df = pd.DataFrame({"Phone": values})
+
+    assert phone_column(df, "Phone") == [_normalize_phone(v) for v in values]
+
+
+def test_iso_date_column_matches_scalar_form_date_parser():
+    df = pd.DataFrame({"Birthdate": pd.Series(MIXED_DATES, dtype=object)})
+
+    assert iso_date_column(df, "Birthdate") == [_parse_form_date(v) for v in MIXED_DATES]
+
+
+def test_iso_date_column_handles_native_datetime_dtype():
+    df = pd.DataFrame({"Birthdate": pd.to_datetime(["2009-12-31", None])})
+
+    assert iso_date_column(df, "Birthdate") == ["2009-12-31", ""]
+
+
+def test_datetime_column_returns_python_datetimes_or_none():
+    df = pd.DataFrame({"Submission Date": ["2026-04-01 10:15", "", np.nan, "junk"]})
+
+    assert datetime_column(df, "Submission Date") == [
+        datetime.datetime(2026, 4, 1, 10, 15),
+        None,
+        None,
+        None,
+    ]
+
+
+def test_first_text_column_prefers_earliest_non_blank_column():
+    df = pd.DataFrame({"A": ["", np.nan, "x"], "B": ["b1", "b2", "b3"]})
+
+    assert first_text_column(df, "Missing", "A", "B") == ["b1", "b2", "x"]
+
+
+def test_source_row_numbers_and_records():
+    df = pd.DataFrame({"Quantity": [2, 3], "Name": ["Gym A", np.nan]})
+
+    assert source_row_numbers(df) == [2, 3]
+    assert zip_records({"a": [1, 2], "b": ["x", "y"]}) == [
+        {"a": 1, "b": "x"},
+        {"a": 2, "b": "y"},
+    ]
+    records = frame_records(df)
+    assert records[0] == {"Quantity": 2, "Name": "Gym A"}
+    assert isinstance(records[1]["Quantity"], int)
+    assert pd.isna(records[1]["Name"])
+
+
+def test_load_source_export_rows_skips_blank_church_and_keeps_row_numbers(mocker):
+    mocker.patch(
+        "group_assignment.pd.read_excel",
+        return_value=pd.DataFrame(
+            [
+                {
+                    "First Name": " Anna ",
+                    "Last Name": "Tran",
+                    "Church Team": " rpc ",
+                    "Email": " Anna@Example.com ",
+                    "Mobile Phone": "(714) 555-0101",
+                    "Birthdate": "03/04/2008",
+                },
+                {
+                    "First Name": "No",
+                    "Last Name": "Church",
+                    "Church Team": np.nan,
+                    "Email": "",
+                    "Mobile Phone": np.nan,
+                    "Birthdate": np.nan,
+                },
+            ]
+        ),
+    )
+
+    rows = _load_source_export_rows("export.xlsx")
+
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["source_row"] == "2"
+    assert row["first_name"] == "Anna"
+    assert row["church_code"] == "RPC"
+    assert row["email"] == "anna@example.com"
+    assert row["email_display"] == "Anna@Example.com"
+    assert row["mobile_phone"] == "7145550101"
+    assert row["birth_date"] == "2008-03-04"
+    assert row["parent_name"] == ""
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from chmeetings.backend_connector import ChMeetingsReadError
+from group_membership import MembershipSnapshotCache
 from group_assignment import (
     assign_people_to_church_team_groups,
     audit_form_people,
@@ -906,6 +907,57 @@ def test_clear_team_groups_requires_execute_for_live_mode(mock_connector, mocker
     mock_connector.authenticate.assert_not_called()
 
 
+def test_assign_rerun_plans_from_cached_snapshot_with_no_writes(mock_connector, mocker, tmp_path):
+    """A rerun within the cache TTL reads no Team group and writes nothing."""
+    mocker.patch("group_assignment.DATA_DIR", tmp_path)
+    cache = MembershipSnapshotCache(tmp_path / "team_membership.json", ttl_seconds=600, scope="test")
+    mocker.patch("group_assignment.default_membership_cache", return_value=cache)
+
+    mock_connector.get_people.return_value = [
+        _make_person("111", "RPC"),
+        _make_person("112", "ORN"),
+    ]
+    mock_connector.get_groups.return_value = [
+        {"id": "870578", "name": "Team RPC"},
+        {"id": "872490", "name": "Team ORN"},
+    ]
+    mock_connector.get_group_people.side_effect = [[{"person_id": "112"}], []]
+
+    assert assign_people_to_church_team_groups(dry_run=False) is True
+    mock_connector.add_person_to_group.assert_called_once_with("870578", "111")
+    assert mock_connector.get_group_people.call_count == 2
+
+    mock_connector.add_person_to_group.reset_mock()
+    mock_connector.get_group_people.reset_mock()
+    reloaded = MembershipSnapshotCache(cache.path, ttl_seconds=600, scope="test")
+    mocker.patch("group_assignment.default_membership_cache", return_value=reloaded)
+
+    assert assign_people_to_church_team_groups(dry_run=False) is True
+    mock_connector.add_person_to_group.assert_not_called()
+    mock_connector.get_group_people.assert_not_called()
+
+
+def test_clear_team_groups_reads_live_and_updates_cached_snapshot(mock_connector, mocker, tmp_path):
+    """Clearing ignores cached members, then records the removals in the cache."""
+    mocker.patch("group_assignment.DATA_DIR", tmp_path)
+    cache = MembershipSnapshotCache(tmp_path / "team_membership.json", ttl_seconds=600, scope="test")
+    mocker.patch("group_assignment.default_membership_cache", return_value=cache)
+
+    mock_connector.get_groups.return_value = [{"id": "870578", "name": "Team RPC"}]
+    mock_connector.get_group_people.return_value = [{"person_id": "121"}]
+    mock_connector.last_group_membership_delete_status = "removed"
+    assert assign_people_to_church_team_groups(dry_run=False) is True
+
+    mock_connector.get_group_people.return_value = [{"person_id": "121"}, {"person_id": "122"}]
+    result = clear_team_groups(dry_run=False, execute=True)
+
+    assert result is True
+    assert mock_connector.get_group_people.call_count == 2
+    assert mock_connector.remove_person_from_group.call_count == 2
+    fetched_at, members = cache.fresh_members("870578", 600)
+    assert members == []
+
+
 def test_assign_other_routed_to_lost_and_found(mock_connector, mocker, tmp_path):
     """Person with church_code 'Other' is assigned to the Lost and Found group."""
     mocker.patch("group_assignment.DATA_DIR", tmp_path)
@@ -0,0 +1,68 @@
+# Tests for group_membership: the Team-group snapshot, change planning and cache.
+import os
+import sys
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from group_membership import (
+    ADD,
+    REMOVE,
+    MembershipChange,
+    MembershipSnapshotCache,
+    apply_membership_changes,
+    load_membership_snapshot,
+)
+
+
+GROUPS = [{"id": 1, "name": "Team RPC"}, {"id": 2, "name": "Team ORN"}]
+
+
+def test_snapshot_indexes_both_ways_and_plans_minimal_changes():
+    chm = MagicMock()
+    chm.get_group_people.side_effect = [
+        [{"person_id": "10", "first_name": "Amy"}, {"person_id": "11"}],
+        [{"id": "11"}],
+    ]
+    chm.add_person_to_group.return_value = True
+    chm.remove_person_from_group.return_value = True
+    chm.last_group_membership_delete_status = "removed"
+
+    snapshot = load_membership_snapshot(chm, GROUPS)
+
+    assert snapshot.groups_of("11") == {"1", "2"}
+    assert snapshot.people_in(["1"]) == {"10", "11"}
+    assert snapshot.members("1")[0]["first_name"] == "Amy"
+
+    adds = snapshot.plan_additions([("1", "10"), ("2", "12"), ("2", "12")])
+    assert adds == [MembershipChange(ADD, "2", "Team ORN", "12")]
+    removes = snapshot.plan_removals(["1"], person_ids=["11"])
+    assert removes == [MembershipChange(REMOVE, "1", "Team RPC", "11")]
+
+    assert apply_membership_changes(chm, snapshot, adds + removes) == ["added", "removed"]
+    assert snapshot.groups_of("12") == {"2"}
+    assert snapshot.groups_of("11") == {"2"}
+    assert snapshot.plan_additions([("2", "12")]) == []
+
+
+def test_cache_serves_fresh_groups_and_skips_failed_reads(tmp_path):
+    path = tmp_path / "team_membership.json"
+    chm = MagicMock()
+
+    def get_group_people(group_id):
+        chm.last_get_group_people_status = "failed" if group_id == "2" else "ok"
+        return [{"person_id": "10"}] if group_id == "1" else []
+
+    chm.get_group_people.side_effect = get_group_people
+    cache = MembershipSnapshotCache(path, ttl_seconds=600, scope="site-a")
+    cache.store(load_membership_snapshot(chm, GROUPS, cache=cache))
+    assert chm.get_group_people.call_count == 2
+
+    chm.get_group_people.reset_mock()
+    snapshot = load_membership_snapshot(chm, GROUPS, cache=MembershipSnapshotCache(path, scope="site-a"))
+    assert [call.args[0] for call in chm.get_group_people.call_args_list] == ["2"]
+    assert snapshot.people_in(["1"]) == {"10"}
+
+    chm.get_group_people.reset_mock()
+    load_membership_snapshot(chm, GROUPS, cache=MembershipSnapshotCache(path, scope="site-b"))
+    assert chm.get_group_people.call_count == 2
@@ -0,0 +1,34 @@
+# Tests for sync.issue_ledger.ValidationIssueLedger — the local record of
+# validation-issue sets last synced to WordPress.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sync.issue_ledger import CHURCH, PARTICIPANT, ValidationIssueLedger, issue_set_digest
+
+
+def test_digest_ignores_issue_order_but_not_content_or_context():
+    first = {"type": "missing_photo", "severity": "WARNING"}
+    second = {"type": "missing_consent", "severity": "ERROR"}
+
+    assert issue_set_digest([first, second], church_code="RPC") == issue_set_digest([second, first], church_code="RPC")
+    assert issue_set_digest([first], church_code="RPC") != issue_set_digest([first], church_code="ABC")
+    assert issue_set_digest([first]) != issue_set_digest([{**first, "severity": "ERROR"}])
+
+
+def test_ledger_persists_per_site_and_expires_entries(tmp_path, mocker):
+    path = tmp_path / "ledger.json"
+    ledger = ValidationIssueLedger(path, max_age_seconds=3600, scope="https://site-a")
+    ledger.record(PARTICIPANT, 42, "abc")
+    ledger.record(CHURCH, 1, "def")
+    ledger.save()
+
+    reopened = ValidationIssueLedger(path, max_age_seconds=3600, scope="https://site-a")
+    assert reopened.is_unchanged(PARTICIPANT, "42", "abc")
+    assert not reopened.is_unchanged(PARTICIPANT, "42", "changed")
+    assert reopened.is_unchanged(CHURCH, 1, "def")
+    assert not ValidationIssueLedger(path, scope="https://site-b").is_unchanged(PARTICIPANT, 42, "abc")
+
+    mocker.patch("sync.issue_ledger.time.time", return_value=10**12)
+    assert not reopened.is_unchanged(PARTICIPANT, 42, "abc")
@@ -1,13 +1,19 @@
 import argparse
 import datetime as dt
 import json
+import os
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import PatternFill
 
+import church_teams_export
 import main
 from schedule_workbook import ScheduleWorkbookBuilder
+from wordpress import frontend_connector
 
 
 def _run_main_expect_exit(expected_code: int) -> None:
@@ -464,6 +470,17 @@ def test_parse_args_generate_scoresheets_bible_challenge(monkeypatch):
     assert args.sport == "bible-challenge"
 
 
+def test_parse_args_generate_scoresheets_all_with_workers(monkeypatch):
+    monkeypatch.setattr(
+        main.sys,
+        "argv",
+        ["main.py", "generate-scoresheets", "--sport", "all", "--workers", "3"],
+    )
+    args = main.parse_args()
+    assert args.sport == "all"
+    assert args.workers == 3
+
+
 def test_parse_args_generate_scoresheets_defaults_have_no_filters(monkeypatch):
     """No --stage/--game-key supplied: both parse to None (Issue #348)."""
     monkeypatch.setattr(
@@ -626,9 +643,18 @@ class _FakeWordPressConnectorForPublish:
         self.get_schedules_calls += 1
         return []
 
-    def upsert_schedules(self, games, schedule_version, force_cancel=False):
+    def get_schedule_manifest(self, updated_since=None, since_version=None):
+        self.get_schedules_calls += 1
+        return {"rows": [], "total": 0, "max_updated_at": None}
+
+    def upsert_schedules(self, games, schedule_version, force_cancel=False, idempotency_key=None):
         self.upsert_calls.append(
-            {"games": games, "schedule_version": schedule_version, "force_cancel": force_cancel}
+            {
+                "games": games,
+                "schedule_version": schedule_version,
+                "force_cancel": force_cancel,
+                "idempotency_key": idempotency_key,
+            }
         )
         return {
             "success": True,
@@ -668,7 +694,7 @@ def _write_publish_schedule_fixtures(tmp_path):
 def test_main_publish_schedule_dry_run_never_upserts(monkeypatch, tmp_path):
     schedule_input_path, schedule_output_path = _write_publish_schedule_fixtures(tmp_path)
     fake_connector = _FakeWordPressConnectorForPublish()
-    monkeypatch.setattr(main, "WordPressConnector", lambda: fake_connector)
+    monkeypatch.setattr(frontend_connector, "WordPressConnector", lambda: fake_connector)
     monkeypatch.setattr(
         main.sys,
         "argv",
@@ -690,7 +716,7 @@ def test_main_publish_schedule_dry_run_never_upserts(monkeypatch, tmp_path):
 def test_main_publish_schedule_execute_upserts_once(monkeypatch, tmp_path):
     schedule_input_path, schedule_output_path = _write_publish_schedule_fixtures(tmp_path)
     fake_connector = _FakeWordPressConnectorForPublish()
-    monkeypatch.setattr(main, "WordPressConnector", lambda: fake_connector)
+    monkeypatch.setattr(frontend_connector, "WordPressConnector", lambda: fake_connector)
     monkeypatch.setattr(
         main.sys,
         "argv",
@@ -1161,7 +1187,7 @@ def test_schedule_pipeline_export_solve_produce_local(mocker, monkeypatch, tmp_p
     schedule_input_path = export_dir / "schedule_input.json"
     schedule_output_path = export_dir / "schedule_output.json"
     workbook_path = export_dir / "VAYSF_Schedule_test.xlsx"
-    real_exporter_cls = main.ChurchTeamsExporter
+    real_exporter_cls = church_teams_export.ChurchTeamsExporter
 
     class FakeExporter:
         def __enter__(self):
@@ -1191,7 +1217,7 @@ def test_schedule_pipeline_export_solve_produce_local(mocker, monkeypatch, tmp_p
             schedule_input.write_text(json.dumps(data), encoding="utf-8")
             return True
 
-    monkeypatch.setattr(main, "ChurchTeamsExporter", FakeExporter)
+    monkeypatch.setattr(church_teams_export, "ChurchTeamsExporter", FakeExporter)
 
     monkeypatch.setattr(
         main,
@@ -1209,7 +1235,7 @@ def test_schedule_pipeline_export_solve_produce_local(mocker, monkeypatch, tmp_p
     )
     _run_main_expect_exit(0)
     assert schedule_input_path.exists()
-    monkeypatch.setattr(main, "ChurchTeamsExporter", real_exporter_cls)
+    monkeypatch.setattr(church_teams_export, "ChurchTeamsExporter", real_exporter_cls)
 
     monkeypatch.setattr(
         main,
@@ -1335,3 +1361,64 @@ def test_main_import_match_schedule_overrides_execute_writes_sidecar(monkeypatch
     assert sidecar_path.exists()
     payload = json.loads(sidecar_path.read_text(encoding="utf-8"))
     assert payload["validation"]["created_game_count"] == 2
+
+
+MIDDLEWARE_DIR = Path(main.__file__).resolve().parent
+HEAVY_STARTUP_MODULES = {"pandas", "ortools", "PIL"}
+
+
+def _startup_imports(python_args: list[str]) -> tuple[set[str], int, str]:
+    """Run the interpreter with -X importtime; return top-level modules, main's cumulative µs and stdout."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *python_args],
+        cwd=MIDDLEWARE_DIR,
+        env={**os.environ, "APP_ENV": "test"},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    modules: set[str] = set()
+    main_cumulative_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = [field.strip() for field in line[len("import time:"):].split("|")]
+        if len(fields) != 3 or not fields[1].isdigit():
+            continue  # the column header line
+        modules.add(fields[2].split(".")[0])
+        if fields[2] == "main":
+            main_cumulative_us = int(fields[1])
+    return modules, main_cumulative_us, result.stdout
+
+
+@pytest.mark.parametrize(
+    "python_args",
+    [
+        ["-c", "import sys, main; sys.argv = ['main.py', 'config']; main.main()"],
+        # inspect-person: run the handler itself against stub connectors, so
+        # everything it imports on the way is counted.
+        [
+            "-c",
+            "import argparse, main\n"
+            "from unittest import mock\n"
+            "with mock.patch('chmeetings.backend_connector.ChMeetingsConnector') as chm, "
+            "mock.patch('wordpress.frontend_connector.WordPressConnector') as wp:\n"
+            "    chm.return_value.__enter__.return_value.get_person.return_value = {'id': '1'}\n"
+            "    wp.return_value.__enter__.return_value.get_participants.return_value = []\n"
+            "    ok = main.COMMAND_HANDLERS['inspect-person'](argparse.Namespace(chm_id='1'))\n"
+            "print('HANDLER_RAN', ok)",
+        ],
+    ],
+    ids=["config", "inspect-person"],
+)
+def test_light_commands_do_not_import_heavy_dependencies(python_args):
+    modules, main_cumulative_us, stdout = _startup_imports(python_args)
+
+    assert "main" in modules
+    if "inspect-person" in python_args[-1]:
+        assert "HANDLER_RAN True" in stdout
+    heavy = sorted(modules & HEAVY_STARTUP_MODULES)
+    assert not heavy, (
+        f"light command imported {heavy} at startup "
+        f"(import main took {main_cumulative_us / 1000:.0f} ms cumulative)"
+    )
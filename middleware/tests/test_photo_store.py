@@ -0,0 +1,236 @@
+# Tests for photo_store.PhotoStore — the persistent photo cache shared by
+# score sheets, badges and roster-workbook photo enrichment.
+import io
+import os
+import pickle
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from badges.generator import BadgeGenerator
+from badges.runner import BadgeRunner
+from photo_store import PhotoStore
+from scoresheets import PhotoCache, enrich_roster_photos_from_workbook
+
+
+def _png_bytes(color=(30, 120, 220), size=(120, 80)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _response(content=b"", status_code=200, headers=None):
+    response = MagicMock()
+    response.content = content
+    response.status_code = status_code
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status_code}")
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+def _store(tmp_path, mocker, responses, **kwargs):
+    store = PhotoStore(tmp_path / "photos", **kwargs)
+    session = MagicMock()
+    session.get.side_effect = responses
+    mocker.patch.object(PhotoStore, "_session", return_value=session)
+    return store, session
+
+
+def test_fetch_downloads_once_then_revalidates_once_per_run(tmp_path, mocker):
+    data = _png_bytes()
+    store, session = _store(
+        tmp_path,
+        mocker,
+        [_response(data, headers={"ETag": '"v1"'}), _response(status_code=304)],
+    )
+
+    assert store.fetch("https://chm.example/a.jpg") == (data, "downloaded")
+    assert store.fetch("https://chm.example/a.jpg") == (data, "cached")
+    store.save()
+
+    # With revalidation on every run, a later run asks once whether the photo
+    # behind the URL changed.
+    reopened = PhotoStore(tmp_path / "photos", revalidate_after_seconds=0)
+    assert reopened.fetch("https://chm.example/a.jpg") == (data, "revalidated")
+    assert reopened.fetch("https://chm.example/a.jpg") == (data, "cached")
+    assert session.get.call_count == 2
+
+
+def test_default_revalidation_window_serves_from_disk_across_runs(tmp_path, mocker):
+    data = _png_bytes()
+    store, session = _store(tmp_path, mocker, [_response(data)])
+    store.fetch("https://chm.example/a.jpg")
+    store.save()
+
+    reopened = PhotoStore(tmp_path / "photos")
+    assert reopened.fetch("https://chm.example/a.jpg") == (data, "cached")
+    assert session.get.call_count == 1
+
+
+def test_replaced_photo_is_downloaded_again_on_the_next_run(tmp_path, mocker):
+    old, new = _png_bytes(), _png_bytes(color=(200, 40, 40))
+    store, _ = _store(
+        tmp_path, mocker, [_response(old, headers={"ETag": '"v1"'}), _response(new)],
+    )
+    store.fetch("https://chm.example/a.jpg")
+    store.save()
+
+    reopened = PhotoStore(tmp_path / "photos", revalidate_after_seconds=0)
+    assert reopened.fetch("https://chm.example/a.jpg") == (new, "downloaded")
+
+
+def test_stale_entry_is_revalidated_with_etag_and_kept_on_304(tmp_path, mocker):
+    data = _png_bytes()
+    store, session = _store(
+        tmp_path,
+        mocker,
+        [_response(data, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jun 2026 00:00:00 GMT"}),
+         _response(status_code=304)],
+    )
+
+    store.fetch("https://chm.example/a.jpg")
+    store.save()
+    reopened = PhotoStore(tmp_path / "photos", revalidate_after_seconds=0)
+    assert reopened.fetch("https://chm.example/a.jpg") == (data, "revalidated")
+
+    headers = session.get.call_args_list[1].kwargs["headers"]
+    assert headers == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jun 2026 00:00:00 GMT",
+    }
+
+
+def test_fetch_rejects_non_image_and_get_bytes_returns_none(tmp_path, mocker):
+    store, _ = _store(
+        tmp_path,
+        mocker,
+        [_response(b"<html>login</html>"), _response(status_code=404)],
+    )
+
+    with pytest.raises(OSError):
+        store.fetch("https://chm.example/a.jpg")
+    assert store.get_bytes("https://chm.example/b.jpg") is None
+    assert store.get_bytes("/local/photo.jpg") is None
+
+
+def test_thumbnail_is_stored_pre_decoded_and_reused(tmp_path, mocker):
+    store, session = _store(
+        tmp_path, mocker, [_response(_png_bytes(size=(120, 80)))],
+    )
+
+    thumb = store.thumbnail("https://chm.example/a.jpg", (40, 40))
+    store.save()
+    mocker.patch("photo_store.Image.open", side_effect=AssertionError("decoded again"))
+    again = PhotoStore(tmp_path / "photos").thumbnail("https://chm.example/a.jpg", (40, 40))
+
+    assert thumb.size == (40, 27)
+    assert again.size == thumb.size
+    assert again.tobytes() == thumb.tobytes()
+    assert session.get.call_count == 1
+
+
+def test_prefetch_downloads_unique_remote_urls(tmp_path, mocker):
+    data = _png_bytes()
+    store, session = _store(tmp_path, mocker, lambda *args, **kwargs: _response(data))
+
+    fetched = store.prefetch(
+        ["https://chm.example/a.jpg", "https://chm.example/b.jpg", "https://chm.example/a.jpg", "", "C:/photo.jpg"],
+        workers=4,
+    )
+
+    assert fetched == 2
+    assert session.get.call_count == 2
+    assert (tmp_path / "photos" / "index.json").is_file()
+    assert store.prefetch(["https://chm.example/a.jpg"]) == 0
+
+
+def test_save_evicts_least_recently_used_photos(tmp_path, mocker):
+    photos = [_png_bytes(color=(i * 40, 0, 0)) for i in range(3)]
+    store, _ = _store(
+        tmp_path,
+        mocker,
+        [_response(data) for data in photos],
+        max_bytes=max(len(data) for data in photos) * 2,
+    )
+    mocker.patch("photo_store.time.time", side_effect=[100.0, 200.0, 300.0, 400.0])
+
+    store.fetch("https://chm.example/0.jpg")
+    store.fetch("https://chm.example/1.jpg")
+    store.fetch("https://chm.example/2.jpg")
+    store.fetch("https://chm.example/0.jpg")  # touch: 1.jpg is now least recently used
+    store.save()
+
+    reopened = PhotoStore(tmp_path / "photos")
+    assert set(reopened._index) == {"https://chm.example/0.jpg", "https://chm.example/2.jpg"}
+
+
+def test_store_survives_pickling_for_render_workers(tmp_path, mocker):
+    data = _png_bytes()
+    store, _ = _store(tmp_path, mocker, [_response(data)])
+    store.fetch("https://chm.example/a.jpg")
+
+    clone = pickle.loads(pickle.dumps(store))
+
+    assert clone.fetch("https://chm.example/a.jpg") == (data, "cached")
+
+
+def test_photo_cache_uses_store_thumbnails_for_remote_photos(tmp_path, mocker):
+    store, session = _store(tmp_path, mocker, [_response(_png_bytes(size=(120, 80)))])
+    cache = PhotoCache(store=store)
+
+    first = cache.load('=IMAGE("https://chm.example/a.jpg")', size=(44, 46))
+    second = PhotoCache(store=store).load("https://chm.example/a.jpg", size=(44, 46))
+
+    assert first.size == second.size == (44, 29)
+    assert session.get.call_count == 1
+
+
+def test_badge_runner_reuses_photos_cached_by_an_earlier_run(tmp_path, mocker):
+    data = _png_bytes()
+    store, session = _store(tmp_path, mocker, [_response(data)])
+    chm = MagicMock()
+    chm.get_person.return_value = {"id": "3139537", "photo": "https://chm.example/a.jpg"}
+    direct_get = mocker.patch("badges.runner.requests.get")
+    runner = BadgeRunner(
+        chm,
+        MagicMock(),
+        BadgeGenerator(output_dir=tmp_path / "badges", filename_salt="test-only-badge-salt"),
+        photo_store=store,
+    )
+
+    first = runner._fetch_photo_bytes({"chmeetings_id": "3139537"})
+    second = runner._fetch_photo_bytes({"chmeetings_id": "3139537"})
+
+    assert first == second == data
+    assert session.get.call_count == 1
+    direct_get.assert_not_called()
+
+
+def test_enrich_roster_photos_remembers_formulas_per_workbook_file(tmp_path, mocker):
+    from openpyxl import Workbook
+
+    workbook_path = tmp_path / "roster.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Roster"
+    ws.append(["Church Team", "Photo"])
+    ws.append(["RPC", '=IMAGE("https://example.test/player.jpg")'])
+    wb.save(workbook_path)
+    store = PhotoStore(tmp_path / "photos")
+    rows = [{"Church Team": "RPC", "Photo": None}]
+
+    first = enrich_roster_photos_from_workbook(rows, workbook_path, store=store)
+    load = mocker.patch("openpyxl.load_workbook", side_effect=AssertionError("re-read"))
+    second = enrich_roster_photos_from_workbook(rows, workbook_path, store=store)
+
+    assert first == second
+    assert second[0]["Photo"] == '=IMAGE("https://example.test/player.jpg")'
+    load.assert_not_called()
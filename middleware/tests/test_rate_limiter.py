@@ -0,0 +1,101 @@
+# Tests for chmeetings.rate_limiter — the adaptive token bucket that paces
+# every ChMeetings request made through ChMeetingsConnector._api_request.
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from chmeetings.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _limiter(clock, **kwargs):
+    kwargs.setdefault("rate", 5.0)
+    kwargs.setdefault("burst", 2)
+    return AdaptiveRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_burst_is_free_then_requests_are_spaced_at_the_rate():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == waits[3] == 0.2
+
+
+def test_request_latency_counts_towards_pacing():
+    clock = FakeClock()
+    limiter = _limiter(clock, burst=1)
+    limiter.acquire()
+    clock.now += 0.4  # the request itself took 400 ms
+
+    assert limiter.acquire() == 0.0
+
+
+def test_concurrent_callers_reserve_distinct_slots():
+    clock = FakeClock()
+    limiter = _limiter(clock, burst=1)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        wait = limiter.reserve()
+        with lock:
+            waits.append(round(wait, 6))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits) == [0.0, 0.2, 0.4, 0.6, 0.8]
+
+
+def test_throttle_halves_rate_blocks_callers_and_success_recovers():
+    clock = FakeClock()
+    limiter = _limiter(clock, recover_after=3, recover_step=1.0)
+
+    limiter.on_throttle(5.0)
+
+    assert limiter.rate == 2.5
+    assert limiter.reserve() == 5.0
+    for _ in range(3):
+        limiter.on_success()
+    assert limiter.rate == 3.5
+    for _ in range(6):
+        limiter.on_success()
+    assert limiter.rate == 5.0
+
+
+def test_throttle_never_drops_below_min_rate():
+    limiter = _limiter(FakeClock(), min_rate=1.0)
+
+    for _ in range(10):
+        limiter.on_throttle(0)
+
+    assert limiter.rate == 1.0
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    now = datetime(2026, 7, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    assert parse_retry_after({"Retry-After": "7"}) == 7.0
+    assert parse_retry_after({"Retry-After": "Wed, 01 Jul 2026 12:00:30 GMT"}, now=now) == 30.0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+    assert parse_retry_after(object()) is None
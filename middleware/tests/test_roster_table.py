@@ -0,0 +1,92 @@
+# Tests for scheduling.roster_table.RosterTable — the normalized roster index
+# shared by the schedule workbook builders.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from schedule_workbook import ScheduleWorkbookBuilder
+from scheduling.roster_table import RosterTable
+
+
+def _row(pid, church, sport_type, gender="Men", fmt="Team", team_order="", **extra):
+    row = {
+        "Participant ID (WP)": pid,
+        "First Name": f" First{pid} ",
+        "Last Name": f"Last{pid}",
+        "Church Team": church,
+        "sport_type": sport_type,
+        "sport_gender": gender,
+        "sport_format": fmt,
+        "team_order": team_order,
+    }
+    row.update(extra)
+    return row
+
+
+ROWS = [
+    _row("1", " rpc ", "Basketball"),
+    _row("2", "RPC", "basketball ", team_order="b"),
+    _row("3", "ANH", "Basketball - Men Team"),
+    _row("4", "", "Basketball"),
+    _row("5", "RPC", "Basketball", gender="Women"),
+    _row("6", "FVC", "Badminton", fmt="Men Singles"),
+    _row("7", "FVC", "Basketball", fmt="Singles"),
+]
+
+
+def test_roster_table_behaves_like_the_original_row_list():
+    table = RosterTable(ROWS)
+
+    assert len(table) == len(ROWS)
+    assert table[0] is ROWS[0]
+    assert list(table) == ROWS
+    assert RosterTable.of(table) is table
+
+
+def test_entries_precompute_normalized_keys():
+    entry = RosterTable(ROWS).entries[1]
+
+    assert entry.church == "RPC"
+    assert entry.team_order == "B"
+    assert entry.team_id == "RPC-B"
+    assert entry.sport_type_cf == "basketball"
+    assert entry.full_name == "First2 Last2"
+
+
+def test_event_teams_matches_base_and_full_event_names_in_roster_order():
+    table = RosterTable(ROWS)
+
+    teams = table.event_teams("Basketball - Men Team", "Basketball", "Men")
+
+    assert list(teams) == [("RPC", ""), ("RPC", "B"), ("ANH", ""), ("FVC", "")]
+    assert [e.participant_id for e in teams[("RPC", "")]] == ["1"]
+    assert table.event_teams("Basketball - Men Team", "Basketball", "Men") is teams
+
+
+def test_event_teams_team_format_only_drops_non_team_rows():
+    teams = RosterTable(ROWS).event_teams(
+        "Basketball - Men Team", "Basketball", "Men", team_format_only=True
+    )
+
+    assert ("FVC", "") not in teams
+
+
+def test_racquet_entries_and_sport_lookup():
+    table = RosterTable(ROWS)
+
+    assert [e.participant_id for e in table.racquet_entries] == ["6"]
+    assert [e.participant_id for e in table.sport_entries("BADMINTON")] == ["6"]
+    assert table.sport_entries("Soccer") == []
+
+
+def test_count_estimating_teams_same_for_list_and_table():
+    builder = ScheduleWorkbookBuilder()
+
+    from_list = builder._count_estimating_teams(ROWS, "Basketball - Men Team", 1)
+    from_table = builder._count_estimating_teams(
+        RosterTable(ROWS), "Basketball - Men Team", 1
+    )
+
+    assert from_list == from_table
+    assert from_table["team_codes"] == "ANH, FVC, RPC, RPC-B"
@@ -3,6 +3,7 @@ import json
 
 import pytest
 
+import schedule_contracts
 from schedule_contracts import (
     ScheduleContractError,
     validate_output_against_input,
@@ -486,6 +487,74 @@ def test_integer_duration_is_accepted_for_float_field():
     assert validate_schedule_input(data) == []
 
 
+# ---------------------------------------------------------------------------
+# Columnar fast path
+# ---------------------------------------------------------------------------
+
+def _per_item_reference(items, model, section, id_field):
+    """The original one-model_validate-per-item loop, kept as the oracle."""
+    from pydantic import ValidationError
+
+    errors, warnings, warned = [], [], set()
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append(f"{section}[{index}]: must be an object, got {type(item).__name__}")
+            continue
+        identity = item.get(id_field)
+        note = f" ({id_field}={identity!r})" if identity else ""
+        try:
+            model.model_validate(item)
+        except ValidationError as exc:
+            errors.extend(schedule_contracts._format_pydantic_errors(exc, f"{section}[{index}]", note))
+        for name in item:
+            if name in model.model_fields or schedule_contracts._is_annotation_field(name):
+                continue
+            if (section, name) not in warned:
+                warned.add((section, name))
+                warnings.append(
+                    f"{section}: unknown field {name!r} (first seen at {section}[{index}]{note}) "
+                    "— not part of the documented schema; use 'operator_notes' or an 'x_' "
+                    "prefix for operator annotations"
+                )
+    return errors, warnings
+
+
+@pytest.mark.parametrize("section, model, id_field, items", [
+    ("games", "_GameContract", "game_id", [
+        _game("G1"), _game("G2", duration_minutes="60", zeta=1), "not a game",
+        _game("G4", duration_minutes=float("nan")), _game("G5", round=True, alpha=2),
+        _game("G6", team_ids=["T1", 2]), _game("", x_note="ok", zeta=3),
+        {"game_id": "G8"}, _game("G9", seed=-1, duration_minutes=30.5),
+    ]),
+    ("resources", "_ResourceContract", "resource_id", [
+        _resource("R1"), _resource("R2", open_time="25:00"), _resource("R3", close_time=None),
+        _resource("R4", slot_minutes=0, playoff_pinned="yes"), _resource("R5", day=""),
+    ]),
+    ("pool_results", "_PoolResultContract", "resource_type", [
+        {"resource_type": "Gym Court", "status": "OPTIMAL", "assignments": [{"a": 1}]},
+        {"resource_type": "Gym Court", "status": "DONE", "solver_wall_seconds": -1.0},
+        {"resource_type": "Gym Court", "status": "FEASIBLE", "diagnostics": ["x"]},
+    ]),
+])
+def test_fast_path_matches_per_item_validation(section, model, id_field, items):
+    model = getattr(schedule_contracts, model)
+    errors, warnings = [], []
+    schedule_contracts._validate_items(items, model, section, id_field, errors, warnings, set())
+    assert errors
+    assert (errors, warnings) == _per_item_reference(items, model, section, id_field)
+
+
+def test_fast_path_leaves_valid_items_to_the_column_checks(mocker):
+    games = [_game(f"G{index}") for index in range(50)] + [_game("BAD", duration_minutes=0)]
+    spy = mocker.spy(schedule_contracts._GameContract, "model_validate")
+    errors, warnings = [], []
+    schedule_contracts._validate_items(
+        games, schedule_contracts._GameContract, "games", "game_id", errors, warnings, set()
+    )
+    assert spy.call_count == 1
+    assert errors == ["games[50] (game_id='BAD'): duration_minutes — Input should be greater than 0"]
+
+
 # ---------------------------------------------------------------------------
 # Clock windows and min_gap_slots (review follow-up)
 # ---------------------------------------------------------------------------
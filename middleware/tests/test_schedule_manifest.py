@@ -0,0 +1,67 @@
+# Tests for schedule_manifest: delta reads of the published sf_schedules manifest.
+import os
+import sys
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from schedule_manifest import ScheduleManifestCache, load_published_manifest
+
+
+def _row(game_key, status="scheduled", source_hash="h", updated_at="2026-07-18 08:00:00"):
+    return {
+        "game_key": game_key,
+        "game_status": status,
+        "source_hash": source_hash,
+        "schedule_version": 1,
+        "updated_at": updated_at,
+    }
+
+
+def _manifest(rows, total=None, max_updated_at="2026-07-18 08:00:00"):
+    return {"rows": rows, "total": len(rows) if total is None else total, "max_updated_at": max_updated_at}
+
+
+def test_manifest_is_refreshed_with_a_delta_since_the_cached_cursor(tmp_path):
+    cache = ScheduleManifestCache(tmp_path / "manifest.json", scope="site")
+    wp = MagicMock()
+    wp.get_schedule_manifest.return_value = _manifest([_row("G1"), _row("G2")])
+    load_published_manifest(wp, cache)
+
+    reported = _row("G2", status="reported", updated_at="2026-07-18 09:30:00")
+    wp.get_schedule_manifest.reset_mock()
+    wp.get_schedule_manifest.return_value = _manifest([reported], total=2, max_updated_at="2026-07-18 09:30:00")
+    rows = load_published_manifest(wp, cache)
+
+    wp.get_schedule_manifest.assert_called_once_with(updated_since="2026-07-18 08:00:00")
+    assert {row["game_key"]: row["game_status"] for row in rows} == {"G1": "scheduled", "G2": "reported"}
+    assert cache.load()["cursor"] == "2026-07-18 09:30:00"
+
+
+def test_manifest_row_count_drift_forces_a_full_read(tmp_path):
+    cache = ScheduleManifestCache(tmp_path / "manifest.json", scope="site")
+    wp = MagicMock()
+    wp.get_schedule_manifest.return_value = _manifest([_row("G1"), _row("G2")])
+    load_published_manifest(wp, cache)
+
+    # A row was removed on the WordPress side: the delta is empty but the
+    # table total no longer matches the cached copy.
+    wp.get_schedule_manifest.reset_mock()
+    wp.get_schedule_manifest.side_effect = [_manifest([], total=1), _manifest([_row("G1")])]
+    rows = load_published_manifest(wp, cache)
+
+    assert [call.kwargs for call in wp.get_schedule_manifest.call_args_list] == [
+        {"updated_since": "2026-07-18 08:00:00"},
+        {},
+    ]
+    assert [row["game_key"] for row in rows] == ["G1"]
+
+
+def test_full_manifest_read_ignores_the_cache(tmp_path):
+    cache = ScheduleManifestCache(tmp_path / "manifest.json", scope="site")
+    wp = MagicMock()
+    wp.get_schedule_manifest.return_value = _manifest([_row("G1")])
+    load_published_manifest(wp, cache)
+    load_published_manifest(wp, cache, full=True)
+
+    assert [call.kwargs for call in wp.get_schedule_manifest.call_args_list] == [{}, {}]
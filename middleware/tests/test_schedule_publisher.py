@@ -6,6 +6,7 @@ from schedule_publisher import (
     build_publish_diff,
     compute_source_hash,
     merge_schedule,
+    publish_journal_path,
     run_publish_schedule,
 )
 
@@ -266,9 +267,20 @@ class _FakeConnector:
         self.get_schedules_calls += 1
         return self.published_rows
 
-    def upsert_schedules(self, games, schedule_version, force_cancel=False):
+    def get_schedule_manifest(self, updated_since=None, since_version=None):
+        self.get_schedules_calls += 1
+        if self.published_rows is None:
+            return None
+        return {"rows": self.published_rows, "total": len(self.published_rows), "max_updated_at": None}
+
+    def upsert_schedules(self, games, schedule_version, force_cancel=False, idempotency_key=None):
         self.upsert_calls.append(
-            {"games": games, "schedule_version": schedule_version, "force_cancel": force_cancel}
+            {
+                "games": games,
+                "schedule_version": schedule_version,
+                "force_cancel": force_cancel,
+                "idempotency_key": idempotency_key,
+            }
         )
         if self.upsert_response is not None:
             return self.upsert_response
@@ -508,3 +520,91 @@ def test_run_publish_schedule_failed_upsert_returns_1(tmp_path):
 
     assert exit_code == 1
     assert len(connector.upsert_calls) == 1
+
+
+class _FlakyConnector(_FakeConnector):
+    """Fails the upsert calls whose 1-based numbers are in ``fail_calls``."""
+
+    def __init__(self, published_rows=_UNSET, fail_calls=()):
+        super().__init__(published_rows=published_rows)
+        self.fail_calls = set(fail_calls)
+
+    def upsert_schedules(self, games, schedule_version, force_cancel=False, idempotency_key=None):
+        response = super().upsert_schedules(games, schedule_version, force_cancel, idempotency_key)
+        return None if len(self.upsert_calls) in self.fail_calls else response
+
+
+def test_run_publish_schedule_execute_sends_one_keyed_request_per_chunk(tmp_path):
+    input_path, output_path = _write_fixtures(tmp_path)
+    connector = _FakeConnector()
+
+    exit_code = run_publish_schedule(
+        schedule_input_path=input_path,
+        schedule_output_path=output_path,
+        wp_connector=connector,
+        dry_run=False,
+        chunk_size=1,
+    )
+
+    assert exit_code == 0
+    assert [len(call["games"]) for call in connector.upsert_calls] == [1, 1]
+    assert {call["schedule_version"] for call in connector.upsert_calls} == {1}
+    keys = [call["idempotency_key"] for call in connector.upsert_calls]
+    assert len(set(keys)) == 2 and all(keys)
+    journal = json.loads(publish_journal_path(output_path).read_text(encoding="utf-8"))
+    assert journal["completed"] is True
+    assert [chunk["status"] for chunk in journal["chunks"]] == ["done", "done"]
+
+
+def test_run_publish_schedule_resumes_failed_publish_at_same_version(tmp_path):
+    input_path, output_path = _write_fixtures(tmp_path)
+    failing = _FlakyConnector(fail_calls={2})
+
+    assert run_publish_schedule(
+        schedule_input_path=input_path,
+        schedule_output_path=output_path,
+        wp_connector=failing,
+        dry_run=False,
+        chunk_size=1,
+    ) == 1
+
+    # WordPress now holds the first chunk at version 1.
+    landed = dict(failing.upsert_calls[0]["games"][0], schedule_version=1)
+    retry = _FakeConnector(published_rows=[landed])
+    assert run_publish_schedule(
+        schedule_input_path=input_path,
+        schedule_output_path=output_path,
+        wp_connector=retry,
+        dry_run=False,
+        chunk_size=1,
+    ) == 0
+
+    assert len(retry.upsert_calls) == 1
+    assert retry.upsert_calls[0]["schedule_version"] == 1
+    assert retry.upsert_calls[0]["idempotency_key"] == failing.upsert_calls[1]["idempotency_key"]
+    assert retry.upsert_calls[0]["games"] == failing.upsert_calls[1]["games"]
+
+
+def test_run_publish_schedule_skips_chunk_already_applied_by_source_hash(tmp_path):
+    input_path, output_path = _write_fixtures(tmp_path)
+    # The first request applied but its response was lost.
+    lost = _FlakyConnector(fail_calls={1})
+    assert run_publish_schedule(
+        schedule_input_path=input_path,
+        schedule_output_path=output_path,
+        wp_connector=lost,
+        dry_run=False,
+        chunk_size=1,
+    ) == 1
+
+    landed = dict(lost.upsert_calls[0]["games"][0], schedule_version=1)
+    retry = _FakeConnector(published_rows=[landed])
+    assert run_publish_schedule(
+        schedule_input_path=input_path,
+        schedule_output_path=output_path,
+        wp_connector=retry,
+        dry_run=False,
+        chunk_size=1,
+    ) == 0
+
+    assert [call["games"][0]["game_key"] for call in retry.upsert_calls] == ["BC-01"]
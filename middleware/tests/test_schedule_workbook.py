@@ -386,6 +386,95 @@ def test_write_schedule_workbook_loads_pool_assignment_sidecar(tmp_path):
     assert rpc_row["Pool Slot"] is not None
 
 
+def _write_incremental_fixture(tmp_path):
+    builder = ScheduleWorkbookBuilder()
+    roster_rows = _make_gym_roster()
+    schedule_input = builder.write_schedule_input_json(
+        roster_rows,
+        [],
+        tmp_path / "missing.xlsx",
+        tmp_path / "schedule_input.json",
+    )
+    workbook_path = tmp_path / "schedule_workbook.xlsx"
+    sidecar_path = tmp_path / "pool_assignments.json"
+
+    def build():
+        builder.write_schedule_workbook(
+            workbook_path,
+            roster_rows,
+            [],
+            schedule_input,
+            None,
+            pool_assignment_path=sidecar_path,
+            incremental=True,
+        )
+
+    return builder, workbook_path, sidecar_path, build
+
+
+def test_incremental_schedule_workbook_skips_unchanged_build(tmp_path):
+    _, workbook_path, _, build = _write_incremental_fixture(tmp_path)
+    build()
+    manifest_path = tmp_path / "schedule_workbook.xlsx.build.json"
+    first_bytes = workbook_path.read_bytes()
+
+    build()
+
+    assert manifest_path.is_file()
+    assert workbook_path.read_bytes() == first_bytes
+
+
+def test_incremental_schedule_workbook_rebuilds_only_dirty_tabs(tmp_path, mocker):
+    builder, workbook_path, sidecar_path, build = _write_incremental_fixture(tmp_path)
+    build()
+    sheet_order = load_workbook(workbook_path).sheetnames
+    sidecar_path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "rows": [
+                    {
+                        "event": SPORT_TYPE["BASKETBALL"],
+                        "team_id": "RPC",
+                        "seed": 1,
+                        "random_draw_order": 4,
+                        "notes": "Returning champion",
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    sketch_spy = mocker.spy(builder, "_write_court_schedule_sketch")
+    venue_spy = mocker.spy(builder, "_build_venue_capacity_rows")
+
+    build()
+
+    wb = load_workbook(workbook_path)
+    assert wb.sheetnames == sheet_order
+    rpc_row = next(
+        row for row in _sheet_rows(wb["Pool-Assignment"])
+        if row["Event"] == SPORT_TYPE["BASKETBALL"] and row["Team ID"] == "RPC"
+    )
+    assert rpc_row["Notes"] == "Returning champion"
+    assert sketch_spy.call_count == 0
+    assert venue_spy.call_count == 0
+
+
+def test_incremental_schedule_workbook_full_rebuild_after_external_edit(tmp_path, mocker):
+    builder, workbook_path, _, build = _write_incremental_fixture(tmp_path)
+    build()
+    wb = load_workbook(workbook_path)
+    wb["Summary"]["A1"] = "edited by hand"
+    wb.save(workbook_path)
+    sketch_spy = mocker.spy(builder, "_write_court_schedule_sketch")
+
+    build()
+
+    assert sketch_spy.call_count == 1
+    assert load_workbook(workbook_path)["Summary"]["A1"].value != "edited by hand"
+
+
 def test_refresh_pool_assignments_persists_seed_edits_and_recomputes_draw(tmp_path):
     builder = ScheduleWorkbookBuilder()
     roster_rows = _make_gym_roster(n_churches=4)
@@ -4109,6 +4198,37 @@ def _bc_roster(church_codes, n_per_church=3):
     return rows
 
 
+def test_build_schedule_grid_indexes_games_by_day_resource_and_slot():
+    """Report tabs read one (day, resource, HH:MM) index; master hits are pre-bucketed per row."""
+    from scheduling.output_report import _build_schedule_grid
+
+    so, si = _make_render_schedule_pair()
+    resource = si["resources"][0]
+    so = {
+        **so,
+        "assignments": so["assignments"] + [
+            # Later assignment to the same cell replaces the earlier one.
+            {"game_id": "BBM-Final", "resource_id": resource["resource_id"], "slot": "Sat-1-08:00"},
+            # Not a <day>-<HH:MM> label: never lands on a grid row.
+            {"game_id": "BBM-01", "resource_id": resource["resource_id"], "slot": "Sat-1-8:00"},
+        ],
+    }
+    si = {**si, "resources": si["resources"] + [dict(resource)]}
+
+    grid = _build_schedule_grid(so, si)
+
+    assert grid.game_at("Sat-1", resource["resource_id"], "08:00")["game_id"] == "BBM-Final"
+    assert grid.game_at("Sun-1", resource["resource_id"], "08:00") is None
+    row_key, day, hhmm = grid.master_rows[0]
+    assert (day, hhmm) == ("Sat-1", "08:00")
+    # The resource is listed twice, so the Master-Schedule tab sees both hits
+    # and can flag the double-booking.
+    hits = grid.master_cells[row_key]
+    assert [(res["resource_id"], game["game_id"], label) for res, game, label in hits] == [
+        (resource["resource_id"], "BBM-Final", "Sat-1-08:00"),
+    ] * 2
+
+
 def test_bc_venue_estimator_rr_game_count_12_teams():
     """12 BC teams × 2 games/team ÷ 3 teams/game = 8 RR games."""
     from config import (
@@ -4372,6 +4492,44 @@ def test_bc_no_repeat_triplets_seeded_teams_never_share_game():
             f"Two seeded teams appear in the same game: {ids}"
 
 
+def test_bc_no_repeat_triplets_proves_too_many_seeds_impossible():
+    """Ten teams with four seeds cannot fit (ten games, at most one seed each,
+    four seeds × 3 games = 12); the draw must say so instead of searching forever."""
+    rows = [
+        {"Pool ID": "P1", "Pool Slot": f"T{i+1}", "Team ID": chr(65 + i), "Seed": str(i + 1) if i < 4 else ""}
+        for i in range(10)
+    ]
+    from loguru import logger as _loguru_logger
+
+    messages = []
+    sink_id = _loguru_logger.add(messages.append, level="WARNING")
+    try:
+        triplets = ScheduleWorkbookBuilder._bc_no_repeat_triplets(rows)
+    finally:
+        _loguru_logger.remove(sink_id)
+
+    assert triplets == []
+    assert any("not possible for 10 teams (4 seeded)" in m for m in messages)
+
+
+def test_solve_bc_triplets_falls_back_to_cp_sat_when_search_budget_runs_out():
+    """A spent backtracking budget hands over to CP-SAT, which still returns a
+    valid draw; a search that exhausts its tree is itself the proof."""
+    from itertools import combinations
+
+    from scheduling.game_builder import _solve_bc_triplets
+
+    status, triples = _solve_bc_triplets(12, 3, {0, 1, 2, 3}, 10.0, node_budget=1)
+    assert status in ("OPTIMAL", "FEASIBLE")
+    assert len(triples) == 12
+    pairs = [p for t in triples for p in combinations(t, 2)]
+    assert len(pairs) == len(set(pairs))
+    assert all(sum(team in t for t in triples) == 3 for team in range(12))
+    assert all(sum(team in {0, 1, 2, 3} for team in t) <= 1 for t in triples)
+
+    assert _solve_bc_triplets(7, 3, {0, 1, 2}, 10.0) == ("INFEASIBLE", [])
+
+
 def test_bc_schedule_input_adds_playoff_precedence(tmp_path):
     """Nine BC teams should keep all BC prelims ahead of semis, then semis ahead of the final."""
     builder = ScheduleWorkbookBuilder()
@@ -1,6 +1,7 @@
 import json
 
-from PIL import Image
+import pytest
+from PIL import Image, PdfParser
 
 import scoresheets
 from score_sheet_verses import VerseSetError, load_bible_verse_set
@@ -30,6 +31,7 @@ from scoresheets import (
     score_entry_url_for_game,
     write_basketball_scoresheets_pdf,
     write_bible_challenge_scoresheets_pdf,
+    write_scoresheets_pdfs,
     write_soccer_scoresheets_pdf,
     write_volleyball_scoresheets_pdf,
 )
@@ -1041,6 +1043,61 @@ def test_write_bible_challenge_scoresheets_cycles_one_verse_per_game(tmp_path, m
     assert assigned_references[14] == "Matthew 13:23"
 
 
+@pytest.mark.parametrize("workers", [1, 2])
+def test_write_scoresheets_pdfs_writes_every_sport_in_one_pass(tmp_path, workers):
+    logo = tmp_path / "logo.png"
+    _logo(logo)
+    input_path = tmp_path / "approved_schedule_input.json"
+    output_path = tmp_path / "approved_schedule_output.json"
+    input_path.write_text(json.dumps(_schedule_input()), encoding="utf-8")
+    output_path.write_text(json.dumps(_schedule_output()), encoding="utf-8")
+
+    results = write_scoresheets_pdfs(
+        ["basketball", "bible-challenge", "soccer", "volleyball"],
+        input_path,
+        output_path,
+        tmp_path / "scoresheets",
+        logo_path=logo,
+        score_entry_base_url=SCORE_ENTRY_URL,
+        workers=workers,
+    )
+
+    pages_by_sport = {sport: page_count for sport, _path, page_count in results}
+    assert pages_by_sport == {"basketball": 1, "bible-challenge": 1, "soccer": 1, "volleyball": 2}
+    for _sport, pdf_path, page_count in results:
+        with PdfParser.PdfParser(str(pdf_path)) as pdf:
+            assert len(pdf.pages) == page_count
+
+
+def test_write_scoresheets_pdfs_skips_sports_without_matching_games(tmp_path):
+    input_path = tmp_path / "approved_schedule_input.json"
+    output_path = tmp_path / "approved_schedule_output.json"
+    input_path.write_text(json.dumps(_schedule_input()), encoding="utf-8")
+    output_path.write_text(json.dumps(_schedule_output()), encoding="utf-8")
+
+    results = write_scoresheets_pdfs(
+        ["basketball", "soccer"],
+        input_path,
+        output_path,
+        tmp_path / "scoresheets",
+        score_entry_base_url=SCORE_ENTRY_URL,
+        game_keys=["BBM-01"],
+        workers=1,
+    )
+
+    assert [(sport, page_count) for sport, _path, page_count in results] == [("basketball", 1)]
+    with pytest.raises(ScoreSheetError, match="any score-sheet sport"):
+        write_scoresheets_pdfs(
+            ["soccer"],
+            input_path,
+            output_path,
+            tmp_path / "scoresheets",
+            score_entry_base_url=SCORE_ENTRY_URL,
+            game_keys=["BBM-01"],
+            workers=1,
+        )
+
+
 # ---------------------------------------------------------------------------
 # --stage / --game-key filtering (Issue #348)
 # ---------------------------------------------------------------------------
@@ -210,3 +210,74 @@ def test_reset_only_skips_archive_note(mock_cfg):
     assert result is True
     chm.add_member_note.assert_not_called()
     chm.update_person.assert_called_once()
+
+
+# ── Checkpoint journal / resume ───────────────────────────────────────────────
+
+@patch("season_reset.Config")
+def test_full_run_journals_steps_and_resume_skips_completed_members(mock_cfg, tmp_path):
+    from season_reset import ResetJournal
+
+    journal_path = tmp_path / "season_reset_2025.journal.jsonl"
+    resetter, chm, wp = _make_resetter()
+    chm.get_person.side_effect = lambda pid: {
+        "id": pid, "first_name": "P", "last_name": pid,
+        "additional_fields": chm.get_group_people.return_value[0]["additional_fields"],
+    }
+    # Person 222's reset fails: its archive step is journaled, its reset is not.
+    chm.update_person.side_effect = lambda pid, *args, **kwargs: pid != "222"
+
+    assert resetter.run(2025, journal=ResetJournal(journal_path, 2025)) is False
+    assert chm.add_member_note.call_count == 2
+
+    chm.reset_mock()
+    chm.update_person.side_effect = None
+    chm.update_person.return_value = True
+    assert resetter.run(2025, journal=ResetJournal(journal_path, 2025)) is True
+
+    # 111 is done: no profile read at all.  222 only redoes the reset step.
+    chm.get_person.assert_called_once_with("222")
+    chm.get_person_notes.assert_not_called()
+    chm.add_member_note.assert_not_called()
+    chm.update_person.assert_called_once()
+    assert chm.update_person.call_args.args[0] == "222"
+
+    reopened = ResetJournal(journal_path, 2025)
+    assert reopened.completed_people(["archive", "reset"]) == {"111", "222"}
+    assert len(ResetJournal(journal_path, 2026)) == 0
+
+
+@patch("season_reset.Config")
+def test_journal_ignores_torn_line_and_no_resume_redoes_everything(mock_cfg, tmp_path):
+    from season_reset import ResetJournal
+
+    journal_path = tmp_path / "journal.jsonl"
+    journal_path.write_text(
+        '{"year": 2025, "person_id": "111", "step": "archive", "at": "x"}\n{"year": 2025, "perso',
+        encoding="utf-8",
+    )
+
+    assert ResetJournal(journal_path, 2025).is_done("111", "archive")
+    assert len(ResetJournal(journal_path, 2025)) == 1
+    assert len(ResetJournal(journal_path, 2025, resume=False)) == 0
+
+
+@patch("season_reset.Config")
+def test_journal_marks_after_torn_line_survive_reopen(mock_cfg, tmp_path):
+    from season_reset import ResetJournal
+
+    journal_path = tmp_path / "journal.jsonl"
+    journal_path.write_text(
+        '{"year": 2025, "person_id": "111", "step": "archive", "at": "x"}\n{"year": 2025, "perso',
+        encoding="utf-8",
+    )
+
+    journal = ResetJournal(journal_path, 2025)
+    journal.mark("222", "archive")
+    journal.mark("333", "archive")
+
+    reopened = ResetJournal(journal_path, 2025)
+    assert reopened.is_done("111", "archive")
+    assert reopened.is_done("222", "archive")
+    assert reopened.is_done("333", "archive")
+    assert len(reopened) == 3
@@ -1945,6 +1945,140 @@ def test_sync_validation_issues_distinguishes_same_rule_by_sport_and_format(sync
     }
 
 
+def test_fetch_open_validation_issues_is_shared_and_flags_partial_reads(sync_manager, mocker):
+    """Manager and participant snapshot page through one reader; a failed page marks it incomplete."""
+    from sync.participants import fetch_open_validation_issues
+
+    connector = sync_manager.wordpress_connector
+    pages = {1: [{"issue_id": i} for i in range(100)], 2: [{"issue_id": 100}]}
+
+    def get_issues(params):
+        connector.last_get_validation_issues_status = "ok"
+        return pages[params["page"]]
+
+    mocker.patch.object(connector, "get_validation_issues", side_effect=get_issues)
+    issues, complete = fetch_open_validation_issues(connector, church_id=5)
+    assert complete is True
+    assert len(issues) == 101
+    assert connector.get_validation_issues.call_args.args[0]["church_id"] == 5
+    assert len(sync_manager._fetch_open_validation_issues()) == 101
+
+    def fail_second_page(params):
+        connector.last_get_validation_issues_status = "failed" if params["page"] == 2 else "ok"
+        return [] if params["page"] == 2 else pages[1]
+
+    connector.get_validation_issues.side_effect = fail_second_page
+    issues, complete = fetch_open_validation_issues(connector)
+    assert complete is False
+    assert len(issues) == 100
+
+
+def test_bulk_issue_sync_reads_open_issues_once_and_ledger_skips_unchanged_sets(sync_manager, tmp_path, mocker):
+    """A full run reads open issues in one bulk call; an unchanged rerun touches nothing."""
+    from sync.issue_ledger import ValidationIssueLedger
+
+    participant_syncer = ParticipantSyncer(
+        sync_manager.chm_connector,
+        sync_manager.wordpress_connector,
+        sync_manager.stats,
+        sync_manager.churches_cache,
+    )
+    participant_syncer.issue_ledger = ValidationIssueLedger(tmp_path / "ledger.json", scope="test")
+    sync_manager.churches_cache["RPC"] = {"church_id": 1}
+    stale_issue = {
+        "issue_id": "7",
+        "participant_id": "42",
+        "issue_type": "missing_consent",
+        "rule_code": "CONSENT_REQUIRED",
+        "status": "open",
+    }
+    get_issues = mocker.patch.object(
+        sync_manager.wordpress_connector, "get_validation_issues", return_value=[stale_issue]
+    )
+    create_issue = mocker.patch.object(
+        sync_manager.wordpress_connector, "create_validation_issue", return_value={"issue_id": 8}
+    )
+    update_issue = mocker.patch.object(
+        sync_manager.wordpress_connector, "update_validation_issue", return_value=True
+    )
+    photo_issue = [{
+        "type": "missing_photo",
+        "description": "No photo uploaded",
+        "rule_code": "PHOTO_REQUIRED",
+        "rule_level": "INDIVIDUAL",
+        "severity": "WARNING",
+    }]
+
+    participant_syncer._begin_bulk_issue_sync()
+    participant_syncer._sync_validation_issues("42", "RPC", [], "2026-05-09 00:00:00")
+    participant_syncer._sync_validation_issues("43", "RPC", photo_issue, "2026-05-09 00:00:00")
+    participant_syncer._end_bulk_issue_sync()
+
+    get_issues.assert_called_once()
+    assert get_issues.call_args.args[0]["page"] == 1
+    update_issue.assert_called_once()
+    assert update_issue.call_args.args[0] == "7"
+    create_issue.assert_called_once()
+    assert (tmp_path / "ledger.json").is_file()
+
+    get_issues.return_value = [{
+        "issue_id": "8",
+        "participant_id": "43",
+        "issue_type": "missing_photo",
+        "rule_code": "PHOTO_REQUIRED",
+        "status": "open",
+    }]
+    rerun = ParticipantSyncer(
+        sync_manager.chm_connector,
+        sync_manager.wordpress_connector,
+        sync_manager.stats,
+        sync_manager.churches_cache,
+    )
+    rerun.issue_ledger = ValidationIssueLedger(tmp_path / "ledger.json", scope="test")
+    rerun._begin_bulk_issue_sync()
+    rerun._sync_validation_issues("42", "RPC", [], "2026-05-10 00:00:00")
+    rerun._sync_validation_issues("43", "RPC", photo_issue, "2026-05-10 00:00:00")
+    rerun._sync_validation_issues("43", "RPC", [], "2026-05-10 00:00:00")
+    rerun._end_bulk_issue_sync()
+
+    # Only the changed set (43 now clean) is reconciled, from a single bulk read.
+    assert get_issues.call_count == 2
+    assert create_issue.call_count == 1
+    assert update_issue.call_count == 2
+    assert update_issue.call_args.args[0] == "8"
+
+
+def test_validate_data_skips_church_whose_issue_set_is_unchanged(sync_manager, tmp_path, mocker):
+    """Church-level issues identical to the last synced set are not reconciled again."""
+    from sync.issue_ledger import CHURCH, ValidationIssueLedger, issue_set_digest
+
+    current_issue = {
+        "church_id": 1,
+        "issue_type": "church_entry_limit",
+        "issue_description": "Too many teams",
+        "rule_code": "MAX_CHURCH_TEAMS_BASKETBALL",
+        "rule_level": "CHURCH",
+    }
+    sync_manager.issue_ledger = ValidationIssueLedger(tmp_path / "ledger.json", scope="test")
+    sync_manager.issue_ledger.record(CHURCH, 1, issue_set_digest([current_issue]))
+    mocker.patch.object(
+        sync_manager.wordpress_connector,
+        "get_participants",
+        return_value=[{"participant_id": 5, "church_id": 1, "church_code": "RPC", "chmeetings_id": "9"}],
+    )
+    mocker.patch.object(sync_manager.wordpress_connector, "get_validation_issues", return_value=[])
+    mocker.patch.object(sync_manager.wordpress_connector, "get_churches", return_value=[])
+    mocker.patch.object(sync_manager.wordpress_connector, "get_rosters", return_value=[])
+    mocker.patch("sync.manager.TeamValidator.validate_church", return_value=[])
+    mocker.patch("sync.manager.ChurchValidator.validate_church", return_value=[current_issue])
+    sync_group = mocker.patch.object(sync_manager, "_sync_group_validation_issues")
+
+    assert sync_manager.validate_data() is True
+
+    sync_group.assert_not_called()
+    assert sync_manager.stats["validation_issues"]["unchanged"] == 1
+
+
 def test_sync_participants_skips_orphaned_group_membership(sync_manager, mocker):
     """Full Team-group sync should skip API-only orphaned memberships whose person lookup returns 404."""
     mocker.patch("sync.participants.Config.TEAM_PREFIX", "Team")
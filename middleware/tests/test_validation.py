@@ -5,7 +5,7 @@ import os
 import json
 import pytest
 from datetime import datetime
-from validation.models import Participant, RulesManager
+from validation.models import Participant, RulesManager, clear_rules_registry
 from validation.church_validator import ChurchValidator
 from validation.individual_validator import IndividualValidator
 from validation.name_matcher import likely_name_match, normalized_name
@@ -20,6 +20,13 @@ def rules_manager():
     """Fixture for RulesManager."""
     return RulesManager(collection="SUMMER_2026")
 
+@pytest.fixture
+def fresh_rules_registry():
+    """Isolate tests that write their own rules files from the shared registry."""
+    clear_rules_registry()
+    yield
+    clear_rules_registry()
+
 @pytest.fixture
 def validator():
     """Fixture for IndividualValidator."""
@@ -59,7 +66,7 @@ def test_rules_manager_qualifying_and_excluded_are_disjoint(rules_manager):
     assert rules_manager.qualifying_roles.isdisjoint(rules_manager.known_excluded_roles)
 
 
-def test_rules_manager_empty_configuration_is_not_role_configured(tmp_path):
+def test_rules_manager_empty_configuration_is_not_role_configured(tmp_path, fresh_rules_registry):
     """Generic rules files may omit roles, but eligibility filtering must detect it."""
     rules_file = tmp_path / "minimal.json"
     rules_file.write_text('{"rules": []}', encoding="utf-8")
@@ -69,7 +76,7 @@ def test_rules_manager_empty_configuration_is_not_role_configured(tmp_path):
     assert rm.participant_roles_configured is False
 
 
-def test_rules_manager_rejects_overlapping_participant_roles(tmp_path):
+def test_rules_manager_rejects_overlapping_participant_roles(tmp_path, fresh_rules_registry):
     """A role cannot be both qualifying and intentionally excluded."""
     rules_file = tmp_path / "overlap.json"
     rules_file.write_text(
@@ -92,6 +99,78 @@ def test_rules_manager_rejects_overlapping_participant_roles(tmp_path):
     assert rm.qualifying_roles == frozenset()
 
 
+def test_rules_manager_instances_share_one_parse_per_file_version(
+    tmp_path, mocker, fresh_rules_registry
+):
+    """The registry parses a rules file once and again only after it changes."""
+    import os
+
+    from validation import models
+
+    rules_file = tmp_path / "shared.json"
+    rules_file.write_text(json.dumps({"rules": [{"rule_type": "age"}]}), encoding="utf-8")
+    load = mocker.spy(models.json, "load")
+
+    first = RulesManager(collection="SHARED", rules_file=str(rules_file))
+    second = RulesManager(collection="SHARED", rules_file=str(rules_file))
+    assert load.call_count == 1
+    assert second.rules is first.rules
+
+    rules_file.write_text(
+        json.dumps({"rules": [{"rule_type": "age"}, {"rule_type": "photo"}]}),
+        encoding="utf-8",
+    )
+    stat = rules_file.stat()
+    os.utime(rules_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = RulesManager(collection="SHARED", rules_file=str(rules_file))
+    assert load.call_count == 2
+    assert [r["rule_type"] for r in third.rules] == ["age", "photo"]
+
+    clear_rules_registry()
+    fourth = RulesManager(collection="SHARED", rules_file=str(rules_file))
+    assert load.call_count == 3
+    assert fourth.rules is not third.rules
+
+
+def test_rules_manager_indexed_lookup_matches_linear_filter(rules_manager):
+    """get_rules_for_sport keeps the original sport-then-default merge order."""
+
+    def linear(sport_event, parameter=None):
+        rules = [r for r in rules_manager.rules
+                 if r.get("sport_event") == sport_event
+                 and (parameter is None or r.get("parameter") == parameter)]
+        if not rules or sport_event != DEFAULT_SPORT:
+            for rule in [r for r in rules_manager.rules
+                         if r.get("sport_event") == DEFAULT_SPORT
+                         and (parameter is None or r.get("parameter") == parameter)]:
+                if not any(r.get("rule_type") == rule.get("rule_type")
+                           and r.get("category") == rule.get("category") for r in rules):
+                    rules.append(rule)
+        return rules
+
+    events = {r.get("sport_event") for r in rules_manager.rules} | {"Unknown Sport"}
+    parameters = {r.get("parameter") for r in rules_manager.rules} | {None}
+    rule_types = {r.get("rule_type") for r in rules_manager.rules}
+    for event in events:
+        for parameter in parameters:
+            expected = linear(event, parameter)
+            assert rules_manager.get_rules_for_sport(event, parameter) == expected
+            for rule_type in rule_types:
+                assert rules_manager.get_rules_for_sport(event, parameter, rule_type=rule_type) == [
+                    r for r in expected if r.get("rule_type") == rule_type
+                ]
+    assert rules_manager.get_rules_by_type("age") == [
+        r for r in rules_manager.rules if r.get("rule_type") == "age"
+    ]
+
+
+def test_individual_validator_reads_event_date_from_loaded_rules(validator):
+    assert validator.sports_fest_date.isoformat() == (
+        validator.rules_manager.metadata["event_date"]
+    )
+
+
 def test_participant_model():
     """Test Participant Pydantic model."""
     valid_data = {
@@ -762,6 +841,49 @@ def test_likely_name_match_remains_conservative_for_non_equivalent_names():
     )
 
 
+def test_name_key_precomputes_forms_once_per_name():
+    from validation.name_matcher import name_key
+
+    key = name_key("Gao Shan (Gary) Jr.")
+
+    assert key.name == "gao shan (gary) jr."
+    assert key.tokens == ("gao", "shan", "gary", "jr")
+    assert key.base_tokens == ("gao", "shan", "jr")
+    assert key.sorted_tokens == ("gao", "jr", "shan")
+    assert key.joined == "gaoshanjr"
+    assert key.initials == frozenset("gsj")
+    assert name_key("Gao Shan (Gary) Jr.") is key
+    assert name_key(None) == name_key("")
+
+
+def test_name_index_returns_same_matches_as_pairwise_scan():
+    import random
+
+    from validation.name_matcher import NameIndex, resolvable_name_match
+
+    rng = random.Random(7)
+    parts = ["an", "anh", "minh", "thu", "minhthu", "bui", "tran", "j", "jamie", "s",
+             "sauveur", "(gary)", "gao", "shan", "vi-tam", "vitam", "van", "le"]
+    pool = [
+        normalized_name(" ".join(rng.choice(parts) for _ in range(rng.randint(1, 3))))
+        for _ in range(150)
+    ]
+    queries = pool[:40] + [
+        normalized_name(" ".join(rng.choice(parts) for _ in range(rng.randint(1, 3))))
+        for _ in range(80)
+    ] + ["", "(gary)"]
+    index = NameIndex(pool)
+
+    for query in queries:
+        assert index.likely_matches(query) == [
+            i for i, name in enumerate(pool) if likely_name_match(query, name)
+        ]
+        assert index.resolvable_matches(query) == [
+            i for i, name in enumerate(pool) if resolvable_name_match(query, name)
+        ]
+        assert index.exact(query) == [i for i, name in enumerate(pool) if name == query]
+
+
 def test_team_validator_under_team_limit(team_validator):
     """2 non-members in Basketball — at limit, no issue."""
     participants = [
@@ -5,6 +5,7 @@ import pytest
 import requests
 from http.client import RemoteDisconnected
 from tenacity import RetryError
+from wordpress.cookie_jar import WordPressCookieJar
 from wordpress.frontend_connector import WordPressConnector
 from loguru import logger
 from wordpress.frontend_connector import Config
@@ -203,6 +204,35 @@ def test_get_schedules_returns_none_on_request_exception(wp_connector, mocker):
     assert wp_connector.last_get_schedules_status == "failed"
 
 
+def test_get_schedule_manifest_requests_manifest_delta(wp_connector, mocker):
+    live_test = os.getenv("LIVE_TEST", "false").strip().lower() == "true"
+    if live_test:
+        pytest.skip("Pure mock test — no live variant needed")
+
+    manifest = {"rows": [{"game_key": "BBM-01"}], "total": 12, "max_updated_at": "2026-07-18 09:00:00"}
+    get = mocker.patch.object(
+        wp_connector.session, "get", return_value=mocker.Mock(status_code=200, json=lambda: manifest)
+    )
+
+    result = wp_connector.get_schedule_manifest(updated_since="2026-07-18 08:00:00")
+
+    assert get.call_args.kwargs["params"] == {"fields": "manifest", "updated_since": "2026-07-18 08:00:00"}
+    assert result == manifest
+
+
+def test_get_schedule_manifest_wraps_full_rows_from_older_plugin(wp_connector, mocker):
+    live_test = os.getenv("LIVE_TEST", "false").strip().lower() == "true"
+    if live_test:
+        pytest.skip("Pure mock test — no live variant needed")
+
+    rows = [{"game_key": "BBM-01", "event": "Basketball - Men Team"}]
+    mocker.patch.object(
+        wp_connector.session, "get", return_value=mocker.Mock(status_code=200, json=lambda: rows)
+    )
+
+    assert wp_connector.get_schedule_manifest() == {"rows": rows, "total": 1, "max_updated_at": None}
+
+
 def test_upsert_schedules_posts_expected_payload(wp_connector, mocker):
     """Issue #203: upsert_schedules POSTs games/schedule_version/force_cancel
     to /schedules/upsert and returns the parsed JSON response."""
@@ -259,6 +289,31 @@ def test_upsert_schedules_returns_none_on_request_exception(wp_connector, mocker
     assert result is None
 
 
+def test_upsert_schedules_with_idempotency_key_retries_transient_failure(wp_connector, mocker):
+    """A keyed upsert is replay-safe, so a dropped connection is retried with
+    the same Idempotency-Key header and payload."""
+    live_test = os.getenv("LIVE_TEST", "false").strip().lower() == "true"
+    if live_test:
+        pytest.skip("Pure mock test — no live variant needed")
+
+    ok = mocker.Mock(status_code=200)
+    ok.json.return_value = {"success": True, "created_count": 1}
+    post = mocker.patch.object(
+        wp_connector.session, "post", side_effect=[requests.ConnectionError("reset"), ok]
+    )
+    mocker.patch("time.sleep")
+
+    result = wp_connector.upsert_schedules(
+        games=[{"game_key": "BBM-01"}], schedule_version=2, idempotency_key="publish-v2-abc"
+    )
+
+    assert result == {"success": True, "created_count": 1}
+    assert post.call_count == 2
+    for call in post.call_args_list:
+        assert call.kwargs["headers"] == {"Idempotency-Key": "publish-v2-abc"}
+        assert call.kwargs["json"]["idempotency_key"] == "publish-v2-abc"
+
+
 def test_get_approvals_records_failed_read_status(wp_connector, mocker):
     mocker.patch.object(
         wp_connector.session,
@@ -557,3 +612,44 @@ def test_get_validation_issues_does_not_retry_non_transient_errors(wp_connector,
     assert result == []
     assert mock_get.call_count == 1
     assert wp_connector.last_get_validation_issues_status == "failed"
+
+
+def _http_response(body, content_type):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = body.encode("utf-8")
+    return response
+
+
+def test_connector_init_makes_no_warm_up_request(mocker):
+    """Constructing the connector must not fetch the WordPress homepage."""
+    mocker.patch("wordpress.frontend_connector.Config.WP_URL", "https://test.wordpress.com")
+    send = mocker.patch("requests.Session.request")
+
+    WordPressConnector().close()
+
+    send.assert_not_called()
+
+
+def test_challenged_request_is_retried_with_cookie_and_jar_reused(mocker, tmp_path):
+    """A bot-protection challenge is answered once and the cookie persisted for the next run."""
+    mocker.patch("wordpress.frontend_connector.Config.WP_URL", "https://test.wordpress.com")
+    jar = WordPressCookieJar(tmp_path / "wp_cookies.json", ttl_seconds=3600, scope="test")
+    mocker.patch("wordpress.frontend_connector.default_cookie_jar", return_value=jar)
+    challenge = _http_response(
+        '<script>document.cookie = "humans_21909=1"; location.reload();</script>', "text/html"
+    )
+    churches = _http_response('[{"church_id": 1}]', "application/json")
+    send = mocker.patch("requests.Session.request", side_effect=[challenge, churches, churches])
+
+    connector = WordPressConnector()
+    assert connector.get_churches() == [{"church_id": 1}]
+    assert send.call_count == 2
+    assert connector.session.cookies.get("humans_21909") == "1"
+    assert jar.load() == {"humans_21909": "1"}
+
+    next_run = WordPressConnector()
+    assert next_run.session.cookies.get("humans_21909") == "1"
+    assert next_run.get_churches() == [{"church_id": 1}]
+    assert send.call_count == 3
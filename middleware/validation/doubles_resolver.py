@@ -15,9 +15,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from validation.name_matcher import (
+    NameIndex,
     normalized_name,
     resolvable_name_match,
-    likely_name_match,
 )
 
 
@@ -97,8 +97,17 @@ def _gkey(sel: Selection) -> str:
     return sel.group_key or f"{sel.sport_type}|{sel.sport_format}"
 
 
-def _t3_suggestions(partner_norm: str, peers: list[Selection]) -> list[str]:
-    return [c.name for c in peers if likely_name_match(partner_norm, c.norm_name)]
+def _indexed(
+    members: list[Selection], positions: list[int], keep
+) -> list[Selection]:
+    """Members at ``positions`` (pool order) that pass the peer filter ``keep``."""
+    return [members[position] for position in positions if keep(members[position])]
+
+
+def _t3_suggestions(
+    partner_norm: str, members: list[Selection], name_index: NameIndex, keep
+) -> list[str]:
+    return [c.name for c in _indexed(members, name_index.likely_matches(partner_norm), keep)]
 
 
 def _make_pair(sel_a: Selection, sel_b: Selection) -> ConfirmedPair:
@@ -128,10 +137,16 @@ def resolve_doubles(
 
     The function is pure: it does not mutate its inputs.
     """
-    # Index selections by their event pool for O(1) peer lookup.
+    # Index selections by their event pool for O(1) peer lookup, and each
+    # pool's names by token prefix so T1/T2/T3 candidate searches verify only
+    # the few peers that can match instead of rescanning the whole pool.
     by_group: dict[str, list[Selection]] = {}
     for sel in selections:
         by_group.setdefault(_gkey(sel), []).append(sel)
+    name_indexes = {
+        gk: NameIndex([c.norm_name for c in members])
+        for gk, members in by_group.items()
+    }
 
     # Confirmation is tracked per (group_key, participant_id) so the same participant
     # can independently confirm pairs in two different event groups (e.g. Badminton
@@ -153,16 +168,19 @@ def resolve_doubles(
 
         # Exclude: same object, same non-empty participant_id, already confirmed
         # in this event group, or different church (cross-church pairs are never valid).
-        peers_unconfirmed = [
-            c for c in by_group.get(gk, [])
-            if c is not sel
-            and (not sel.participant_id or c.participant_id != sel.participant_id)
-            and (gk, c.participant_id) not in confirmed_gkpids
-            and c.church_code == sel.church_code
-        ]
+        def is_unconfirmed_peer(c: Selection, sel: Selection = sel, gk: str = gk) -> bool:
+            return (
+                c is not sel
+                and (not sel.participant_id or c.participant_id != sel.participant_id)
+                and (gk, c.participant_id) not in confirmed_gkpids
+                and c.church_code == sel.church_code
+            )
+
+        members = by_group[gk]
+        name_index = name_indexes[gk]
 
         # T1: exact normalized_name lookup.
-        t1_cands = [c for c in peers_unconfirmed if c.norm_name == partner_norm]
+        t1_cands = _indexed(members, name_index.exact(partner_norm), is_unconfirmed_peer)
         if t1_cands:
             # If T1 found anything, commit to T1 result (do not fall through to T2).
             if len(t1_cands) == 1:
@@ -174,10 +192,9 @@ def resolve_doubles(
             continue
 
         # T2: resolvable match (only when T1 found zero candidates).
-        t2_cands = [
-            c for c in peers_unconfirmed
-            if resolvable_name_match(partner_norm, c.norm_name)
-        ]
+        t2_cands = _indexed(
+            members, name_index.resolvable_matches(partner_norm), is_unconfirmed_peer
+        )
         if len(t2_cands) == 1:
             cand = t2_cands[0]
             if (
@@ -224,15 +241,18 @@ def resolve_doubles(
 
         # Use all same-church peers (including confirmed) for accurate diagnosis,
         # but still exclude rows with the same non-empty participant_id (duplicate rows).
-        all_peers = [
-            c for c in by_group.get(gk, [])
-            if c is not sel
-            and (not sel.participant_id or c.participant_id != sel.participant_id)
-            and c.church_code == sel.church_code
-        ]
+        def is_peer(c: Selection, sel: Selection = sel) -> bool:
+            return (
+                c is not sel
+                and (not sel.participant_id or c.participant_id != sel.participant_id)
+                and c.church_code == sel.church_code
+            )
+
+        members = by_group[gk]
+        name_index = name_indexes[gk]
 
         # T1 diagnosis.
-        t1_cands = [c for c in all_peers if c.norm_name == partner_norm]
+        t1_cands = _indexed(members, name_index.exact(partner_norm), is_peer)
         if len(t1_cands) > 1:
             unresolved.append(UnresolvedRecord(
                 participant_id=sel.participant_id,
@@ -258,15 +278,12 @@ def resolve_doubles(
                 reason="NonReciprocal",
                 notes="T1: partner found but did not reciprocate",
                 candidate_name=cand.name,
-                suggestions=_t3_suggestions(partner_norm, all_peers),
+                suggestions=_t3_suggestions(partner_norm, members, name_index, is_peer),
             ))
             continue
 
         # T2 diagnosis.
-        t2_cands = [
-            c for c in all_peers
-            if resolvable_name_match(partner_norm, c.norm_name)
-        ]
+        t2_cands = _indexed(members, name_index.resolvable_matches(partner_norm), is_peer)
         if len(t2_cands) > 1:
             unresolved.append(UnresolvedRecord(
                 participant_id=sel.participant_id,
@@ -292,7 +309,7 @@ def resolve_doubles(
                 reason="NonReciprocal",
                 notes="T2: partner found via resolvable match but did not reciprocate",
                 candidate_name=cand.name,
-                suggestions=_t3_suggestions(partner_norm, all_peers),
+                suggestions=_t3_suggestions(partner_norm, members, name_index, is_peer),
             ))
             continue
 
@@ -306,7 +323,7 @@ def resolve_doubles(
             partner_name=sel.partner_name,
             reason="PartnerNotFound",
             notes=f"No match found for '{sel.partner_name}'",
-            suggestions=_t3_suggestions(partner_norm, all_peers),
+            suggestions=_t3_suggestions(partner_norm, members, name_index, is_peer),
         ))
 
     return confirmed_pairs, unresolved
@@ -1,7 +1,6 @@
 # validation/individual_validator.py
 # version: 1.0.0
 # author: Bumble and Grok 3
-import json
 import os
 import re
 from datetime import datetime
@@ -14,6 +13,17 @@ from config import (Config, SPORT_TYPE, SPORT_CATEGORY, SPORT_FORMAT, GENDER,
                    FORMAT_MAPPINGS,
                    VALIDATION_SEVERITY, AGE_RESTRICTIONS, is_racquet_sport)
 
+_PHOTO_URL_PATTERN = (
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$'
+)
+_PHOTO_URL_RE = re.compile(_PHOTO_URL_PATTERN, re.IGNORECASE)
+
+
 class IndividualValidator:
     """Simple validator for individual participants."""
     
@@ -24,14 +34,12 @@ class IndividualValidator:
     
     def _parse_event_date(self):
         """Parse the event date from rules metadata or fall back to config."""
-        try:
-            with open(self.rules_manager.rules_file, "r") as f:
-                data = json.load(f)
-            event_date = data.get("metadata", {}).get("event_date")
-            if event_date:
+        event_date = self.rules_manager.metadata.get("event_date")
+        if event_date:
+            try:
                 return datetime.strptime(event_date, "%Y-%m-%d").date()
-        except Exception as e:
-            logger.warning(f"Could not read event_date metadata from {self.rules_manager.rules_file}: {e}")
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Could not read event_date metadata from {self.rules_manager.rules_file}: {e}")
 
         logger.warning(
             f"Falling back to Config.SPORTS_FEST_DATE for validation event date: "
@@ -93,10 +101,9 @@ class IndividualValidator:
             # Check each sport
             for sport in sports:
                 # Get age rules for this sport
-                min_rules = [r for r in self.rules_manager.get_rules_for_sport(sport) 
-                            if r.get("rule_type") == "age" and r.get("category") == "min"]
-                max_rules = [r for r in self.rules_manager.get_rules_for_sport(sport) 
-                            if r.get("rule_type") == "age" and r.get("category") == "max"]
+                age_rules = self.rules_manager.get_rules_for_sport(sport, rule_type="age")
+                min_rules = [r for r in age_rules if r.get("category") == "min"]
+                max_rules = [r for r in age_rules if r.get("category") == "max"]
                 
                 # Apply min age rules
                 for rule in min_rules:
@@ -143,8 +150,8 @@ class IndividualValidator:
             param = sport_parts[1] if len(sport_parts) > 1 else None
             
             # Get gender rules for this sport
-            rules = [r for r in self.rules_manager.get_rules_for_sport(sport, param) 
-                    if r.get("rule_type") == "gender" and r.get("category") == "restriction"]
+            rules = [r for r in self.rules_manager.get_rules_for_sport(sport, param, rule_type="gender")
+                    if r.get("category") == "restriction"]
             
             for rule in rules:
                 required_gender = rule.get("value", "").lower()
@@ -164,8 +171,8 @@ class IndividualValidator:
             param = sport_parts[1] if len(sport_parts) > 1 else None
             
             # Get gender rules for this sport
-            rules = [r for r in self.rules_manager.get_rules_for_sport(sport, param) 
-                    if r.get("rule_type") == "gender" and r.get("category") == "restriction"]
+            rules = [r for r in self.rules_manager.get_rules_for_sport(sport, param, rule_type="gender")
+                    if r.get("category") == "restriction"]
             
             for rule in rules:
                 required_gender = rule.get("value", "").lower()
@@ -272,15 +279,7 @@ class IndividualValidator:
             return issues
         
         # Validate URL format
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(participant.photo_url):
+        if not _PHOTO_URL_RE.match(participant.photo_url):
             for rule in rules:
                 issues.append({
                     "type": "invalid_photo_url",
@@ -1,6 +1,7 @@
 # validation/models.py
 import json
 import os
+import threading
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -73,6 +74,120 @@ class ValidationConfiguration(BaseModel):
     participant_roles: Optional[ParticipantRolesConfiguration] = None
 
 
+class _RulesDocument:
+    """One parsed rules file with its rules pre-indexed for lookup.
+
+    Shared by every RulesManager for the same file (see ``_load_rules_document``),
+    so treat ``rules``, ``configuration`` and ``metadata`` as read-only.
+    """
+
+    def __init__(self, rules_file: str):
+        self.rules_file = rules_file
+        self.rules: List[Dict[str, Any]] = []
+        self.metadata: Dict[str, Any] = {}
+        self.configuration: Dict[str, Any] = {}
+        self.configuration_error: Optional[str] = None
+
+        try:
+            with open(rules_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading rules from {rules_file}: {e}")
+            self.configuration_error = str(e)
+            data = None
+
+        if data is not None:
+            self.rules = data.get("rules", [])
+            self.metadata = data.get("metadata", {}) or {}
+            try:
+                validated = ValidationConfiguration.model_validate(
+                    data.get("configuration", {})
+                )
+                self.configuration = validated.model_dump(exclude_none=True)
+            except ValidationError as e:
+                self.configuration_error = str(e)
+                logger.error(f"Invalid configuration in rules file {rules_file}: {e}")
+            except Exception as e:
+                self.configuration_error = str(e)
+                logger.error(f"Error loading configuration from {rules_file}: {e}")
+
+        self.by_type: Dict[Any, List[Dict[str, Any]]] = {}
+        self.by_event: Dict[Any, List[Dict[str, Any]]] = {}
+        self.by_event_parameter: Dict[tuple, List[Dict[str, Any]]] = {}
+        for rule in self.rules:
+            self.by_type.setdefault(rule.get("rule_type"), []).append(rule)
+            self.by_event.setdefault(rule.get("sport_event"), []).append(rule)
+            self.by_event_parameter.setdefault(
+                (rule.get("sport_event"), rule.get("parameter")), []
+            ).append(rule)
+        # (sport_event, parameter, rule_type) -> merged sport + default rules
+        self.sport_rules: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _event_rules(self, sport_event, parameter) -> List[Dict[str, Any]]:
+        if parameter is None:
+            return self.by_event.get(sport_event, [])
+        return self.by_event_parameter.get((sport_event, parameter), [])
+
+    def rules_for_sport(self, sport_event, parameter=None, rule_type=None) -> List[Dict[str, Any]]:
+        key = (sport_event, parameter, rule_type)
+        cached = self.sport_rules.get(key)
+        if cached is not None:
+            return cached
+
+        if rule_type is not None:
+            merged = [
+                r for r in self.rules_for_sport(sport_event, parameter)
+                if r.get("rule_type") == rule_type
+            ]
+        else:
+            # Sport-specific rules first, then defaults that don't conflict
+            # with a sport rule of the same type and category.
+            merged = list(self._event_rules(sport_event, parameter))
+            if not merged or sport_event != DEFAULT_SPORT:
+                taken = {(r.get("rule_type"), r.get("category")) for r in merged}
+                for rule in self._event_rules(DEFAULT_SPORT, parameter):
+                    type_category = (rule.get("rule_type"), rule.get("category"))
+                    if type_category not in taken:
+                        merged.append(rule)
+                        taken.add(type_category)
+        with self._lock:
+            return self.sport_rules.setdefault(key, merged)
+
+
+_RULES_REGISTRY: Dict[str, tuple] = {}
+_RULES_REGISTRY_LOCK = threading.Lock()
+
+
+def _load_rules_document(rules_file: str) -> _RulesDocument:
+    """Return the parsed rules file, re-reading it only when it changed on disk.
+
+    Validators, the sync manager and the schedule workbook each construct a
+    RulesManager; the registry makes all of them share one parse per
+    (path, mtime, size).  Unreadable files are never cached so a file that
+    appears later is picked up.
+    """
+    path = os.path.abspath(rules_file)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return _RulesDocument(rules_file)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _RULES_REGISTRY_LOCK:
+        cached = _RULES_REGISTRY.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        document = _RulesDocument(rules_file)
+        _RULES_REGISTRY[path] = (stamp, document)
+        return document
+
+
+def clear_rules_registry() -> None:
+    """Forget every cached rules file (tests and long-lived processes)."""
+    with _RULES_REGISTRY_LOCK:
+        _RULES_REGISTRY.clear()
+
+
 class RulesManager:
     """Simple manager for loading validation rules."""
 
@@ -83,39 +198,11 @@ class RulesManager:
             os.path.dirname(__file__),
             f"{collection.lower()}.json"
         )
-        self.rules = self._load_rules()
-        self.configuration_error: Optional[str] = None
-        self.configuration = self._load_configuration()
-
-    def _load_rules(self):
-        """Load rules from JSON file."""
-        try:
-            with open(self.rules_file, 'r') as f:
-                data = json.load(f)
-                return data.get("rules", [])
-        except Exception as e:
-            logger.error(f"Error loading rules from {self.rules_file}: {e}")
-            return []
-
-    def _load_configuration(self):
-        """Load and validate the configuration section from rules JSON."""
-        try:
-            with open(self.rules_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            validated = ValidationConfiguration.model_validate(
-                data.get("configuration", {})
-            )
-            return validated.model_dump(exclude_none=True)
-        except ValidationError as e:
-            self.configuration_error = str(e)
-            logger.error(
-                f"Invalid configuration in rules file {self.rules_file}: {e}"
-            )
-            return {}
-        except Exception as e:
-            self.configuration_error = str(e)
-            logger.error(f"Error loading configuration from {self.rules_file}: {e}")
-            return {}
+        self._document = _load_rules_document(self.rules_file)
+        self.rules = self._document.rules
+        self.metadata = self._document.metadata
+        self.configuration_error: Optional[str] = self._document.configuration_error
+        self.configuration = self._document.configuration
 
     @property
     def participant_roles_configured(self) -> bool:
@@ -139,29 +226,13 @@ class RulesManager:
     
     def get_rules_by_type(self, rule_type):
         """Get rules filtered by type."""
-        return [r for r in self.rules if r.get("rule_type") == rule_type]
-    
-    def get_rules_for_sport(self, sport_event, parameter=None):
-        """Get rules for a specific sport event and parameter."""
-        # First look for exact sport match
-        rules = [r for r in self.rules 
-                if r.get("sport_event") == sport_event 
-                and (parameter is None or r.get("parameter") == parameter)]
-        
-        # Add default rules if no specific match
-        if not rules or sport_event != DEFAULT_SPORT:
-            default_rules = [r for r in self.rules 
-                            if r.get("sport_event") == DEFAULT_SPORT
-                            and (parameter is None or r.get("parameter") == parameter)]
-            # Only add default rules that don't conflict with specific ones
-            for rule in default_rules:
-                rule_type = rule.get("rule_type")
-                category = rule.get("category")
-                
-                # Skip if we already have a rule of this type and category for this sport
-                if not any(r.get("rule_type") == rule_type and r.get("category") == category 
-                           for r in rules):
-                    rules.append(rule)
-        
-        return rules
-    
+        return list(self._document.by_type.get(rule_type, []))
+
+    def get_rules_for_sport(self, sport_event, parameter=None, rule_type=None):
+        """Get rules for a specific sport event and parameter.
+
+        Sport-specific rules come first, followed by default rules that don't
+        conflict with a sport rule of the same type and category.  Pass
+        ``rule_type`` to narrow the result; lookups are cached per file.
+        """
+        return list(self._document.rules_for_sport(sport_event, parameter, rule_type))
@@ -1,9 +1,25 @@
+"""Partner / participant name matching shared by the validators and exports.
+
+Names are compared through ``NameKey`` objects that hold every normalized
+form the matchers need (tokens with and without parenthetical aliases,
+sorted tokens, the joined form and initials).  ``name_key`` builds them
+through an LRU cache, so a name that is compared against a whole event pool
+is NFKD-normalized and tokenized once rather than on every comparison.
+
+``NameIndex`` indexes one pool of candidate names by token prefix (a
+flattened token trie) so a partner lookup only verifies the few candidates
+that share a token prefix with the query instead of scanning the pool.
+"""
 import re
 import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
 
 
 _PAREN_CONTENT_RE = re.compile(r"\([^)]*\)")
 _NON_WORD_RE = re.compile(r"[^\w\s]+", re.UNICODE)
+NAME_KEY_CACHE_SIZE = 16384
 
 
 def normalized_name(name: str) -> str:
@@ -26,7 +42,39 @@ def _clean_tokens(name_key: str, *, keep_parenthetical: bool) -> list[str]:
     return [token for token in text.split() if token]
 
 
-def _token_prefix_match(query_tokens: list[str], candidate_tokens: list[str]) -> bool:
+@dataclass(frozen=True)
+class NameKey:
+    """One name, normalized and tokenized once for repeated matching."""
+
+    name: str
+    tokens: tuple[str, ...]  # parenthetical aliases kept
+    base_tokens: tuple[str, ...]  # parenthetical aliases dropped
+    sorted_tokens: tuple[str, ...]
+    joined: str
+    initials: frozenset[str]
+
+
+@lru_cache(maxsize=NAME_KEY_CACHE_SIZE)
+def _cached_name_key(name: str) -> NameKey:
+    base_tokens = tuple(_clean_tokens(name, keep_parenthetical=False))
+    return NameKey(
+        name=normalized_name(name),
+        tokens=tuple(_clean_tokens(name, keep_parenthetical=True)),
+        base_tokens=base_tokens,
+        sorted_tokens=tuple(sorted(base_tokens)),
+        joined="".join(base_tokens),
+        initials=frozenset(token[0] for token in base_tokens),
+    )
+
+
+def name_key(name: Any) -> NameKey:
+    """Return the cached ``NameKey`` for ``name`` (None and "" give an empty key)."""
+    if isinstance(name, NameKey):
+        return name
+    return _cached_name_key(str(name or ""))
+
+
+def _token_prefix_match(query_tokens: Sequence[str], candidate_tokens: Sequence[str]) -> bool:
     if not query_tokens or not candidate_tokens:
         return False
 
@@ -36,7 +84,7 @@ def _token_prefix_match(query_tokens: list[str], candidate_tokens: list[str]) ->
     )
 
 
-def _initial_tolerant_match(query_tokens: list[str], candidate_tokens: list[str]) -> bool:
+def _initial_tolerant_match(query_tokens: Sequence[str], candidate_tokens: Sequence[str]) -> bool:
     if not query_tokens or not candidate_tokens:
         return False
 
@@ -64,33 +112,108 @@ def _initial_tolerant_match(query_tokens: list[str], candidate_tokens: list[str]
     return saw_initial and saw_non_initial
 
 
-def resolvable_name_match(query_name_key: str, candidate_name_key: str) -> bool:
-    query_base_tokens = _clean_tokens(query_name_key, keep_parenthetical=False)
-    candidate_base_tokens = _clean_tokens(candidate_name_key, keep_parenthetical=False)
+def resolvable_key_match(query: NameKey, candidate: NameKey) -> bool:
+    query_base_tokens = query.base_tokens
+    candidate_base_tokens = candidate.base_tokens
     if not query_base_tokens or not candidate_base_tokens:
         return False
 
     if query_base_tokens == candidate_base_tokens:
         return True
 
-    if len(query_base_tokens) > 1 and sorted(query_base_tokens) == sorted(candidate_base_tokens):
+    if len(query_base_tokens) > 1 and query.sorted_tokens == candidate.sorted_tokens:
         return True
 
-    if "".join(query_base_tokens) == "".join(candidate_base_tokens):
+    if query.joined == candidate.joined:
         return True
 
+    # Every query token must start some candidate token, so a query initial
+    # missing from the candidate's initials rules the match out cheaply.
+    if not query.initials <= candidate.initials:
+        return False
     return _initial_tolerant_match(query_base_tokens, candidate_base_tokens)
 
 
-def likely_name_match(query_name_key: str, candidate_name_key: str) -> bool:
-    query_all_tokens = _clean_tokens(query_name_key, keep_parenthetical=True)
-    candidate_all_tokens = _clean_tokens(candidate_name_key, keep_parenthetical=True)
-    if _token_prefix_match(query_all_tokens, candidate_all_tokens):
+def likely_key_match(query: NameKey, candidate: NameKey) -> bool:
+    if _token_prefix_match(query.tokens, candidate.tokens):
         return True
+    return resolvable_key_match(query, candidate)
 
-    query_base_tokens = _clean_tokens(query_name_key, keep_parenthetical=False)
-    candidate_base_tokens = _clean_tokens(candidate_name_key, keep_parenthetical=False)
-    if not query_base_tokens or not candidate_base_tokens:
-        return False
 
-    return resolvable_name_match(query_name_key, candidate_name_key)
+def resolvable_name_match(query_name_key: str, candidate_name_key: str) -> bool:
+    return resolvable_key_match(name_key(query_name_key), name_key(candidate_name_key))
+
+
+def likely_name_match(query_name_key: str, candidate_name_key: str) -> bool:
+    return likely_key_match(name_key(query_name_key), name_key(candidate_name_key))
+
+
+class TokenPrefixIndex:
+    """Positions of token lists keyed by every prefix of every token."""
+
+    def __init__(self, token_lists: Iterable[Sequence[str]]) -> None:
+        self._by_token: dict[str, set[int]] = {}
+        self._by_prefix: dict[str, set[int]] = {}
+        for position, tokens in enumerate(token_lists):
+            for token in tokens:
+                self._by_token.setdefault(token, set()).add(position)
+                for end in range(1, len(token) + 1):
+                    self._by_prefix.setdefault(token[:end], set()).add(position)
+
+    def with_token(self, token: str) -> set[int]:
+        return self._by_token.get(token, set())
+
+    def with_prefix(self, prefix: str) -> set[int]:
+        return self._by_prefix.get(prefix, set())
+
+
+class NameIndex:
+    """A pool of candidate names indexed for repeated partner lookups.
+
+    Every ``likely`` / ``resolvable`` rule except the joined-form rule needs
+    each query token to start some candidate token, so candidates are the
+    positions sharing a prefix with the query's longest token plus the
+    positions with the same joined form.  Those few are then verified with
+    the exact matcher; results are positions in the original pool order.
+    """
+
+    def __init__(self, names: Iterable[Any]) -> None:
+        self.names = list(names)
+        self.keys = [name_key(name) for name in self.names]
+        self._exact: dict[Any, list[int]] = {}
+        self._joined: dict[str, list[int]] = {}
+        for position, (name, key) in enumerate(zip(self.names, self.keys)):
+            self._exact.setdefault(name, []).append(position)
+            if key.joined:
+                self._joined.setdefault(key.joined, []).append(position)
+        self._tokens = TokenPrefixIndex(key.tokens for key in self.keys)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def exact(self, name: Any) -> list[int]:
+        """Positions whose name equals ``name`` as given (no normalization)."""
+        return list(self._exact.get(name, ()))
+
+    def _candidates(self, query: NameKey) -> list[int]:
+        anchor_tokens = query.base_tokens or query.tokens
+        if not anchor_tokens:
+            return []
+        positions = set(self._tokens.with_prefix(max(anchor_tokens, key=len)))
+        if query.joined:
+            positions.update(self._joined.get(query.joined, ()))
+        return sorted(positions)
+
+    def likely_matches(self, name: Any) -> list[int]:
+        query = name_key(name)
+        return [
+            position for position in self._candidates(query)
+            if likely_key_match(query, self.keys[position])
+        ]
+
+    def resolvable_matches(self, name: Any) -> list[int]:
+        query = name_key(name)
+        return [
+            position for position in self._candidates(query)
+            if resolvable_key_match(query, self.keys[position])
+        ]
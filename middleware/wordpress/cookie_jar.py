@@ -0,0 +1,90 @@
+# wordpress/cookie_jar.py
+"""
+Small on-disk jar for the WordPress host's bot-protection cookie.
+
+The host answers an unrecognised client with an HTML page whose script sets a
+``humans_*`` cookie.  WordPressConnector answers that challenge only when a
+request is actually challenged, and stores the cookie here with an expiry so
+later CLI runs and daemon cycles start with it and skip the extra round trip.
+The jar is scoped to one WordPress site (``Config.WP_URL``).
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+from config import Config, WP_COOKIE_JAR_FILE, WP_COOKIE_JAR_TTL_HOURS
+from file_utils import LazyDefault, atomic_write_json
+
+
+COOKIE_JAR_VERSION = 1
+
+
+class WordPressCookieJar:
+    """JSON-backed ``name -> value`` cookies, each with an expiry time."""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = WP_COOKIE_JAR_TTL_HOURS * 3600,
+        scope: Optional[str] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.scope = (Config.WP_URL or "") if scope is None else scope
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, object]]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable WordPress cookie jar {self.path}: {exc}")
+            return {}
+        if payload.get("version") != COOKIE_JAR_VERSION or payload.get("scope") != self.scope:
+            return {}
+        return dict(payload.get("cookies") or {})
+
+    def load(self) -> Dict[str, str]:
+        """Return the cookies that have not expired yet."""
+        now = time.time()
+        with self._lock:
+            entries = self._read()
+        return {
+            name: str(entry.get("value", ""))
+            for name, entry in entries.items()
+            if float(entry.get("expires_at") or 0) > now
+        }
+
+    def store(self, name: str, value: str) -> None:
+        """Save ``name=value`` for ``ttl_seconds``, dropping expired entries."""
+        now = time.time()
+        with self._lock:
+            entries = {
+                key: entry for key, entry in self._read().items()
+                if float(entry.get("expires_at") or 0) > now
+            }
+            entries[name] = {"value": value, "expires_at": now + self.ttl_seconds}
+            try:
+                atomic_write_json(
+                    self.path,
+                    {"version": COOKIE_JAR_VERSION, "scope": self.scope, "cookies": entries},
+                    sort_keys=True,
+                )
+            except OSError as exc:
+                logger.warning(f"Could not write WordPress cookie jar {self.path}: {exc}")
+
+
+_DEFAULT_JAR: LazyDefault[WordPressCookieJar] = LazyDefault(WordPressCookieJar, WP_COOKIE_JAR_FILE)
+
+
+def default_cookie_jar() -> Optional[WordPressCookieJar]:
+    """Return the process-wide jar at WP_COOKIE_JAR_FILE, or None when disabled.
+
+    Every connector shares this one jar, so its lock serializes their writes.
+    """
+    return _DEFAULT_JAR.get()
@@ -10,8 +10,9 @@ from config import (Config, SPORT_TYPE, SPORT_CATEGORY, SPORT_FORMAT, GENDER, ME
 import datetime  # Add this if not already imported
 from typing import Dict, List, Optional, Any
 from tenacity import (
-    retry, stop_after_attempt, wait_exponential, retry_if_exception, retry_if_exception_type,
+    RetryError, retry, stop_after_attempt, wait_exponential, retry_if_exception, retry_if_exception_type,
 )
+from wordpress.cookie_jar import WordPressCookieJar, default_cookie_jar
 
 # Retry policy shared by transient-safe read methods.
 _WP_TRANSIENT_HTTP_STATUS_CODES = {408, 425, 429, 502, 503, 504}
@@ -38,6 +39,53 @@ _WP_READ_RETRY = dict(
     ),
 )
 
+# The host's bot protection answers an unrecognised client with an HTML page
+# whose script sets a "humans_*" cookie before reloading.
+_BOT_CHALLENGE_COOKIE_RE = re.compile(r'document\.cookie\s*=\s*"([^"]+)"')
+
+
+def _bot_challenge_cookie(response: requests.Response) -> Optional[tuple]:
+    """Return ``(name, value)`` when ``response`` is a bot-protection challenge."""
+    if "json" in response.headers.get("Content-Type", ""):
+        return None
+    text = response.text
+    if "humans_" not in text:
+        return None
+    match = _BOT_CHALLENGE_COOKIE_RE.search(text)
+    if not match:
+        return None
+    name, _, value = match.group(1).split(";", 1)[0].partition("=")
+    return (name.strip(), value.strip()) if name.strip() else None
+
+
+class _WordPressSession(requests.Session):
+    """Session that answers the bot-protection challenge only when a request is challenged.
+
+    The harvested cookie is kept in ``cookie_jar`` (when enabled) and loaded by
+    the next connector, so warm-up round trips are paid once per expiry rather
+    than once per connector.
+    """
+
+    def __init__(self, cookie_jar: Optional[WordPressCookieJar] = None):
+        super().__init__()
+        self.cookie_jar = cookie_jar
+        if cookie_jar is not None:
+            for name, value in cookie_jar.load().items():
+                self.cookies.set(name, value)
+
+    def request(self, method, url, *args, **kwargs):
+        response = super().request(method, url, *args, **kwargs)
+        cookie = _bot_challenge_cookie(response)
+        if cookie is None:
+            return response
+        name, value = cookie
+        logger.info(f"Detected WordPress bot protection on {method} {url}; retrying with challenge cookie.")
+        self.cookies.set(name, value)
+        if self.cookie_jar is not None:
+            self.cookie_jar.store(name, value)
+        return super().request(method, url, *args, **kwargs)
+
+
 class WordPressAPIError(Exception):
     """Exception raised for WordPress API errors."""
     pass
@@ -60,8 +108,9 @@ class WordPressConnector:
         self.last_update_validation_issue_status = "unknown"
         self.last_get_schedules_status = "unknown"
     
-        # Create a session to maintain cookies
-        self.session = requests.Session()
+        # Create a session to maintain cookies; it answers the bot-protection
+        # challenge lazily, on the first challenged request.
+        self.session = _WordPressSession(default_cookie_jar())
         
         # Set up headers
         self.session.headers.update({
@@ -72,34 +121,7 @@ class WordPressConnector:
             "Origin": Config.WP_URL,
             "Referer": Config.WP_URL
         })
-        
-        # Initialize the session
-        self._initialize_session()
-     
-    def _initialize_session(self):
-        """Initialize session with cookies by visiting the main site."""
-        logger.info("Initializing session with WordPress...")
-        try:
-            # First visit the main site to get any cookies
-            main_response = self.session.get(Config.WP_URL)
-            
-            # Check if we need to handle a bot protection cookie
-            if "humans_" in main_response.text:
-                logger.info("Detected bot protection. Extracting cookie...")
-                cookie_match = re.search(r'document\.cookie\s*=\s*"([^"]+)"', main_response.text)
-                if cookie_match:
-                    cookie_script = cookie_match.group(1)
-                    cookie_name, cookie_value = cookie_script.split('=')
-                    self.session.cookies.set(cookie_name, cookie_value)
-                    
-                    # Visit the site again with the cookie
-                    second_response = self.session.get(Config.WP_URL)
-                    logger.info(f"Second site visit status code: {second_response.status_code}")
-            
-            logger.info(f"WordPress session initialized with cookies: {dict(self.session.cookies)}")
-        except Exception as e:
-            logger.error(f"Failed to initialize WordPress session: {e}")
-        
+
     def get_churches(self) -> List[Dict[str, Any]]:
         """Get churches from WordPress."""
         try:
@@ -487,30 +509,85 @@ class WordPressConnector:
             logger.error(f"Failed to parse schedules response: {str(e)}")
             return None
 
+    @retry(**_WP_READ_RETRY)
+    def get_schedule_manifest(
+        self,
+        updated_since: Optional[str] = None,
+        since_version: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get the lightweight sf_schedules manifest used by publish-schedule.
+
+        Returns ``{"rows": [...], "total": int, "max_updated_at": str|None}``
+        where each row carries game_key, game_status, source_hash,
+        schedule_version and updated_at (plus event/resource_id/scheduled_slot
+        for reports).  ``updated_since`` / ``since_version`` narrow ``rows``;
+        ``total`` and ``max_updated_at`` always describe the whole table.
+        """
+        params: Dict[str, Any] = {"fields": "manifest"}
+        if updated_since:
+            params["updated_since"] = updated_since
+        if since_version is not None:
+            params["since_version"] = since_version
+        try:
+            response = self.session.get(f"{self.custom_api_url}/schedules", params=params)
+            response.raise_for_status()
+            payload = response.json()
+        except requests.RequestException as e:
+            self.last_get_schedules_status = "failed"
+            logger.error(f"Failed to get schedule manifest: {str(e)}")
+            if _is_retryable_wp_read_exception(e):
+                raise  # Let retry handle transient failures.
+            return None
+        except ValueError as e:
+            self.last_get_schedules_status = "failed"
+            logger.error(f"Failed to parse schedule manifest response: {str(e)}")
+            return None
+        self.last_get_schedules_status = "ok"
+        if isinstance(payload, list):
+            # A plugin without manifest support ignores "fields" and returns
+            # full rows; it cannot filter either, so this is a full read.
+            return {"rows": payload, "total": len(payload), "max_updated_at": None}
+        return payload
+
     def upsert_schedules(
         self,
         games: List[Dict[str, Any]],
         schedule_version: int,
         force_cancel: bool = False,
+        idempotency_key: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """Bulk create/update sf_schedules rows by stable game_key (Issue #203).
 
-        Not retried: a blind retry of a partially-applied bulk write isn't safe
-        without stronger idempotency guarantees than this endpoint offers.
+        Without an ``idempotency_key`` the request is not retried: a blind
+        retry of a partially-applied bulk write isn't safe.  With one, the
+        endpoint replays the stored response of a batch it already applied,
+        so transient failures are retried like reads.
         """
+        payload = {
+            "games": games,
+            "schedule_version": schedule_version,
+            "force_cancel": force_cancel,
+        }
         try:
-            payload = {
-                "games": games,
-                "schedule_version": schedule_version,
-                "force_cancel": force_cancel,
-            }
-            response = self.session.post(f"{self.custom_api_url}/schedules/upsert", json=payload)
-            response.raise_for_status()
+            if idempotency_key:
+                payload["idempotency_key"] = idempotency_key
+                response = self._post_idempotent(
+                    f"{self.custom_api_url}/schedules/upsert", payload, idempotency_key
+                )
+            else:
+                response = self.session.post(f"{self.custom_api_url}/schedules/upsert", json=payload)
+                response.raise_for_status()
             return response.json()
-        except requests.RequestException as e:
+        except (requests.RequestException, RetryError) as e:
             logger.error(f"Failed to upsert schedules: {str(e)}")
             return None
 
+    @retry(**_WP_READ_RETRY)
+    def _post_idempotent(self, url: str, payload: Dict[str, Any], idempotency_key: str) -> requests.Response:
+        response = self.session.post(url, json=payload, headers={"Idempotency-Key": idempotency_key})
+        response.raise_for_status()
+        return response
+
     def create_approval(self, approval_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create an approval record in WordPress."""
         try:
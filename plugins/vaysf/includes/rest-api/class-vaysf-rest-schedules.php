@@ -46,6 +46,12 @@ class VAYSF_REST_Schedules extends VAYSF_REST_Controller {
     /**
      * Get the currently published schedule (Issue #203)
      *
+     * fields=manifest returns only what publish-schedule diffs on (plus the
+     * few columns its report prints) as {rows, total, max_updated_at}, where
+     * total and max_updated_at describe the whole table so a client can
+     * merge an updated_since delta into a cached copy and detect drift.
+     * since_version and updated_since filter either mode.
+     *
      * @param WP_REST_Request $request Request object
      * @return WP_REST_Response Response object
      */
@@ -54,6 +60,7 @@ class VAYSF_REST_Schedules extends VAYSF_REST_Controller {
 
         $table_schedules = vaysf_get_table_name('schedules');
         $params = $request->get_params();
+        $manifest = isset($params['fields']) && $params['fields'] === 'manifest';
 
         $where = array();
         $where_format = array();
@@ -66,14 +73,39 @@ class VAYSF_REST_Schedules extends VAYSF_REST_Controller {
             $where[] = 'event = %s';
             $where_format[] = sanitize_text_field($params['event']);
         }
+        if (isset($params['since_version']) && $params['since_version'] !== '') {
+            $where[] = 'schedule_version > %d';
+            $where_format[] = absint($params['since_version']);
+        }
+        if (!empty($params['updated_since'])) {
+            $where[] = 'updated_at >= %s';
+            $where_format[] = sanitize_text_field($params['updated_since']);
+        }
 
+        $columns = $manifest
+            ? 'game_key, game_status, source_hash, schedule_version, updated_at, event, resource_id, scheduled_slot'
+            : '*';
         $where_clause = !empty($where) ? 'WHERE ' . implode(' AND ', $where) : '';
-        $query_sql = "SELECT * FROM $table_schedules $where_clause ORDER BY schedule_id";
+        $query_sql = "SELECT $columns FROM $table_schedules $where_clause ORDER BY schedule_id";
         $query = !empty($where_format) ? $wpdb->prepare($query_sql, $where_format) : $query_sql;
 
+        if (!$manifest) {
+            return rest_ensure_response($wpdb->get_results($query, ARRAY_A));
+        }
+
+        // Read the table state first: a row written while the rows are being
+        // read then has updated_at >= max_updated_at and lands in the next delta.
+        $table_state = $wpdb->get_row(
+            "SELECT COUNT(*) AS total, MAX(updated_at) AS max_updated_at FROM $table_schedules",
+            ARRAY_A
+        );
         $schedules = $wpdb->get_results($query, ARRAY_A);
 
-        return rest_ensure_response($schedules);
+        return rest_ensure_response(array(
+            'rows' => $schedules,
+            'total' => (int) ($table_state['total'] ?? 0),
+            'max_updated_at' => $table_state['max_updated_at'] ?? null,
+        ));
     }
 
     /**
@@ -113,6 +145,11 @@ class VAYSF_REST_Schedules extends VAYSF_REST_Controller {
      * (game_status = "cancelled") additionally requires force_cancel = true at
      * the request level.
      *
+     * A batch sent with an Idempotency-Key header (or idempotency_key field)
+     * stores its successful response for a day; resending the same key
+     * replays that response instead of writing again, so a chunked publish
+     * can resume after a lost response.
+     *
      * @param WP_REST_Request $request Request object
      * @return WP_REST_Response|WP_Error Response object or error
      */
@@ -130,6 +167,21 @@ class VAYSF_REST_Schedules extends VAYSF_REST_Controller {
             );
         }
 
+        $idempotency_key = (string) $request->get_header('idempotency_key');
+        if ($idempotency_key === '' && !empty($params['idempotency_key'])) {
+            $idempotency_key = (string) $params['idempotency_key'];
+        }
+        $idempotency_transient = $idempotency_key !== ''
+            ? 'vaysf_schedule_upsert_' . md5($idempotency_key)
+            : '';
+        if ($idempotency_transient !== '') {
+            $replayed = get_transient($idempotency_transient);
+            if (is_array($replayed)) {
+                $replayed['replayed'] = true;
+                return rest_ensure_response($replayed);
+            }
+        }
+
         $protected_statuses = array('reported', 'official', 'under_review');
         $schedule_version = isset($params['schedule_version']) ? absint($params['schedule_version']) : 0;
         $force_cancel = !empty($params['force_cancel']);
@@ -293,13 +345,20 @@ class VAYSF_REST_Schedules extends VAYSF_REST_Controller {
             }
         }
 
-        return rest_ensure_response(array(
+        $response_data = array(
             'success' => ($skipped_count === 0),
             'schedule_version' => $schedule_version,
             'created_count' => $created_count,
             'updated_count' => $updated_count,
             'skipped_count' => $skipped_count,
             'results' => $results,
-        ));
+        );
+        // Only a fully applied batch is replayable; a failed one must be
+        // able to run again.
+        if ($idempotency_transient !== '' && $response_data['success']) {
+            set_transient($idempotency_transient, $response_data, DAY_IN_SECONDS);
+        }
+
+        return rest_ensure_response($response_data);
     }
 }